@@ -7,12 +7,13 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
     
-from logger import setup_logger
+from logger import configure_logging, setup_logger, shutdown_logging
 from Gateway.providers.market_data import MarketDataProvider
 from Gateway.providers.news import NewsProvider
 from Gateway.stream import Stream
 
 def run_gateway(config: dict):
+    configure_logging(**config.get("logging", {}))
     logger = setup_logger("gateway")
     logger.info("Starting Gateway process")
     
@@ -22,9 +23,13 @@ def run_gateway(config: dict):
         logger.error(f"Failed to initialize market data provider: {e}", exc_info=True)
         return
     
-    md_stream = Stream(market_provider, config["md_port"], config["delimiter"], logger)
+    sequenced = config.get("sequenced", False)
+    traced = config.get("tracing", False)
+    md_stream = Stream(market_provider, config["md_port"], config["delimiter"], logger,
+                       sequenced=sequenced, traced=traced)
     news_provider = NewsProvider(config = config)
-    news_stream = Stream(news_provider, config["news_port"], config["delimiter"], logger)
+    news_stream = Stream(news_provider, config["news_port"], config["delimiter"], logger,
+                         sequenced=sequenced, traced=traced)
 
     for stream in [md_stream, news_stream]:
         threading.Thread(target=stream.run, daemon=True).start()
@@ -38,6 +43,7 @@ def run_gateway(config: dict):
     def signal_handler(signum, frame):
         logger.info(f"[GATEWAY] Received signal {signum}")
         shutdown()
+        shutdown_logging()  # os._exit skips atexit, flush queued records first
         os._exit(0)
     
     signal.signal(signal.SIGTERM, signal_handler)
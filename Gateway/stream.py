@@ -7,7 +7,8 @@ import time
 from Gateway.providers.provider import Provider
 
 class Stream:
-    def __init__(self, provider: Provider, port: int, delimiter: bytes = b'*', logger: Optional[logging.Logger] = None):
+    def __init__(self, provider: Provider, port: int, delimiter: bytes = b'*', logger: Optional[logging.Logger] = None,
+                 sequenced: bool = False, traced: bool = False):
         self.provider = provider
         self.port = port
         self.delimiter = delimiter
@@ -18,6 +19,11 @@ class Stream:
         self.accept_thread = None
         self._shutdown_called = False
         self.logger = logger or logging.getLogger(f"stream_{port}")
+        # When sequenced, every message is prefixed with "<seq>|" so clients can detect gaps
+        self.sequenced = sequenced
+        self.sequence = 0
+        # When traced, the header also carries the monotonic origin time: "<seq>,<origin_ns>|"
+        self.traced = traced
 
 
     def accept_clients(self, server_socket: socket.socket):
@@ -45,6 +51,13 @@ class Stream:
         if not data.endswith(self.delimiter):
             data = data + self.delimiter
         
+        if self.traced:
+            self.sequence += 1
+            data = b'%d,%d|' % (self.sequence, time.monotonic_ns()) + data
+        elif self.sequenced:
+            self.sequence += 1
+            data = b'%d|' % self.sequence + data
+        
         with self.lock:
             clients_copy = self.clients.copy()
         
@@ -45,3 +45,32 @@ def test_stream_removes_dead_clients(mock_provider):
     assert len(stream.clients) == 1
     assert good_socket in stream.clients
     assert bad_socket not in stream.clients
+
+def test_stream_sequenced_prefix(mock_provider):
+    stream = Stream(mock_provider, 0, delimiter=b'*', sequenced=True)
+    
+    received = []
+    mock_socket = MagicMock()
+    mock_socket.sendall = Mock(side_effect=lambda data: received.append(data))
+    
+    stream.clients.append(mock_socket)
+    stream.broadcast(b"first")
+    stream.broadcast(b"second*")
+    
+    assert received == [b"1|first*", b"2|second*"]
+
+def test_stream_traced_prefix(mock_provider):
+    stream = Stream(mock_provider, 0, delimiter=b'*', traced=True)
+    
+    received = []
+    mock_socket = MagicMock()
+    mock_socket.sendall = Mock(side_effect=lambda data: received.append(data))
+    
+    stream.clients.append(mock_socket)
+    stream.broadcast(b"first")
+    
+    header, payload = received[0].split(b'|')
+    seq, origin_ns = header.split(b',')
+    assert seq == b"1"
+    assert int(origin_ns) > 0
+    assert payload == b"first*"
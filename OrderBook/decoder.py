@@ -0,0 +1,273 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+import time
+
+import numpy as np
+
+from OrderBook.events import MarketDataEvent, NewsEvent
+
+# Fixed Gateway timestamp layout: YYYY-MM-DD HH:MM:SS
+TIMESTAMP_LENGTH = 19
+# Symbol id of ticks for symbols outside the configured universe (MarketDataEvent's default id)
+UNKNOWN_SYMBOL_ID = -1
+
+ErrorCallback = Callable[[bytes, ValueError], None]
+
+
+class FeedDecoder(ABC):
+    """Decoder plugged into FeedHandler so each message is parsed once for all subscribers"""
+
+    @abstractmethod
+    def decode_event(self, message: bytes) -> Any:
+        """Decode one delimiter-free message into a (possibly reused) event, raising ValueError if malformed"""
+        raise NotImplementedError("Subclasses must implement decode_event method")
+
+    @abstractmethod
+    def decode_batch(self, messages: Iterable[bytes], on_error: Optional[ErrorCallback] = None,
+                     origins: Optional[List[int]] = None) -> Any:
+        """Decode one read's worth of messages, skipping malformed ones and reporting them to on_error.
+
+        ``origins`` optionally carries each message's Gateway origin time (traced feeds).
+        """
+        raise NotImplementedError("Subclasses must implement decode_batch method")
+
+    @abstractmethod
+    def iter_events(self, batch: Any) -> Iterable[Any]:
+        """Yield (possibly reused) events from an already decoded batch"""
+        raise NotImplementedError("Subclasses must implement iter_events method")
+
+
+class MarketDataBatch(NamedTuple):
+    """Aligned arrays of decoded ticks"""
+
+    symbol_ids: np.ndarray
+    prices: np.ndarray
+    timestamps: np.ndarray
+    origin_ns: Optional[np.ndarray] = None  # Only set for traced feeds
+
+
+class MarketDataDecoder(FeedDecoder):
+    """Fast decoder for ``SYMBOL,PRICE,YYYY-MM-DD HH:MM:SS`` market data messages.
+
+    Symbols are interned to integer ids. Ids ``0..len(symbols)-1`` match the
+    order of ``symbols`` (and therefore ``SharedPriceBook.symbol_index``).
+    Unknown symbols decode to ``UNKNOWN_SYMBOL_ID`` and are only counted in
+    ``unknown_count``, so a noisy feed cannot grow the symbol tables.
+
+    Timestamps are parsed arithmetically: the epoch of each distinct
+    ``YYYY-MM-DD HH`` prefix is computed once (local time, exactly as
+    ``datetime.strptime(...).timestamp()`` would) and cached, minutes are
+    added once per ``YYYY-MM-DD HH:MM`` prefix, and seconds are added
+    directly. Unparseable timestamps fall back to the
+    current time, as the original ``OrderBook`` parser did.
+    """
+
+    def __init__(self, symbols: Iterable[str], field_delimiter: bytes = b',',
+                 clock: Callable[[], float] = time.time):
+        self.symbols: List[str] = []
+        self.symbol_ids: Dict[bytes, int] = {}
+        self.field_delimiter = field_delimiter
+        self._clock = clock
+        # Epochs of the current hour and minute only (ticks arrive in time order), keyed by their prefix
+        self._hour_key, self._hour_epoch = b'', 0.0
+        self._minute_key, self._minute_epoch = b'', 0.0
+        self._event = MarketDataEvent()
+        for symbol in symbols:
+            self.intern(symbol.encode('utf-8'))
+        self.num_known_symbols = len(self.symbols)
+        self.unknown_count = 0  # Ticks decoded with UNKNOWN_SYMBOL_ID
+
+    def intern(self, symbol: bytes) -> int:
+        """Return the id for ``symbol``, assigning a new one if needed (only for configured symbols)"""
+        symbol_id = self.symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = len(self.symbols)
+            self.symbol_ids[symbol] = symbol_id
+            self.symbols.append(symbol.decode('utf-8'))
+        return symbol_id
+
+    def parse_timestamp(self, value: bytes) -> float:
+        """Parse ``YYYY-MM-DD HH:MM:SS`` to a Unix timestamp, raising ValueError if malformed"""
+        if value[:16] == self._minute_key and len(value) == TIMESTAMP_LENGTH and value[16] == 58:
+            minute_epoch = self._minute_epoch
+        else:
+            minute_epoch = self._parse_minute(value)
+        second = value[17:19]
+        if not second.isdigit() or second > b'59':
+            raise ValueError(f"Invalid timestamp: {value!r}")
+        return minute_epoch + int(second)
+
+    def _parse_minute(self, value: bytes) -> float:
+        if (len(value) != TIMESTAMP_LENGTH or value[13] != 58 or value[16] != 58
+                or not value[14:16].isdigit() or value[14:16] > b'59'):
+            raise ValueError(f"Invalid timestamp: {value!r}")
+        
+        hour_key = value[:13]
+        if hour_key != self._hour_key:
+            self._hour_epoch, self._hour_key = self._parse_hour(hour_key), hour_key
+        minute_epoch = self._hour_epoch + int(value[14:16]) * 60
+        self._minute_key, self._minute_epoch = value[:16], minute_epoch
+        return minute_epoch
+
+    @staticmethod
+    def _parse_hour(hour_key: bytes) -> float:
+        if (hour_key[4] != 45 or hour_key[7] != 45 or hour_key[10] != 32
+                or not (hour_key[:4] + hour_key[5:7] + hour_key[8:10] + hour_key[11:13]).isdigit()):
+            raise ValueError(f"Invalid timestamp: {hour_key!r}")
+        return datetime(
+            int(hour_key[:4]), int(hour_key[5:7]), int(hour_key[8:10]), int(hour_key[11:13])
+        ).timestamp()
+
+    def decode(self, message: bytes) -> Tuple[int, float, float]:
+        """Decode one delimiter-free message into (symbol_id, price, timestamp).
+
+        The id is ``UNKNOWN_SYMBOL_ID`` for symbols not given to the constructor.
+
+        Raises:
+            ValueError: If the message is empty or malformed
+        """
+        parts = message.split(self.field_delimiter)
+        if len(parts) != 3:
+            raise ValueError(f"Malformed market data (expected 3 fields, got {len(parts)}): {message!r}")
+        
+        symbol = parts[0].strip()
+        if not symbol:
+            raise ValueError(f"Empty symbol in message: {message!r}")
+        symbol_id = self.symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = UNKNOWN_SYMBOL_ID
+            self.unknown_count += 1
+        
+        try:
+            price = float(parts[1])
+        except ValueError:
+            raise ValueError(f"Invalid price {parts[1]!r} in message: {message!r}") from None
+        
+        try:
+            timestamp = self.parse_timestamp(parts[2].strip())
+        except ValueError:
+            timestamp = self._clock()
+        return symbol_id, price, timestamp
+
+    def decode_event(self, message: bytes) -> MarketDataEvent:
+        """Decode into the decoder's preallocated MarketDataEvent"""
+        symbol_id, price, timestamp = self.decode(message)
+        event = self._event
+        event.symbol_id = symbol_id
+        event.symbol = self.symbols[symbol_id] if symbol_id != UNKNOWN_SYMBOL_ID else ''
+        event.price = price
+        event.timestamp = timestamp
+        event.origin_ns = 0
+        return event
+
+    def decode_batch(self, messages: Iterable[bytes], on_error: Optional[ErrorCallback] = None,
+                     origins: Optional[List[int]] = None) -> MarketDataBatch:
+        """Decode many messages into aligned ``(symbol_ids, prices, timestamps)`` arrays.
+
+        Malformed messages are skipped and reported through ``on_error``.
+        """
+        symbol_ids = []
+        prices = []
+        timestamps = []
+        kept = [] if origins is not None else None
+        decode = self.decode
+        for index, message in enumerate(messages):
+            if not message:
+                continue
+            try:
+                symbol_id, price, timestamp = decode(message)
+            except ValueError as e:
+                if on_error is not None:
+                    on_error(message, e)
+                continue
+            symbol_ids.append(symbol_id)
+            prices.append(price)
+            timestamps.append(timestamp)
+            if kept is not None:
+                kept.append(origins[index])
+        
+        return MarketDataBatch(
+            np.array(symbol_ids, dtype=np.int32),
+            np.array(prices, dtype=np.float64),
+            np.array(timestamps, dtype=np.float64),
+            None if kept is None else np.array(kept, dtype=np.int64),
+        )
+
+    def iter_events(self, batch: MarketDataBatch) -> Iterable[MarketDataEvent]:
+        event = self._event
+        symbols = self.symbols
+        origins = batch.origin_ns.tolist() if batch.origin_ns is not None else [0] * len(batch.symbol_ids)
+        for symbol_id, price, timestamp, origin_ns in zip(batch.symbol_ids.tolist(), batch.prices.tolist(),
+                                                          batch.timestamps.tolist(), origins):
+            event.symbol_id = symbol_id
+            event.symbol = symbols[symbol_id] if symbol_id != UNKNOWN_SYMBOL_ID else ''
+            event.price = price
+            event.timestamp = timestamp
+            event.origin_ns = origin_ns
+            yield event
+
+    def decode_buffer(self, buffer: bytes, delimiter: bytes = b'*',
+                      on_error: Optional[ErrorCallback] = None) -> MarketDataBatch:
+        """Decode a buffer of delimited messages (a trailing partial message is ignored)"""
+        messages = buffer.split(delimiter)
+        messages.pop()
+        return self.decode_batch(messages, on_error)
+
+
+class NewsDecoder(FeedDecoder):
+    """Decoder for ``SYMBOL,SENTIMENT`` news messages (sentiment 0-100)"""
+
+    def __init__(self, field_delimiter: bytes = b','):
+        self.field_delimiter = field_delimiter
+        self._event = NewsEvent()
+
+    def decode(self, message: bytes) -> Tuple[str, int]:
+        """Decode one delimiter-free message into (ticker, sentiment).
+
+        Raises:
+            ValueError: If the message is malformed or sentiment is out of range
+        """
+        parts = message.split(self.field_delimiter)
+        if len(parts) != 2:
+            raise ValueError(f"Malformed news data (expected 2 fields, got {len(parts)}): {message!r}")
+
+        ticker = parts[0].strip().decode('utf-8')
+        try:
+            sentiment = int(parts[1])
+        except ValueError:
+            raise ValueError(f"Invalid sentiment {parts[1]!r} in message: {message!r}") from None
+
+        if not 0 <= sentiment <= 100:
+            raise ValueError(f"Expected sentiment between 0 and 100, actual value: {parts[1]!r} in message: {message!r}")
+
+        return ticker, sentiment
+
+    def decode_event(self, message: bytes) -> NewsEvent:
+        """Decode into the decoder's preallocated NewsEvent"""
+        ticker, sentiment = self.decode(message)
+        event = self._event
+        event.symbol = ticker
+        event.sentiment = sentiment
+        event.origin_ns = 0
+        return event
+
+    def decode_batch(self, messages: Iterable[bytes], on_error: Optional[ErrorCallback] = None,
+                     origins: Optional[List[int]] = None) -> List[Tuple[str, int]]:
+        """Decode many messages into a list of (ticker, sentiment); origins are not tracked for news"""
+        decoded = []
+        for message in messages:
+            try:
+                decoded.append(self.decode(message))
+            except ValueError as e:
+                if on_error is not None:
+                    on_error(message, e)
+        return decoded
+
+    def iter_events(self, batch: List[Tuple[str, int]]) -> Iterable[NewsEvent]:
+        event = self._event
+        event.origin_ns = 0
+        for ticker, sentiment in batch:
+            event.symbol = ticker
+            event.sentiment = sentiment
+            yield event
@@ -0,0 +1,36 @@
+class MarketDataEvent:
+    """Decoded market data tick.
+
+    Decoders reuse a single preallocated instance, so an event is only valid
+    for the duration of the subscriber callback; copy the fields to keep them.
+    """
+
+    __slots__ = ('symbol_id', 'symbol', 'price', 'timestamp', 'origin_ns')
+
+    def __init__(self, symbol_id: int = -1, symbol: str = '', price: float = 0.0, timestamp: float = 0.0,
+                 origin_ns: int = 0):
+        self.symbol_id = symbol_id
+        self.symbol = symbol
+        self.price = price
+        self.timestamp = timestamp
+        self.origin_ns = origin_ns  # Gateway monotonic_ns() on traced feeds, else 0
+
+    def __repr__(self):
+        return (
+            f"MarketDataEvent(symbol_id={self.symbol_id}, symbol='{self.symbol}', "
+            f"price={self.price}, timestamp={self.timestamp})"
+        )
+
+
+class NewsEvent:
+    """Decoded news sentiment (0-100). Reused by its decoder like MarketDataEvent."""
+
+    __slots__ = ('symbol', 'sentiment', 'origin_ns')
+
+    def __init__(self, symbol: str = '', sentiment: int = 0, origin_ns: int = 0):
+        self.symbol = symbol
+        self.sentiment = sentiment
+        self.origin_ns = origin_ns
+
+    def __repr__(self):
+        return f"NewsEvent(symbol='{self.symbol}', sentiment={self.sentiment})"
@@ -1,66 +1,347 @@
-from typing import Callable, List, Dict
+from typing import Callable, List, Dict, Optional, Tuple
+import logging
 import time
 import socket
 import threading
 
+from backoff import ExponentialBackoff
+from latency import LatencyRecorder
+from OrderBook.decoder import FeedDecoder
+
+# Large enough that a busy feed drains many ticks per recv()
+RECV_BUFFER_SIZE = 65536
+
+# Separates the "<seq>" or "<seq>,<origin_ns>" header from the payload on sequenced/traced feeds
+SEQUENCE_SEPARATOR = b'|'
+
+
 class FeedHandler:
-    def __init__(self, host: str, md_port: int, news_port: int):
+    def __init__(self, host: str, md_port: int, news_port: int, reconnect: bool = True,
+                 sequenced: bool = False, backoff_initial: float = 0.1, backoff_max: float = 5.0,
+                 logger: Optional[logging.Logger] = None, decoders: Optional[Dict[str, FeedDecoder]] = None,
+                 traced: bool = False, latency_recorder: Optional[LatencyRecorder] = None):
         self.host = host
         self.md_port = md_port
         self.news_port = news_port
+        self.reconnect = reconnect
+        self.sequenced = sequenced
+        # Traced feeds carry the Gateway's monotonic origin time in the header
+        self.traced = traced
+        self.latency_recorder = latency_recorder
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.logger = logger or logging.getLogger("feed_handler")
+        self.ports: Dict[str, int] = {
+            "market_data": md_port,
+            "news": news_port
+        }
         self.subscribers: Dict[str, List[Callable]] = {
             "market_data": [],
             "news": []
         }
+        # Batch subscribers receive every complete message from one recv() as a list
+        self.batch_subscribers: Dict[str, List[Callable]] = {
+            "market_data": [],
+            "news": []
+        }
+        # Feeds with a decoder are parsed once and subscribers receive typed events
+        self.decoders: Dict[str, FeedDecoder] = {}
+        for feed_type, decoder in (decoders or {}).items():
+            self.set_decoder(feed_type, decoder)
         self.socket_to_feed_type: Dict[socket.socket, str] = {}
 
-        self.md_client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.md_client_socket.connect((self.host, self.md_port))
-        self.socket_to_feed_type[self.md_client_socket] = "market_data"
+        # Sockets are opened by connect()/run(), never in the constructor
+        self.md_client_socket: Optional[socket.socket] = None
+        self.news_client_socket: Optional[socket.socket] = None
+
+        # Sequence tracking (only used when the Gateway runs with sequenced=True)
+        self.expected_sequence: Dict[str, Optional[int]] = {"market_data": None, "news": None}
+        self.missed_messages: Dict[str, int] = {"market_data": 0, "news": 0}
+        # monotonic_ns() of the read currently being dispatched, per feed
+        self.last_received_ns: Dict[str, int] = {"market_data": 0, "news": 0}
+
+        self._disconnect_listener: Optional[Callable[[str], None]] = None
+        self._reconnect_listener: Optional[Callable[[str], None]] = None
+        self._gap_listener: Optional[Callable[[str, int, int, int], None]] = None
 
-        self.news_client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.news_client_socket.connect((self.host, self.news_port))
-        self.socket_to_feed_type[self.news_client_socket] = "news"
+        self.lock = threading.Lock()
+        self.shutdown_event = threading.Event()
+
+    def connect(self):
+        """Connect every feed that is not already connected"""
+        for feed_type in self.ports:
+            if self._get_socket(feed_type) is None:
+                self.connect_feed(feed_type)
+
+    def connect_feed(self, feed_type: str) -> socket.socket:
+        """Open the socket for one feed, raising OSError if the Gateway is unreachable"""
+        client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            client_socket.connect((self.host, self.ports[feed_type]))
+        except Exception:
+            client_socket.close()
+            raise
+        
+        with self.lock:
+            self.socket_to_feed_type[client_socket] = feed_type
+            if feed_type == "market_data":
+                self.md_client_socket = client_socket
+            else:
+                self.news_client_socket = client_socket
+        return client_socket
 
     def run(self):
-        threading.Thread(target=self.listen, args=(self.md_client_socket,), daemon=True).start()
-        threading.Thread(target=self.listen, args=(self.news_client_socket,), daemon=True).start()
+        """Start one background thread per feed; each connects and reconnects on its own"""
+        for feed_type in self.ports:
+            threading.Thread(target=self._run_feed, args=(feed_type,), daemon=True).start()
+
+    def _run_feed(self, feed_type: str):
+        backoff = ExponentialBackoff(self.backoff_initial, self.backoff_max)
+        has_connected = False
+
+        while not self.shutdown_event.is_set():
+            client_socket = self._get_socket(feed_type)
+            if client_socket is None:
+                try:
+                    client_socket = self.connect_feed(feed_type)
+                except OSError as e:
+                    delay = backoff.next_delay()
+                    self.logger.warning(
+                        f"Could not connect to {feed_type} feed at {self.host}:{self.ports[feed_type]} "
+                        f"({e}), retrying in {delay:.2f}s"
+                    )
+                    self.shutdown_event.wait(delay)
+                    continue
+                
+                backoff.reset()
+                if has_connected:
+                    self.logger.info(f"Reconnected to {feed_type} feed")
+                    self._notify(self._reconnect_listener, feed_type)
+            has_connected = True
+
+            self.listen(client_socket)
+
+            if self.shutdown_event.is_set():
+                break
+            self.logger.warning(f"Lost connection to {feed_type} feed")
+            self._close_socket(feed_type)
+            self._notify(self._disconnect_listener, feed_type)
+            if not self.reconnect:
+                break
     
     def listen(self, socket: socket.socket):
+        """Read from one feed socket until it closes or errors"""
         feed_type = self.socket_to_feed_type[socket]
         buffer = b''  # Buffer for partial messages
         delimiter = b'*'
         
         while True:
             try:
-                chunk = socket.recv(1024)
-                if not chunk:
-                    break
-                
-                buffer += chunk
-                
-                # Split by delimiter and process complete messages
-                while delimiter in buffer:
-                    message, buffer = buffer.split(delimiter, 1)
-                    if message:  # Skip empty messages
-                        # Add delimiter back for parsing
-                        for subscriber in self.subscribers[feed_type]:
-                            subscriber(message + delimiter)
+                chunk = socket.recv(RECV_BUFFER_SIZE)
             except Exception as e:
+                if not self.shutdown_event.is_set():
+                    self.logger.error(f"Error reading {feed_type} feed: {e}")
                 break
+            if not chunk:
+                break
+            received_ns = time.monotonic_ns()
+            
+            buffer += chunk
+            if delimiter not in chunk:
+                continue  # No message completed by this read
+            
+            # Split once; the trailing element is the partial message (or b'')
+            messages = buffer.split(delimiter)
+            buffer = messages.pop()
+            messages = [message for message in messages if message]  # Skip empty messages
+            origins = None
+            if self.sequenced or self.traced:
+                messages, origins = self._strip_headers(feed_type, messages)
+                if origins and self.latency_recorder is not None:
+                    for origin_ns in origins:
+                        self.latency_recorder.record("gateway_to_feed", origin_ns, received_ns)
+            if messages:
+                self.last_received_ns[feed_type] = received_ns
+                try:
+                    self._dispatch(feed_type, messages, delimiter, origins)
+                except Exception as e:
+                    # A failing subscriber must not kill the feed thread
+                    self.logger.error(f"Error in {feed_type} subscriber: {e}", exc_info=True)
+
+    def _strip_headers(self, feed_type: str, messages: List[bytes]) -> Tuple[List[bytes], Optional[List[int]]]:
+        """Strip "<seq>|" / "<seq>,<origin_ns>|" headers, reporting any gap in the sequence.
+
+        Returns the payloads and, on traced feeds, their aligned origin times
+        (0 where a message had no origin).
+        """
+        payloads = []
+        origins = [] if self.traced else None
+        expected = self.expected_sequence[feed_type]
+        for message in messages:
+            header, separator, payload = message.partition(SEQUENCE_SEPARATOR)
+            if not separator:
+                payloads.append(message)  # Unsequenced message, pass through
+                if origins is not None:
+                    origins.append(0)
+                continue
+            try:
+                sequence, _, origin = header.partition(b',')
+                sequence = int(sequence)
+                origin_ns = int(origin) if origin else 0
+            except ValueError:
+                self.logger.error(f"Invalid sequence header on {feed_type} feed: {message!r}")
+                continue
+            
+            if expected is not None:
+                if sequence > expected:
+                    missed = sequence - expected
+                    self.missed_messages[feed_type] += missed
+                    self.logger.warning(
+                        f"Sequence gap on {feed_type} feed: expected {expected}, got {sequence} "
+                        f"({missed} missed, {self.missed_messages[feed_type]} total)"
+                    )
+                    self._notify(self._gap_listener, feed_type, expected, sequence, missed)
+                elif sequence < expected:
+                    self.logger.info(f"Sequence reset on {feed_type} feed (Gateway restart?): {expected} -> {sequence}")
+            expected = sequence + 1
+            payloads.append(payload)
+            if origins is not None:
+                origins.append(origin_ns)
+        
+        self.expected_sequence[feed_type] = expected
+        return payloads, origins
+
+    def _dispatch(self, feed_type: str, messages: List[bytes], delimiter: bytes,
+                  origins: Optional[List[int]] = None):
+        """Deliver one read's worth of complete messages to all subscribers"""
+        decoder = self.decoders.get(feed_type)
+        if decoder is not None:
+            self._dispatch_decoded(feed_type, decoder, messages, origins)
+            return
+        
+        for subscriber in self.batch_subscribers[feed_type]:
+            subscriber(messages)
+        
+        per_message = self.subscribers[feed_type]
+        if per_message:
+            for message in messages:
+                # Add delimiter back for parsing
+                framed = message + delimiter
+                for subscriber in per_message:
+                    subscriber(framed)
+
+    def _dispatch_decoded(self, feed_type: str, decoder: FeedDecoder, messages: List[bytes],
+                          origins: Optional[List[int]] = None):
+        """Decode each message exactly once, however many subscribers there are"""
+        batch_subscribers = self.batch_subscribers[feed_type]
+        per_message = self.subscribers[feed_type]
+        
+        if batch_subscribers:
+            batch = decoder.decode_batch(messages, self._on_decode_error, origins)
+            for subscriber in batch_subscribers:
+                subscriber(batch)
+            if per_message:
+                for event in decoder.iter_events(batch):
+                    for subscriber in per_message:
+                        subscriber(event)
+            return
+        
+        if per_message:
+            for index, message in enumerate(messages):
+                try:
+                    event = decoder.decode_event(message)
+                except ValueError as e:
+                    self._on_decode_error(message, e)
+                    continue
+                if origins is not None:
+                    event.origin_ns = origins[index]
+                for subscriber in per_message:
+                    subscriber(event)
+
+    def _on_decode_error(self, message: bytes, error: ValueError):
+        self.logger.error(str(error))
+
+    def _notify(self, listener: Optional[Callable], *args):
+        if listener is None:
+            return
+        try:
+            listener(*args)
+        except Exception as e:
+            self.logger.error(f"Error in feed listener: {e}", exc_info=True)
+
+    def _get_socket(self, feed_type: str) -> Optional[socket.socket]:
+        with self.lock:
+            return self.md_client_socket if feed_type == "market_data" else self.news_client_socket
+
+    def _close_socket(self, feed_type: str):
+        with self.lock:
+            if feed_type == "market_data":
+                client_socket, self.md_client_socket = self.md_client_socket, None
+            else:
+                client_socket, self.news_client_socket = self.news_client_socket, None
+            if client_socket is not None:
+                self.socket_to_feed_type.pop(client_socket, None)
+        if client_socket is not None:
+            try:
+                # Shutdown first so a thread blocked in recv() wakes up
+                client_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            try:
+                client_socket.close()
+            except OSError:
+                pass
     
     def disconnect(self, socket: socket.socket):
-        socket.close()
-        self.socket_to_feed_type.pop(socket)
-        self.subscribers[self.socket_to_feed_type[socket]].clear()
+        if socket is None:
+            return
+        feed_type = self.socket_to_feed_type.get(socket)
+        if feed_type is None:
+            socket.close()
+            return
+        self._close_socket(feed_type)
+        self.subscribers[feed_type].clear()
+        self.batch_subscribers[feed_type].clear()
 
     def subscribe(self, callback: Callable, feed_type: str):
         
         if feed_type not in self.subscribers:
             raise ValueError(f"Invalid feed type: {feed_type}")
         self.subscribers[feed_type].append(callback)
-    
+
+    def subscribe_batch(self, callback: Callable[[List[bytes]], None], feed_type: str):
+        """Subscribe to batched delivery.
+
+        The callback is invoked once per socket read with a list of every
+        complete message in that read, delimiters stripped.
+        """
+        if feed_type not in self.batch_subscribers:
+            raise ValueError(f"Invalid feed type: {feed_type}")
+        self.batch_subscribers[feed_type].append(callback)
+
+    def set_decoder(self, feed_type: str, decoder: FeedDecoder):
+        """Decode ``feed_type`` messages once with ``decoder`` before dispatch.
+
+        Subscribers then receive ``decoder.decode_event`` results and batch
+        subscribers receive ``decoder.decode_batch`` results instead of bytes.
+        """
+        if feed_type not in self.subscribers:
+            raise ValueError(f"Invalid feed type: {feed_type}")
+        self.decoders[feed_type] = decoder
+
+    def set_disconnect_listener(self, callback: Callable[[str], None]):
+        """Called with the feed type whenever a feed connection is lost"""
+        self._disconnect_listener = callback
+
+    def set_reconnect_listener(self, callback: Callable[[str], None]):
+        """Called with the feed type whenever a lost feed is re-established"""
+        self._reconnect_listener = callback
+
+    def set_gap_listener(self, callback: Callable[[str, int, int, int], None]):
+        """Called with (feed_type, expected, received, missed) on a sequence gap"""
+        self._gap_listener = callback
     
     def shutdown(self):
+        self.shutdown_event.set()
         self.disconnect(self.md_client_socket)
         self.disconnect(self.news_client_socket)
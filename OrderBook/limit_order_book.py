@@ -0,0 +1,178 @@
+import heapq
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class _BookSide:
+    """One side of the book: aggregated price levels plus a heap of level keys.
+
+    Bids use ``price`` as key and asks use ``-price``, so the best level has
+    the largest key; the heap holds negated keys, making it ``-heap[0]``.
+    Adding a level is a heap push (O(log n)). Emptied levels are only
+    removed from the dicts, and their heap entries are discarded lazily
+    when they reach the top; ``in_heap`` keeps one entry per key, and the
+    heap is rebuilt from the live levels once stale entries outnumber them.
+    """
+
+    __slots__ = ('sign', 'heap', 'in_heap', 'quantity', 'count')
+
+    def __init__(self, sign: float):
+        self.sign = sign
+        self.heap: List[float] = []         # -key for every level key in ``in_heap``
+        self.in_heap: Set[float] = set()    # Keys with a heap entry, live or stale
+        self.quantity: Dict[float, int] = {}   # key -> aggregate resting quantity
+        self.count: Dict[float, int] = {}      # key -> number of resting orders
+
+    def add(self, key: float, quantity: int):
+        level_quantity = self.quantity.get(key)
+        if level_quantity is None:
+            if key not in self.in_heap:
+                heapq.heappush(self.heap, -key)
+                self.in_heap.add(key)
+            self.quantity[key] = quantity
+            self.count[key] = 1
+        else:
+            self.quantity[key] = level_quantity + quantity
+            self.count[key] += 1
+
+    def remove(self, key: float, quantity: int):
+        remaining_orders = self.count[key] - 1
+        if remaining_orders:
+            self.count[key] = remaining_orders
+            self.quantity[key] -= quantity
+            return
+        
+        del self.count[key]
+        del self.quantity[key]
+        if len(self.heap) > 2 * len(self.quantity) + 16:
+            self.heap = [-live for live in self.quantity]
+            heapq.heapify(self.heap)
+            self.in_heap = set(self.quantity)
+
+    def best_key(self) -> Optional[float]:
+        heap, quantity = self.heap, self.quantity
+        while heap:
+            key = -heap[0]
+            if key in quantity:
+                return key
+            heapq.heappop(heap)
+            self.in_heap.discard(key)
+        return None
+
+    def best(self) -> Optional[float]:
+        key = self.best_key()
+        return None if key is None else self.sign * key
+
+    def levels(self, depth: Optional[int]) -> List[Tuple[float, int, int]]:
+        keys = sorted(self.quantity, reverse=True) if depth is None else heapq.nlargest(depth, self.quantity)
+        return [(self.sign * key, self.quantity[key], self.count[key]) for key in keys]
+
+
+class LimitOrderBook:
+    """Per-symbol limit order book with L2 aggregation.
+
+    Orders are tracked by id so they can be modified and cancelled; price
+    levels aggregate quantity and order count per price. Adding a price
+    level is O(log n), removing one is O(1), and best bid/ask are O(1)
+    amortised over the lazily discarded levels.
+    """
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.bids = _BookSide(1.0)
+        self.asks = _BookSide(-1.0)
+        # order_id -> [side, level key, quantity]
+        self.orders: Dict[object, list] = {}
+
+    def _side(self, side: str) -> _BookSide:
+        if side == "BUY":
+            return self.bids
+        if side == "SELL":
+            return self.asks
+        raise ValueError(f"Invalid side: {side}")
+
+    def add(self, order_id, side: str, price: float, quantity: int):
+        """Add a resting order.
+
+        Raises:
+            ValueError: If the id is already live, the side is unknown, or price/quantity are not positive
+        """
+        if order_id in self.orders:
+            raise ValueError(f"Duplicate order id: {order_id}")
+        if quantity <= 0:
+            raise ValueError("Quantity must be positive")
+        if price <= 0:
+            raise ValueError("Price must be positive")
+        
+        book_side = self._side(side)
+        key = book_side.sign * price
+        book_side.add(key, quantity)
+        self.orders[order_id] = [book_side, key, quantity]
+
+    def cancel(self, order_id) -> int:
+        """Remove an order and return its resting quantity.
+
+        Raises:
+            KeyError: If the order id is unknown
+        """
+        book_side, key, quantity = self.orders.pop(order_id)
+        book_side.remove(key, quantity)
+        return quantity
+
+    def modify(self, order_id, quantity: Optional[int] = None, price: Optional[float] = None):
+        """Change an order's quantity and/or price.
+
+        A quantity-only change updates the level in place; a price change
+        moves the order to the new level. A quantity of 0 cancels the order.
+
+        Raises:
+            KeyError: If the order id is unknown
+            ValueError: If quantity is negative or price is not positive
+        """
+        entry = self.orders[order_id]
+        book_side, key, current_quantity = entry
+        new_quantity = current_quantity if quantity is None else quantity
+        if new_quantity < 0:
+            raise ValueError("Quantity must not be negative")
+        if new_quantity == 0:
+            self.cancel(order_id)
+            return
+        
+        if price is None or book_side.sign * price == key:
+            book_side.quantity[key] += new_quantity - current_quantity
+            entry[2] = new_quantity
+            return
+        
+        if price <= 0:
+            raise ValueError("Price must be positive")
+        book_side.remove(key, current_quantity)
+        new_key = book_side.sign * price
+        book_side.add(new_key, new_quantity)
+        entry[1] = new_key
+        entry[2] = new_quantity
+
+    def best_bid(self) -> Optional[float]:
+        return self.bids.best()
+
+    def best_ask(self) -> Optional[float]:
+        return self.asks.best()
+
+    def best_bid_quantity(self) -> int:
+        key = self.bids.best_key()
+        return 0 if key is None else self.bids.quantity[key]
+
+    def best_ask_quantity(self) -> int:
+        key = self.asks.best_key()
+        return 0 if key is None else self.asks.quantity[key]
+
+    def spread(self) -> Optional[float]:
+        bid, ask = self.best_bid(), self.best_ask()
+        if bid is None or ask is None:
+            return None
+        return ask - bid
+
+    def depth(self, levels: Optional[int] = 5) -> Dict[str, List[Tuple[float, int, int]]]:
+        """L2 snapshot: best-first ``(price, quantity, order_count)`` per side"""
+        return {"bids": self.bids.levels(levels), "asks": self.asks.levels(levels)}
+
+    def __len__(self):
+        return len(self.orders)
@@ -1,7 +1,10 @@
 from typing import List
-from datetime import datetime
 
+import numpy as np
+
+from OrderBook.decoder import UNKNOWN_SYMBOL_ID, MarketDataBatch, MarketDataDecoder
 from OrderBook.feed_handler import FeedHandler
+from latency import LatencyRecorder
 from logger import setup_logger
 from shared_memory_utils import SharedPriceBook
 
@@ -13,15 +16,27 @@ class OrderBook:
             symbols = config["symbols"]
         except KeyError:
             raise ValueError("Symbols are required")
-        
 
-        self.order_book = {symbol: [] for symbol in symbols}
-        self.feed_handler = FeedHandler(config["host"], config["md_port"], config["news_port"])
-        self.feed_handler.subscribe(self.on_market_data, "market_data")
+        # Symbol ids match SharedPriceBook.symbol_index
+        self.decoder = MarketDataDecoder(symbols)
+        self.traced = config.get("tracing", False)
+        self.latency = LatencyRecorder("orderbook", enabled=self.traced)
+        self.feed_handler = FeedHandler(
+            config["host"],
+            config["md_port"],
+            config["news_port"],
+            sequenced=config.get("sequenced", False),
+            logger=self.logger,
+            decoders={"market_data": self.decoder},
+            traced=self.traced,
+            latency_recorder=self.latency
+        )
+        self.feed_handler.subscribe_batch(self.on_market_data_batch, "market_data")
         self.shared_price_book = SharedPriceBook(
             symbols, 
             name=config.get("shared_memory_name", "order_book"), 
-            create=True
+            create=True,
+            traced=self.traced
         )
         self.update_count = 0  # Track updates for periodic logging
 
@@ -32,54 +47,71 @@ class OrderBook:
                 self.logger.info("Receiving market data...")
                 self.first_log_done = True
             
-            # Decode and strip delimiter
-            message = data.decode('utf-8').rstrip('*').strip()
-            
-            if not message:  # Empty message
-                return
-                
-            parts = message.split(',')
-            
-            if len(parts) != 3:
-                self.logger.error(f"Malformed market data (expected 3 fields, got {len(parts)}): '{message}'")
+            message = data.rstrip(b'*')
+            if not message.strip():  # Empty message
                 return
             
-            symbol = parts[0].strip()
-            if not symbol:
-                self.logger.error(f"Empty symbol in message: '{message}'")
-                return
-                
             try:
-                price = float(parts[1].strip())
+                symbol_id, price, timestamp = self.decoder.decode(message)
             except ValueError as e:
-                self.logger.error(f"Invalid price '{parts[1]}' in message: '{message}'")
+                self.logger.error(str(e))
                 return
             
-            # Parse timestamp string to Unix epoch time
-            timestamp_str = parts[2].strip()
-            try:
-                dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                timestamp = dt.timestamp()
-            except ValueError:
-                # If timestamp parsing fails, use current time
-                timestamp = datetime.now().timestamp()
-                self.logger.debug(f"Using current time for invalid timestamp: '{timestamp_str}'")
+            if symbol_id == UNKNOWN_SYMBOL_ID:
+                self.logger.error(f"Symbol {message.split(b',', 1)[0].decode(errors='replace')} not found in price book")
+                return
+            symbol = self.decoder.symbols[symbol_id]
 
             self.shared_price_book.update(symbol, price, timestamp)
             
             # Log periodically to show activity without spam
             self.update_count += 1
             if self.update_count % 50 == 0:
-                self.logger.info(f"Processed {self.update_count} updates (latest: {symbol} @ ${price:.2f})")
-                self.logger.info(f"Processed {self.update_count} updates (latest: {symbol} @ ${price:.2f})")
+                self.logger.info("Processed %d updates (latest: %s @ $%.2f)", self.update_count, symbol, price)
         except Exception as e:
             self.logger.error(f"Unexpected error processing market data: {e}")
-    
+
+    def on_market_data_batch(self, batch: MarketDataBatch):
+        """Publish one feed read's worth of decoded ticks in one shared memory update"""
+        try:
+            if not hasattr(self, 'first_log_done'):
+                self.logger.info("Receiving market data...")
+                self.first_log_done = True
+
+            symbol_ids, prices, timestamps, origin_ns = batch
+
+            known = symbol_ids != UNKNOWN_SYMBOL_ID
+            if not known.all():
+                self.logger.error("%d ticks for symbols not in price book (%d so far)",
+                                  int(symbol_ids.size - np.count_nonzero(known)), self.decoder.unknown_count)
+                symbol_ids, prices, timestamps = symbol_ids[known], prices[known], timestamps[known]
+                if origin_ns is not None:
+                    origin_ns = origin_ns[known]
+
+            if symbol_ids.size == 0:
+                return
+            self.shared_price_book.update_many(symbol_ids, prices, timestamps, origin_ns)
+            if origin_ns is not None:
+                self.latency.record("feed_to_shm", self.feed_handler.last_received_ns["market_data"],
+                                    count=int(symbol_ids.size))
+
+            # Log when the running count crosses a multiple of 50
+            previous_count = self.update_count
+            self.update_count += int(symbol_ids.size)
+            if self.update_count // 50 > previous_count // 50:
+                symbol = self.decoder.symbols[symbol_ids[-1]]
+                self.logger.info("Processed %d updates (latest: %s @ $%.2f)", self.update_count, symbol, prices[-1])
+        except Exception as e:
+            self.logger.error(f"Unexpected error processing market data batch: {e}")
+
     def run(self):
         self.feed_handler.run()
 
     def shutdown(self):
         self.logger.info(f"Shared memory size: {self.shared_price_book.shared_memory_size()}")
         self.feed_handler.shutdown()
+        if self.traced:
+            self.logger.info("%s", self.latency.format_report())
+            self.latency.dump("logs/latency_orderbook.json")
     
         
\ No newline at end of file
@@ -7,11 +7,12 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from logger import setup_logger
+from logger import configure_logging, setup_logger
 from OrderBook.order_book import OrderBook
 
 
 def run_orderbook(config: dict):
+    configure_logging(**config.get("logging", {}))
     logger = setup_logger("orderbook")
     logger.info("Starting OrderBook process")
     
@@ -0,0 +1,142 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from OrderBook.decoder import UNKNOWN_SYMBOL_ID, MarketDataDecoder, NewsDecoder
+
+
+def strptime_epoch(value: str) -> float:
+    return datetime.strptime(value, '%Y-%m-%d %H:%M:%S').timestamp()
+
+
+def test_decoder_matches_strptime():
+    """Test arithmetic timestamp parsing against datetime.strptime"""
+    decoder = MarketDataDecoder(["AAPL"])
+    for value in [
+        "2025-10-01 09:30:00",
+        "2025-10-01 09:59:59",
+        "2025-10-01 10:00:01",
+        "2024-02-29 23:45:12",
+        "2025-03-09 03:15:00",
+        "2025-11-02 01:30:00",
+    ]:
+        assert decoder.parse_timestamp(value.encode()) == strptime_epoch(value)
+
+
+
+def test_decoder_caches_only_the_current_minute():
+    decoder = MarketDataDecoder(["AAPL"])
+    for day in range(1, 29):
+        for hour in (9, 10):
+            value = f"2025-02-{day:02d} {hour:02d}:15:30"
+            assert decoder.parse_timestamp(value.encode()) == strptime_epoch(value)
+    assert decoder._minute_key == b"2025-02-28 10:15"
+    # A late tick from an earlier minute is still parsed correctly
+    assert decoder.parse_timestamp(b"2025-02-01 09:15:30") == strptime_epoch("2025-02-01 09:15:30")
+    with pytest.raises(ValueError):
+        decoder.parse_timestamp(b"2025-02-01 09:15:7x")  # Cached minute, bad seconds
+
+@pytest.mark.parametrize("value", [
+    b"2025-10-01",
+    b"2025-10-01T09:30:00",
+    b"2025-13-01 09:30:00",
+    b"2025-10-01 09:60:00",
+    b"2025-10-01 09:30:6x",
+    b"1234567890.1",
+])
+def test_decoder_rejects_invalid_timestamps(value):
+    decoder = MarketDataDecoder(["AAPL"])
+    with pytest.raises(ValueError):
+        decoder.parse_timestamp(value)
+
+
+def test_decoder_decode():
+    decoder = MarketDataDecoder(["AAPL", "MSFT"])
+    symbol_id, price, timestamp = decoder.decode(b"MSFT,325.20,2025-10-01 09:30:00")
+    
+    assert symbol_id == 1
+    assert price == 325.20
+    assert timestamp == strptime_epoch("2025-10-01 09:30:00")
+
+
+def test_decoder_does_not_intern_unknown_symbols():
+    decoder = MarketDataDecoder(["AAPL"])
+    for i in range(100):
+        symbol_id, price, _ = decoder.decode(b"SYM%d,1.0,2025-10-01 09:30:00" % i)
+        assert symbol_id == UNKNOWN_SYMBOL_ID and price == 1.0
+    
+    assert decoder.symbols == ["AAPL"] and len(decoder.symbol_ids) == 1
+    assert decoder.num_known_symbols == 1
+    assert decoder.unknown_count == 100
+    event = decoder.decode_event(b"TSLA,2.0,2025-10-01 09:30:00")
+    assert event.symbol_id == UNKNOWN_SYMBOL_ID and event.symbol == ''
+
+
+def test_decoder_invalid_timestamp_uses_clock():
+    decoder = MarketDataDecoder(["AAPL"], clock=lambda: 42.0)
+    _, _, timestamp = decoder.decode(b"AAPL,1.0,1234567890.1")
+    assert timestamp == 42.0
+
+
+@pytest.mark.parametrize("message", [b"AAPL,172.53", b",1.0,2025-10-01 09:30:00", b"AAPL,abc,2025-10-01 09:30:00"])
+def test_decoder_rejects_malformed_messages(message):
+    decoder = MarketDataDecoder(["AAPL"])
+    with pytest.raises(ValueError):
+        decoder.decode(message)
+
+
+def test_decoder_decode_buffer():
+    decoder = MarketDataDecoder(["AAPL", "MSFT"])
+    errors = []
+    
+    batch = decoder.decode_buffer(
+        b"AAPL,1.5,2025-10-01 09:30:00*bad*MSFT,2.5,2025-10-01 09:30:01*AAPL,3.5,2025-10-01",
+        on_error=lambda message, error: errors.append(message),
+    )
+    
+    np.testing.assert_array_equal(batch.symbol_ids, [0, 1])
+    np.testing.assert_array_equal(batch.prices, [1.5, 2.5])
+    assert batch.timestamps[1] - batch.timestamps[0] == 1.0
+    assert batch.origin_ns is None
+    assert errors == [b"bad"]
+
+
+def test_decoder_decode_batch_keeps_origins_aligned():
+    decoder = MarketDataDecoder(["AAPL", "MSFT"])
+    batch = decoder.decode_batch(
+        [b"AAPL,1.5,2025-10-01 09:30:00", b"bad", b"MSFT,2.5,2025-10-01 09:30:01"],
+        origins=[10, 20, 30],
+    )
+    
+    np.testing.assert_array_equal(batch.origin_ns, [10, 30])
+    assert [event.origin_ns for event in decoder.iter_events(batch)] == [10, 30]
+
+
+def test_market_data_decode_event_reuses_instance():
+    decoder = MarketDataDecoder(["AAPL", "MSFT"])
+    first = decoder.decode_event(b"AAPL,1.0,2025-10-01 09:30:00")
+    assert (first.symbol_id, first.symbol, first.price) == (0, "AAPL", 1.0)
+    
+    second = decoder.decode_event(b"MSFT,2.0,2025-10-01 09:30:00")
+    assert second is first
+    assert (second.symbol_id, second.symbol, second.price) == (1, "MSFT", 2.0)
+
+
+def test_market_data_iter_events():
+    decoder = MarketDataDecoder(["AAPL", "MSFT"])
+    batch = decoder.decode_batch([b"AAPL,1.0,2025-10-01 09:30:00", b"MSFT,2.0,2025-10-01 09:30:00"])
+    assert [(event.symbol, event.price) for event in decoder.iter_events(batch)] == [("AAPL", 1.0), ("MSFT", 2.0)]
+
+
+def test_news_decoder():
+    decoder = NewsDecoder()
+    assert decoder.decode(b"MSFT,25") == ("MSFT", 25)
+    
+    event = decoder.decode_event(b" AAPL , 75 ")
+    assert (event.symbol, event.sentiment) == ("AAPL", 75)
+    
+    errors = []
+    batch = decoder.decode_batch([b"MSFT,25", b"Hi", b"ABCD,1000"], on_error=lambda m, e: errors.append(m))
+    assert batch == [("MSFT", 25)]
+    assert errors == [b"Hi", b"ABCD,1000"]
@@ -61,6 +61,10 @@ def test_feed_handler_socket_mapping():
         mock_socket.side_effect = [md_socket, news_socket]
         
         handler = FeedHandler("localhost", 5555, 5556)
+        # Constructor must not touch the network
+        mock_socket.assert_not_called()
+        
+        handler.connect()
         
         assert handler.socket_to_feed_type[md_socket] == "market_data"
         assert handler.socket_to_feed_type[news_socket] == "news"
@@ -83,8 +87,9 @@ def test_feed_handler_listen_calls_subscribers(mock_server):
     server = threading.Thread(target=server_thread, daemon=True)
     server.start()
     
-    # Create handler (will connect to mock server)
+    # Create handler and connect to mock server
     handler = FeedHandler("localhost", port, port)
+    handler.connect()
     
     # Subscribe to market data
     received_data = []
@@ -139,3 +144,213 @@ def test_feed_handler_separate_feeds():
         assert md_callback not in handler.subscribers["news"]
         assert news_callback not in handler.subscribers["market_data"]
 
+
+
+def test_feed_handler_subscribe_batch_invalid_feed():
+    """Test batch subscribing to invalid feed type"""
+    with patch('socket.socket'):
+        handler = FeedHandler("localhost", 5555, 5556)
+        
+        with pytest.raises(ValueError):
+            handler.subscribe_batch(Mock(), "invalid_feed_type")
+
+
+def test_feed_handler_listen_delivers_batches():
+    """Test that one read is delivered as one batch, with partial messages carried over"""
+    with patch('socket.socket') as mock_socket:
+        md_socket = MagicMock()
+        news_socket = MagicMock()
+        mock_socket.side_effect = [md_socket, news_socket]
+        
+        handler = FeedHandler("localhost", 5555, 5556)
+        handler.connect()
+    
+    md_socket.recv.side_effect = [
+        b"AAPL,1.0,t*MSFT,2.0,t*SP",
+        b"Y,3.0,t*",
+        b"",
+    ]
+    
+    batches = []
+    messages = []
+    handler.subscribe_batch(batches.append, "market_data")
+    handler.subscribe(messages.append, "market_data")
+    
+    handler.listen(md_socket)
+    
+    assert batches == [
+        [b"AAPL,1.0,t", b"MSFT,2.0,t"],
+        [b"SPY,3.0,t"],
+    ]
+    # Per-message subscribers still receive delimited messages
+    assert messages == [b"AAPL,1.0,t*", b"MSFT,2.0,t*", b"SPY,3.0,t*"]
+
+
+def test_feed_handler_sequence_gap_reporting():
+    """Test that sequence headers are stripped and gaps are reported"""
+    with patch('socket.socket') as mock_socket:
+        md_socket = MagicMock()
+        news_socket = MagicMock()
+        mock_socket.side_effect = [md_socket, news_socket]
+        
+        handler = FeedHandler("localhost", 5555, 5556, sequenced=True)
+        handler.connect()
+    
+    md_socket.recv.side_effect = [
+        b"1|AAPL,1.0,t*2|MSFT,2.0,t*",
+        b"5|SPY,3.0,t*6|AAPL,4.0,t*",
+        b"",
+    ]
+    
+    gaps = []
+    batches = []
+    handler.set_gap_listener(lambda *args: gaps.append(args))
+    handler.subscribe_batch(batches.append, "market_data")
+    
+    handler.listen(md_socket)
+    
+    assert batches == [
+        [b"AAPL,1.0,t", b"MSFT,2.0,t"],
+        [b"SPY,3.0,t", b"AAPL,4.0,t"],
+    ]
+    assert gaps == [("market_data", 3, 5, 2)]
+    assert handler.missed_messages["market_data"] == 2
+    assert handler.expected_sequence["market_data"] == 7
+
+
+def test_feed_handler_traced_headers_carry_origin():
+    """Test that traced headers are stripped and origins reach decoded batches"""
+    from OrderBook.decoder import MarketDataDecoder
+    
+    with patch('socket.socket') as mock_socket:
+        md_socket = MagicMock()
+        news_socket = MagicMock()
+        mock_socket.side_effect = [md_socket, news_socket]
+        
+        decoder = MarketDataDecoder(["AAPL", "MSFT"])
+        handler = FeedHandler("localhost", 5555, 5556, traced=True,
+                              decoders={"market_data": decoder})
+        handler.connect()
+    
+    md_socket.recv.side_effect = [
+        b"1,100|AAPL,1.0,2024-01-01 09:30:00*2,200|MSFT,2.0,2024-01-01 09:30:01*",
+        b"",
+    ]
+    
+    batches = []
+    handler.subscribe_batch(batches.append, "market_data")
+    
+    handler.listen(md_socket)
+    
+    assert len(batches) == 1
+    assert list(batches[0].symbol_ids) == [0, 1]
+    assert list(batches[0].origin_ns) == [100, 200]
+    assert handler.expected_sequence["market_data"] == 3
+    assert handler.last_received_ns["market_data"] > 0
+
+
+def test_feed_handler_subscriber_error_does_not_stop_listen():
+    """Test that an exception in a subscriber does not end the feed loop"""
+    with patch('socket.socket') as mock_socket:
+        md_socket = MagicMock()
+        news_socket = MagicMock()
+        mock_socket.side_effect = [md_socket, news_socket]
+        
+        handler = FeedHandler("localhost", 5555, 5556)
+        handler.connect()
+    
+    md_socket.recv.side_effect = [b"bad*", b"good*", b""]
+    
+    received = []
+    def callback(data):
+        if data == b"bad*":
+            raise RuntimeError("boom")
+        received.append(data)
+    
+    handler.subscribe(callback, "market_data")
+    handler.listen(md_socket)
+    
+    assert received == [b"good*"]
+
+
+def test_feed_handler_reconnects_after_disconnect():
+    """Test that run() reconnects after the Gateway drops the connection"""
+    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server_socket.bind(('localhost', 0))
+    server_socket.listen(4)
+    port = server_socket.getsockname()[1]
+    
+    # Only the market data feed is exercised; news points at a closed port
+    closed = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    closed.bind(('localhost', 0))
+    news_port = closed.getsockname()[1]
+    closed.close()
+    
+    handler = FeedHandler("localhost", port, news_port, backoff_initial=0.01, backoff_max=0.05)
+    received = []
+    disconnects = []
+    reconnects = []
+    handler.subscribe(received.append, "market_data")
+    handler.set_disconnect_listener(disconnects.append)
+    handler.set_reconnect_listener(reconnects.append)
+    
+    try:
+        handler.run()
+        
+        server_socket.settimeout(2.0)
+        first, _ = server_socket.accept()
+        first.sendall(b"AAPL,1.0,t*")
+        time.sleep(0.1)
+        first.close()  # Simulate Gateway going away
+        
+        second, _ = server_socket.accept()
+        second.sendall(b"MSFT,2.0,t*")
+        time.sleep(0.1)
+        
+        assert received == [b"AAPL,1.0,t*", b"MSFT,2.0,t*"]
+        assert "market_data" in disconnects
+        assert reconnects == ["market_data"]
+        second.close()
+    finally:
+        handler.shutdown()
+        server_socket.close()
+
+
+def test_feed_handler_decodes_each_message_once():
+    """Test that a feed decoder runs once per message and subscribers get typed events"""
+    from OrderBook.decoder import MarketDataDecoder
+    from OrderBook.events import MarketDataEvent
+
+    with patch('socket.socket') as mock_socket:
+        md_socket = MagicMock()
+        news_socket = MagicMock()
+        mock_socket.side_effect = [md_socket, news_socket]
+        
+        decoder = MarketDataDecoder(["AAPL", "MSFT"])
+        handler = FeedHandler("localhost", 5555, 5556, decoders={"market_data": decoder})
+        handler.connect()
+    
+    md_socket.recv.side_effect = [
+        b"AAPL,1.0,2025-10-01 09:30:00*bad*MSFT,2.0,2025-10-01 09:30:01*",
+        b"",
+    ]
+    
+    first, second, batches = [], [], []
+    handler.subscribe(lambda event: first.append((event.symbol, event.price)), "market_data")
+    handler.subscribe(lambda event: second.append(type(event)), "market_data")
+    handler.subscribe_batch(batches.append, "market_data")
+    
+    with patch.object(decoder, 'decode', wraps=decoder.decode) as decode:
+        handler.listen(md_socket)
+    
+    assert decode.call_count == 3  # Once per message, not once per subscriber
+    assert first == [("AAPL", 1.0), ("MSFT", 2.0)]
+    assert second == [MarketDataEvent, MarketDataEvent]
+    assert len(batches) == 1
+    assert batches[0].symbol_ids.tolist() == [0, 1]
+
+
+def test_feed_handler_set_decoder_invalid_feed():
+    with pytest.raises(ValueError):
+        FeedHandler("localhost", 5555, 5556).set_decoder("invalid_feed_type", Mock())
@@ -0,0 +1,138 @@
+import random
+
+import pytest
+
+from OrderBook.limit_order_book import LimitOrderBook
+
+
+def test_empty_book():
+    book = LimitOrderBook("AAPL")
+    assert book.best_bid() is None
+    assert book.best_ask() is None
+    assert book.spread() is None
+    assert book.best_bid_quantity() == 0
+    assert book.depth() == {"bids": [], "asks": []}
+
+
+def test_add_tracks_best_prices_and_levels():
+    book = LimitOrderBook("AAPL")
+    book.add(1, "BUY", 100.0, 10)
+    book.add(2, "BUY", 101.0, 5)
+    book.add(3, "BUY", 100.0, 7)
+    book.add(4, "SELL", 103.0, 4)
+    book.add(5, "SELL", 102.0, 6)
+    
+    assert book.best_bid() == 101.0
+    assert book.best_ask() == 102.0
+    assert book.spread() == 1.0
+    assert book.depth() == {
+        "bids": [(101.0, 5, 1), (100.0, 17, 2)],
+        "asks": [(102.0, 6, 1), (103.0, 4, 1)],
+    }
+    assert book.depth(levels=1)["bids"] == [(101.0, 5, 1)]
+
+
+def test_cancel_removes_empty_levels():
+    book = LimitOrderBook("AAPL")
+    book.add(1, "BUY", 100.0, 10)
+    book.add(2, "BUY", 101.0, 5)
+    book.add(3, "BUY", 99.0, 1)
+    
+    assert book.cancel(2) == 5
+    assert book.best_bid() == 100.0
+    
+    assert book.cancel(3) == 1
+    assert book.depth()["bids"] == [(100.0, 10, 1)]
+    assert len(book) == 1
+    
+    with pytest.raises(KeyError):
+        book.cancel(2)
+
+
+def test_modify_quantity_and_price():
+    book = LimitOrderBook("AAPL")
+    book.add(1, "SELL", 102.0, 10)
+    book.add(2, "SELL", 102.0, 5)
+    
+    book.modify(1, quantity=4)
+    assert book.depth()["asks"] == [(102.0, 9, 2)]
+    
+    book.modify(2, price=101.5)
+    assert book.best_ask() == 101.5
+    assert book.depth()["asks"] == [(101.5, 5, 1), (102.0, 4, 1)]
+    
+    book.modify(2, quantity=0)
+    assert book.depth()["asks"] == [(102.0, 4, 1)]
+
+
+@pytest.mark.parametrize("args", [
+    (1, "BUY", 100.0, 0),
+    (1, "BUY", 0.0, 10),
+    (1, "HOLD", 100.0, 10),
+])
+def test_add_rejects_invalid_orders(args):
+    with pytest.raises(ValueError):
+        LimitOrderBook("AAPL").add(*args)
+
+
+def test_add_rejects_duplicate_ids():
+    book = LimitOrderBook("AAPL")
+    book.add(1, "BUY", 100.0, 10)
+    with pytest.raises(ValueError, match="Duplicate"):
+        book.add(1, "SELL", 101.0, 10)
+
+
+def test_random_operations_match_naive_aggregation():
+    """Compare L2 levels against a recomputation from the live orders"""
+    rng = random.Random(0)
+    book = LimitOrderBook("AAPL")
+    live = {}
+    for order_id in range(5000):
+        action = rng.random()
+        if live and action < 0.35:
+            victim = rng.choice(list(live))
+            book.cancel(victim)
+            del live[victim]
+        elif live and action < 0.5:
+            target = rng.choice(list(live))
+            side, _, _ = live[target]
+            price = rng.randint(90, 110) * 1.0
+            quantity = rng.randint(1, 50)
+            book.modify(target, quantity=quantity, price=price)
+            live[target] = (side, price, quantity)
+        else:
+            side = rng.choice(["BUY", "SELL"])
+            price = rng.randint(90, 110) * 1.0
+            quantity = rng.randint(1, 50)
+            book.add(order_id, side, price, quantity)
+            live[order_id] = (side, price, quantity)
+    
+    for side, label, reverse in [("BUY", "bids", True), ("SELL", "asks", False)]:
+        expected = {}
+        for order_side, price, quantity in live.values():
+            if order_side == side:
+                total, count = expected.get(price, (0, 0))
+                expected[price] = (total + quantity, count + 1)
+        expected_levels = [(price, *expected[price]) for price in sorted(expected, reverse=reverse)]
+        assert book.depth(levels=None)[label] == expected_levels
+
+
+def test_best_prices_stay_correct_with_lazily_removed_levels():
+    """Levels are emptied and refilled at random, so stale heap entries and rebuilds are exercised"""
+    rng = random.Random(1)
+    book = LimitOrderBook("AAPL")
+    live = {}
+    for order_id in range(20000):
+        if live and rng.random() < 0.5:
+            victim = rng.choice(list(live))
+            book.cancel(victim)
+            del live[victim]
+        else:
+            side = rng.choice(["BUY", "SELL"])
+            live[order_id] = (side, rng.randint(1, 500) * 1.0)
+            book.add(order_id, side, live[order_id][1], 1)
+        bids = [price for side, price in live.values() if side == "BUY"]
+        asks = [price for side, price in live.values() if side == "SELL"]
+        assert book.best_bid() == (max(bids) if bids else None)
+        assert book.best_ask() == (min(asks) if asks else None)
+        assert len(book.bids.heap) <= 2 * len(book.bids.quantity) + 17
@@ -27,11 +27,18 @@ def test_order_book_init(mock_price_book, mock_feed_handler, mock_config):
     mock_feed_handler.assert_called_once_with(
         mock_config["host"],
         mock_config["md_port"],
-        mock_config["news_port"]
+        mock_config["news_port"],
+        sequenced=False,
+        logger=order_book.logger,
+        decoders={"market_data": order_book.decoder},
+        traced=False,
+        latency_recorder=order_book.latency
     )
     
     # Verify subscription
-    order_book.feed_handler.subscribe.assert_called_once()
+    order_book.feed_handler.subscribe_batch.assert_called_once_with(
+        order_book.on_market_data_batch, "market_data"
+    )
 
 
 @patch('OrderBook.order_book.FeedHandler')
@@ -132,3 +139,36 @@ def test_order_book_on_market_data_malformed(mock_feed_handler, mock_config):
         book.close()
         book.unlink()
 
+
+
+@patch('OrderBook.order_book.FeedHandler')
+def test_order_book_on_market_data_batch(mock_feed_handler, mock_config):
+    """Test processing a batch of market data messages in one publish"""
+    book = SharedPriceBook(mock_config["symbols"], name="test_ob_batch", create=True)
+    
+    try:
+        with patch('OrderBook.order_book.SharedPriceBook', return_value=book):
+            order_book = OrderBook(mock_config)
+            
+            batch = order_book.decoder.decode_batch([
+                b"AAPL,172.53,2025-10-01 09:30:00",
+                b"MSFT,325.20,2025-10-01 09:30:00",
+                b"garbage data",
+                b"UNKNOWN,1.00,2025-10-01 09:30:00",
+                b"AAPL,173.00,2025-10-01 09:30:01",
+            ])
+            order_book.on_market_data_batch(batch)
+            
+            # Latest update per symbol wins, malformed and unknown messages are skipped
+            aapl_price, aapl_ts = book.read("AAPL")
+            msft_price, _ = book.read("MSFT")
+            goog_price, _ = book.read("GOOG")
+            
+            assert aapl_price == 173.00
+            assert aapl_ts > 0
+            assert msft_price == 325.20
+            assert goog_price == 0.0
+            assert order_book.update_count == 3
+    finally:
+        book.close()
+        book.unlink()
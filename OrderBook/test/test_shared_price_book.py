@@ -192,3 +192,42 @@ def test_shared_price_book_close_twice():
         # Unlink still works after close
         book.unlink()
 
+
+
+def test_shared_price_book_update_many():
+    """Test bulk updates keep the latest value per symbol"""
+    symbols = ["AAPL", "MSFT", "GOOG"]
+    book = SharedPriceBook(symbols, name="test_update_many", create=True)
+    
+    try:
+        book.update_many([0, 1, 0], [170.0, 320.0, 171.0], [1.0, 2.0, 3.0])
+        
+        assert book.read("AAPL") == (171.0, 3.0)
+        assert book.read("MSFT") == (320.0, 2.0)
+        assert book.read("GOOG") == (0.0, 0.0)
+        
+        # Empty batch is a no-op
+        book.update_many([], [], [])
+        assert book.read("AAPL") == (171.0, 3.0)
+    finally:
+        book.close()
+        book.unlink()
+
+
+def test_shared_price_book_read_traced():
+    """Test traced books carry origin and publish times"""
+    symbols = ["AAPL", "MSFT"]
+    book = SharedPriceBook(symbols, name="test_read_traced", create=True, traced=True)
+    
+    try:
+        assert book.read_traced("AAPL") == (0.0, 0.0, 0, 0)
+        
+        book.update_many([0], [170.0], [1.0], origin_ns=[12345])
+        price, timestamp, origin_ns, publish_ns = book.read_traced("AAPL")
+        
+        assert (price, timestamp, origin_ns) == (170.0, 1.0, 12345)
+        assert publish_ns > 0
+        assert book.read("AAPL") == (170.0, 1.0)
+    finally:
+        book.close()
+        book.unlink()
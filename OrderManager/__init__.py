@@ -1,4 +1,4 @@
 # Re-export from models for convenience
-from OrderManager.models import Order, Side
+from OrderManager.models import ExecType, ExecutionReport, Order, Side, ORDER_SIZE
 
-__all__ = ['Order', 'Side']
\ No newline at end of file
+__all__ = ['Order', 'Side', 'ORDER_SIZE', 'ExecType', 'ExecutionReport']
\ No newline at end of file
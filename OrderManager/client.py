@@ -1,62 +1,342 @@
+from collections import deque
+from concurrent.futures import Future
+import itertools
+import os
 import socket
+import threading
 import time
-from OrderManager import Order
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from backoff import ExponentialBackoff
+from OrderManager import ExecType, ExecutionReport, Order, Side
+from OrderManager.framing import OrderFramer
+from OrderManager.models import logon_message
+from OrderManager.order_store import TERMINAL_STATUSES
 
 from logger import setup_logger
 
+RECV_BUFFER_SIZE = 65536
+
 class OrderManagerClient:
-    """Client for sending orders to OrderManager"""
-    def __init__(self, host: str, port: int):
+    """Client for sending orders to OrderManager.
+
+    Every order is tagged with a client order id. A background reader thread
+    consumes the server's execution reports, resolves the order's Future on
+    its ACK or REJECT and passes every report to the execution listener, so
+    many orders can be in flight without waiting on each round trip.
+
+    By default each order is written with one ``sendall``. With
+    ``buffered=True`` orders are appended to an outgoing queue instead and a
+    writer thread sends everything queued in one write once ``flush_bytes``
+    are pending or every ``flush_interval`` seconds (``low_latency=True``
+    flushes on every call). The writer reconnects with backoff when the
+    connection drops; up to ``max_queued_orders`` unsent orders are kept and
+    sent on the new connection, and orders beyond that are refused.
+
+    ``order_ids`` maps live orders' client ids to server ids; entries are
+    dropped on any terminal report, and the oldest beyond
+    ``max_tracked_orders`` are evicted.
+
+    With ``account`` every connection starts with a logon, so the server keeps
+    risk limits and positions under that id across reconnects (otherwise it
+    uses the client's host).
+    """
+    def __init__(self, host: str, port: int, buffered: bool = False, flush_bytes: int = 16384,
+                 flush_interval: float = 0.001, low_latency: bool = False, max_queued_orders: int = 10_000,
+                 backoff_initial: float = 0.1, backoff_max: float = 5.0, max_tracked_orders: int = 100_000,
+                 account: Optional[str] = None):
         self.logger = setup_logger("order_manager_client")
         self.host = host
         self.port = port
         self.connected = False
+        self.socket = None
+        self.buffered = buffered
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.low_latency = low_latency
+        self.max_queued_orders = max_queued_orders
+        self.max_tracked_orders = max_tracked_orders
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self._logon = logon_message(account) if account is not None else None
+
+        # Client order ids are unique per client instance: "<pid>-<counter>"
+        self._id_prefix = f"{os.getpid()}-"
+        self._id_counter = itertools.count(1)
+        self.pending: Dict[str, Future] = {}  # client_order_id -> Future[ExecutionReport], until ACK/REJECT
+        self.order_ids: Dict[str, str] = {}   # client_order_id -> server order_id, live orders, oldest first
+        self._pending_lock = threading.Lock()
+        self._execution_listener: Optional[Callable[[ExecutionReport], None]] = None
+        self._reader: Optional[threading.Thread] = None
 
+        # Buffered mode: encoded orders not yet written, oldest first
+        self._outgoing: Deque[Tuple[str, bytes]] = deque()
+        self._outgoing_bytes = 0
+        self._outgoing_lock = threading.Lock()
+        self._write_lock = threading.Lock()  # Serializes flushes from the writer and low-latency callers
+        self._flush_event = threading.Event()
+        self._closing = threading.Event()
+        self._writer: Optional[threading.Thread] = None
 
     def connect(self):
+        """Connect once; in buffered mode the writer thread keeps reconnecting after a failure"""
+        self._closing.clear()
+        connected = self._open_socket()
+        if self.buffered and self._writer is None:
+            self._writer = threading.Thread(target=self._run_writer, name="order_client_writer", daemon=True)
+            self._writer.start()
+        return connected
+
+    def _open_socket(self) -> bool:
+        client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.connect((self.host, self.port))
-            self.logger.info(f"Connected to OrderManager at {self.host}:{self.port}")
-            self.connected = True
+            client_socket.connect((self.host, self.port))
+            if self._logon is not None:
+                client_socket.sendall(self._logon)
         except Exception as e:
+            client_socket.close()
             self.logger.error(f"Error connecting to OrderManager: {e}")
             return False
+        self.socket = client_socket
+        self.connected = True
+        self.logger.info(f"Connected to OrderManager at {self.host}:{self.port}")
+        self._reader = threading.Thread(target=self._read_reports, args=(client_socket,), daemon=True)
+        self._reader.start()
         return True
 
-    def place_order(self, symbol: str, side: str, quantity: int, price: float) -> bool:
+    def set_execution_listener(self, callback: Callable[[ExecutionReport], None]):
+        """Call ``callback(report)`` for every ACK, FILL and REJECT (from the reader thread)"""
+        self._execution_listener = callback
+
+    def next_client_order_id(self) -> str:
+        return self._id_prefix + str(next(self._id_counter))
+
+    def place_order(self, symbol: str, side: str, quantity: int, price: float, origin_ns: int = 0) -> bool:
+        return self.submit_order(symbol, side, quantity, price, origin_ns) is not None
+
+    def place_orders(self, orders: Iterable[Tuple[str, str, int, float]]) -> List[Optional[Future]]:
+        """Send many ``(symbol, side, quantity, price)`` orders in one write (or one enqueue).
+
+        Returns a Future per order, None for orders that could not be sent or queued.
+        """
+        built = []
+        timestamp = time.time()
+        for symbol, side, quantity, price in orders:
+            try:
+                built.append(Order(symbol=symbol, side=Side(side.upper()), quantity=quantity,
+                                   price=price, timestamp=timestamp))
+            except Exception as e:
+                self.logger.error(f"Error placing order: {e}")
+                built.append(None)
+        sent = iter(self.send_orders_async([order for order in built if order is not None]))
+        return [None if order is None else next(sent) for order in built]
+
+    def submit_order(self, symbol: str, side: str, quantity: int, price: float,
+                     origin_ns: int = 0) -> Optional[Future]:
+        """Send an order and return a Future resolved with its ACK or REJECT report (None if not sent)"""
         try:
-            from OrderManager import Side
             order = Order(
                 symbol=symbol,
                 side=Side(side.upper()),
                 quantity=quantity,
                 price=price,
-                timestamp=time.time()
+                timestamp=time.time(),
+                origin_ns=origin_ns
             )
-            return self.send_order(order)
+            return self.send_order_async(order)
         except Exception as e:
             self.logger.error(f"Error placing order: {e}")
-            return False
+            return None
 
     def send_order(self, order: Order) -> bool:
-        if not self.connected:
+        return self.send_order_async(order) is not None
+
+    def send_order_async(self, order: Order) -> Optional[Future]:
+        """Send ``order`` (assigning a client order id if it has none) without waiting for a reply"""
+        return self.send_orders_async([order])[0]
+
+    def send_orders_async(self, orders: List[Order]) -> List[Optional[Future]]:
+        """Send ``orders`` with a single write (unbuffered) or enqueue them together (buffered)"""
+        if not orders:
+            return []
+        if not self.connected and not self.buffered:
             self.logger.error("Not connected to OrderManager")
-            return False
+            return [None] * len(orders)
+        futures: List[Optional[Future]] = [Future() for _ in orders]
+        with self._pending_lock:
+            for order, future in zip(orders, futures):
+                if order.client_order_id is None:
+                    order.client_order_id = self.next_client_order_id()
+                self.pending[order.client_order_id] = future
+        if self.buffered:
+            return self._enqueue(orders, futures)
+
         try:
-            message = order.to_bytes()
-            self.socket.sendall(message)
-            self.logger.info(f"Sent order: {order}")
-            return True
+            self.socket.sendall(b''.join(self._encode(order) for order in orders))
+            self.logger.debug("Sent %d order(s)", len(orders))
+            return futures
         except Exception as e:
             self.logger.error(f"Error sending order: {e}")
             self.connected = False
-            return False
+            with self._pending_lock:
+                for order in orders:
+                    self.pending.pop(order.client_order_id, None)
+            return [None] * len(orders)
+
+    @staticmethod
+    def _encode(order: Order) -> bytes:
+        if order.origin_ns:
+            order.sent_ns = time.monotonic_ns()
+        return order.to_bytes()
+
+    def _enqueue(self, orders: List[Order], futures: List[Optional[Future]]) -> List[Optional[Future]]:
+        refused = []
+        with self._outgoing_lock:
+            for i, order in enumerate(orders):
+                if len(self._outgoing) >= self.max_queued_orders:
+                    refused.append(order.client_order_id)
+                    futures[i] = None
+                    continue
+                message = self._encode(order)
+                self._outgoing.append((order.client_order_id, message))
+                self._outgoing_bytes += len(message)
+            full = self._outgoing_bytes >= self.flush_bytes
+        if refused:
+            self.logger.warning("Outgoing order queue full (%d), refused %d order(s)",
+                                self.max_queued_orders, len(refused))
+            with self._pending_lock:
+                for client_order_id in refused:
+                    self.pending.pop(client_order_id, None)
+        if self.low_latency and self.connected:
+            self.flush()
+        elif full:
+            self._flush_event.set()
+        return futures
+
+    @property
+    def queued_orders(self) -> int:
+        """Buffered mode: orders accepted but not yet written to the socket"""
+        return len(self._outgoing)
+
+    def flush(self) -> bool:
+        """Write every queued order now; returns False if the connection failed"""
+        with self._write_lock:
+            with self._outgoing_lock:
+                if not self._outgoing:
+                    return True
+                batch = list(self._outgoing)
+            client_socket = self.socket
+            if not self.connected or client_socket is None:
+                return False
+            payload = memoryview(b''.join(message for _, message in batch))
+            written = 0
+            try:
+                while written < len(payload):
+                    written += client_socket.send(payload[written:])
+            except OSError as e:
+                self.logger.error(f"Error sending orders: {e}")
+                self._on_connection_lost(client_socket)
+            finally:
+                # Drop the orders that were written whole; a partly written one is resent
+                # in full on the next connection (the server discards the torn frame)
+                with self._outgoing_lock:
+                    for _, message in batch:
+                        if written < len(message):
+                            break
+                        written -= len(message)
+                        self._outgoing.popleft()
+                        self._outgoing_bytes -= len(message)
+            return self.connected
+
+    def _run_writer(self):
+        backoff = ExponentialBackoff(self.backoff_initial, self.backoff_max)
+        while not self._closing.is_set():
+            if not self.connected:
+                if not self._open_socket():
+                    delay = backoff.next_delay()
+                    self.logger.warning(f"Reconnecting to OrderManager in {delay:.2f}s "
+                                        f"({len(self._outgoing)} order(s) queued)")
+                    self._closing.wait(delay)
+                    continue
+                backoff.reset()
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            self.flush()
 
+    def _read_reports(self, client_socket: socket.socket):
+        framer = OrderFramer()
+        try:
+            while True:
+                data = client_socket.recv(RECV_BUFFER_SIZE)
+                if not data:
+                    break
+                for frame in framer.feed(data):
+                    try:
+                        self._on_report(ExecutionReport.from_bytes(frame))
+                    except Exception as e:
+                        self.logger.error(f"Error handling execution report: {e}")
+                if framer.error is not None:
+                    self.logger.error(f"Closing connection: {framer.error}")
+                    break
+        except OSError as e:
+            if self.connected:
+                self.logger.error(f"Error reading execution reports: {e}")
+        finally:
+            self._on_connection_lost(client_socket)
+
+    def _on_connection_lost(self, client_socket: socket.socket):
+        if self.socket is not client_socket:
+            return  # Already replaced by a reconnect
+        self.connected = False
+        try:
+            client_socket.close()
+        except OSError:
+            pass
+        # Orders still queued are resent on the next connection; written ones can get no reports
+        with self._outgoing_lock:
+            queued = {client_order_id for client_order_id, _ in self._outgoing}
+        self._fail_pending(ConnectionError("Connection to OrderManager closed"), keep=queued)
+
+    def _on_report(self, report: ExecutionReport):
+        future = None
+        with self._pending_lock:
+            if report.exec_type is not ExecType.FILL:
+                future = self.pending.pop(report.client_order_id, None)
+            if (report.status in TERMINAL_STATUSES or report.exec_type is ExecType.REJECT
+                    or (report.exec_type is ExecType.FILL and report.leaves_quantity == 0)):
+                self.order_ids.pop(report.client_order_id, None)
+            elif report.exec_type is ExecType.ACK:
+                order_ids = self.order_ids
+                order_ids[report.client_order_id] = report.order_id
+                if len(order_ids) > self.max_tracked_orders:
+                    del order_ids[next(iter(order_ids))]
+        if future is not None:
+            future.set_result(report)
+        if self._execution_listener is not None:
+            self._execution_listener(report)
+
+    def _fail_pending(self, error: Exception, keep=frozenset()):
+        with self._pending_lock:
+            failed = [client_order_id for client_order_id in self.pending if client_order_id not in keep]
+            futures = [self.pending.pop(client_order_id) for client_order_id in failed]
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
 
     def disconnect(self):
-        """Disconnect from OrderManager"""
+        """Disconnect from OrderManager (flushing queued orders first in buffered mode)"""
+        self._closing.set()
+        if self._writer is not None:
+            self._flush_event.set()
+            self._writer.join(timeout=1.0)
+            self._writer = None
+            self.flush()
         if self.socket:
+            try:
+                self.connected = False
+                self.socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             try:
                 self.socket.close()
                 self.logger.info("Disconnected from OrderManager")
@@ -64,4 +344,4 @@ class OrderManagerClient:
                 pass
             finally:
                 self.connected = False
-                self.socket = None
\ No newline at end of file
+                self.socket = None
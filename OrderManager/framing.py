@@ -0,0 +1,47 @@
+from typing import List, Optional
+
+# Largest partial order kept while waiting for its delimiter; a longer
+# unterminated frame means the peer is not speaking the order protocol
+MAX_FRAME_SIZE = 4096
+
+
+class OrderFramer:
+    """Reassembles delimiter-framed orders from one connection's byte stream.
+
+    TCP delivers a byte stream, so a single recv can hold several orders or
+    only part of one. ``feed`` returns every order completed by the chunk
+    and carries the trailing partial order over to the next call.
+
+    If the partial order grows past ``max_frame_size``, ``feed`` still
+    returns the orders completed before it, drops the partial order and
+    sets ``error``; the caller should then close the connection, and any
+    further ``feed`` raises ValueError.
+    """
+
+    def __init__(self, delimiter: bytes = b'*', max_frame_size: int = MAX_FRAME_SIZE):
+        self.delimiter = delimiter
+        self.max_frame_size = max_frame_size
+        self.buffer = b''
+        self.error: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Append ``chunk`` and return the complete frames (without delimiters)"""
+        if self.error is not None:
+            raise ValueError(self.error)
+        if self.delimiter not in chunk:
+            self.buffer += chunk
+            frames = []
+        else:
+            # Split once; the trailing element is the partial frame (or b'')
+            frames = (self.buffer + chunk).split(self.delimiter)
+            self.buffer = frames.pop()
+            frames = [frame for frame in frames if frame]  # Skip empty frames
+        if len(self.buffer) > self.max_frame_size:
+            self.error = f"Unterminated order frame of {len(self.buffer)} bytes exceeds {self.max_frame_size}"
+            self.buffer = b''
+        return frames
+
+    @property
+    def pending(self) -> int:
+        """Bytes of an incomplete frame waiting for more data"""
+        return len(self.buffer)
@@ -0,0 +1,388 @@
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from logger import setup_logger
+from OrderManager.matching_engine import BookOrder, Fill
+from OrderManager.models import Side
+from trading_lib.models import OrderStatus
+
+# File layout: MAGIC, then records of
+#   header: body length u32, crc32(body) u32
+#   body:   record type u8, fixed fields, then u16-length-prefixed UTF-8 strings
+MAGIC = b'OMJ1'
+RECORD_HEADER = struct.Struct('<II')
+RECORD_ORDER = 1
+RECORD_FILL = 2
+RECORD_CANCEL = 3
+# Written by compaction: the id high-water mark, then one record per open order
+RECORD_CHECKPOINT = 4
+RECORD_OPEN = 5
+# side u8, quantity u32, price f64, timestamp f64
+_ORDER_FIELDS = struct.Struct('<BIdd')
+_FILL_FIELDS = _ORDER_FIELDS
+# Open order: the order fields plus filled quantity u32
+_OPEN_FIELDS = struct.Struct('<BIddI')
+_CHECKPOINT_FIELDS = struct.Struct('<Q')
+_STRING_LENGTH = struct.Struct('<H')
+
+_SIDES = (Side.BUY, Side.SELL)
+_SIDE_CODES = {Side.BUY: 0, Side.SELL: 1}
+
+
+def _pack_strings(*values: str) -> bytes:
+    parts = []
+    for value in values:
+        encoded = value.encode('utf-8')
+        parts.append(_STRING_LENGTH.pack(len(encoded)))
+        parts.append(encoded)
+    return b''.join(parts)
+
+
+def _record(body: bytes) -> bytes:
+    return RECORD_HEADER.pack(len(body), zlib.crc32(body)) + body
+
+
+def _write_all(fd: int, data) -> None:
+    """``os.write`` until every byte is written; it may write less than asked"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _unpack_strings(buffer, offset: int, count: int) -> Tuple[str, ...]:
+    """Decode ``count`` strings; trailing ones missing from older records read as ''"""
+    values = []
+    for _ in range(count):
+        if offset >= len(buffer):
+            values.append("")
+            continue
+        (length,) = _STRING_LENGTH.unpack_from(buffer, offset)
+        offset += _STRING_LENGTH.size
+        values.append(buffer[offset:offset + length].decode('utf-8'))
+        offset += length
+    return tuple(values)
+
+
+class Journal:
+    """Append-only binary write-ahead journal of order and execution events.
+
+    Appends only copy into an in-memory buffer, so they are safe under the
+    server's matching lock. The buffer is written and fsynced as a group by a
+    background thread every ``fsync_interval`` seconds or as soon as
+    ``fsync_batch`` records are pending, or by ``commit`` (the server commits
+    once per batch of orders, before sending their reports). Concurrent
+    committers share one fsync: the first becomes the leader and the others
+    wait for it, so throughput is not bounded by one disk flush per order.
+
+    ``compact`` replaces the file with a checkpoint of the open orders, so the
+    journal (and recovery time) does not grow with the whole order history;
+    the server compacts on clean shutdown.
+
+    A failed write or fsync truncates the file back to the last durable
+    record and fails the journal: every later append and commit raises, so
+    nothing is acknowledged that is not on disk.
+    """
+
+    def __init__(self, path: str, fsync_batch: int = 512, fsync_interval: float = 0.005):
+        self.logger = setup_logger("order_journal")
+        self.path = path
+        self.fsync_batch = fsync_batch
+        self.fsync_interval = fsync_interval
+
+        if os.path.exists(path) and os.path.getsize(path) and not _has_magic(path):
+            raise ValueError(f"{path} exists and is not an order journal")
+        # Drop a torn tail left by a crash so new records follow the last valid one
+        valid_length = scan_valid_length(path)
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        if valid_length < len(MAGIC):
+            os.ftruncate(self.fd, 0)
+            os.write(self.fd, MAGIC)
+            os.fsync(self.fd)
+        else:
+            os.ftruncate(self.fd, valid_length)
+        self._offset = os.lseek(self.fd, 0, os.SEEK_END)  # End of the durable records
+
+        self._buffer = bytearray()
+        self._appended = 0   # Sequence number of the last appended record
+        self._durable = 0    # Sequence number of the last fsynced record
+        self._syncing = False
+        self._lock = threading.Lock()
+        self._synced = threading.Condition(self._lock)
+        self._closed = False
+        self._error: Optional[OSError] = None  # Set once a write or fsync failed
+        self._wakeup = threading.Event()
+        self.fsyncs = 0
+
+        self._flusher = threading.Thread(target=self._flush_periodically, name="journal_flusher", daemon=True)
+        self._flusher.start()
+
+    def _append(self, body: bytes) -> int:
+        record = _record(body)
+        with self._lock:
+            if self._closed:
+                raise ValueError("Journal is closed")
+            self._check_failed()
+            self._buffer += record
+            self._appended += 1
+            sequence = self._appended
+            full = sequence - self._durable >= self.fsync_batch
+        if full:
+            self._wakeup.set()
+        return sequence
+
+    def append_order(self, order: BookOrder, client_order_id: Optional[str] = None) -> int:
+        """Journal an accepted order as submitted (before any fills); returns its sequence number"""
+        return self._append(
+            bytes((RECORD_ORDER,))
+            + _ORDER_FIELDS.pack(_SIDE_CODES[order.side], order.quantity, order.price, order.timestamp)
+            + _pack_strings(order.order_id, client_order_id or order.client_order_id or "", order.symbol,
+                            order.owner or "")
+        )
+
+    def append_fill(self, fill: Fill) -> int:
+        return self._append(
+            bytes((RECORD_FILL,))
+            + _FILL_FIELDS.pack(_SIDE_CODES[fill.aggressor_side], fill.quantity, fill.price, fill.timestamp)
+            + _pack_strings(fill.aggressor_order_id, fill.resting_order_id, fill.symbol)
+        )
+
+    def append_cancel(self, order_id: str) -> int:
+        return self._append(bytes((RECORD_CANCEL,)) + _pack_strings(order_id))
+
+    @property
+    def appended_sequence(self) -> int:
+        return self._appended
+
+    @property
+    def durable_sequence(self) -> int:
+        return self._durable
+
+    @property
+    def failed(self) -> bool:
+        return self._error is not None
+
+    def _check_failed(self):
+        if self._error is not None:
+            raise OSError(f"Journal {self.path} failed: {self._error}") from self._error
+
+    def commit(self, sequence: Optional[int] = None):
+        """Block until every record up to ``sequence`` (default: all appended) is on disk"""
+        with self._lock:
+            if sequence is None:
+                sequence = self._appended
+            while self._durable < sequence:
+                self._check_failed()
+                if self._syncing:
+                    self._synced.wait()  # Follower: the leader's fsync may cover us
+                    continue
+                # Leader: take everything buffered so far, including other threads' records
+                data, self._buffer = self._buffer, bytearray()
+                target = self._appended
+                self._syncing = True
+                self._lock.release()
+                error = None
+                try:
+                    _write_all(self.fd, data)
+                    os.fsync(self.fd)
+                except OSError as e:
+                    error = e
+                    self._rewind()
+                finally:
+                    self._lock.acquire()
+                    self._syncing = False
+                    if error is None:
+                        self._durable = target
+                        self._offset += len(data)
+                        self.fsyncs += 1
+                    else:
+                        self._buffer[:0] = data  # Keep the records; nothing after them is durable either
+                        self._error = error
+                    self._synced.notify_all()
+
+    def _rewind(self):
+        """Drop a partly written group so the file ends at the last durable record"""
+        try:
+            os.ftruncate(self.fd, self._offset)
+            os.lseek(self.fd, self._offset, os.SEEK_SET)
+        except OSError:
+            pass  # The file is unusable anyway; recovery stops at the torn record
+
+    def compact(self, open_orders: Iterable[BookOrder], last_order_id: int):
+        """Atomically replace the journal with a checkpoint and keep appending to the new file.
+
+        The checkpoint holds ``last_order_id`` and each of ``open_orders`` with
+        its fill state, so recovery yields the same open orders and id high-water
+        mark as the full history did. Callers must not append meanwhile (the
+        server compacts under its matching lock).
+        """
+        self.commit()
+        checkpoint = [MAGIC, _record(bytes((RECORD_CHECKPOINT,)) + _CHECKPOINT_FIELDS.pack(last_order_id))]
+        for order in open_orders:
+            checkpoint.append(_record(
+                bytes((RECORD_OPEN,))
+                + _OPEN_FIELDS.pack(_SIDE_CODES[order.side], order.quantity, order.price, order.timestamp,
+                                    order.filled_quantity)
+                + _pack_strings(order.order_id, order.client_order_id or "", order.symbol, order.owner or "")
+            ))
+        temporary = self.path + ".tmp"
+        fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            _write_all(fd, b''.join(checkpoint))
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        with self._lock:
+            os.replace(temporary, self.path)
+            _fsync_directory(self.path)
+            os.close(self.fd)
+            self.fd = os.open(self.path, os.O_RDWR)
+            self._offset = os.lseek(self.fd, 0, os.SEEK_END)
+
+    def _flush_periodically(self):
+        while not self._closed:
+            self._wakeup.wait(self.fsync_interval)
+            self._wakeup.clear()
+            if self._appended > self._durable and not self._closed:
+                try:
+                    self.commit()
+                except OSError as e:
+                    self.logger.error(f"Journal flusher stopped: {e}", exc_info=True)
+                    return
+
+    def close(self):
+        """Commit what is buffered (unless the journal failed) and close the file"""
+        if self._closed:
+            return
+        try:
+            if self._error is None:
+                self.commit()
+        finally:
+            self._closed = True
+            self._wakeup.set()
+            self._flusher.join(timeout=1.0)
+            os.close(self.fd)
+
+
+def _fsync_directory(path: str):
+    """Make a rename of ``path`` durable"""
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def scan_valid_length(path: str) -> int:
+    """Byte length of the journal's valid prefix (0 if missing or not a journal)"""
+    end = len(MAGIC)
+    for _, _, end in _scan(path):
+        pass
+    return end if _has_magic(path) else 0
+
+
+def _has_magic(path: str) -> bool:
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except FileNotFoundError:
+        return False
+
+
+def _scan(path: str) -> Iterator[Tuple[int, bytes, int]]:
+    """Yield (record type, field bytes, end offset) for each intact record.
+
+    Stops at the first truncated or corrupt record: a crash can only tear
+    the tail, so nothing after it was acknowledged.
+    """
+    if not _has_magic(path):
+        return
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= len(MAGIC):
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            offset = len(MAGIC)
+            while offset + RECORD_HEADER.size <= size:
+                length, crc = RECORD_HEADER.unpack_from(mapped, offset)
+                start = offset + RECORD_HEADER.size
+                end = start + length
+                if length == 0 or end > size:
+                    return
+                body = mapped[start:end]  # Records are small; a copy keeps the map closable
+                if zlib.crc32(body) != crc:
+                    return
+                yield body[0], body[1:], end
+                offset = end
+
+
+def replay(path: str) -> Iterator[tuple]:
+    """Decode intact journal records in order.
+
+    Yields ``("order", order_id, client_order_id, symbol, side, quantity, price, timestamp, account)``,
+    ``("fill", aggressor_order_id, resting_order_id, symbol, aggressor_side, quantity, price, timestamp)``,
+    ``("cancel", order_id)``, or from a compacted journal ``("checkpoint", last_order_id)`` and
+    ``("open", order_id, client_order_id, symbol, side, quantity, price, timestamp, account, filled_quantity)``.
+    """
+    for record_type, fields, _ in _scan(path):
+        if record_type == RECORD_ORDER:
+            side, quantity, price, timestamp = _ORDER_FIELDS.unpack_from(fields, 0)
+            order_id, client_order_id, symbol, account = _unpack_strings(fields, _ORDER_FIELDS.size, 4)
+            yield ("order", order_id, client_order_id or None, symbol, _SIDES[side], quantity, price, timestamp,
+                   account or None)
+        elif record_type == RECORD_FILL:
+            side, quantity, price, timestamp = _FILL_FIELDS.unpack_from(fields, 0)
+            aggressor_id, resting_id, symbol = _unpack_strings(fields, _FILL_FIELDS.size, 3)
+            yield ("fill", aggressor_id, resting_id, symbol, _SIDES[side], quantity, price, timestamp)
+        elif record_type == RECORD_CANCEL:
+            (order_id,) = _unpack_strings(fields, 0, 1)
+            yield ("cancel", order_id)
+        elif record_type == RECORD_CHECKPOINT:
+            yield ("checkpoint", _CHECKPOINT_FIELDS.unpack_from(fields, 0)[0])
+        elif record_type == RECORD_OPEN:
+            side, quantity, price, timestamp, filled_quantity = _OPEN_FIELDS.unpack_from(fields, 0)
+            order_id, client_order_id, symbol, account = _unpack_strings(fields, _OPEN_FIELDS.size, 4)
+            yield ("open", order_id, client_order_id or None, symbol, _SIDES[side], quantity, price, timestamp,
+                   account or None, filled_quantity)
+
+
+def recover_orders(path: str) -> Tuple[Dict[str, BookOrder], int]:
+    """Rebuild every journaled order's fill state and status, in journal (time priority) order.
+
+    Also returns the highest numeric order id journaled (0 if none), so a
+    restarted engine never hands out an id that was already used.
+    """
+    orders: Dict[str, BookOrder] = {}
+    last_order_id = 0
+    for record in replay(path):
+        kind = record[0]
+        if kind == "order":
+            _, order_id, client_order_id, symbol, side, quantity, price, timestamp, account = record
+            orders[order_id] = BookOrder(order_id, symbol, side, price, quantity, timestamp, 0, OrderStatus.ACTIVE,
+                                         account, client_order_id)
+            if order_id.isdigit():
+                last_order_id = max(last_order_id, int(order_id))
+        elif kind == "open":
+            _, order_id, client_order_id, symbol, side, quantity, price, timestamp, account, filled = record
+            orders[order_id] = BookOrder(order_id, symbol, side, price, quantity, timestamp, filled,
+                                         OrderStatus.PARTIALLY_FILLED if filled else OrderStatus.ACTIVE,
+                                         account, client_order_id)
+        elif kind == "checkpoint":
+            last_order_id = max(last_order_id, record[1])
+        elif kind == "fill":
+            _, aggressor_id, resting_id, _, _, quantity, _, _ = record
+            for order_id in (aggressor_id, resting_id):
+                order = orders.get(order_id)
+                if order is None:
+                    continue
+                order.filled_quantity += quantity
+                order.status = OrderStatus.FILLED if order.filled_quantity >= order.quantity \
+                    else OrderStatus.PARTIALLY_FILLED
+        elif kind == "cancel":
+            order = orders.get(record[1])
+            if order is not None:
+                order.status = OrderStatus.CANCELED
+    return orders, last_order_id
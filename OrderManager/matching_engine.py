@@ -0,0 +1,225 @@
+from collections import deque
+from dataclasses import dataclass
+import heapq
+import time
+from typing import Callable, Deque, Dict, List, Optional
+
+from OrderManager.models import Order, Side
+from trading_lib.models import OrderStatus
+
+
+@dataclass(slots=True)
+class BookOrder:
+    """An order as tracked by the matching engine, with its fill state"""
+    order_id: str
+    symbol: str
+    side: Side
+    price: float
+    quantity: int
+    timestamp: float
+    filled_quantity: int = 0
+    status: OrderStatus = OrderStatus.PENDING
+    owner: object = None  # Opaque account key supplied by the caller
+    client_order_id: Optional[str] = None
+    session: object = None  # Where the order's reports go; set by the server, unused by the engine
+
+    @property
+    def remaining_quantity(self) -> int:
+        return self.quantity - self.filled_quantity
+
+
+@dataclass(slots=True)
+class Fill:
+    """One execution between an incoming (aggressor) order and a resting order"""
+    symbol: str
+    price: float
+    quantity: int
+    aggressor_order_id: str
+    resting_order_id: str
+    aggressor_side: Side
+    timestamp: float
+    resting_leaves_quantity: int = 0  # Resting order's remaining quantity after this fill
+    resting_owner: object = None
+
+    @property
+    def buy_order_id(self) -> str:
+        return self.aggressor_order_id if self.aggressor_side is Side.BUY else self.resting_order_id
+
+    @property
+    def sell_order_id(self) -> str:
+        return self.resting_order_id if self.aggressor_side is Side.BUY else self.aggressor_order_id
+
+
+class _MatchSide:
+    """One side of a symbol's book: a FIFO queue per price level plus a heap of level keys.
+
+    The heap holds ``price`` for asks and ``-price`` for bids, so the best level
+    is ``heap[0]``. Every level has exactly one heap entry: adding a level is a
+    heap push (O(log levels)) and a level is only dropped once it reaches the
+    top and is found empty. Cancelled orders stay in their queue and are
+    skipped when they reach the front.
+    """
+
+    __slots__ = ('sign', 'heap', 'levels')
+
+    def __init__(self, sign: float):
+        self.sign = sign
+        self.heap: List[float] = []
+        self.levels: Dict[float, Deque[BookOrder]] = {}  # price -> resting orders in time priority
+
+    def add(self, order: BookOrder):
+        level = self.levels.get(order.price)
+        if level is None:
+            level = self.levels[order.price] = deque()
+            heapq.heappush(self.heap, self.sign * order.price)
+        level.append(order)
+
+    def best_level(self) -> Optional[Deque[BookOrder]]:
+        """Queue at the best price with a live order at its front, or None if the side is empty"""
+        heap, levels = self.heap, self.levels
+        while heap:
+            price = self.sign * heap[0]
+            level = levels[price]
+            while level and level[0].status is OrderStatus.CANCELED:
+                level.popleft()
+            if level:
+                return level
+            del levels[price]
+            heapq.heappop(heap)
+        return None
+
+    def best_price(self) -> Optional[float]:
+        level = self.best_level()
+        return level[0].price if level else None
+
+
+class _SymbolBook:
+    __slots__ = ('bids', 'asks')
+
+    def __init__(self):
+        self.bids = _MatchSide(-1.0)
+        self.asks = _MatchSide(1.0)
+
+
+class MatchingEngine:
+    """In-process price-time priority matching engine with per-symbol books.
+
+    Incoming limit orders match against the opposite side at the resting
+    order's price, best price first and oldest first within a price, with
+    partial fills. Any remainder rests on the book. Best bid/ask are O(1)
+    (amortised over lazily discarded levels) and adding a price level is
+    O(log levels). Not thread-safe; callers serialize access.
+    """
+
+    def __init__(self):
+        self.books: Dict[str, _SymbolBook] = {}
+        self.orders: Dict[str, BookOrder] = {}  # Live (resting) orders by id
+        self._next_order_id = 1
+        self._fill_listener: Optional[Callable[[Fill], None]] = None
+
+    def set_fill_listener(self, callback: Callable[[Fill], None]):
+        """Call ``callback(fill)`` for every execution"""
+        self._fill_listener = callback
+
+    def _book(self, symbol: str) -> _SymbolBook:
+        book = self.books.get(symbol)
+        if book is None:
+            book = self.books[symbol] = _SymbolBook()
+        return book
+
+    def submit(self, order: Order, order_id: Optional[str] = None, owner: object = None) -> BookOrder:
+        """Match ``order`` and rest any remainder; returns its BookOrder.
+
+        The id is ``order_id``, else ``order.order_id``, else engine-assigned.
+        ``owner`` is stored on the BookOrder and reported on fills against it.
+        """
+        if order_id is None:
+            order_id = order.order_id
+        if order_id is None:
+            order_id = str(self._next_order_id)
+            self._next_order_id += 1
+        elif order_id in self.orders:
+            raise ValueError(f"Duplicate order id: {order_id}")
+
+        incoming = BookOrder(order_id, order.symbol, order.side, order.price, order.quantity, order.timestamp,
+                             0, OrderStatus.ACTIVE, owner, order.client_order_id)
+        book = self._book(order.symbol)
+        if order.side is Side.BUY:
+            own, opposite = book.bids, book.asks
+        else:
+            own, opposite = book.asks, book.bids
+        self._match(incoming, opposite)
+
+        if incoming.remaining_quantity:
+            own.add(incoming)
+            self.orders[order_id] = incoming
+        return incoming
+
+    def _match(self, incoming: BookOrder, opposite: _MatchSide):
+        # Crosses while the opposite side's best key is at or through our limit
+        limit_key = opposite.sign * incoming.price
+        listener = self._fill_listener
+        timestamp = None
+        while incoming.filled_quantity < incoming.quantity:
+            level = opposite.best_level()
+            if level is None or opposite.heap[0] > limit_key:
+                break
+            resting = level[0]
+            quantity = min(incoming.quantity - incoming.filled_quantity, resting.quantity - resting.filled_quantity)
+            resting.filled_quantity += quantity
+            incoming.filled_quantity += quantity
+            if resting.filled_quantity == resting.quantity:
+                resting.status = OrderStatus.FILLED
+                level.popleft()
+                del self.orders[resting.order_id]
+            else:
+                resting.status = OrderStatus.PARTIALLY_FILLED
+
+            if listener is not None:
+                if timestamp is None:
+                    timestamp = time.time()
+                listener(Fill(incoming.symbol, resting.price, quantity, incoming.order_id,
+                              resting.order_id, incoming.side, timestamp,
+                              resting.quantity - resting.filled_quantity, resting.owner))
+
+        if incoming.filled_quantity == incoming.quantity:
+            incoming.status = OrderStatus.FILLED
+        elif incoming.filled_quantity:
+            incoming.status = OrderStatus.PARTIALLY_FILLED
+
+    def restore(self, order: BookOrder):
+        """Rest a recovered order without matching it; restore in original time priority order"""
+        if order.order_id in self.orders:
+            raise ValueError(f"Duplicate order id: {order.order_id}")
+        book = self._book(order.symbol)
+        (book.bids if order.side is Side.BUY else book.asks).add(order)
+        self.orders[order.order_id] = order
+        if order.order_id.isdigit() and int(order.order_id) >= self._next_order_id:
+            self._next_order_id = int(order.order_id) + 1
+
+    @property
+    def last_order_id(self) -> int:
+        """Highest engine-assigned (or reserved) order id so far"""
+        return self._next_order_id - 1
+
+    def reserve_order_ids(self, last_order_id: int):
+        """Assign ids after ``last_order_id`` from now on, e.g. the highest id in a recovered journal"""
+        self._next_order_id = max(self._next_order_id, last_order_id + 1)
+
+    def cancel(self, order_id: str) -> BookOrder:
+        """Cancel a resting order; raises KeyError if it is unknown or already terminal"""
+        order = self.orders.pop(order_id)
+        order.status = OrderStatus.CANCELED  # Removed lazily when it reaches the front of its level
+        return order
+
+    def best_bid(self, symbol: str) -> Optional[float]:
+        book = self.books.get(symbol)
+        return book.bids.best_price() if book else None
+
+    def best_ask(self, symbol: str) -> Optional[float]:
+        book = self.books.get(symbol)
+        return book.asks.best_price() if book else None
+
+    def __len__(self) -> int:
+        """Number of resting orders across all symbols"""
+        return len(self.orders)
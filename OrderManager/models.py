@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 from enum import Enum
+import struct
 import time
-from typing import Optional
+from typing import Iterator, Optional
+
+from trading_lib.models import OrderStatus
 
 class Side(str, Enum):
     BUY = "BUY"
@@ -10,7 +13,38 @@ class Side(str, Enum):
     def __str__(self):
         return self.value
 
-@dataclass
+# Fixed-size binary order record (little-endian):
+# timestamp f64, origin_ns i64, sent_ns i64, price f64, quantity u32, side u8, symbol 11s (NUL padded)
+ORDER_STRUCT = struct.Struct('<dqqdIB11s')
+ORDER_SIZE = ORDER_STRUCT.size
+SYMBOL_SIZE = 11
+
+_SIDES = (Side.BUY, Side.SELL)
+_SIDE_CODES = {Side.BUY: 0, Side.SELL: 1}
+_SIDES_BY_NAME = {b'BUY': Side.BUY, b'SELL': Side.SELL}
+
+# Padded wire symbol -> str; the symbol universe is small, so decoded names are interned
+_SYMBOL_CACHE_LIMIT = 4096
+_symbol_cache = {}
+
+# Optional first frame on an order connection, naming the account its orders trade for:
+# ``LOGON,<account>*``. Without one the server uses the client's host.
+LOGON_PREFIX = b'LOGON,'
+
+def logon_message(account: str, msg_delim: bytes = b'*') -> bytes:
+    if not account or ',' in account or msg_delim.decode('utf-8') in account:
+        raise ValueError(f"Invalid account id: {account!r}")
+    return LOGON_PREFIX + account.encode('utf-8') + msg_delim
+
+def _decode_symbol(raw: bytes) -> str:
+    symbol = _symbol_cache.get(raw)
+    if symbol is None:
+        symbol = raw.rstrip(b'\0').decode('utf-8')
+        if len(_symbol_cache) < _SYMBOL_CACHE_LIMIT:
+            _symbol_cache[raw] = symbol
+    return symbol
+
+@dataclass(slots=True)
 class Order:
     symbol: str
     quantity: int
@@ -18,55 +52,118 @@ class Order:
     side: Side
     timestamp: float = None
     order_id: Optional[str] = None
+    # Caller-chosen id echoed back on execution reports (no ',' or '*')
+    client_order_id: Optional[str] = None
+    # Latency tracing (monotonic ns): Gateway origin of the triggering tick and client send time
+    origin_ns: int = 0
+    sent_ns: int = 0
 
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = time.time()
-        if isinstance(self.side, str):
+        if type(self.side) is not Side:
             self.side = Side(self.side.upper())
         
-        # Basic validation
-        if self.quantity <= 0:
-            raise ValueError("Quantity must be positive")
-        if self.price <= 0:
-            raise ValueError("Price must be positive")
-        if not self.symbol:
+        # Basic validation, one combined check on the happy path
+        if self.quantity <= 0 or self.price <= 0 or not self.symbol:
+            if self.quantity <= 0:
+                raise ValueError("Quantity must be positive")
+            if self.price <= 0:
+                raise ValueError("Price must be positive")
             raise ValueError("Symbol cannot be empty")
 
     @classmethod
     def from_bytes(cls, data: bytes, field_delim: str = ',', msg_delim: bytes = b'*') -> 'Order':
         try:
-            text = data.rstrip(msg_delim).decode('utf-8')
-            parts = text.split(field_delim)
+            # Split the raw bytes; int()/float() accept ASCII bytes directly
+            parts = data.rstrip(msg_delim).split(field_delim.encode('utf-8'))
             
-            if len(parts) != 5:
-                raise ValueError(f"Expected 5 fields, got {len(parts)}")
+            num_fields = len(parts)
+            if num_fields not in (5, 6, 7, 8):
+                raise ValueError(f"Expected 5 to 8 fields, got {num_fields}")
+            # Optional client order id (6 or 8 fields), then optional origin_ns,sent_ns (7 or 8)
+            client_order_id = parts[5].decode('utf-8') if num_fields in (6, 8) else None
+            if num_fields >= 7:
+                origin_ns, sent_ns = int(parts[-2]), int(parts[-1])
+            else:
+                origin_ns = sent_ns = 0
             
-            timestamp, side, quantity, symbol, price = parts
+            timestamp, side, quantity, symbol, price = parts[:5]
             
             return cls(
-                symbol=symbol,
+                symbol=symbol.decode('utf-8'),
                 quantity=int(quantity),
                 price=float(price),
-                side=Side(side),
-                timestamp=float(timestamp)
+                side=_SIDES_BY_NAME[side],
+                timestamp=float(timestamp),
+                client_order_id=client_order_id,
+                origin_ns=origin_ns,
+                sent_ns=sent_ns
             )
-        except (ValueError, KeyError) as e:
+        except (ValueError, KeyError, UnicodeDecodeError) as e:
             raise ValueError(
                 f"Invalid order data: {data.decode('utf-8', errors='replace')}. "
-                f"Expected format: timestamp,side,quantity,symbol,price*"
+                f"Expected format: timestamp,side,quantity,symbol,price[,client_order_id][,origin_ns,sent_ns]*"
             ) from e
     
     def to_bytes(self, field_delim: str = ',', msg_delim: bytes = b'*') -> bytes:
-        order_str = field_delim.join([
+        fields = [
             str(self.timestamp),
             self.side.value,
             str(self.quantity),
             self.symbol,
             str(self.price)
-        ])
+        ]
+        if self.client_order_id is not None:
+            fields.append(self.client_order_id)
+        if self.origin_ns:
+            fields += [str(self.origin_ns), str(self.sent_ns)]
+        order_str = field_delim.join(fields)
         return order_str.encode('utf-8') + msg_delim
     
+    @classmethod
+    def from_buffer(cls, buffer, offset: int = 0) -> 'Order':
+        """Unpack one binary order record from ``buffer`` (any bytes-like object) at ``offset``"""
+        try:
+            timestamp, origin_ns, sent_ns, price, quantity, side, symbol = ORDER_STRUCT.unpack_from(buffer, offset)
+            # Positional: (symbol, quantity, price, side, timestamp, order_id, client_order_id, origin_ns, sent_ns)
+            return cls(_decode_symbol(symbol), quantity, price, _SIDES[side], timestamp, None, None, origin_ns, sent_ns)
+        except (struct.error, IndexError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid binary order record at offset {offset}") from e
+    
+    @classmethod
+    def iter_buffer(cls, buffer) -> Iterator['Order']:
+        """Unpack consecutive binary order records; ``len(buffer)`` must be a multiple of ORDER_SIZE"""
+        try:
+            for timestamp, origin_ns, sent_ns, price, quantity, side, symbol in ORDER_STRUCT.iter_unpack(buffer):
+                yield cls(_decode_symbol(symbol), quantity, price, _SIDES[side], timestamp, None, None, origin_ns, sent_ns)
+        except (struct.error, IndexError, UnicodeDecodeError) as e:
+            raise ValueError("Invalid binary order buffer") from e
+    
+    def to_buffer(self, buffer, offset: int = 0) -> int:
+        """Pack this order into a writable ``buffer`` at ``offset``; returns the offset just past it.
+
+        Raises ValueError for a field the record cannot hold (e.g. a quantity outside u32).
+        """
+        symbol = self.symbol.encode('utf-8')
+        if len(symbol) > SYMBOL_SIZE:
+            raise ValueError(f"Symbol longer than {SYMBOL_SIZE} bytes: {self.symbol}")
+        try:
+            ORDER_STRUCT.pack_into(
+                buffer, offset,
+                self.timestamp, self.origin_ns, self.sent_ns, self.price,
+                self.quantity, _SIDE_CODES[self.side], symbol
+            )
+        except struct.error as e:
+            raise ValueError(f"Order not representable as a binary record ({e}): {self}") from e
+        return offset + ORDER_SIZE
+    
+    def pack(self) -> bytes:
+        """Binary order record as a new bytes object"""
+        buffer = bytearray(ORDER_SIZE)
+        self.to_buffer(buffer)
+        return bytes(buffer)
+    
     def __str__(self):
         return f"[{self.timestamp}] {self.side} {self.quantity} {self.symbol} @ {self.price:.2f}"
     
@@ -77,3 +174,57 @@ class Order:
             f"timestamp={self.timestamp})"
         )
 
+
+class ExecType(str, Enum):
+    """Kind of execution report the server sends back for an order"""
+    ACK = "ACK"          # Accepted by the matching engine, order_id assigned
+    FILL = "FILL"        # Partially or fully executed
+    REJECT = "REJECT"    # Not accepted; reason says why
+
+    def __str__(self):
+        return self.value
+
+@dataclass(slots=True)
+class ExecutionReport:
+    """Server -> client report for one order event.
+
+    Wire format (reason last so it may contain commas):
+    ``exec_type,client_order_id,order_id,status,last_quantity,last_price,filled_quantity,leaves_quantity,reason*``
+    """
+    exec_type: ExecType
+    client_order_id: str
+    order_id: str
+    status: OrderStatus
+    last_quantity: int = 0
+    last_price: float = 0.0
+    filled_quantity: int = 0
+    leaves_quantity: int = 0
+    reason: str = ""
+
+    @classmethod
+    def from_bytes(cls, data: bytes, msg_delim: bytes = b'*') -> 'ExecutionReport':
+        try:
+            parts = data.rstrip(msg_delim).decode('utf-8').split(',', 8)
+            if len(parts) != 9:
+                raise ValueError(f"Expected 9 fields, got {len(parts)}")
+            exec_type, client_order_id, order_id, status, last_quantity, last_price, filled, leaves, reason = parts
+            return cls(
+                exec_type=ExecType(exec_type),
+                client_order_id=client_order_id,
+                order_id=order_id,
+                status=OrderStatus(status),
+                last_quantity=int(last_quantity),
+                last_price=float(last_price),
+                filled_quantity=int(filled),
+                leaves_quantity=int(leaves),
+                reason=reason
+            )
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid execution report: {data.decode('utf-8', errors='replace')}") from e
+
+    def to_bytes(self, msg_delim: bytes = b'*') -> bytes:
+        reason = self.reason.replace('*', ' ')  # The message delimiter cannot appear in the payload
+        return (
+            f"{self.exec_type.value},{self.client_order_id},{self.order_id},{self.status.value},"
+            f"{self.last_quantity},{self.last_price},{self.filled_quantity},{self.leaves_quantity},{reason}"
+        ).encode('utf-8') + msg_delim
@@ -0,0 +1,156 @@
+from collections import deque
+from typing import Callable, Deque, Dict, Iterator, List, Optional
+
+from OrderManager.matching_engine import BookOrder
+from trading_lib.models import OrderStatus
+
+TERMINAL_STATUSES = frozenset((OrderStatus.FILLED, OrderStatus.CANCELED, OrderStatus.FAILED))
+OPEN_STATUSES = frozenset((OrderStatus.PENDING, OrderStatus.ACTIVE, OrderStatus.PARTIALLY_FILLED))
+
+
+class OrderStore:
+    """In-memory order state keyed by order id, with secondary indices.
+
+    Stores the engine's own ``BookOrder`` objects, so fill state is never
+    copied. Indices (all dicts of order id -> order, insertion ordered):
+
+    - by status: every stored order
+    - by symbol: open orders only, so ``open_orders(symbol)`` is O(k)
+    - by client (``BookOrder.owner``, e.g. the account id): every stored order
+
+    Lookups and transitions are O(1). A terminal order's ``session`` is
+    cleared so it cannot keep a closed connection alive; read it before the
+    transition that completes the order. Terminal orders stay queryable until
+    more than ``max_terminal_orders`` are held; the oldest are then evicted
+    and passed to ``archive`` (if given). With a journal configured they are
+    already durable there, so no archive is needed. Not thread-safe; callers
+    serialize access.
+    """
+
+    def __init__(self, max_terminal_orders: int = 100_000,
+                 archive: Optional[Callable[[BookOrder], None]] = None):
+        self.max_terminal_orders = max_terminal_orders
+        self.archive = archive
+        self.orders: Dict[str, BookOrder] = {}
+        self._by_status: Dict[OrderStatus, Dict[str, BookOrder]] = {status: {} for status in OrderStatus}
+        self._by_symbol: Dict[str, Dict[str, BookOrder]] = {}
+        self._by_client: Dict[object, Dict[str, BookOrder]] = {}
+        self._terminal: Deque[str] = deque()  # Terminal order ids, oldest first, for eviction
+        self.evicted = 0
+
+    def add(self, order: BookOrder):
+        """Index ``order`` under its current status; raises ValueError on a duplicate id"""
+        order_id = order.order_id
+        if order_id in self.orders:
+            raise ValueError(f"Duplicate order id: {order_id}")
+        self.orders[order_id] = order
+        self._by_status[order.status][order_id] = order
+        client = self._by_client.get(order.owner)
+        if client is None:
+            client = self._by_client[order.owner] = {}
+        client[order_id] = order
+        if order.status in TERMINAL_STATUSES:
+            self._on_terminal(order)
+        else:
+            symbol = self._by_symbol.get(order.symbol)
+            if symbol is None:
+                symbol = self._by_symbol[order.symbol] = {}
+            symbol[order_id] = order
+
+    def get(self, order_id: str) -> Optional[BookOrder]:
+        return self.orders.get(order_id)
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self.orders
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def transition(self, order_id: str, status: OrderStatus) -> BookOrder:
+        """Move an open order to ``status``.
+
+        Raises KeyError for an unknown (or evicted) id and ValueError if the
+        order is already terminal.
+        """
+        order = self.orders[order_id]
+        if order.status in TERMINAL_STATUSES:
+            raise ValueError(f"Order {order_id} is already {order.status.value}")
+        previous_status, order.status = order.status, status
+        self._reindex(order, previous_status, status)
+        return order
+
+    def refresh(self, order: BookOrder):
+        """Re-index ``order`` after its status changed elsewhere (e.g. by a fill in the engine)"""
+        order_id = order.order_id
+        if order_id in self._by_status[order.status] or order_id not in self.orders:
+            return
+        # Only open orders change status, so the old entry is in one of three indices
+        for previous_status in OPEN_STATUSES:
+            if order_id in self._by_status[previous_status]:
+                self._reindex(order, previous_status, order.status)
+                return
+
+    def _reindex(self, order: BookOrder, old: OrderStatus, new: OrderStatus):
+        if old is new:
+            return
+        order_id = order.order_id
+        del self._by_status[old][order_id]
+        self._by_status[new][order_id] = order
+        if new in TERMINAL_STATUSES:
+            symbol = self._by_symbol[order.symbol]
+            del symbol[order_id]
+            if not symbol:
+                del self._by_symbol[order.symbol]
+            self._on_terminal(order)
+
+    def _on_terminal(self, order: BookOrder):
+        order.session = None
+        self._terminal.append(order.order_id)
+        while len(self._terminal) > self.max_terminal_orders:
+            self._evict(self._terminal.popleft())
+
+    def _evict(self, order_id: str):
+        order = self.orders.pop(order_id)
+        del self._by_status[order.status][order_id]
+        client = self._by_client[order.owner]
+        del client[order_id]
+        if not client:
+            del self._by_client[order.owner]
+        self.evicted += 1
+        if self.archive is not None:
+            self.archive(order)
+
+    def open_orders(self, symbol: str) -> List[BookOrder]:
+        """Open orders for ``symbol`` in arrival order"""
+        return list(self._by_symbol.get(symbol, {}).values())
+
+    def orders_with_status(self, status: OrderStatus) -> List[BookOrder]:
+        return list(self._by_status[status].values())
+
+    def orders_for_client(self, client: object) -> List[BookOrder]:
+        return list(self._by_client.get(client, {}).values())
+
+    def count(self, status: OrderStatus) -> int:
+        return len(self._by_status[status])
+
+    def __iter__(self) -> Iterator[BookOrder]:
+        return iter(self.orders.values())
+
+
+class OrderArchive:
+    """Appends evicted orders to a CSV file:
+    ``order_id,client_order_id,symbol,side,quantity,price,filled_quantity,status,timestamp``
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, 'a', encoding='utf-8')
+
+    def __call__(self, order: BookOrder):
+        self.file.write(
+            f"{order.order_id},{order.client_order_id or ''},{order.symbol},{order.side.value},"
+            f"{order.quantity},{order.price},{order.filled_quantity},{order.status.value},{order.timestamp}\n"
+        )
+
+    def close(self):
+        self.file.close()
@@ -0,0 +1,125 @@
+import threading
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from OrderManager.matching_engine import Fill
+from OrderManager.models import Side
+from shared_memory_utils import SharedPnLBook
+
+DEFAULT_ACCOUNT = "default"
+# Label of the row shared by accounts past ``max_accounts``; '*' cannot appear in an account id
+OVERFLOW_ACCOUNT = "*other*"
+
+
+class PositionKeeper:
+    """Positions and PnL per account, in NumPy arrays of shape (accounts, symbols).
+
+    Symbol ids are positions in ``symbols``, which should match the
+    SharedPriceBook's symbol order so a mark is one vector read. Fills are
+    applied incrementally (average-cost: realized PnL when a position is
+    reduced, the average price reset when it flips). ``mark`` revalues every
+    account and symbol in a few vector operations, and ``publish`` writes the
+    result to a SharedPnLBook. Accounts are any hashable key (the server
+    uses stable account ids), labelled with ``str(key)``; None is the default
+    account. Accounts past ``max_accounts`` share one extra overflow row,
+    labelled OVERFLOW_ACCOUNT, so the first ``max_accounts`` keep their own
+    rows; ``pnl_book`` needs room for ``max_accounts + 1``. Thread-safe.
+    """
+
+    def __init__(self, symbols: Sequence[str], max_accounts: int = 64, pnl_book: Optional[SharedPnLBook] = None):
+        self.symbols = list(symbols)
+        self.symbol_index: Dict[str, int] = {sym: i for i, sym in enumerate(self.symbols)}
+        self.max_accounts = max_accounts
+        self.pnl_book = pnl_book
+        shape = (max_accounts + 1, len(self.symbols))  # Last row: overflow
+        self.position = np.zeros(shape, dtype=np.int64)
+        self.avg_price = np.zeros(shape, dtype=np.float64)
+        self.realized = np.zeros(shape, dtype=np.float64)
+        self.marks = np.zeros(len(self.symbols), dtype=np.float64)
+        self.unrealized = np.zeros(shape, dtype=np.float64)
+        self.accounts: Dict[object, int] = {}
+        self.account_labels: List[str] = []
+        self.untracked_fills = 0  # Fills in symbols outside ``symbols``
+        self.overflow_accounts = 0  # Accounts sharing the overflow row
+        self.lock = threading.Lock()
+
+    def _slot(self, account: object) -> int:
+        slot = self.accounts.get(account)
+        if slot is None:
+            slot = len(self.account_labels)
+            if slot < self.max_accounts:
+                self.account_labels.append(DEFAULT_ACCOUNT if account is None else str(account)[:32])
+            else:
+                # Rows are only handed out in order, so the overflow row follows the last named one
+                slot = self.max_accounts
+                if len(self.account_labels) == slot:
+                    self.account_labels.append(OVERFLOW_ACCOUNT)
+                self.overflow_accounts += 1
+            self.accounts[account] = slot
+        return slot
+
+    def on_fill(self, fill: Fill, aggressor_account: object = None):
+        """Apply both sides of ``fill``: the aggressor's account and the resting order's owner"""
+        symbol = self.symbol_index.get(fill.symbol)
+        if symbol is None:
+            self.untracked_fills += 1
+            return
+        quantity = fill.quantity if fill.aggressor_side is Side.BUY else -fill.quantity
+        with self.lock:
+            self._apply(self._slot(aggressor_account), symbol, quantity, fill.price)
+            self._apply(self._slot(fill.resting_owner), symbol, -quantity, fill.price)
+
+    def _apply(self, account: int, symbol: int, quantity: int, price: float):
+        position = int(self.position[account, symbol])
+        new_position = position + quantity
+        if position == 0 or (position > 0) == (quantity > 0):
+            # Opening or adding: new average cost
+            self.avg_price[account, symbol] = (
+                self.avg_price[account, symbol] * abs(position) + price * abs(quantity)
+            ) / abs(new_position)
+        else:
+            # Reducing: realize PnL on the closed quantity against the average cost
+            closed = min(abs(quantity), abs(position))
+            direction = 1 if position > 0 else -1
+            self.realized[account, symbol] += closed * (price - self.avg_price[account, symbol]) * direction
+            if new_position == 0:
+                self.avg_price[account, symbol] = 0.0
+            elif (new_position > 0) != (position > 0):
+                self.avg_price[account, symbol] = price  # Flipped: the remainder opened at this fill
+        self.position[account, symbol] = new_position
+
+    def mark(self, prices: np.ndarray):
+        """Revalue every position at ``prices`` (aligned with ``symbols``; 0 = no price yet)"""
+        with self.lock:
+            n = len(self.account_labels)
+            self.marks = np.asarray(prices, dtype=np.float64)
+            avg_price = self.avg_price[:n]
+            marks = np.where(self.marks > 0, self.marks, avg_price)  # Unpriced symbols carry at cost
+            np.multiply(self.position[:n], marks - avg_price, out=self.unrealized[:n])
+
+    def publish(self):
+        """Write the current positions and PnL to the shared PnL book"""
+        if self.pnl_book is None:
+            return
+        with self.lock:
+            n = len(self.account_labels)
+            self.pnl_book.publish(self.account_labels, self.position[:n], self.avg_price[:n],
+                                  self.marks, self.realized[:n], self.unrealized[:n])
+
+    def refresh(self, price_book):
+        """Mark to a SharedPriceBook with one vector read, then publish"""
+        self.mark(price_book.read_prices())
+        self.publish()
+
+    def position_of(self, symbol: str, account: object = None) -> int:
+        slot = self.accounts.get(account)
+        return 0 if slot is None else int(self.position[slot, self.symbol_index[symbol]])
+
+    def pnl(self, account: object = None) -> float:
+        """Realized plus unrealized PnL (as of the last mark) for ``account``"""
+        slot = self.accounts.get(account)
+        if slot is None:
+            return 0.0
+        with self.lock:
+            return float(self.realized[slot].sum() + self.unrealized[slot].sum())
@@ -0,0 +1,158 @@
+from dataclasses import dataclass
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from OrderManager.models import Order
+from OrderManager.risk import RiskCheckError
+
+RATE_LIMIT_MODES = ("reject", "queue")
+# Slack for float drift in refills (elapsed * rate lands just under a whole token)
+_TOKEN_EPSILON = 1e-9
+
+
+class RateLimitExceeded(RiskCheckError):
+    """Raised when an order is over a rate limit (and cannot be queued)"""
+
+
+@dataclass
+class RateLimits:
+    """Order rates in orders/second with burst sizes; a rate of None disables that bucket.
+
+    A burst of None defaults to one second's worth of orders. In "queue"
+    mode an over-limit order waits for its tokens instead of being
+    rejected, as long as the wait is at most ``max_delay`` seconds. Orders
+    waiting off the client's thread are capped at ``max_queued`` per
+    session, and each is rejected once it has waited ``max_queued_delay``
+    seconds since it was received.
+    """
+    global_rate: Optional[float] = None
+    global_burst: Optional[float] = None
+    client_rate: Optional[float] = None
+    client_burst: Optional[float] = None
+    symbol_rate: Optional[float] = None
+    symbol_burst: Optional[float] = None
+    mode: str = "reject"
+    max_delay: float = 0.05
+    max_queued: int = 1024
+    max_queued_delay: float = 0.25
+
+    def __post_init__(self):
+        if self.mode not in RATE_LIMIT_MODES:
+            raise ValueError(f"Invalid rate limit mode: {self.mode}. Must be one of {RATE_LIMIT_MODES}")
+
+    @classmethod
+    def from_config(cls, config: dict) -> 'RateLimits':
+        return cls(**config)
+
+
+class TokenBucket:
+    """Token bucket refilled lazily from the elapsed time on each use (no timer).
+
+    ``tokens`` may go negative when orders are queued: the deficit is the
+    time, in tokens, that later orders must wait behind them.
+    """
+
+    __slots__ = ('rate', 'burst', 'tokens', 'updated')
+
+    def __init__(self, rate: float, burst: Optional[float], now: float):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self.tokens = self.burst
+        self.updated = now
+
+    def refill(self, now: float) -> float:
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+            self.updated = now
+        return self.tokens
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until one token is available (0 if available now)"""
+        tokens = self.refill(now)
+        return 0.0 if tokens >= 1.0 - _TOKEN_EPSILON else (1.0 - tokens) / self.rate
+
+
+class RateLimiter:
+    """Global, per-client and per-symbol order rate limits.
+
+    Each order needs a token from every enabled bucket. Buckets are created
+    on first use and refilled lazily, so ``acquire`` is O(1) regardless of
+    how many symbols or clients are tracked. Thread-safe.
+    """
+
+    def __init__(self, limits: Optional[RateLimits] = None, clock: Callable[[], float] = time.monotonic):
+        self.limits = limits or RateLimits()
+        self.clock = clock
+        now = clock()
+        self.global_bucket = TokenBucket(self.limits.global_rate, self.limits.global_burst, now) \
+            if self.limits.global_rate else None
+        self.client_buckets: Dict[object, TokenBucket] = {}
+        self.symbol_buckets: Dict[str, TokenBucket] = {}
+        self.accepted = 0
+        self.delayed = 0
+        self.rejected: Dict[str, int] = {"global": 0, "client": 0, "symbol": 0, "queue": 0}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        limits = self.limits
+        return bool(limits.global_rate or limits.client_rate or limits.symbol_rate)
+
+    def acquire(self, order: Order, client: object = None) -> float:
+        """Take a token for ``order`` from every enabled bucket.
+
+        Returns 0.0, or in "queue" mode the seconds the caller must wait
+        before executing the order. Raises RateLimitExceeded (taking no
+        tokens) if the order is over a limit and cannot be queued.
+        """
+        limits = self.limits
+        with self._lock:
+            now = self.clock()
+            buckets = []
+            if self.global_bucket is not None:
+                buckets.append(("global", self.global_bucket))
+            if limits.client_rate:
+                bucket = self.client_buckets.get(client)
+                if bucket is None:
+                    bucket = self.client_buckets[client] = TokenBucket(limits.client_rate, limits.client_burst, now)
+                buckets.append(("client", bucket))
+            if limits.symbol_rate:
+                bucket = self.symbol_buckets.get(order.symbol)
+                if bucket is None:
+                    bucket = self.symbol_buckets[order.symbol] = TokenBucket(limits.symbol_rate, limits.symbol_burst, now)
+                buckets.append(("symbol", bucket))
+
+            delay, limited_by = 0.0, None
+            for name, bucket in buckets:
+                wait = bucket.wait_time(now)
+                if wait > delay:
+                    delay, limited_by = wait, name
+            if limited_by is not None and (limits.mode == "reject" or delay > limits.max_delay):
+                self.rejected[limited_by] += 1
+                raise RateLimitExceeded(f"Order rate over {limited_by} limit"
+                                        + (f" ({order.symbol})" if limited_by == "symbol" else ""))
+            for _, bucket in buckets:
+                bucket.tokens -= 1.0
+            self.accepted += 1
+            if delay:
+                self.delayed += 1
+            return delay
+
+    def remove_client(self, client: object):
+        """Forget a client's bucket once it has refilled; one still in debt is kept for its next connection"""
+        with self._lock:
+            bucket = self.client_buckets.get(client)
+            if bucket is not None and bucket.refill(self.clock()) >= bucket.burst:
+                del self.client_buckets[client]
+
+    def reject_queued(self, reason: str) -> RateLimitExceeded:
+        """Count an order dropped from the "queue" mode backlog; returns the error to report"""
+        with self._lock:
+            self.rejected["queue"] += 1
+        return RateLimitExceeded(f"Order {reason}")
+
+    @property
+    def total_rejected(self) -> int:
+        return sum(self.rejected.values())
@@ -0,0 +1,164 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from OrderManager.matching_engine import BookOrder, Fill
+from OrderManager.models import Order, Side
+
+
+class RiskCheckError(ValueError):
+    """Raised when an order breaches a pre-trade risk limit"""
+
+
+@dataclass
+class RiskLimits:
+    """Pre-trade limits applied per account; None disables a limit"""
+    max_order_quantity: Optional[int] = None
+    max_order_notional: Optional[float] = None
+    # Worst-case absolute position per symbol: position plus every same-side open order
+    max_position: Optional[int] = None
+    position_limits: Dict[str, int] = field(default_factory=dict)  # Per-symbol overrides of max_position
+    max_open_orders: Optional[int] = None
+    max_open_notional: Optional[float] = None
+
+    @classmethod
+    def from_config(cls, config: dict) -> 'RiskLimits':
+        return cls(**config)
+
+
+class _SymbolRisk:
+    __slots__ = ('position', 'open_buy_quantity', 'open_sell_quantity', 'position_limit')
+
+    def __init__(self, position_limit: Optional[int]):
+        self.position = 0
+        self.open_buy_quantity = 0
+        self.open_sell_quantity = 0
+        self.position_limit = position_limit
+
+
+class _AccountRisk:
+    __slots__ = ('symbols', 'open_orders', 'open_notional')
+
+    def __init__(self):
+        self.symbols: Dict[str, _SymbolRisk] = {}
+        self.open_orders = 0
+        self.open_notional = 0.0
+
+
+class RiskEngine:
+    """Incremental pre-trade risk checks per account.
+
+    Running totals (position and open quantity per symbol, open order count
+    and open notional) are updated on every resting order, fill and cancel, so
+    ``check`` is O(1) and never rescans order history. An account is any
+    hashable key; the server uses a stable account id (the client's logon
+    or host), so reconnecting does not reset an account's limits. Not
+    thread-safe; the server calls it under its matching lock.
+    """
+
+    def __init__(self, limits: Optional[RiskLimits] = None):
+        self.limits = limits or RiskLimits()
+        self.accounts: Dict[object, _AccountRisk] = {}
+
+    def _account(self, account: object) -> _AccountRisk:
+        state = self.accounts.get(account)
+        if state is None:
+            state = self.accounts[account] = _AccountRisk()
+        return state
+
+    def _symbol(self, account: _AccountRisk, symbol: str) -> _SymbolRisk:
+        state = account.symbols.get(symbol)
+        if state is None:
+            limit = self.limits.position_limits.get(symbol, self.limits.max_position)
+            state = account.symbols[symbol] = _SymbolRisk(limit)
+        return state
+
+    def check(self, order: Order, account: object = None):
+        """Raise RiskCheckError if ``order`` would breach a limit for ``account``"""
+        limits = self.limits
+        quantity = order.quantity
+        notional = quantity * order.price
+        if limits.max_order_quantity is not None and quantity > limits.max_order_quantity:
+            raise RiskCheckError(f"Order quantity {quantity} exceeds limit {limits.max_order_quantity}")
+        if limits.max_order_notional is not None and notional > limits.max_order_notional:
+            raise RiskCheckError(f"Order notional {notional:.2f} exceeds limit {limits.max_order_notional:.2f}")
+
+        state = self._account(account)
+        if limits.max_open_orders is not None and state.open_orders >= limits.max_open_orders:
+            raise RiskCheckError(f"Open order count at limit {limits.max_open_orders}")
+        if limits.max_open_notional is not None and state.open_notional + notional > limits.max_open_notional:
+            raise RiskCheckError(
+                f"Open notional {state.open_notional + notional:.2f} would exceed limit {limits.max_open_notional:.2f}"
+            )
+
+        symbol_state = self._symbol(state, order.symbol)
+        limit = symbol_state.position_limit
+        if limit is not None:
+            # Worst case: every open order on this side fills, then this one does too
+            if order.side is Side.BUY:
+                exposure = symbol_state.position + symbol_state.open_buy_quantity + quantity
+            else:
+                exposure = symbol_state.open_sell_quantity + quantity - symbol_state.position
+            if exposure > limit:
+                raise RiskCheckError(f"{order.symbol} position limit {limit} would be exceeded ({exposure})")
+
+    def on_fill(self, fill: Fill, account: object = None):
+        """Apply one execution: both accounts' positions and the resting order's open totals.
+
+        ``account`` owns the aggressor order; the resting owner comes from the fill.
+        """
+        quantity = fill.quantity
+        aggressor = self._symbol(self._account(account), fill.symbol)
+        resting_account = self._account(fill.resting_owner)
+        resting = self._symbol(resting_account, fill.symbol)
+        if fill.aggressor_side is Side.BUY:
+            aggressor.position += quantity
+            resting.position -= quantity
+            resting.open_sell_quantity -= quantity
+        else:
+            aggressor.position -= quantity
+            resting.position += quantity
+            resting.open_buy_quantity -= quantity
+        resting_account.open_notional -= quantity * fill.price
+        if not fill.resting_leaves_quantity:
+            resting_account.open_orders -= 1
+
+    def on_rest(self, order: BookOrder):
+        """Add an order's remainder to its owner's open totals once it rests on the book"""
+        remaining = order.remaining_quantity
+        if remaining:
+            self._adjust_open(order, remaining, 1)
+
+    def on_cancel(self, order: BookOrder):
+        """Remove a cancelled order's remainder from its owner's open totals"""
+        self._adjust_open(order, -order.remaining_quantity, -1)
+
+    def _adjust_open(self, order: BookOrder, quantity: int, count: int):
+        account = self._account(order.owner)
+        state = self._symbol(account, order.symbol)
+        if order.side is Side.BUY:
+            state.open_buy_quantity += quantity
+        else:
+            state.open_sell_quantity += quantity
+        account.open_orders += count
+        account.open_notional += quantity * order.price
+
+    def release(self, account: object = None):
+        """Forget ``account``'s flat symbols, and the account once nothing is open or held.
+
+        Dropped state equals a new account's, so this never loosens a limit; the
+        server calls it when a session disconnects.
+        """
+        state = self.accounts.get(account)
+        if state is None:
+            return
+        symbols = state.symbols
+        for symbol in [symbol for symbol, s in symbols.items()
+                       if not (s.position or s.open_buy_quantity or s.open_sell_quantity)]:
+            del symbols[symbol]
+        if not symbols and not state.open_orders:
+            del self.accounts[account]
+
+    def position(self, symbol: str, account: object = None) -> int:
+        state = self.accounts.get(account)
+        symbol_state = state.symbols.get(symbol) if state else None
+        return symbol_state.position if symbol_state else 0
@@ -6,11 +6,12 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from logger import setup_logger
+from logger import configure_logging, setup_logger
 from OrderManager.server import Server
 
 
 def run_order_manager(config: dict):
+    configure_logging(**config.get("logging", {}))
     logger = setup_logger("order_manager")
     logger.info("Starting OrderManager process")
     
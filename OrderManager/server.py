@@ -1,15 +1,150 @@
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import itertools
+import selectors
 import socket
 import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
+from latency import LatencyRecorder
 from logger import setup_logger
-from OrderManager import Order
+from OrderManager import ExecType, ExecutionReport, Order
+from OrderManager.framing import OrderFramer
+from OrderManager.journal import Journal, recover_orders
+from OrderManager.matching_engine import Fill, MatchingEngine
+from OrderManager.models import LOGON_PREFIX
+from OrderManager.order_store import OrderArchive, OrderStore
+from OrderManager.positions import PositionKeeper
+from OrderManager.rate_limit import RateLimitExceeded, RateLimiter, RateLimits
+from OrderManager.risk import RiskCheckError, RiskEngine, RiskLimits
+from OrderManager.shm_channel import OrderRing
+from shared_memory_utils import SharedPnLBook, SharedPriceBook
+from trading_lib.models import OrderStatus
+
+RECV_BUFFER_SIZE = 65536
+SERVER_MODES = ("threaded", "event_loop")
+ORDER_TRANSPORTS = ("tcp", "shm")
+# Shared-memory transport: orders taken per ring read, and the idle wakeup bound
+RING_BATCH_SIZE = 1024
+RING_WAIT_TIMEOUT = 0.01
+# Threaded mode: a client that stops reading its execution reports for this long is dropped
+SEND_TIMEOUT = 5.0
+# Event-loop mode: a client whose unsent reports pass this many bytes is dropped
+MAX_OUTBOUND_BYTES = 1 << 20
+# Shutdown: how long to wait for each thread still executing orders
+SHUTDOWN_JOIN_TIMEOUT = 2.0
+# Rate-limit rejects are logged once every this many, not per order
+RATE_LIMIT_LOG_EVERY = 1000
+
+
+class ClientSession:
+    """Per-connection state: order framer, execution report channel, pinned worker and account.
+
+    ``account`` keys the connection's risk and positions: the client's host
+    until it logs on (``LOGON,<account>*``) with its own id.
+
+    By default ``send`` blocks (up to the socket timeout) until the report is
+    written. With ``on_backlog`` (event-loop mode, non-blocking socket) it
+    writes what the socket takes and appends the rest to ``outbound``, which
+    the event loop flushes on EVENT_WRITE; ``on_backlog`` is called whenever
+    the backlog grows or the session closes. A backlog over ``max_outbound``
+    closes the session (``overflowed``).
+    """
+
+    def __init__(self, client_socket: socket.socket, addr: tuple, delimiter: bytes = b'*', worker=None,
+                 on_backlog: Optional[Callable[['ClientSession'], None]] = None,
+                 max_outbound: int = MAX_OUTBOUND_BYTES):
+        self.socket = client_socket
+        self.addr = addr
+        self.framer = OrderFramer(delimiter)
+        self.worker = worker
+        self.account: str = addr[0]
+        self.logged_on = False
+        self.closed = False
+        self.overflowed = False
+        self.outbound = bytearray()
+        self.max_outbound = max_outbound
+        self._on_backlog = on_backlog
+        # Reports for one connection can come from any thread (fills of resting orders)
+        self.send_lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"{self.addr[0]}:{self.addr[1]}"
+
+    def send(self, data: bytes) -> bool:
+        if self.closed:
+            return False
+        if self._on_backlog is None:
+            try:
+                with self.send_lock:
+                    self.socket.sendall(data)
+                return True
+            except OSError:
+                self.closed = True
+                return False
+        with self.send_lock:
+            try:
+                if not self.outbound:  # Otherwise queue behind the backlog to keep report order
+                    sent = self.socket.send(data)
+                    if sent == len(data):
+                        return True
+                    data = data[sent:]
+            except BlockingIOError:
+                pass
+            except OSError:
+                self.closed = True
+            if not self.closed:
+                self.outbound += data
+                if len(self.outbound) > self.max_outbound:
+                    self.closed = self.overflowed = True
+        self._on_backlog(self)
+        return not self.closed
+
+    def flush(self) -> bool:
+        """Write as much of the backlog as the socket takes; True once it is empty"""
+        with self.send_lock:
+            if self.outbound and not self.closed:
+                try:
+                    del self.outbound[:self.socket.send(self.outbound)]
+                except BlockingIOError:
+                    pass
+                except OSError:
+                    self.closed = True
+            return not self.outbound
+
+class DeferredOrders:
+    """One session's "queue" mode backlog: batches of (orders, received_ns, ready_at), oldest first"""
+
+    __slots__ = ('batches', 'orders')
+
+    def __init__(self):
+        self.batches: Deque[Tuple[List[Order], int, float]] = deque()
+        self.orders = 0
+
 
 class Server:
     def __init__(self, config: dict):
         self.logger = setup_logger("order_manager_server")
         self.host = config["host"]
         self.port = config["order_manager_port"]
+        self.delimiter = config.get("delimiter", b'*')
+        # "threaded": one thread per client; "event_loop": all clients on one selector thread
+        self.mode = config.get("server_mode", "threaded")
+        if self.mode not in SERVER_MODES:
+            raise ValueError(f"Invalid server_mode: {self.mode}. Must be one of {SERVER_MODES}")
+        # "tcp": orders arrive on client connections only; "shm": also from a shared-memory
+        # ring written by a same-host Strategy (see the "order_ring" config section)
+        self.transport = config.get("order_transport", "tcp")
+        if self.transport not in ORDER_TRANSPORTS:
+            raise ValueError(f"Invalid order_transport: {self.transport}. Must be one of {ORDER_TRANSPORTS}")
+        # Event-loop mode only: number of single-thread workers that execute parsed batches
+        self.num_workers = config.get("workers", 0)
+        # Event-loop mode only: unsent report bytes per client before it is dropped
+        self.max_outbound_bytes = config.get("max_outbound_bytes", MAX_OUTBOUND_BYTES)
         self.running = True
+        self.latency = LatencyRecorder("order_manager", enabled=config.get("tracing", False))
 
         self.logger.info(f"Server attempting to listen on {self.host}:{self.port}")
 
@@ -39,29 +174,110 @@ class Server:
                 raise
 
         # Start listening for clients
-        self.server_socket.listen(5)
+        self.server_socket.listen(config.get("backlog", 128))
         self.logger.info(f"Server listening on {self.host}:{self.port}")
 
         self.clients = []
+        self._client_threads = set()  # Threaded mode: live handle_client threads, joined on shutdown
         self.lock = threading.Lock()
+        self.matching_engine = MatchingEngine()
+        self.matching_engine.set_fill_listener(self._on_fill)
+        # Global/per-session/per-symbol token buckets, see the "rate_limit" config section.
+        # Checked before anything else (including logging) so a flood stays cheap to shed.
+        rate_limiter = RateLimiter(RateLimits.from_config(config.get("rate_limit", {})))
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter if rate_limiter.enabled else None
+        # "queue" mode outside the threaded per-client path: delayed orders wait in a timer heap
+        # served by one thread, never on the selector, a shared worker or the ring reader. Each
+        # session (None: the ring) has its own backlog, scheduled by when its oldest batch is due,
+        # so a flooding client only delays itself; while a session has one, its later batches
+        # queue behind it. A session is in the heap unless the queue thread is executing it.
+        self._deferred: Dict[Optional[ClientSession], DeferredOrders] = {}
+        self._deferral_heap: List[Tuple[float, int, Optional[ClientSession]]] = []
+        self._deferral_seq = itertools.count()  # Heap tie-break: sessions are not comparable
+        self._deferral_ready = threading.Condition()
+        self._deferral_thread: Optional[threading.Thread] = None
+        if self.rate_limiter is not None and rate_limiter.limits.mode == "queue":
+            self._deferral_thread = threading.Thread(target=self._run_deferred, name="rate_limit_queue", daemon=True)
+            self._deferral_thread.start()
+        # Pre-trade checks per account, see the "risk" config section
+        self.risk = RiskEngine(RiskLimits.from_config(config.get("risk", {})))
+        # Client threads / workers execute concurrently; the engine itself is not thread-safe.
+        # Also guards the fill buffer and report routing below.
+        self.matching_lock = threading.Lock()
+        self._pending_fills: List[Fill] = []
+        # Every accepted order by id, status, symbol and account; fills are routed back via its session.
+        # Terminal orders beyond the limit are evicted (to the archive file, if configured).
+        store_config = config.get("order_store", {})
+        archive_path = store_config.get("archive_path")
+        self.archive = OrderArchive(archive_path) if archive_path else None
+        self.orders = OrderStore(store_config.get("max_terminal_orders", 100_000), self.archive)
+        # Optional write-ahead journal, see the "journal" config section
+        self.journal: Optional[Journal] = None
+        journal_config = config.get("journal")
+        if journal_config:
+            self._recover(journal_config["path"])
+            self.journal = Journal(**journal_config)
+        # Positions/PnL per account, marked to the SharedPriceBook and published to a shared
+        # PnL segment, see the "positions" config section (needs "symbols")
+        self.positions: Optional[PositionKeeper] = None
+        self.price_book: Optional[SharedPriceBook] = None
+        self._positions_thread: Optional[threading.Thread] = None
+        positions_config = config.get("positions")
+        if positions_config is not None and config.get("symbols"):
+            max_accounts = positions_config.get("max_accounts", 64)
+            pnl_book = SharedPnLBook(config["symbols"], max_accounts + 1,  # Plus the overflow row
+                                     name=positions_config.get("pnl_memory_name", "pnl_book"), create=True)
+            self.positions = PositionKeeper(config["symbols"], max_accounts, pnl_book)
+            self.positions_refresh_interval = positions_config.get("refresh_interval", 0.1)
+            self.price_book_name = config.get("shared_memory_name", "order_book")
+            self.price_book_traced = config.get("tracing", False)
+        self.selector = None
+        self.workers: List[ThreadPoolExecutor] = []
+        # Event-loop mode: sessions whose backlog grew or that closed, applied by the loop thread,
+        # which other threads wake through a socket pair
+        self._backlogged: Deque[ClientSession] = deque()
+        self._wakeup: Optional[Tuple[socket.socket, socket.socket]] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self.order_ring: Optional[OrderRing] = None
+        self._ring_thread: Optional[threading.Thread] = None
+        # Account of orders without a session (the ring has no logon)
+        self.ring_account: Optional[str] = None
+        if self.transport == "shm":
+            ring_config = config.get("order_ring", {})
+            self.ring_account = ring_config.get("account")
+            self.order_ring = OrderRing(ring_config.get("name", "order_ring"), ring_config.get("capacity", 65536),
+                                        create=True)
+            self.ring_spin = ring_config.get("spin_us", 0) / 1e6
     
     def run(self):
         """Start accepting client connections"""
-        self.logger.info(f"OrderManager listening on {self.host}:{self.port}")
-        self.accept_clients()
+        self.logger.info(f"OrderManager listening on {self.host}:{self.port} ({self.mode})")
+        if self.order_ring is not None:
+            self._ring_thread = threading.Thread(target=self.serve_order_ring, name="order_ring", daemon=True)
+            self._ring_thread.start()
+        if self.positions is not None:
+            self._positions_thread = threading.Thread(target=self.refresh_positions, name="positions", daemon=True)
+            self._positions_thread.start()
+        if self.mode == "event_loop":
+            self.serve_event_loop()
+        else:
+            self.accept_clients()
 
     def accept_clients(self):
         while self.running:
             try:
                 self.server_socket.settimeout(1.0)  # Allow periodic check of self.running
                 client_socket, addr = self.server_socket.accept()
-                with self.lock:
-                    self.clients.append(client_socket)
-                threading.Thread(
+                client_socket.settimeout(SEND_TIMEOUT)
+                thread = threading.Thread(
                     target=self.handle_client,
                     args=(client_socket, addr), 
                     daemon=True
-                ).start()
+                )
+                with self.lock:
+                    self.clients.append(client_socket)
+                    self._client_threads.add(thread)
+                thread.start()
             except socket.timeout:
                 continue  # Check self.running again
             except (OSError, socket.error) as e:
@@ -72,43 +288,501 @@ class Server:
     def handle_client(self, client_socket: socket.socket, addr: tuple):
         """Handle client connection"""
         self.logger.info(f"Client connected from {addr}")
+        session = ClientSession(client_socket, addr, self.delimiter)
+        framer = session.framer
         try:
             while self.running:
-                data = client_socket.recv(1024)
+                try:
+                    data = client_socket.recv(RECV_BUFFER_SIZE)
+                except socket.timeout:
+                    continue  # The timeout bounds report sends; an idle client is fine
                 if not data:
+                    if framer.pending:
+                        self.logger.warning(f"Client {addr} closed with a partial order of {framer.pending} bytes")
                     self.logger.info(f"Client {addr} disconnected")
                     break
-                self.route_order(data)
+                orders = framer.feed(data)
+                if orders:
+                    self.route_orders(orders, session)
+                if framer.error is not None:
+                    raise ValueError(framer.error)
         except Exception as e:
             self.logger.error(f"Error handling client {addr}: {e}")
         finally:
+            session.closed = True
             client_socket.close()
+            self._release_session(session)
             with self.lock:
-                self.clients.remove(client_socket)
+                if client_socket in self.clients:  # shutdown() may have cleared it already
+                    self.clients.remove(client_socket)
+                self._client_threads.discard(threading.current_thread())
         self.logger.info(f"Client {addr} disconnected")
 
-    def route_order(self, data: bytes):
+    def serve_event_loop(self):
+        """Serve every client from this thread with non-blocking sockets and a selector.
+
+        Parsed batches run inline, or on ``workers`` single-thread executors. Each
+        connection is pinned to one worker so its orders keep their arrival order.
+        Reports a client is not reading are buffered per session and flushed when
+        its socket is writable, so a slow reader never blocks this thread.
+        """
+        self.selector = selectors.DefaultSelector()
+        self.workers = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"order_worker_{i}")
+            for i in range(self.num_workers)
+        ]
+        server_socket = self.server_socket  # shutdown() clears the attribute from another thread
+        server_socket.setblocking(False)
+        self.selector.register(server_socket, selectors.EVENT_READ, None)
+        self._loop_thread = threading.current_thread()
+        self._wakeup = socket.socketpair()
+        for end in self._wakeup:
+            end.setblocking(False)
+        self.selector.register(self._wakeup[0], selectors.EVENT_READ, self._wakeup)
+        connection_count = 0
         try:
-            order = Order.from_bytes(data)
-            self.logger.info(f"Received order: {order}")
+            while self.running:
+                for key, events in self.selector.select(timeout=1.0):  # Timeout allows periodic check of self.running
+                    if key.data is None:
+                        connection_count = self._accept_client(server_socket, connection_count)
+                    elif key.data is self._wakeup:
+                        self._drain_wakeup()
+                    else:
+                        session = key.data
+                        if events & selectors.EVENT_WRITE and session.flush():
+                            self.selector.modify(session.socket, selectors.EVENT_READ, session)
+                        if events & selectors.EVENT_READ:
+                            self._read_client(session)
+                self._apply_backlog()
+        except (OSError, ValueError) as e:
+            # ValueError: a socket closed by shutdown() while still registered
+            if self.running:
+                self.logger.error(f"Error in event loop: {e}")
+        finally:
+            for worker in self.workers:
+                worker.shutdown(wait=True)
+            self.selector.close()
+            for end in self._wakeup:
+                end.close()
+
+    def _on_backlog(self, session: ClientSession):
+        """ClientSession callback, from any thread: have the loop watch or drop the session"""
+        self._backlogged.append(session)
+        if threading.current_thread() is not self._loop_thread:
+            try:
+                self._wakeup[1].send(b'\0')
+            except (BlockingIOError, OSError):
+                pass  # Already woken, or shutting down
+
+    def _drain_wakeup(self):
+        try:
+            while self._wakeup[0].recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _apply_backlog(self):
+        """Watch backlogged sessions for EVENT_WRITE and disconnect closed ones (loop thread)"""
+        backlogged = self._backlogged
+        while backlogged:
+            session = backlogged.popleft()
+            if session.closed:
+                if session.overflowed:
+                    self.logger.warning(f"Client {session.addr} is not reading its reports "
+                                        f"({len(session.outbound)} bytes unsent); disconnecting")
+                self._close_session(session)
+            elif session.outbound:
+                try:
+                    self.selector.modify(session.socket, selectors.EVENT_READ | selectors.EVENT_WRITE, session)
+                except (KeyError, ValueError):
+                    pass  # Already disconnected
 
-            self._execute_order(order)
+    def _accept_client(self, server_socket: socket.socket, connection_count: int) -> int:
+        try:
+            client_socket, addr = server_socket.accept()
+        except BlockingIOError:
+            return connection_count
+        client_socket.setblocking(False)
+        worker = self.workers[connection_count % len(self.workers)] if self.workers else None
+        self.selector.register(client_socket, selectors.EVENT_READ,
+                               ClientSession(client_socket, addr, self.delimiter, worker,
+                                             self._on_backlog, self.max_outbound_bytes))
+        with self.lock:
+            self.clients.append(client_socket)
+        self.logger.info(f"Client connected from {addr}")
+        return connection_count + 1
+
+    def _read_client(self, session: ClientSession):
+        client_socket, addr, framer = session.socket, session.addr, session.framer
+        try:
+            data = client_socket.recv(RECV_BUFFER_SIZE)
+            if data:
+                orders = framer.feed(data)
+                if orders:
+                    if session.worker is None:
+                        self.route_orders(orders, session)
+                    else:
+                        session.worker.submit(self.route_orders, orders, session)
+                if framer.error is None:
+                    return
+                raise ValueError(framer.error)
+            if framer.pending:
+                self.logger.warning(f"Client {addr} closed with a partial order of {framer.pending} bytes")
+        except (BlockingIOError, socket.timeout):
+            return  # Spurious wakeup
         except Exception as e:
-            self.logger.error(f"Error routing order: {e}")
+            self.logger.error(f"Error handling client {addr}: {e}")
+        self._close_session(session)
+
+    def _close_session(self, session: ClientSession):
+        """Unregister and close an event-loop client (loop thread; once per session)"""
+        session.closed = True
+        client_socket = session.socket
+        try:
+            self.selector.unregister(client_socket)
+        except (KeyError, ValueError):
+            return  # Already closed
+        self._release_session(session)
+        client_socket.close()
+        with self.lock:
+            if client_socket in self.clients:
+                self.clients.remove(client_socket)
+        self.logger.info(f"Client {session.addr} disconnected")
+
+    def _release_session(self, session: ClientSession):
+        """Drop a disconnected session's own state; its account's positions and open orders stay"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.remove_client(session.account)
+        with self.matching_lock:
+            self.risk.release(session.account)
+
+    def refresh_positions(self):
+        """Mark positions to the SharedPriceBook and publish PnL every refresh interval until shutdown"""
+        while self.running:
+            if self.price_book is None:
+                try:
+                    self.price_book = SharedPriceBook(self.positions.symbols, name=self.price_book_name,
+                                                      create=False, traced=self.price_book_traced)
+                except FileNotFoundError:
+                    pass  # OrderBook not up yet: publish positions at cost, try again next time
+            try:
+                if self.price_book is not None:
+                    self.positions.refresh(self.price_book)
+                else:
+                    self.positions.publish()
+            except Exception as e:
+                self.logger.error(f"Error refreshing positions: {e}")
+            time.sleep(self.positions_refresh_interval)
+
+    def serve_order_ring(self):
+        """Execute orders from the shared-memory ring until shutdown"""
+        ring = self.order_ring
+        self.logger.info(f"Reading orders from shared-memory ring '{ring.name}' ({ring.capacity} records)")
+        while self.running:
+            try:
+                orders = ring.read(RING_BATCH_SIZE)
+                if orders:
+                    self.execute_orders(orders, received_ns=time.monotonic_ns())
+                else:
+                    ring.wait(RING_WAIT_TIMEOUT, self.ring_spin)
+            except Exception as e:
+                # The batch is already off the ring; keep serving the orders behind it
+                self.logger.error(f"Error serving order ring: {e}", exc_info=True)
+                time.sleep(RING_WAIT_TIMEOUT)  # Bounds the retry rate of a persistent failure
+
+    def route_order(self, data: bytes):
+        """Route every order in ``data``, which may hold one or more delimited orders"""
+        self.route_orders([frame for frame in data.split(self.delimiter) if frame])
+
+    def _recover(self, path: str):
+        """Rest every open order from the journal again, in its original time priority"""
+        orders, last_order_id = recover_orders(path)
+        # Terminal orders are not restored, but their ids must not be handed out again
+        self.matching_engine.reserve_order_ids(last_order_id)
+        restored = 0
+        for order in orders.values():
+            if order.status in (OrderStatus.ACTIVE, OrderStatus.PARTIALLY_FILLED):
+                self.matching_engine.restore(order)
+                self.risk.on_rest(order)
+                self.orders.add(order)
+                restored += 1
+        self.logger.info(f"Recovered {restored} open order(s) from journal {path}")
+
+    def route_orders(self, frames: List[bytes], session: Optional[ClientSession] = None):
+        """Parse a batch of framed orders in one pass and execute the valid ones.
+
+        A malformed frame is logged and skipped without affecting the rest of the
+        batch; if it carried a client order id, the session gets a REJECT report.
+        A logon frame sets the session's account for the orders after it.
+        With a journal, the batch's reports are only sent once its records are on disk.
+        """
+        received_ns = time.monotonic_ns()
+        orders = []
+        for frame in frames:
+            try:
+                order = Order.from_bytes(frame)
+            except Exception as e:
+                if session is not None and frame.startswith(LOGON_PREFIX):
+                    self.execute_orders(orders, session, received_ns)  # Earlier orders keep the old account
+                    orders = []
+                    self._logon(session, frame[len(LOGON_PREFIX):].decode('utf-8', errors='replace'))
+                    continue
+                self.logger.error(f"Error routing order: {e}")
+                client_order_id = self._client_order_id_of(frame)
+                if session is not None and client_order_id:
+                    session.send(self._reject(client_order_id, str(e)).to_bytes())
+                continue
+            orders.append(order)
+        self.execute_orders(orders, session, received_ns)
+
+    def _logon(self, session: ClientSession, account: str):
+        if session.logged_on:
+            self.logger.warning(f"Client {session.addr} is already logged on as {session.account}; "
+                                f"ignoring logon as {account}")
+            return
+        if not account:
+            self.logger.error(f"Client {session.addr} sent a logon without an account")
+            return
+        with self.matching_lock:
+            self.risk.release(session.account)
+        session.account, session.logged_on = account, True
+        self.logger.info(f"Client {session.addr} logged on as {account}")
+
+    def execute_orders(self, orders: List[Order], session: Optional[ClientSession] = None,
+                       received_ns: int = 0):
+        """Execute parsed orders in order, then send their reports (after the journal commit)"""
+        if self._deferred:
+            reports = []
+            # Keep arrival order behind the session's deferred orders
+            if self._defer(orders, session, received_ns, 0.0, reports, if_deferred=True):
+                self._send_reports(reports)
+                return
+        # Only a threaded-mode client thread may sleep out a "queue" mode delay itself
+        self._execute_batch(orders, session, received_ns, session is not None and self.mode == "threaded")
+
+    def _execute_batch(self, orders: List[Order], session: Optional[ClientSession], received_ns: int,
+                       may_sleep: bool, ready_at: float = 0.0, deferred: bool = False):
+        """Execute ``orders``; with ``ready_at``, the first already holds its rate-limit tokens
+        and runs at that ``time.monotonic()``. ``deferred`` batches come off the session's backlog:
+        orders there past ``max_queued_delay`` are rejected, and a delayed rest goes back to its front."""
+        reports = []
+        rate_limiter = self.rate_limiter
+        account = session.account if session is not None else self.ring_account
+        expires_ns = received_ns + int(rate_limiter.limits.max_queued_delay * 1e9) if deferred else 0
+        for i, order in enumerate(orders):
+            if i or not ready_at:
+                ready_at = 0.0
+                if rate_limiter is not None:
+                    try:
+                        if expires_ns and time.monotonic_ns() > expires_ns:
+                            raise rate_limiter.reject_queued("queued too long")
+                        delay = rate_limiter.acquire(order, account)
+                    except RateLimitExceeded as e:
+                        self._on_rate_limited(order, session, e, reports)
+                        continue
+                    if delay:
+                        ready_at = time.monotonic() + delay
+            if ready_at and ready_at > time.monotonic():  # A deferred batch is taken off when due
+                if not may_sleep:
+                    self._defer(orders[i:], session, received_ns, ready_at, reports, front=deferred)
+                    break
+                # "queue" mode: holds back this connection's later orders too
+                time.sleep(max(0.0, ready_at - time.monotonic()))
+            if order.origin_ns:
+                self.latency.record("order_transit", order.sent_ns, received_ns)
+                self.latency.record("tick_to_order", order.origin_ns, received_ns)
+            self.logger.info("Received order: %s", order)
+            reports += self._execute_order(order, session) or ()
+        if self.journal is not None and reports:
+            try:
+                self.journal.commit()
+            except OSError as e:
+                self._on_journal_failure(e)
+                return  # Never report what the journal did not make durable
+        self._send_reports(reports)
+
+    def _on_journal_failure(self, error: Exception):
+        """Stop the server: orders it can no longer journal must not be acknowledged"""
+        if not self.running:
+            return
+        self.logger.critical(f"Journal failed, shutting down: {error}")
+        threading.Thread(target=self.shutdown, name="journal_failure_shutdown", daemon=True).start()
+
+    def _defer(self, orders: List[Order], session: Optional[ClientSession], received_ns: int, ready_at: float,
+               reports: List[Tuple[ClientSession, ExecutionReport]], front: bool = False,
+               if_deferred: bool = False) -> bool:
+        """Add ``orders`` to the session's backlog, at its ``front`` for the rest of a batch taken off it.
+
+        Orders over ``max_queued`` are rejected into ``reports``. With ``if_deferred``,
+        does nothing unless the session already has a backlog; returns whether it was queued.
+        """
+        with self._deferral_ready:
+            backlog = self._deferred.get(session)
+            if backlog is None and if_deferred:
+                return False
+            room = max(0, self.rate_limiter.limits.max_queued - (backlog.orders if backlog is not None else 0))
+            overflow, orders = orders[room:], orders[:room]
+            if orders:
+                if backlog is None:
+                    backlog = self._deferred[session] = DeferredOrders()
+                    heapq.heappush(self._deferral_heap,
+                                   (ready_at or time.monotonic(), next(self._deferral_seq), session))
+                    self._deferral_ready.notify()
+                backlog.orders += len(orders)
+                if front:
+                    backlog.batches.appendleft((orders, received_ns, ready_at))
+                else:
+                    backlog.batches.append((orders, received_ns, ready_at))
+        for order in overflow:
+            self._on_rate_limited(order, session, self.rate_limiter.reject_queued("queue full"), reports)
+        return True
+
+    def _run_deferred(self):
+        """Execute deferred batches as they fall due, earliest first across sessions"""
+        heap = self._deferral_heap
+        ready = self._deferral_ready
+        while True:
+            with ready:
+                while self.running and (not heap or heap[0][0] > time.monotonic()):
+                    ready.wait(heap[0][0] - time.monotonic() if heap else None)
+                if not self.running:
+                    return
+                _, _, session = heapq.heappop(heap)
+                backlog = self._deferred[session]
+                orders, received_ns, ready_at = backlog.batches.popleft()
+                backlog.orders -= len(orders)
+            try:
+                self._execute_batch(orders, session, received_ns, False, ready_at, deferred=True)
+            except Exception as e:
+                self.logger.error(f"Error executing deferred orders: {e}", exc_info=True)
+            finally:
+                with ready:
+                    if backlog.batches:
+                        heapq.heappush(heap, (backlog.batches[0][2] or time.monotonic(),
+                                              next(self._deferral_seq), session))
+                    else:
+                        del self._deferred[session]
+
+    def _on_rate_limited(self, order: Order, session: Optional[ClientSession], error: RateLimitExceeded,
+                         reports: List[Tuple[ClientSession, ExecutionReport]]):
+        rejected = self.rate_limiter.total_rejected
+        if (rejected - 1) % RATE_LIMIT_LOG_EVERY == 0:
+            self.logger.warning("%s; %d order(s) rate limited so far", error, rejected)
+        if session is not None and order.client_order_id is not None:
+            reports.append((session, self._reject(order.client_order_id, str(error))))
+
+    @staticmethod
+    def _client_order_id_of(frame: bytes) -> Optional[str]:
+        parts = frame.split(b',')
+        if len(parts) in (6, 8):
+            return parts[5].decode('utf-8', errors='replace')
+        return None
+
+    @staticmethod
+    def _reject(client_order_id: str, reason: str) -> ExecutionReport:
+        return ExecutionReport(ExecType.REJECT, client_order_id, "", OrderStatus.FAILED, reason=reason)
     
-    def _execute_order(self, order: Order):
+    def _execute_order(self, order: Order,
+                       session: Optional[ClientSession] = None) -> List[Tuple[ClientSession, ExecutionReport]]:
+        """Check, match and journal ``order``; returns the reports to send.
+
+        Orders carrying a ``client_order_id`` get an ACK (with the server-assigned
+        order id) or a REJECT, then a FILL per execution; fills of resting orders
+        are routed to the session that placed them. Orders without one get no reports.
+        Risk and positions are kept per account (the session's, else ``ring_account``).
+        """
+        reports: List[Tuple[ClientSession, ExecutionReport]] = []
+        client_order_id = order.client_order_id
+        wants_reports = session is not None and client_order_id is not None
+        account = session.account if session is not None else self.ring_account
         try:
-            self.logger.info(f"Executing order: {order}")
+            self.logger.info("Executing order: %s", order)
+            with self.matching_lock:
+                self.risk.check(order, account)
+                try:
+                    book_order = self.matching_engine.submit(order, owner=account)
+                finally:
+                    fills, self._pending_fills = self._pending_fills, []
+                book_order.session = session
+                self.risk.on_rest(book_order)
+                self.orders.add(book_order)
+                if wants_reports:
+                    reports.append((session, ExecutionReport(
+                        ExecType.ACK, client_order_id, book_order.order_id, OrderStatus.ACTIVE,
+                        leaves_quantity=book_order.quantity
+                    )))
+                filled = 0
+                for fill in fills:
+                    self.risk.on_fill(fill, account)
+                    if self.positions is not None:
+                        self.positions.on_fill(fill, account)
+                    filled += fill.quantity
+                    if wants_reports:
+                        reports.append((session, ExecutionReport(
+                            ExecType.FILL, client_order_id, book_order.order_id,
+                            OrderStatus.FILLED if filled == book_order.quantity else OrderStatus.PARTIALLY_FILLED,
+                            fill.quantity, fill.price, filled, book_order.quantity - filled
+                        )))
+                    resting = self.orders.get(fill.resting_order_id)
+                    if resting is None:
+                        continue
+                    resting_session = resting.session  # Cleared once the order is terminal
+                    self.orders.refresh(resting)
+                    if resting_session is not None and resting.client_order_id is not None:
+                        reports.append((resting_session, ExecutionReport(
+                            ExecType.FILL, resting.client_order_id, resting.order_id, resting.status,
+                            fill.quantity, fill.price, resting.filled_quantity, resting.remaining_quantity
+                        )))
+                # Journaled last: the order is in the book by now, so a failure here must not REJECT it
+                if self.journal is not None:
+                    try:
+                        self.journal.append_order(book_order, client_order_id)
+                        for fill in fills:
+                            self.journal.append_fill(fill)
+                    except (OSError, ValueError) as e:
+                        self._on_journal_failure(e)
+                        return []
+            self.logger.info("Order %s %s: filled %d/%d", book_order.order_id, book_order.status.value,
+                             book_order.filled_quantity, book_order.quantity)
+        except RiskCheckError as e:
+            self.logger.warning(f"Order rejected by risk: {e}")
+            if wants_reports:
+                reports.append((session, self._reject(client_order_id, str(e))))
         except Exception as e:
             self.logger.error(f"Error executing order: {e}")
+            if wants_reports:
+                reports.append((session, self._reject(client_order_id, str(e))))
+        return reports
+
+    def _send_reports(self, reports: List[Tuple[ClientSession, ExecutionReport]]):
+        # Sent outside the matching lock so a slow client cannot stall matching
+        for report_session, report in reports:
+            if report_session.closed:
+                continue  # Owner disconnected; its resting orders still trade
+            if not report_session.send(report.to_bytes()):
+                self.logger.warning(f"Could not send execution report to {report_session.addr}")
+
+    def _on_fill(self, fill: Fill):
+        # Called by the engine inside submit(), under matching_lock
+        self._pending_fills.append(fill)
+        self.logger.info("Fill %s %d @ %.2f (buy %s, sell %s)", fill.symbol, fill.quantity, fill.price,
+                         fill.buy_order_id, fill.sell_order_id)
     
     def shutdown(self):
-        """Shutdown the server and clean up all resources"""
+        """Shutdown the server and clean up all resources.
+
+        Order intake stops first (listener, client connections, then the threads
+        still executing their orders), so the journal is compacted and closed
+        only once nothing can append to it.
+        """
         if not self.running:
             return  # Already shut down
         
         self.running = False
         self.logger.info("Shutting down server...")
+        if self.latency.enabled:
+            self.logger.info("%s", self.latency.format_report())
+            self.latency.dump("logs/latency_order_manager.json")
         
         # Close server socket first to stop accepting new connections
         if self.server_socket:
@@ -137,7 +811,50 @@ class Server:
                 except Exception:
                     pass
             self.clients.clear()
+            client_threads = list(self._client_threads)
             if client_count > 0:
                 self.logger.info(f"Closed {client_count} client connection(s)")
         
-        self.logger.info("Server shutdown complete")
\ No newline at end of file
+        # Let every thread that executes orders finish what it has already read
+        current = threading.current_thread()
+        for thread in client_threads + [self._loop_thread, self._ring_thread]:
+            if thread is not None and thread is not current:
+                thread.join(timeout=SHUTDOWN_JOIN_TIMEOUT)
+        for worker in self.workers:
+            worker.shutdown(wait=True)
+        if self._deferral_thread is not None:
+            with self._deferral_ready:
+                self._deferral_ready.notify()
+            if self._deferral_thread is not current:
+                self._deferral_thread.join(timeout=SHUTDOWN_JOIN_TIMEOUT)
+            dropped = sum(backlog.orders for backlog in self._deferred.values())
+            if dropped:
+                self.logger.warning(f"Dropped {dropped} rate-limited order(s) still queued")
+        
+        if self.order_ring is not None:
+            self.order_ring.close()
+            self.order_ring.unlink()
+        if self._positions_thread is not None:
+            self._positions_thread.join(timeout=self.positions_refresh_interval + 1.0)
+        if self.positions is not None:
+            self.positions.pnl_book.close()
+            self.positions.pnl_book.unlink()
+            if self.price_book is not None:
+                self.price_book.close()
+        if self.journal is not None:
+            # A failed journal is kept as written: the book may hold orders it never recorded
+            if not self.journal.failed:
+                try:
+                    with self.matching_lock:
+                        self.journal.compact(list(self.matching_engine.orders.values()),
+                                             self.matching_engine.last_order_id)
+                except OSError as e:
+                    self.logger.error(f"Error compacting journal: {e}")  # The full journal is still valid
+            try:
+                self.journal.close()
+            except OSError as e:
+                self.logger.error(f"Error closing journal: {e}")
+        if self.archive is not None:
+            self.archive.close()
+        
+        self.logger.info("Server shutdown complete")
@@ -0,0 +1,342 @@
+from concurrent.futures import Future
+import errno
+import os
+import select
+import struct
+import tempfile
+import time
+from multiprocessing import shared_memory
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from logger import setup_logger
+from OrderManager.models import ORDER_SIZE, ExecutionReport, Order, Side
+
+# Control block: int64 slots; head and tail sit on separate 64-byte cache lines
+CONTROL_SIZE = 256
+_HEAD = 0       # Records published by the producer (monotonic count)
+_CAPACITY = 1
+_GENERATION = 2  # Set by the consumer when it creates the ring; 0 once the ring is retired
+_TAIL = 8       # Records consumed by the consumer (monotonic count)
+_WAITING = 16   # 1 while the consumer is about to block on the doorbell
+
+
+def doorbell_path(name: str) -> str:
+    return os.path.join(tempfile.gettempdir(), f"{name}.doorbell")
+
+
+class Doorbell:
+    """Cross-process wakeup over a named FIFO.
+
+    The consumer holds both ends open, so an idle FIFO never reads as EOF,
+    and blocks in ``select`` on the read end. The producer writes one byte per
+    ring; a full pipe or a missing reader just means a wakeup is already
+    pending or nobody is listening.
+    """
+
+    def __init__(self, path: str, reader: bool):
+        self.path = path
+        self.reader = reader
+        try:
+            os.mkfifo(path, 0o600)
+        except FileExistsError:
+            pass
+        self.read_fd: Optional[int] = None
+        self.write_fd: Optional[int] = None
+        if reader:
+            self.read_fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+            self.write_fd = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+
+    def ring(self):
+        if self.write_fd is None:
+            try:
+                self.write_fd = os.open(self.path, os.O_WRONLY | os.O_NONBLOCK)
+            except OSError as e:
+                if e.errno in (errno.ENXIO, errno.ENOENT):
+                    return  # No consumer yet
+                raise
+        try:
+            os.write(self.write_fd, b'\x01')
+        except BlockingIOError:
+            pass  # Pipe full: the consumer has wakeups pending anyway
+        except BrokenPipeError:
+            os.close(self.write_fd)
+            self.write_fd = None
+
+    def wait(self, timeout: float) -> bool:
+        """Block until rung or ``timeout`` seconds pass; drains pending rings"""
+        readable, _, _ = select.select([self.read_fd], [], [], timeout)
+        if not readable:
+            return False
+        try:
+            os.read(self.read_fd, 4096)
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self):
+        for fd in (self.read_fd, self.write_fd):
+            if fd is not None:
+                os.close(fd)
+        self.read_fd = self.write_fd = None
+
+    def unlink(self):
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class OrderRing:
+    """Single-producer/single-consumer ring of fixed-size binary order records
+    (``Order.to_buffer`` layout, ORDER_SIZE bytes) in shared memory.
+
+    The consumer (OrderManager) creates the ring; the producer (Strategy)
+    attaches to it. Each side owns one index: the producer writes records and
+    then publishes ``head``, the consumer reads up to ``head`` and then
+    publishes ``tail``. Index slots are aligned int64 stores. When idle, the
+    consumer sets ``waiting`` and sleeps on the doorbell, and the producer
+    only pays for a doorbell write while that flag is set. The consumer also
+    wakes every ``timeout`` seconds, so a missed wakeup costs at most that
+    much latency.
+
+    The creator stamps the ring with a generation and clears it when it closes
+    the ring or replaces a stale one, so a producer still attached to an old
+    segment (the OrderManager restarted) sees ``retired`` and can re-attach.
+    """
+
+    def __init__(self, name: str = "order_ring", capacity: int = 65536, create: bool = False):
+        self.logger = setup_logger("order_ring")
+        self.name = name
+        self._create = create
+        if create:
+            if capacity <= 0 or capacity & (capacity - 1):
+                raise ValueError("Ring capacity must be a power of two")
+            size = CONTROL_SIZE + capacity * ORDER_SIZE
+            try:
+                self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            except FileExistsError:
+                self.logger.warning(f"Shared memory '{name}' already exists. Cleaning up...")
+                stale = shared_memory.SharedMemory(name=name, create=False)
+                if stale.size >= CONTROL_SIZE:
+                    struct.pack_into('<q', stale.buf, _GENERATION * 8, 0)  # Producers re-attach
+                stale.close()
+                stale.unlink()
+                self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name, create=False)
+
+        self.buf = self.shm.buf
+        self.control = np.ndarray(shape=(CONTROL_SIZE // 8,), dtype=np.int64, buffer=self.buf)
+        if create:
+            self.control[:] = 0
+            self.control[_CAPACITY] = capacity
+            self.control[_GENERATION] = time.time_ns()
+        self.capacity = int(self.control[_CAPACITY])
+        self.generation = int(self.control[_GENERATION])
+        self._mask = self.capacity - 1
+        # Each side caches the index it owns
+        self._head = int(self.control[_HEAD])
+        self._tail = int(self.control[_TAIL])
+        self.doorbell = Doorbell(doorbell_path(name), reader=create)
+
+    def __len__(self) -> int:
+        """Records published but not yet consumed"""
+        return int(self.control[_HEAD]) - int(self.control[_TAIL])
+
+    @property
+    def retired(self) -> bool:
+        """True once the consumer has closed this ring or replaced it with a new one"""
+        return self.control[_GENERATION] != self.generation
+
+    # Producer side
+
+    def write(self, orders: List[Order]) -> int:
+        """Append as many of ``orders`` as fit; returns how many were written.
+
+        Raises ValueError, publishing none of them, if an order cannot be packed.
+        """
+        head = self._head
+        count = min(len(orders), self.capacity - (head - int(self.control[_TAIL])))
+        if count <= 0:
+            return 0
+        buf, mask = self.buf, self._mask
+        for order in orders[:count]:
+            order.to_buffer(buf, CONTROL_SIZE + (head & mask) * ORDER_SIZE)
+            head += 1
+        self._head = head
+        self.control[_HEAD] = head  # Publish after the records are written
+        if self.control[_WAITING]:
+            self.doorbell.ring()
+        return count
+
+    # Consumer side
+
+    def read(self, max_records: int = 1024) -> List[Order]:
+        """Take up to ``max_records`` published orders, oldest first"""
+        tail = self._tail
+        count = min(int(self.control[_HEAD]) - tail, max_records)
+        if count <= 0:
+            return []
+        start = tail & self._mask
+        first = min(count, self.capacity - start)  # Records before the wrap point
+        offset = CONTROL_SIZE + start * ORDER_SIZE
+        data = bytes(self.buf[offset:offset + first * ORDER_SIZE])
+        if first < count:
+            data += bytes(self.buf[CONTROL_SIZE:CONTROL_SIZE + (count - first) * ORDER_SIZE])
+        self._tail = tail + count
+        self.control[_TAIL] = self._tail  # Slots are free once copied out
+        try:
+            return list(Order.iter_buffer(data))
+        except ValueError:
+            return self._salvage(data, tail)
+
+    def _salvage(self, data: bytes, tail: int) -> List[Order]:
+        """Decode ``data`` record by record, dropping the corrupt ones"""
+        orders = []
+        for i, offset in enumerate(range(0, len(data), ORDER_SIZE)):
+            try:
+                orders.extend(Order.iter_buffer(data[offset:offset + ORDER_SIZE]))
+            except ValueError:
+                self.logger.error(f"Dropped corrupt order record {tail + i} from ring '{self.name}'")
+        return orders
+
+    def wait(self, timeout: float = 0.01, spin: float = 0.0) -> bool:
+        """Wait until orders are available: poll for ``spin`` seconds, then sleep on the doorbell"""
+        control, tail = self.control, self._tail
+        if spin:
+            deadline = time.perf_counter() + spin
+            while time.perf_counter() < deadline:
+                if control[_HEAD] != tail:
+                    return True
+        control[_WAITING] = 1
+        try:
+            if control[_HEAD] != tail:  # Published before the flag was visible
+                return True
+            self.doorbell.wait(timeout)
+        finally:
+            control[_WAITING] = 0
+        return bool(control[_HEAD] != tail)
+
+    def close(self):
+        self.doorbell.close()
+        if self._create:
+            self.control[_GENERATION] = 0
+        del self.control
+        self.buf = None
+        self.shm.close()
+
+    def unlink(self):
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass  # Already replaced by a newer ring of the same name
+        self.doorbell.unlink()
+
+
+class OrderRingClient:
+    """Order sender with the ``OrderManagerClient`` interface over an OrderRing.
+
+    The ring carries binary orders only, so there is no client order id and
+    no execution report channel. ``connect`` fails (returns False) until the
+    OrderManager has created the ring. A full ring refuses orders rather
+    than blocking the strategy. When the OrderManager restarts and recreates
+    the ring, the next send re-attaches to the new one.
+    """
+
+    def __init__(self, name: str = "order_ring"):
+        self.logger = setup_logger("order_ring_client")
+        self.name = name
+        self.ring: Optional[OrderRing] = None
+        self.connected = False
+
+    def connect(self) -> bool:
+        if not self._attach():
+            self.logger.error(f"Order ring '{self.name}' does not exist (is the OrderManager running?)")
+            return False
+        self.connected = True
+        return True
+
+    def _attach(self) -> bool:
+        try:
+            self.ring = OrderRing(self.name)
+        except FileNotFoundError:
+            return False
+        self.logger.info(f"Attached to order ring '{self.name}' ({self.ring.capacity} records)")
+        return True
+
+    def _write(self, orders: List[Order]) -> int:
+        if not self.connected:
+            self.logger.error("Not connected to OrderManager")
+            return 0
+        ring = self.ring
+        if ring is None or ring.retired:
+            if ring is not None:
+                self.logger.warning(f"Order ring '{self.name}' was closed or recreated; re-attaching")
+                ring.close()
+                self.ring = None
+            if not self._attach():
+                self.logger.error(f"Order ring '{self.name}' does not exist, dropped {len(orders)} order(s)")
+                return 0
+            ring = self.ring
+        try:
+            written = ring.write(orders)
+        except ValueError as e:
+            self.logger.error(f"Error placing orders, dropped {len(orders)} order(s): {e}")
+            return 0
+        if written < len(orders):
+            self.logger.warning("Order ring full, dropped %d order(s)", len(orders) - written)
+        return written
+
+    def set_execution_listener(self, callback: Callable[[ExecutionReport], None]):
+        """Accepted for interface compatibility; the ring transport sends no execution reports"""
+
+    def place_order(self, symbol: str, side: str, quantity: int, price: float, origin_ns: int = 0) -> bool:
+        try:
+            order = Order(symbol, quantity, price, Side(side.upper()), time.time(), None, None, origin_ns,
+                          time.monotonic_ns() if origin_ns else 0)
+        except Exception as e:
+            self.logger.error(f"Error placing order: {e}")
+            return False
+        return self._write([order]) == 1
+
+    def place_orders(self, orders: Iterable[Tuple[str, str, int, float]],
+                     origin_ns: int = 0) -> List[Optional[Future]]:
+        """Write ``(symbol, side, quantity, price)`` orders, like ``OrderManagerClient.place_orders``.
+
+        Returns a Future per order, already resolved with None since the ring sends
+        no reports, or None for orders that were invalid or did not fit in the ring.
+        """
+        timestamp = time.time()
+        sent_ns = time.monotonic_ns() if origin_ns else 0
+        built = []
+        for symbol, side, quantity, price in orders:
+            try:
+                built.append(Order(symbol, quantity, price, Side(side.upper()), timestamp, None, None,
+                                   origin_ns, sent_ns))
+            except Exception as e:
+                self.logger.error(f"Error placing order: {e}")
+                built.append(None)
+        written = self._write([order for order in built if order is not None])
+        results: List[Optional[Future]] = []
+        for order in built:
+            if order is None or not written:
+                results.append(None)
+                continue
+            written -= 1
+            future = Future()
+            future.set_result(None)
+            results.append(future)
+        return results
+
+    def send_order(self, order: Order) -> bool:
+        if order.origin_ns:
+            order.sent_ns = time.monotonic_ns()
+        return self._write([order]) == 1
+
+    def disconnect(self):
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+        self.connected = False
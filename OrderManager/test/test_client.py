@@ -3,7 +3,8 @@ import socket
 import threading
 import time
 from OrderManager.client import OrderManagerClient
-from OrderManager.models import Order, Side
+from OrderManager.models import ExecType, ExecutionReport, Order, Side
+from trading_lib.models import OrderStatus
 
 
 class MockServer:
@@ -76,6 +77,24 @@ def test_client_connect():
     finally:
         server.stop()
 
+def test_client_logs_on_with_its_account():
+    server = MockServer(9210)
+    server.start()
+    
+    try:
+        client = OrderManagerClient('localhost', 9210, account="desk")
+        assert client.connect()
+        deadline = time.time() + 2.0
+        while not server.received_data and time.time() < deadline:
+            time.sleep(0.01)
+        assert server.received_data[0].startswith(b'LOGON,desk*')
+        client.disconnect()
+    finally:
+        server.stop()
+    
+    with pytest.raises(ValueError):
+        OrderManagerClient('localhost', 9210, account="a,b")
+
 def test_client_connect_failure():
     """Test client connection failure"""
     client = OrderManagerClient('localhost', 9299)  # No server listening
@@ -166,3 +185,148 @@ def test_client_disconnect():
         assert client.socket is None
     finally:
         server.stop()
+
+
+class CollectingServer:
+    """Accepts connections one at a time and records everything received"""
+    
+    def __init__(self, port):
+        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server_socket.bind(('localhost', port))
+        self.server_socket.listen(1)
+        self.data = b''
+        self.connections = 0
+        self.client_socket = None
+        threading.Thread(target=self._run, daemon=True).start()
+    
+    def _run(self):
+        try:
+            while True:
+                self.client_socket, _ = self.server_socket.accept()
+                self.connections += 1
+                while chunk := self.client_socket.recv(65536):
+                    self.data += chunk
+        except OSError:
+            pass
+    
+    def orders(self):
+        return [frame for frame in self.data.split(b'*') if frame]
+    
+    def stop(self):
+        for sock in (self.client_socket, self.server_socket):
+            if sock is None:
+                continue
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+
+
+def wait_for(condition, timeout=3.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_client_place_orders_single_write():
+    server = CollectingServer(9206)
+    try:
+        client = OrderManagerClient('localhost', 9206)
+        client.connect()
+        futures = client.place_orders([("AAPL", "BUY", 10, 100.0), ("MSFT", "BAD", 1, 1.0),
+                                       ("MSFT", "SELL", 5, 300.0)])
+        
+        assert futures[0] is not None and futures[1] is None and futures[2] is not None
+        assert wait_for(lambda: len(server.orders()) == 2)
+        assert [Order.from_bytes(frame).symbol for frame in server.orders()] == ["AAPL", "MSFT"]
+        client.disconnect()
+    finally:
+        server.stop()
+
+
+def test_buffered_client_flushes_on_threshold():
+    server = CollectingServer(9207)
+    try:
+        client = OrderManagerClient('localhost', 9207, buffered=True, flush_interval=60.0, flush_bytes=10_000)
+        client.connect()
+        client.place_orders([("AAPL", "BUY", 1, 100.0)] * 10)
+        time.sleep(0.1)
+        assert server.orders() == [] and client.queued_orders == 10
+        
+        # Crossing flush_bytes wakes the writer
+        client.place_orders([("AAPL", "BUY", 1, 100.0)] * 400)
+        assert wait_for(lambda: len(server.orders()) == 410)
+        assert client.queued_orders == 0
+        client.disconnect()
+    finally:
+        server.stop()
+
+
+def test_low_latency_client_flushes_every_order():
+    server = CollectingServer(9208)
+    try:
+        client = OrderManagerClient('localhost', 9208, buffered=True, flush_interval=60.0, low_latency=True)
+        client.connect()
+        assert client.place_order("AAPL", "BUY", 1, 100.0)
+        assert client.queued_orders == 0
+        assert wait_for(lambda: len(server.orders()) == 1)
+        client.disconnect()
+    finally:
+        server.stop()
+
+
+def test_buffered_client_reconnects_and_resends_queued_orders():
+    server = CollectingServer(9209)
+    client = OrderManagerClient('localhost', 9209, buffered=True, flush_interval=0.01,
+                                backoff_initial=0.05, backoff_max=0.1)
+    try:
+        client.connect()
+        pending = client.submit_order("AAPL", "BUY", 1, 100.0)
+        assert wait_for(lambda: len(server.orders()) == 1 and client.queued_orders == 0)
+        
+        server.stop()
+        assert wait_for(lambda: not client.connected)
+        # Written before the drop: no report can arrive on the old connection
+        with pytest.raises(ConnectionError):
+            pending.result(timeout=1.0)
+        
+        queued = client.place_orders([("MSFT", "SELL", 2, 300.0), ("GOOG", "BUY", 3, 140.0)])
+        assert all(queued) and client.queued_orders == 2
+        
+        server = CollectingServer(9209)
+        assert wait_for(lambda: len(server.orders()) == 2)
+        assert client.connected
+        assert [Order.from_bytes(frame).symbol for frame in server.orders()] == ["MSFT", "GOOG"]
+        assert not any(future.done() for future in queued)
+    finally:
+        client.disconnect()
+        server.stop()
+
+
+def test_buffered_client_bounds_queue():
+    client = OrderManagerClient('localhost', 9299, buffered=True, max_queued_orders=2, backoff_initial=1.0)
+    try:
+        assert client.connect() is False  # Writer keeps retrying in the background
+        futures = client.place_orders([("AAPL", "BUY", 1, 100.0)] * 3)
+        assert [future is not None for future in futures] == [True, True, False]
+        assert client.queued_orders == 2
+    finally:
+        client.disconnect()
+
+
+def test_client_order_ids_drop_terminal_orders_and_stay_bounded():
+    client = OrderManagerClient('localhost', 1, max_tracked_orders=3)
+    for i in range(5):
+        client._on_report(ExecutionReport(ExecType.ACK, f"c{i}", str(i), OrderStatus.ACTIVE, leaves_quantity=10))
+    assert list(client.order_ids) == ["c2", "c3", "c4"]
+
+    client._on_report(ExecutionReport(ExecType.FILL, "c2", "2", OrderStatus.PARTIALLY_FILLED, 5, 1.0, 5, 5))
+    assert "c2" in client.order_ids
+    client._on_report(ExecutionReport(ExecType.FILL, "c2", "2", OrderStatus.FILLED, 5, 1.0, 10, 0))
+    client._on_report(ExecutionReport(ExecType.FILL, "c3", "3", OrderStatus.CANCELED))
+    client._on_report(ExecutionReport(ExecType.REJECT, "c4", "4", OrderStatus.FAILED, reason="risk"))
+    client._on_report(ExecutionReport(ExecType.ACK, "c5", "5", OrderStatus.FILLED))
+    assert client.order_ids == {}
@@ -0,0 +1,45 @@
+import pytest
+
+from OrderManager.framing import OrderFramer
+
+
+def test_framer_coalesced_orders():
+    """Test several orders in one chunk are all returned"""
+    framer = OrderFramer()
+    frames = framer.feed(b'1.0,BUY,100,AAPL,150.5*2.0,SELL,50,MSFT,325.0*')
+    assert frames == [b'1.0,BUY,100,AAPL,150.5', b'2.0,SELL,50,MSFT,325.0']
+    assert framer.pending == 0
+
+
+def test_framer_split_order():
+    """Test an order spanning several chunks is reassembled"""
+    framer = OrderFramer()
+    assert framer.feed(b'1.0,BUY,10') == []
+    assert framer.feed(b'0,AAP') == []
+    assert framer.pending == 15
+    assert framer.feed(b'L,150.5*2.0,SE') == [b'1.0,BUY,100,AAPL,150.5']
+    assert framer.feed(b'LL,50,MSFT,325.0*') == [b'2.0,SELL,50,MSFT,325.0']
+
+
+def test_framer_skips_empty_frames():
+    framer = OrderFramer()
+    assert framer.feed(b'**1.0,BUY,1,A,1.0***') == [b'1.0,BUY,1,A,1.0']
+
+
+def test_framer_rejects_oversized_frame():
+    """Test an unterminated frame beyond the limit sets the error and resets the buffer"""
+    framer = OrderFramer(max_frame_size=16)
+    assert framer.feed(b'x' * 10) == []
+    assert framer.error is None
+    assert framer.feed(b'x' * 10) == []
+    assert "Unterminated order frame" in framer.error
+    assert framer.pending == 0
+    with pytest.raises(ValueError, match="Unterminated order frame"):
+        framer.feed(b'1.0,BUY,1,A,1.0*')
+
+
+def test_framer_returns_orders_completed_before_an_oversized_frame():
+    framer = OrderFramer(max_frame_size=16)
+    assert framer.feed(b'1.0,BUY,1,A,1.0*2.0,SELL,1,B,2.0*' + b'x' * 20) == [b'1.0,BUY,1,A,1.0',
+                                                                          b'2.0,SELL,1,B,2.0']
+    assert framer.error is not None and framer.pending == 0
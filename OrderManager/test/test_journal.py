@@ -0,0 +1,226 @@
+import os
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from OrderManager.journal import Journal, recover_orders, replay, scan_valid_length
+from OrderManager.matching_engine import BookOrder, Fill
+from OrderManager.models import ExecutionReport, Order, Side
+from OrderManager.server import ClientSession, Server
+from trading_lib.models import OrderStatus
+
+
+def book_order(order_id, side=Side.BUY, quantity=10, price=100.0):
+    return BookOrder(order_id, "AAPL", side, price, quantity, 1.0)
+
+
+def write_sample(path):
+    journal = Journal(path)
+    journal.append_order(book_order("1"), "c-1")
+    journal.append_order(book_order("2", Side.SELL, quantity=4))
+    journal.append_fill(Fill("AAPL", 100.0, 4, "2", "1", Side.SELL, 2.0))
+    journal.append_order(book_order("3", quantity=5, price=99.0))
+    journal.append_cancel("3")
+    journal.close()
+
+
+def test_journal_replay_roundtrip(tmp_path):
+    path = str(tmp_path / "orders.journal")
+    write_sample(path)
+
+    records = list(replay(path))
+    assert [record[0] for record in records] == ["order", "order", "fill", "order", "cancel"]
+    assert records[0] == ("order", "1", "c-1", "AAPL", Side.BUY, 10, 100.0, 1.0, None)
+    assert records[1][2] is None
+    assert records[2] == ("fill", "2", "1", "AAPL", Side.SELL, 4, 100.0, 2.0)
+
+
+def test_recover_orders_rebuilds_status(tmp_path):
+    path = str(tmp_path / "orders.journal")
+    write_sample(path)
+
+    orders, last_order_id = recover_orders(path)
+    assert last_order_id == 3
+    assert list(orders) == ["1", "2", "3"]
+    assert (orders["1"].status, orders["1"].filled_quantity) == (OrderStatus.PARTIALLY_FILLED, 4)
+    assert orders["2"].status == OrderStatus.FILLED
+    assert orders["3"].status == OrderStatus.CANCELED
+
+
+@pytest.mark.parametrize("cut", [1, 5, 9])
+def test_truncated_tail_is_dropped_and_overwritten(tmp_path, cut):
+    """A torn last record (crash mid-write) is ignored on replay and truncated on reopen"""
+    path = str(tmp_path / "orders.journal")
+    write_sample(path)
+    full_size = os.path.getsize(path)
+    with open(path, 'r+b') as f:
+        f.truncate(full_size - cut)
+
+    assert [record[0] for record in replay(path)] == ["order", "order", "fill", "order"]
+    assert recover_orders(path)[0]["3"].status == OrderStatus.ACTIVE
+
+    valid_length = scan_valid_length(path)
+    journal = Journal(path)
+    assert os.path.getsize(path) == valid_length
+    journal.append_cancel("1")
+    journal.close()
+    assert [record[0] for record in replay(path)] == ["order", "order", "fill", "order", "cancel"]
+    assert recover_orders(path)[0]["1"].status == OrderStatus.CANCELED
+
+
+def test_short_writes_are_completed(tmp_path, monkeypatch):
+    write = os.write
+    monkeypatch.setattr(os, "write", lambda fd, data: write(fd, bytes(data[:7])))
+    path = str(tmp_path / "orders.journal")
+    write_sample(path)
+    monkeypatch.undo()
+    assert [record[0] for record in replay(path)] == ["order", "order", "fill", "order", "cancel"]
+
+
+def test_failed_write_fails_the_journal(tmp_path, monkeypatch):
+    path = str(tmp_path / "orders.journal")
+    journal = Journal(path)
+    journal.commit(journal.append_order(book_order("1")))
+    durable_size = os.path.getsize(path)
+    
+    write, calls = os.write, []
+    def torn_write(fd, data):
+        calls.append(len(data))
+        if len(calls) > 1:
+            raise OSError(28, "No space left on device")
+        return write(fd, bytes(data[:10]))  # Part of a record, then the disk fills up
+    monkeypatch.setattr(os, "write", torn_write)
+    journal.append_order(book_order("2"))
+    with pytest.raises(OSError):
+        journal.commit()
+    monkeypatch.undo()
+    
+    assert journal.failed and journal.durable_sequence == 1
+    assert os.path.getsize(path) == durable_size  # The torn record was cut off
+    with pytest.raises(OSError, match="failed"):
+        journal.append_order(book_order("3"))
+    with pytest.raises(OSError, match="failed"):
+        journal.commit()
+    journal.close()
+    assert [record[1] for record in replay(path)] == ["1"]
+
+
+def test_compaction_keeps_open_orders_and_last_id(tmp_path):
+    path = str(tmp_path / "orders.journal")
+    journal = Journal(path)
+    for i in range(1, 101):
+        journal.append_order(book_order(str(i), Side.SELL, quantity=1))
+        journal.append_cancel(str(i))
+    open_order = book_order("101", quantity=10)
+    journal.append_order(open_order, "c-101")
+    journal.append_fill(Fill("AAPL", 100.0, 4, "102", "101", Side.SELL, 2.0))
+    journal.commit()
+    size = os.path.getsize(path)
+    
+    open_order.filled_quantity, open_order.owner, open_order.client_order_id = 4, "desk", "c-101"
+    journal.compact([open_order], 102)
+    assert os.path.getsize(path) < size / 20
+    assert [record[0] for record in replay(path)] == ["checkpoint", "open"]
+    journal.append_order(book_order("103", Side.SELL, quantity=1, price=101.0))  # Appends follow the checkpoint
+    journal.close()
+    
+    orders, last_order_id = recover_orders(path)
+    assert last_order_id == 103
+    assert list(orders) == ["101", "103"]
+    recovered = orders["101"]
+    assert (recovered.status, recovered.filled_quantity, recovered.remaining_quantity) == \
+        (OrderStatus.PARTIALLY_FILLED, 4, 6)
+    assert (recovered.client_order_id, recovered.owner) == ("c-101", "desk")
+
+
+def test_corrupt_record_ends_replay(tmp_path):
+    path = str(tmp_path / "orders.journal")
+    write_sample(path)
+    with open(path, 'r+b') as f:
+        f.seek(-3, os.SEEK_END)
+        f.write(b'\xff\xff\xff')  # Flip bytes in the last record's payload
+    assert len(list(replay(path))) == 4
+
+
+def test_journal_refuses_foreign_file(tmp_path):
+    path = tmp_path / "not_a_journal"
+    path.write_bytes(b'hello')
+    with pytest.raises(ValueError, match="not an order journal"):
+        Journal(str(path))
+    assert list(replay(str(path))) == []
+
+
+def test_group_commit_shares_fsyncs(tmp_path):
+    """Many committers are covered by far fewer fsyncs, and commit makes records durable"""
+    journal = Journal(str(tmp_path / "orders.journal"), fsync_batch=1_000_000, fsync_interval=60.0)
+
+    journal.append_order(book_order("1"))
+    journal.append_order(book_order("2"))
+    assert journal.durable_sequence == 0
+    journal.commit()
+    assert (journal.durable_sequence, journal.fsyncs) == (2, 1)
+
+    def worker(offset):
+        for i in range(50):
+            journal.commit(journal.append_order(book_order(f"{offset}-{i}")))
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert journal.durable_sequence == 402
+    assert journal.fsyncs <= 1 + 400
+    journal.close()
+    assert len(list(replay(journal.path))) == 402
+
+
+def test_server_recovers_open_orders(tmp_path):
+    config = {"host": "localhost", "order_manager_port": 0,
+              "journal": {"path": str(tmp_path / "orders.journal")}}
+    server = Server(config)
+    server.route_orders([b'LOGON,desk', b'1.0,BUY,10,AAPL,100.0'], ClientSession(MagicMock(), ("localhost", 1)))
+    server.route_orders([b'2.0,SELL,4,AAPL,100.0', b'3.0,SELL,5,AAPL,101.0'])
+    server.shutdown()
+    assert [record[0] for record in replay(config["journal"]["path"])] == ["checkpoint", "open", "open"]
+
+    restarted = Server(config)
+    try:
+        engine = restarted.matching_engine
+        assert engine.best_bid("AAPL") == 100.0
+        assert engine.best_ask("AAPL") == 101.0
+        assert engine.orders["1"].remaining_quantity == 6
+        assert len(engine) == 2
+        assert engine.orders["1"].owner == "desk"  # Recovered orders count against their account
+        assert restarted.risk.accounts["desk"].open_orders == 1
+        assert restarted.risk.accounts[None].open_orders == 1
+    
+        # New ids continue after the recovered ones, and recovered orders keep trading
+        fills = []
+        engine.set_fill_listener(fills.append)
+        incoming = Order(symbol="AAPL", quantity=6, price=100.0, side=Side.SELL, timestamp=4.0)
+        assert engine.submit(incoming).order_id == "4"
+        assert [fill.resting_order_id for fill in fills] == ["1"]
+    finally:
+        restarted.shutdown()
+
+
+def test_restarted_server_never_reuses_order_ids(tmp_path):
+    config = {"host": "localhost", "order_manager_port": 0,
+              "journal": {"path": str(tmp_path / "orders.journal")}}
+    server = Server(config)
+    server.route_orders([b'1.0,BUY,10,AAPL,100.0', b'2.0,BUY,5,AAPL,99.0', b'3.0,SELL,10,AAPL,100.0'])
+    assert sorted(server.orders.orders) == ["1", "2", "3"]  # "1" and "3" filled, "2" rests
+    server.shutdown()
+
+    restarted = Server(config)
+    try:
+        assert list(restarted.matching_engine.orders) == ["2"]
+        session = ClientSession(MagicMock(), ("localhost", 1))
+        restarted.route_orders([b'4.0,SELL,1,AAPL,101.0,c-1'], session)
+        ack = ExecutionReport.from_bytes(session.socket.sendall.call_args.args[0])
+        assert ack.order_id == "4"  # Not "3", the highest id was a filled order
+    finally:
+        restarted.shutdown()
@@ -0,0 +1,116 @@
+import random
+
+import pytest
+
+from OrderManager.matching_engine import MatchingEngine
+from OrderManager.models import Order, Side
+from trading_lib.models import OrderStatus
+
+
+def order(side, price, quantity, symbol="AAPL"):
+    return Order(symbol=symbol, quantity=quantity, price=price, side=side, timestamp=1.0)
+
+
+@pytest.fixture
+def engine():
+    engine = MatchingEngine()
+    engine.fills = []
+    engine.set_fill_listener(engine.fills.append)
+    return engine
+
+
+def test_resting_orders_set_best_prices(engine):
+    bid = engine.submit(order(Side.BUY, 100.0, 10))
+    engine.submit(order(Side.BUY, 101.0, 5))
+    engine.submit(order(Side.SELL, 103.0, 5))
+    engine.submit(order(Side.SELL, 102.0, 5))
+    
+    assert bid.status == OrderStatus.ACTIVE
+    assert engine.best_bid("AAPL") == 101.0
+    assert engine.best_ask("AAPL") == 102.0
+    assert engine.best_bid("MSFT") is None
+    assert len(engine) == 4
+    assert engine.fills == []
+
+
+def test_price_time_priority_and_partial_fills(engine):
+    first = engine.submit(order(Side.SELL, 101.0, 5))
+    second = engine.submit(order(Side.SELL, 101.0, 5))
+    better = engine.submit(order(Side.SELL, 100.5, 3))
+    
+    buy = engine.submit(order(Side.BUY, 101.0, 10))
+    
+    # Best price first, then oldest first within the level, at the resting price
+    assert [(f.resting_order_id, f.quantity, f.price) for f in engine.fills] == [
+        (better.order_id, 3, 100.5),
+        (first.order_id, 5, 101.0),
+        (second.order_id, 2, 101.0),
+    ]
+    assert buy.status == OrderStatus.FILLED
+    assert better.status == OrderStatus.FILLED
+    assert first.status == OrderStatus.FILLED
+    assert second.status == OrderStatus.PARTIALLY_FILLED
+    assert second.remaining_quantity == 3
+    assert engine.fills[0].buy_order_id == buy.order_id
+    assert engine.fills[0].sell_order_id == better.order_id
+    assert engine.best_ask("AAPL") == 101.0
+    assert engine.best_bid("AAPL") is None
+
+
+def test_incoming_remainder_rests(engine):
+    engine.submit(order(Side.BUY, 99.0, 4))
+    sell = engine.submit(order(Side.SELL, 98.0, 10))
+    
+    assert sell.status == OrderStatus.PARTIALLY_FILLED
+    assert sell.filled_quantity == 4
+    assert engine.best_ask("AAPL") == 98.0
+    assert engine.best_bid("AAPL") is None
+    assert engine.orders == {sell.order_id: sell}
+
+
+def test_no_cross_across_symbols_or_limits(engine):
+    engine.submit(order(Side.SELL, 101.0, 5, symbol="MSFT"))
+    engine.submit(order(Side.SELL, 102.0, 5))
+    engine.submit(order(Side.BUY, 101.5, 5))
+    assert engine.fills == []
+
+
+def test_cancel_skips_order_and_is_terminal(engine):
+    cancelled = engine.submit(order(Side.SELL, 100.0, 5))
+    resting = engine.submit(order(Side.SELL, 100.0, 5))
+    
+    assert engine.cancel(cancelled.order_id) is cancelled
+    assert cancelled.status == OrderStatus.CANCELED
+    with pytest.raises(KeyError):
+        engine.cancel(cancelled.order_id)
+    
+    engine.submit(order(Side.BUY, 100.0, 5))
+    assert [f.resting_order_id for f in engine.fills] == [resting.order_id]
+    assert engine.best_ask("AAPL") is None
+
+
+def test_order_ids(engine):
+    assert engine.submit(order(Side.BUY, 1.0, 1)).order_id == "1"
+    assert engine.submit(order(Side.BUY, 1.0, 1), order_id="abc").order_id == "abc"
+    with pytest.raises(ValueError, match="Duplicate order id"):
+        engine.submit(order(Side.BUY, 1.0, 1), order_id="abc")
+
+
+def test_random_flow_conserves_quantity():
+    """Filled quantity must match on both sides and the book must never be crossed"""
+    rng = random.Random(7)
+    engine = MatchingEngine()
+    fills = []
+    engine.set_fill_listener(fills.append)
+    submitted = []
+    for _ in range(5000):
+        side = Side.BUY if rng.random() < 0.5 else Side.SELL
+        submitted.append(engine.submit(order(side, 100.0 + rng.randint(-10, 10) * 0.5, rng.randint(1, 50))))
+        if engine.orders and rng.random() < 0.2:
+            engine.cancel(rng.choice(list(engine.orders)))
+        bid, ask = engine.best_bid("AAPL"), engine.best_ask("AAPL")
+        assert bid is None or ask is None or bid < ask
+    
+    filled = sum(o.filled_quantity for o in submitted)
+    assert filled == 2 * sum(f.quantity for f in fills)
+    assert all(o.status == OrderStatus.FILLED for o in submitted if o.remaining_quantity == 0)
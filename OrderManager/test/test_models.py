@@ -1,6 +1,7 @@
 import pytest
 import time
-from OrderManager.models import Order, Side
+from OrderManager.models import ExecType, ExecutionReport, Order, Side, ORDER_SIZE
+from trading_lib.models import OrderStatus
 
 
 def test_side_values():
@@ -158,6 +159,52 @@ def test_order_roundtrip():
     assert deserialized.side == original.side
     assert deserialized.timestamp == original.timestamp
 
+def test_order_traced_roundtrip():
+    """Test traced orders carry origin and send times, untraced stay at 5 fields"""
+    original = Order(
+        symbol="MSFT",
+        quantity=50,
+        price=325.75,
+        side=Side.SELL,
+        timestamp=1234567890.5,
+        origin_ns=111,
+        sent_ns=222
+    )
+    
+    serialized = original.to_bytes()
+    assert serialized.count(b',') == 6
+    
+    deserialized = Order.from_bytes(serialized)
+    assert deserialized.origin_ns == 111
+    assert deserialized.sent_ns == 222
+    
+    untraced = Order.from_bytes(b'1234567890.123,BUY,100,AAPL,150.5*')
+    assert untraced.origin_ns == 0
+    assert untraced.to_bytes().count(b',') == 4
+
+
+def test_order_client_order_id_roundtrip():
+    """Test the optional client order id field, with and without trace fields"""
+    order = Order(symbol="AAPL", quantity=1, price=1.5, side=Side.BUY, timestamp=1.0, client_order_id="42-7")
+    assert order.to_bytes() == b'1.0,BUY,1,AAPL,1.5,42-7*'
+    assert Order.from_bytes(order.to_bytes()).client_order_id == "42-7"
+    
+    order.origin_ns, order.sent_ns = 111, 222
+    decoded = Order.from_bytes(order.to_bytes())
+    assert (decoded.client_order_id, decoded.origin_ns, decoded.sent_ns) == ("42-7", 111, 222)
+
+def test_execution_report_roundtrip():
+    report = ExecutionReport(ExecType.FILL, "42-7", "3", OrderStatus.PARTIALLY_FILLED, 5, 101.25, 5, 10)
+    assert ExecutionReport.from_bytes(report.to_bytes()) == report
+    
+    reject = ExecutionReport(ExecType.REJECT, "42-8", "", OrderStatus.FAILED, reason="bad price, try again*")
+    decoded = ExecutionReport.from_bytes(reject.to_bytes())
+    assert decoded.reason == "bad price, try again "
+    
+    with pytest.raises(ValueError, match="Invalid execution report"):
+        ExecutionReport.from_bytes(b'ACK,1,2*')
+
+
 def test_order_from_bytes_invalid_format():
     """Test invalid format raises error"""
     with pytest.raises(ValueError, match="Invalid order data"):
@@ -199,3 +246,46 @@ def test_order_repr():
     assert "symbol='AAPL'" in result
     assert "side=BUY" in result
 
+
+def test_order_is_slotted():
+    """Test orders carry no per-instance __dict__"""
+    order = Order(symbol="AAPL", quantity=1, price=1.0, side=Side.BUY)
+    assert not hasattr(order, '__dict__')
+
+def test_order_buffer_roundtrip():
+    """Test packing into and unpacking from a caller-supplied buffer"""
+    orders = [
+        Order(symbol="AAPL", quantity=100, price=150.5, side=Side.BUY, timestamp=1.5),
+        Order(symbol="BRK.B", quantity=7, price=412.25, side=Side.SELL, timestamp=2.5,
+              origin_ns=111, sent_ns=222),
+    ]
+    buffer = bytearray(ORDER_SIZE * len(orders))
+    
+    offset = 0
+    for order in orders:
+        offset = order.to_buffer(buffer, offset)
+    assert offset == len(buffer)
+    
+    assert Order.from_buffer(buffer, ORDER_SIZE) == orders[1]
+    assert list(Order.iter_buffer(buffer)) == orders
+    assert Order.from_buffer(orders[0].pack()) == orders[0]
+
+def test_order_buffer_invalid():
+    """Test oversized symbols and truncated or corrupt records are rejected"""
+    with pytest.raises(ValueError, match="Symbol longer"):
+        Order(symbol="A" * 12, quantity=1, price=1.0, side=Side.BUY).pack()
+    
+    packed = Order(symbol="AAPL", quantity=1, price=1.0, side=Side.BUY).pack()
+    with pytest.raises(ValueError):
+        Order.from_buffer(packed[:-1])
+    
+    corrupt = bytearray(packed)
+    corrupt[ORDER_SIZE - 12] = 9  # side byte
+    with pytest.raises(ValueError):
+        Order.from_buffer(corrupt)
+    
+    # Out of range for the record's u32 quantity / i64 timestamps
+    for order in (Order(symbol="AAPL", quantity=2 ** 32, price=1.0, side=Side.BUY),
+                  Order(symbol="AAPL", quantity=1, price=1.0, side=Side.BUY, origin_ns=2 ** 63)):
+        with pytest.raises(ValueError, match="not representable"):
+            order.pack()
@@ -0,0 +1,89 @@
+import pytest
+
+from OrderManager.matching_engine import BookOrder, MatchingEngine
+from OrderManager.models import Order, Side
+from OrderManager.order_store import OrderArchive, OrderStore
+from trading_lib.models import OrderStatus
+
+
+def book_order(order_id, symbol="AAPL", owner="a", status=OrderStatus.ACTIVE):
+    return BookOrder(order_id, symbol, Side.BUY, 100.0, 10, 1.0, 0, status, owner, f"c-{order_id}")
+
+
+def test_store_indexes_by_symbol_status_and_client():
+    store = OrderStore()
+    for order in (book_order("1"), book_order("2", "MSFT"), book_order("3", owner="b"),
+                  book_order("4", status=OrderStatus.FILLED)):
+        store.add(order)
+    
+    assert store.get("2").symbol == "MSFT"
+    assert "4" in store and len(store) == 4
+    assert [o.order_id for o in store.open_orders("AAPL")] == ["1", "3"]
+    assert [o.order_id for o in store.orders_with_status(OrderStatus.FILLED)] == ["4"]
+    assert [o.order_id for o in store.orders_for_client("a")] == ["1", "2", "4"]
+    assert store.open_orders("GOOG") == []
+    with pytest.raises(ValueError):
+        store.add(book_order("1"))
+
+
+def test_store_transitions():
+    store = OrderStore()
+    store.add(book_order("1"))
+    store.transition("1", OrderStatus.PARTIALLY_FILLED)
+    assert store.count(OrderStatus.ACTIVE) == 0
+    assert store.count(OrderStatus.PARTIALLY_FILLED) == 1
+    
+    store.transition("1", OrderStatus.CANCELED)
+    assert store.open_orders("AAPL") == []
+    assert store.get("1").status == OrderStatus.CANCELED
+    with pytest.raises(ValueError, match="already CANCELED"):
+        store.transition("1", OrderStatus.ACTIVE)
+    with pytest.raises(KeyError):
+        store.transition("missing", OrderStatus.CANCELED)
+
+
+
+def test_terminal_orders_release_their_session():
+    store = OrderStore()
+    session = object()
+    for order in (book_order("1"), book_order("2"), book_order("3", status=OrderStatus.FILLED)):
+        order.session = session
+        store.add(order)
+    store.transition("1", OrderStatus.PARTIALLY_FILLED)
+    store.transition("2", OrderStatus.CANCELED)
+    
+    assert [store.get(order_id).session for order_id in "123"] == [session, None, None]
+
+def test_store_follows_engine_fills():
+    """refresh() picks up status changes made by the matching engine"""
+    engine, store = MatchingEngine(), OrderStore()
+    resting = engine.submit(Order(symbol="AAPL", quantity=10, price=100.0, side=Side.BUY, timestamp=1.0))
+    store.add(resting)
+    
+    store.add(engine.submit(Order(symbol="AAPL", quantity=4, price=100.0, side=Side.SELL, timestamp=2.0)))
+    store.refresh(resting)
+    assert store.orders_with_status(OrderStatus.PARTIALLY_FILLED) == [resting]
+    
+    store.add(engine.submit(Order(symbol="AAPL", quantity=6, price=100.0, side=Side.SELL, timestamp=3.0)))
+    store.refresh(resting)
+    assert store.open_orders("AAPL") == []
+    assert store.count(OrderStatus.FILLED) == 3
+
+
+def test_store_evicts_oldest_terminal_orders(tmp_path):
+    archive = OrderArchive(str(tmp_path / "archive.csv"))
+    store = OrderStore(max_terminal_orders=2, archive=archive)
+    store.add(book_order("1"))
+    for order_id in ("2", "3", "4"):
+        store.add(book_order(order_id, status=OrderStatus.FILLED))
+    store.transition("1", OrderStatus.CANCELED)
+    archive.close()
+    
+    # Open orders are never evicted; terminal ones go oldest first
+    assert [o.order_id for o in store] == ["1", "4"]
+    assert store.evicted == 2
+    assert store.get("2") is None
+    assert store.orders_for_client("a") == [store.get("1"), store.get("4")]
+    lines = (tmp_path / "archive.csv").read_text().splitlines()
+    assert [line.split(",")[:2] for line in lines] == [["2", "c-2"], ["3", "c-3"]]
+    assert lines[0].split(",")[7] == "FILLED"
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from OrderManager.matching_engine import Fill
+from OrderManager.models import Side
+from OrderManager.positions import OVERFLOW_ACCOUNT, PositionKeeper
+from shared_memory_utils import SharedPnLBook, SharedPriceBook
+
+SYMBOLS = ["AAPL", "MSFT"]
+
+
+def fill(quantity, price, side=Side.BUY, symbol="AAPL", resting_owner="mm"):
+    return Fill(symbol, price, quantity, "1", "2", side, 1.0, 0, resting_owner)
+
+
+def test_fills_update_both_sides_at_average_cost():
+    keeper = PositionKeeper(SYMBOLS)
+    keeper.on_fill(fill(10, 100.0), "trader")
+    keeper.on_fill(fill(10, 110.0), "trader")
+    
+    assert keeper.position_of("AAPL", "trader") == 20
+    assert keeper.position_of("AAPL", "mm") == -20
+    assert keeper.avg_price[keeper.accounts["trader"], 0] == pytest.approx(105.0)
+    assert keeper.position_of("MSFT", "trader") == 0
+
+
+def test_reducing_realizes_pnl_and_flipping_resets_average():
+    keeper = PositionKeeper(SYMBOLS)
+    keeper.on_fill(fill(10, 100.0), "trader")
+    keeper.on_fill(fill(4, 105.0, Side.SELL), "trader")
+    slot = keeper.accounts["trader"]
+    assert keeper.realized[slot, 0] == pytest.approx(20.0)
+    assert keeper.avg_price[slot, 0] == pytest.approx(100.0)
+    
+    keeper.on_fill(fill(10, 90.0, Side.SELL), "trader")  # Close 6 at a loss, go short 4
+    assert keeper.position_of("AAPL", "trader") == -4
+    assert keeper.realized[slot, 0] == pytest.approx(20.0 - 60.0)
+    assert keeper.avg_price[slot, 0] == pytest.approx(90.0)
+    
+    keeper.on_fill(fill(4, 80.0), "trader")
+    assert keeper.position_of("AAPL", "trader") == 0
+    assert keeper.realized[slot, 0] == pytest.approx(0.0)
+    assert keeper.avg_price[slot, 0] == 0.0
+
+
+def test_mark_revalues_all_positions_and_carries_unpriced_at_cost():
+    keeper = PositionKeeper(SYMBOLS)
+    keeper.on_fill(fill(10, 100.0), "trader")
+    keeper.on_fill(fill(5, 300.0, Side.SELL, "MSFT"), "trader")
+    
+    keeper.mark(np.array([102.0, 0.0]))
+    assert keeper.pnl("trader") == pytest.approx(20.0)
+    assert keeper.pnl("mm") == pytest.approx(-20.0)
+    keeper.mark(np.array([102.0, 290.0]))
+    assert keeper.pnl("trader") == pytest.approx(70.0)
+
+
+def test_untracked_symbols_and_account_overflow():
+    keeper = PositionKeeper(SYMBOLS, max_accounts=2)
+    keeper.on_fill(fill(1, 10.0, symbol="TSLA"), "trader")
+    assert keeper.untracked_fills == 1
+    
+    keeper.on_fill(fill(1, 10.0, resting_owner=None), "a")
+    keeper.on_fill(fill(1, 10.0, resting_owner=None), "b")
+    keeper.on_fill(fill(2, 10.0, resting_owner="c"), "a")
+    assert keeper.account_labels == ["a", "default", OVERFLOW_ACCOUNT]
+    assert keeper.overflow_accounts == 2
+    # Named accounts keep their rows; "b" and "c" share the overflow row: +1 - 2
+    assert keeper.position_of("AAPL", "a") == 3
+    assert keeper.position_of("AAPL", None) == -2
+    assert keeper.position_of("AAPL", "b") == keeper.position_of("AAPL", "c") == -1
+
+
+def test_overflow_row_is_published():
+    with SharedPnLBook(SYMBOLS, max_accounts=2, name="test_positions_overflow") as pnl_book:
+        keeper = PositionKeeper(SYMBOLS, max_accounts=1, pnl_book=pnl_book)
+        keeper.on_fill(fill(3, 10.0, resting_owner="b"), "a")
+        keeper.publish()
+        snapshot = pnl_book.read_all()
+        assert list(snapshot) == ["a", OVERFLOW_ACCOUNT]
+        assert snapshot[OVERFLOW_ACCOUNT]["symbols"]["AAPL"]["position"] == -3
+
+
+def test_refresh_marks_to_price_book_and_publishes():
+    with SharedPriceBook(SYMBOLS, name="test_positions_prices") as prices, \
+            SharedPnLBook(SYMBOLS, max_accounts=4, name="test_positions_pnl") as pnl_book:
+        keeper = PositionKeeper(SYMBOLS, max_accounts=4, pnl_book=pnl_book)
+        keeper.on_fill(fill(10, 100.0), "trader")
+        prices.update("AAPL", 101.5, 1.0)
+        keeper.refresh(prices)
+        
+        reader = SharedPnLBook(SYMBOLS, max_accounts=4, name="test_positions_pnl", create=False)
+        try:
+            snapshot = reader.read_all()
+            assert snapshot["trader"]["unrealized"] == pytest.approx(15.0)
+            assert snapshot["trader"]["symbols"]["AAPL"] == {
+                "position": 10, "avg_price": 100.0, "mark": 101.5, "pnl": pytest.approx(15.0)}
+            assert snapshot["mm"]["symbols"]["AAPL"]["position"] == -10
+            assert reader.total_pnl() == pytest.approx(0.0)
+        finally:
+            reader.close()
@@ -0,0 +1,89 @@
+import pytest
+
+from OrderManager.models import Order, Side
+from OrderManager.rate_limit import RateLimitExceeded, RateLimiter, RateLimits
+from OrderManager.risk import RiskCheckError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+    
+    def __call__(self):
+        return self.now
+
+
+def order(symbol="AAPL"):
+    return Order(symbol=symbol, quantity=1, price=10.0, side=Side.BUY, timestamp=1.0)
+
+
+def limiter(**limits):
+    clock = FakeClock()
+    return RateLimiter(RateLimits(**limits), clock), clock
+
+
+def test_bucket_allows_burst_then_refills_lazily():
+    rate_limiter, clock = limiter(global_rate=10, global_burst=3)
+    for _ in range(3):
+        assert rate_limiter.acquire(order()) == 0.0
+    with pytest.raises(RateLimitExceeded, match="global"):
+        rate_limiter.acquire(order())
+    
+    clock.now += 0.1  # One token at 10/s
+    rate_limiter.acquire(order())
+    with pytest.raises(RiskCheckError):
+        rate_limiter.acquire(order())
+    assert (rate_limiter.accepted, rate_limiter.rejected["global"]) == (4, 2)
+
+
+def test_client_and_symbol_buckets_are_independent():
+    rate_limiter, _ = limiter(client_rate=1, client_burst=2, symbol_rate=1, symbol_burst=1)
+    rate_limiter.acquire(order("AAPL"), "a")
+    with pytest.raises(RateLimitExceeded, match=r"symbol limit \(AAPL\)"):
+        rate_limiter.acquire(order("AAPL"), "b")
+    rate_limiter.acquire(order("MSFT"), "a")
+    with pytest.raises(RateLimitExceeded, match="client"):
+        rate_limiter.acquire(order("SPY"), "a")
+    rate_limiter.acquire(order("SPY"), "b")
+    assert rate_limiter.rejected == {"global": 0, "client": 1, "symbol": 1, "queue": 0}
+
+
+def test_rejected_order_takes_no_tokens():
+    rate_limiter, _ = limiter(global_rate=1, global_burst=2, symbol_rate=1, symbol_burst=1)
+    rate_limiter.acquire(order("AAPL"))
+    with pytest.raises(RateLimitExceeded):
+        rate_limiter.acquire(order("AAPL"))
+    # The global bucket still has its second token
+    rate_limiter.acquire(order("MSFT"))
+
+
+def test_queue_mode_delays_up_to_max_delay():
+    rate_limiter, clock = limiter(symbol_rate=100, symbol_burst=1, mode="queue", max_delay=0.025)
+    assert rate_limiter.acquire(order()) == 0.0
+    assert rate_limiter.acquire(order()) == pytest.approx(0.01)
+    assert rate_limiter.acquire(order()) == pytest.approx(0.02)
+    with pytest.raises(RateLimitExceeded):
+        rate_limiter.acquire(order())  # Would wait 30ms
+    assert rate_limiter.delayed == 2
+    
+    clock.now += 0.02
+    assert rate_limiter.acquire(order()) == pytest.approx(0.01)
+
+
+def test_disabled_and_invalid_limits():
+    assert not RateLimiter().enabled
+    assert RateLimiter(RateLimits(symbol_rate=5)).enabled
+    with pytest.raises(ValueError, match="mode"):
+        RateLimits(mode="drop")
+
+
+def test_remove_client_forgets_only_refilled_bucket():
+    rate_limiter, clock = limiter(client_rate=1, client_burst=1)
+    rate_limiter.acquire(order(), "a")
+    rate_limiter.remove_client("a")  # Reconnecting must not reset the limit
+    with pytest.raises(RateLimitExceeded, match="client"):
+        rate_limiter.acquire(order(), "a")
+    
+    clock.now += 1.0
+    rate_limiter.remove_client("a")
+    assert rate_limiter.client_buckets == {}
@@ -0,0 +1,110 @@
+import pytest
+
+from OrderManager.matching_engine import MatchingEngine
+from OrderManager.models import Order, Side
+from OrderManager.risk import RiskCheckError, RiskEngine, RiskLimits
+
+
+def order(side, quantity, price=10.0, symbol="AAPL"):
+    return Order(symbol=symbol, quantity=quantity, price=price, side=side, timestamp=1.0)
+
+
+class RiskedBook:
+    """Matching engine with risk applied the way the server does it"""
+
+    def __init__(self, limits):
+        self.engine = MatchingEngine()
+        self.risk = RiskEngine(limits)
+        self.fills = []
+        self.engine.set_fill_listener(self.fills.append)
+
+    def submit(self, new_order, account):
+        self.risk.check(new_order, account)
+        book_order = self.engine.submit(new_order, owner=account)
+        for fill in self.fills:
+            self.risk.on_fill(fill, account)
+        self.fills.clear()
+        self.risk.on_rest(book_order)
+        return book_order
+
+
+def test_order_size_and_notional_limits():
+    risk = RiskEngine(RiskLimits(max_order_quantity=100, max_order_notional=500.0))
+    risk.check(order(Side.BUY, 50))
+    with pytest.raises(RiskCheckError, match="quantity 101"):
+        risk.check(order(Side.BUY, 101, price=1.0))
+    with pytest.raises(RiskCheckError, match="notional"):
+        risk.check(order(Side.BUY, 60))
+
+
+def test_position_limit_counts_open_orders_and_fills():
+    book = RiskedBook(RiskLimits(max_position=100, position_limits={"MSFT": 10}))
+    
+    book.submit(order(Side.BUY, 60), "a")
+    with pytest.raises(RiskCheckError, match="AAPL position limit 100"):
+        book.risk.check(order(Side.BUY, 41), "a")
+    book.risk.check(order(Side.BUY, 41), "b")  # Limits are per account
+    book.risk.check(order(Side.SELL, 100), "a")  # Sells are checked against the short side
+    
+    book.submit(order(Side.SELL, 60), "b")  # Fills a's resting buy
+    assert book.risk.position("AAPL", "a") == 60
+    assert book.risk.position("AAPL", "b") == -60
+    
+    # a is long 60 with no open orders: 40 more to buy, 160 to sell
+    book.risk.check(order(Side.BUY, 40), "a")
+    with pytest.raises(RiskCheckError):
+        book.risk.check(order(Side.BUY, 41), "a")
+    book.risk.check(order(Side.SELL, 160), "a")
+    
+    with pytest.raises(RiskCheckError, match="MSFT position limit 10"):
+        book.risk.check(order(Side.BUY, 11, symbol="MSFT"), "a")
+
+
+def test_open_order_count_and_notional_track_fills_and_cancels():
+    book = RiskedBook(RiskLimits(max_open_orders=2, max_open_notional=1000.0))
+    
+    first = book.submit(order(Side.BUY, 50), "a")
+    book.submit(order(Side.BUY, 40), "a")
+    state = book.risk.accounts["a"]
+    assert (state.open_orders, state.open_notional) == (2, 900.0)
+    with pytest.raises(RiskCheckError, match="Open order count"):
+        book.risk.check(order(Side.BUY, 1), "a")
+    
+    book.submit(order(Side.SELL, 30), "b")  # Partially fills the first order
+    assert (state.open_orders, state.open_notional) == (2, 600.0)
+    book.submit(order(Side.SELL, 20), "b")  # Completes it
+    assert state.open_orders == 1
+    
+    cancelled = book.engine.cancel(book.engine.submit(order(Side.BUY, 5), owner="a").order_id)
+    book.risk.on_rest(cancelled)
+    book.risk.on_cancel(cancelled)
+    assert (state.open_orders, state.open_notional) == (1, 400.0)
+    with pytest.raises(RiskCheckError, match="Open notional"):
+        book.risk.check(order(Side.BUY, 61), "a")
+    assert first.remaining_quantity == 0
+
+
+def test_limits_from_config():
+    limits = RiskLimits.from_config({"max_position": 5, "position_limits": {"AAPL": 1}})
+    assert limits.max_position == 5
+    assert limits.max_order_quantity is None
+    with pytest.raises(TypeError):
+        RiskLimits.from_config({"max_positon": 5})
+
+
+def test_release_drops_only_flat_state():
+    book = RiskedBook(RiskLimits(max_position=100))
+    book.submit(order(Side.BUY, 10), "a")
+    book.submit(order(Side.SELL, 10), "b")
+    book.submit(order(Side.BUY, 5, symbol="MSFT"), "a")
+    
+    book.risk.release("b")  # Short 10 AAPL
+    book.risk.release("a")
+    assert list(book.risk.accounts["a"].symbols) == ["AAPL", "MSFT"]
+    
+    book.submit(order(Side.SELL, 10), "a")
+    book.submit(order(Side.BUY, 10), "b")
+    book.risk.release("a")
+    assert list(book.risk.accounts["a"].symbols) == ["MSFT"]  # The open MSFT buy
+    book.risk.release("b")
+    assert "b" not in book.risk.accounts
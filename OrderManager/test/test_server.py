@@ -0,0 +1,433 @@
+import pytest
+import time
+from unittest.mock import MagicMock
+
+from OrderManager.models import ExecType, ExecutionReport
+from OrderManager.server import ClientSession, Server
+from trading_lib.models import OrderStatus
+
+
+@pytest.fixture
+def server():
+    """Server bound to an ephemeral port; tests drive handle_client directly"""
+    srv = Server({"host": "localhost", "order_manager_port": 0})
+    yield srv
+    srv.shutdown()
+
+
+def run_client(server, chunks):
+    client_socket = MagicMock()
+    client_socket.recv.side_effect = list(chunks) + [b'']
+    server.clients.append(client_socket)
+    executed = []
+    server._execute_order = lambda order, session=None: executed.append(order)
+    server.handle_client(client_socket, ("localhost", 1234))
+    return executed
+
+
+def test_server_routes_coalesced_orders(server):
+    """Test back-to-back orders delivered in one recv are all executed"""
+    executed = run_client(server, [b'1.0,BUY,100,AAPL,150.5*2.0,SELL,50,MSFT,325.0*3.0,BUY,1,GOOG,1.0*'])
+    assert [order.symbol for order in executed] == ["AAPL", "MSFT", "GOOG"]
+
+
+def test_server_routes_split_orders(server):
+    """Test orders spanning recv boundaries are reassembled"""
+    executed = run_client(server, [b'1.0,BUY,10', b'0,AAPL,150.5*2.0,SE', b'LL,50,MSFT,325.0*'])
+    assert [(order.symbol, order.quantity) for order in executed] == [("AAPL", 100), ("MSFT", 50)]
+    assert server.clients == []
+
+
+def test_server_skips_malformed_order_in_batch(server):
+    """Test one bad order does not drop the rest of its batch"""
+    executed = run_client(server, [b'1.0,BUY,100,AAPL,150.5*garbage*2.0,SELL,50,MSFT,325.0*'])
+    assert [order.symbol for order in executed] == ["AAPL", "MSFT"]
+
+
+def test_server_route_order_accepts_multiple_orders(server):
+    executed = []
+    server._execute_order = lambda order, session=None: executed.append(order)
+    server.route_order(b'1.0,BUY,100,AAPL,150.5*2.0,SELL,50,MSFT,325.0*')
+    assert len(executed) == 2
+
+
+def reports_sent(session):
+    return [ExecutionReport.from_bytes(call.args[0]) for call in session.socket.sendall.call_args_list]
+
+
+def test_server_sends_ack_and_fills_to_both_sides(server):
+    """Test the aggressor gets ACK then FILL, and the resting owner gets its FILL"""
+    seller = ClientSession(MagicMock(), ("localhost", 1))
+    buyer = ClientSession(MagicMock(), ("localhost", 2))
+    
+    server.route_orders([b'1.0,SELL,10,AAPL,100.0,s-1'], seller)
+    server.route_orders([b'2.0,BUY,4,AAPL,101.0,b-1'], buyer)
+    
+    ack, seller_fill = reports_sent(seller)
+    assert (ack.exec_type, ack.client_order_id, ack.status) == (ExecType.ACK, "s-1", OrderStatus.ACTIVE)
+    assert (seller_fill.exec_type, seller_fill.order_id) == (ExecType.FILL, ack.order_id)
+    assert (seller_fill.last_quantity, seller_fill.last_price) == (4, 100.0)
+    assert (seller_fill.filled_quantity, seller_fill.leaves_quantity) == (4, 6)
+    assert seller_fill.status == OrderStatus.PARTIALLY_FILLED
+    
+    buyer_ack, buyer_fill = reports_sent(buyer)
+    assert buyer_ack.exec_type == ExecType.ACK
+    assert buyer_ack.order_id != ack.order_id
+    assert (buyer_fill.client_order_id, buyer_fill.status) == ("b-1", OrderStatus.FILLED)
+
+
+def test_server_rejects_malformed_order_with_client_id(server):
+    session = ClientSession(MagicMock(), ("localhost", 1))
+    server.route_orders([b'1.0,HOLD,10,AAPL,100.0,c-1', b'garbage'], session)
+    
+    (reject,) = reports_sent(session)
+    assert (reject.exec_type, reject.client_order_id, reject.status) == (ExecType.REJECT, "c-1", OrderStatus.FAILED)
+
+
+def test_server_rejects_order_breaching_risk_limit():
+    srv = Server({"host": "localhost", "order_manager_port": 0, "risk": {"max_order_quantity": 5}})
+    try:
+        session = ClientSession(MagicMock(), ("localhost", 1))
+        srv.route_orders([b'1.0,BUY,10,AAPL,100.0,c-1', b'1.0,BUY,5,AAPL,100.0,c-2'], session)
+        
+        reject, ack = reports_sent(session)
+        assert (reject.exec_type, reject.client_order_id) == (ExecType.REJECT, "c-1")
+        assert "quantity 10 exceeds limit 5" in reject.reason
+        assert (ack.exec_type, ack.client_order_id) == (ExecType.ACK, "c-2")
+        assert srv.risk.accounts["localhost"].open_orders == 1
+    finally:
+        srv.shutdown()
+
+
+def test_risk_limits_follow_the_account_across_reconnects():
+    srv = Server({"host": "localhost", "order_manager_port": 0, "risk": {"max_open_orders": 1}})
+    try:
+        first = ClientSession(MagicMock(), ("10.0.0.1", 1))
+        srv.route_orders([b'LOGON,desk', b'1.0,BUY,5,AAPL,100.0,c-1'], first)
+        srv._release_session(first)  # Disconnect with the order still open
+        
+        second = ClientSession(MagicMock(), ("10.0.0.2", 2))
+        srv.route_orders([b'LOGON,desk', b'1.0,BUY,5,AAPL,100.0,c-2', b'LOGON,other'], second)
+        (reject,) = reports_sent(second)
+        assert "Open order count at limit 1" in reject.reason
+        assert second.account == "desk"  # A second logon is ignored
+        
+        # A client without a logon trades for its host; a flat account is dropped on disconnect
+        anonymous = ClientSession(MagicMock(), ("10.0.0.3", 3))
+        srv.route_orders([b'1.0,SELL,5,AAPL,100.0,c-3'], anonymous)
+        assert srv.risk.position("AAPL", "10.0.0.3") == -5
+        srv._release_session(anonymous)
+        assert "10.0.0.3" in srv.risk.accounts
+        assert srv.risk.accounts["desk"].open_orders == 0
+        srv._release_session(second)
+        assert "desk" in srv.risk.accounts  # Long 5
+    finally:
+        srv.shutdown()
+
+
+def test_journal_failure_shuts_down_without_rejecting_booked_order(tmp_path):
+    srv = Server({"host": "localhost", "order_manager_port": 0, "journal": {"path": str(tmp_path / "orders.wal")}})
+    try:
+        seller = ClientSession(MagicMock(), ("localhost", 1))
+        buyer = ClientSession(MagicMock(), ("localhost", 2))
+        srv.route_orders([b'1.0,SELL,10,AAPL,100.0,s-1'], seller)
+        srv.journal.append_fill = MagicMock(side_effect=OSError("disk full"))
+        srv.route_orders([b'2.0,BUY,4,AAPL,101.0,b-1'], buyer)
+        
+        # The trade happened and its bookkeeping is complete, but nothing is reported for it
+        assert reports_sent(buyer) == []
+        assert [r.exec_type for r in reports_sent(seller)] == [ExecType.ACK]
+        assert srv.orders.get("1").filled_quantity == 4
+        assert srv.risk.position("AAPL", "localhost") == 0  # +4 -4 in one account
+        deadline = time.monotonic() + 3
+        while srv.running and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not srv.running
+    finally:
+        srv.shutdown()
+
+
+def test_server_sends_no_reports_without_client_id(server):
+    session = ClientSession(MagicMock(), ("localhost", 1))
+    server.route_orders([b'1.0,BUY,10,AAPL,100.0'], session)
+    session.socket.sendall.assert_not_called()
+
+
+@pytest.mark.integration
+def test_client_receives_pipelined_reports():
+    """Test many in-flight orders resolve their futures and stream fills back"""
+    import threading
+    from OrderManager.client import OrderManagerClient
+
+    srv = Server({"host": "localhost", "order_manager_port": 0})
+    port = srv.server_socket.getsockname()[1]
+    thread = threading.Thread(target=srv.run, daemon=True)
+    thread.start()
+    seller, buyer = OrderManagerClient("localhost", port), OrderManagerClient("localhost", port)
+    fills = []
+    seller.set_execution_listener(lambda report: report.exec_type == ExecType.FILL and fills.append(report))
+    try:
+        assert seller.connect() and buyer.connect()
+        sells = [seller.submit_order("AAPL", "SELL", 10, 100.0) for _ in range(50)]
+        acks = [future.result(timeout=5) for future in sells]
+        assert all(ack.exec_type == ExecType.ACK for ack in acks)
+        assert len({ack.order_id for ack in acks}) == 50
+        
+        buy = buyer.submit_order("AAPL", "BUY", 500, 100.0).result(timeout=5)
+        assert buy.exec_type == ExecType.ACK
+        
+        deadline = time.time() + 5
+        while len(fills) < 50 and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(fills) == 50
+        assert all(fill.status == OrderStatus.FILLED for fill in fills)
+        assert seller.order_ids == {}
+    finally:
+        seller.disconnect()
+        buyer.disconnect()
+        srv.shutdown()
+
+
+def test_server_invalid_mode():
+    with pytest.raises(ValueError, match="Invalid server_mode"):
+        Server({"host": "localhost", "order_manager_port": 0, "server_mode": "forking"})
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("workers", [0, 2])
+def test_event_loop_server_handles_many_clients(workers):
+    """Test the selector server frames and executes orders from concurrent clients"""
+    import socket
+    import threading
+    import time
+
+    srv = Server({"host": "localhost", "order_manager_port": 0, "server_mode": "event_loop", "workers": workers})
+    executed = []
+    srv._execute_order = lambda order, session=None: executed.append(order)
+    port = srv.server_socket.getsockname()[1]
+    thread = threading.Thread(target=srv.run, daemon=True)
+    thread.start()
+
+    clients = [socket.create_connection(("localhost", port)) for _ in range(5)]
+    try:
+        for i, client in enumerate(clients):
+            # Split one order across two sends, then pipeline two more
+            client.sendall(b'1.0,BUY,%d,AAPL,1' % (i + 1))
+            time.sleep(0.01)
+            client.sendall(b'50.5*2.0,SELL,1,MSFT,2.0*3.0,BUY,1,GOOG,3.0*')
+
+        deadline = time.time() + 5
+        while len(executed) < 15 and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(executed) == 15
+        assert sorted(order.quantity for order in executed if order.symbol == "AAPL") == [1, 2, 3, 4, 5]
+    finally:
+        for client in clients:
+            client.close()
+        srv.shutdown()
+        thread.join(timeout=3)
+    assert not thread.is_alive()
+
+
+def test_server_tracks_orders_in_store():
+    srv = Server({"host": "localhost", "order_manager_port": 0, "order_store": {"max_terminal_orders": 1}})
+    try:
+        session = ClientSession(MagicMock(), ("localhost", 1))
+        srv.route_orders([b'1.0,BUY,10,AAPL,100.0,c-1', b'2.0,SELL,4,AAPL,100.0,c-2',
+                          b'3.0,SELL,6,AAPL,100.0,c-3'], session)
+        
+        assert srv.orders.open_orders("AAPL") == []
+        # Only the most recently completed order is kept: 1 filled after 3
+        assert srv.orders.get("3") is None
+        assert srv.orders.get("1").status == OrderStatus.FILLED
+        assert srv.orders.evicted == 2
+        fills = [r for r in reports_sent(session) if r.exec_type is ExecType.FILL]
+        assert [(r.client_order_id, r.leaves_quantity) for r in fills] == [
+            ("c-2", 0), ("c-1", 6), ("c-3", 0), ("c-1", 0)]
+    finally:
+        srv.shutdown()
+
+
+def test_server_rate_limits_orders():
+    srv = Server({"host": "localhost", "order_manager_port": 0,
+                  "rate_limit": {"client_rate": 1, "client_burst": 2}})
+    try:
+        session = ClientSession(MagicMock(), ("localhost", 1))
+        srv.route_orders([b'1.0,BUY,1,AAPL,100.0,c-1', b'1.0,BUY,1,AAPL,100.0,c-2',
+                          b'1.0,BUY,1,AAPL,100.0,c-3'], session)
+        
+        reports = reports_sent(session)
+        assert [r.exec_type for r in reports] == [ExecType.ACK, ExecType.ACK, ExecType.REJECT]
+        assert "rate over client limit" in reports[-1].reason
+        assert len(srv.orders) == 2
+        assert srv.rate_limiter.rejected["client"] == 1
+    finally:
+        srv.shutdown()
+
+
+def test_event_loop_server_defers_queued_orders_off_the_loop_thread():
+    srv = Server({"host": "localhost", "order_manager_port": 0, "server_mode": "event_loop",
+                  "rate_limit": {"client_rate": 20, "client_burst": 1, "mode": "queue", "max_delay": 1.0}})
+    try:
+        session = ClientSession(MagicMock(), ("localhost", 1))
+        start = time.perf_counter()
+        srv.route_orders([b'1.0,BUY,1,AAPL,100.0,c-%d' % i for i in range(4)], session)
+        srv.route_orders([b'1.0,BUY,1,AAPL,100.0,c-4'], session)  # Queued behind the deferred ones
+        other = ClientSession(MagicMock(), ("10.0.0.2", 2))  # Another account, another bucket
+        srv.route_orders([b'1.0,SELL,1,MSFT,100.0,o-1'], other)
+        assert time.perf_counter() - start < 0.1  # Nothing slept on the calling (selector) thread
+        assert [r.client_order_id for r in reports_sent(session)] == ["c-0"]
+        assert [r.client_order_id for r in reports_sent(other)] == ["o-1"]
+        
+        deadline = time.time() + 3.0
+        while (len(reports_sent(session)) < 5 or srv._deferred) and time.time() < deadline:
+            time.sleep(0.01)
+        reports = reports_sent(session)
+        assert [r.client_order_id for r in reports] == [f"c-{i}" for i in range(5)]
+        assert all(r.exec_type == ExecType.ACK for r in reports)
+        assert time.perf_counter() - start >= 0.15  # Four orders paced at 20/s
+        assert srv._deferred == {}
+    finally:
+        srv.shutdown()
+
+
+def wait_for_reports(srv, session, count, timeout=3.0):
+    deadline = time.time() + timeout
+    while len(reports_sent(session)) < count and time.time() < deadline:
+        time.sleep(0.005)
+    return reports_sent(session)
+
+
+def test_flooding_session_does_not_delay_other_sessions_queued_orders():
+    srv = Server({"host": "localhost", "order_manager_port": 0, "server_mode": "event_loop",
+                  "rate_limit": {"client_rate": 20, "client_burst": 1, "mode": "queue", "max_delay": 1.0,
+                                 "max_queued_delay": 1.0}})
+    try:
+        flood = ClientSession(MagicMock(), ("10.0.0.1", 1))
+        srv.route_orders([b'1.0,BUY,1,AAPL,100.0,f-%d' % i for i in range(8)], flood)
+        other = ClientSession(MagicMock(), ("10.0.0.2", 2))
+        start = time.perf_counter()
+        srv.route_orders([b'1.0,SELL,1,MSFT,100.0,o-0', b'1.0,SELL,1,MSFT,100.0,o-1'], other)
+        
+        assert len(wait_for_reports(srv, other, 2)) == 2
+        assert time.perf_counter() - start < 0.15  # Due after 50ms, not after the flood's 350ms
+        assert len(reports_sent(flood)) < 8
+    finally:
+        srv.shutdown()
+
+
+def test_queue_mode_caps_backlog_depth_and_wait():
+    srv = Server({"host": "localhost", "order_manager_port": 0, "server_mode": "event_loop",
+                  "rate_limit": {"client_rate": 20, "client_burst": 1, "mode": "queue", "max_delay": 1.0,
+                                 "max_queued": 2, "max_queued_delay": 0.01}})
+    try:
+        session = ClientSession(MagicMock(), ("localhost", 1))
+        srv.route_orders([b'1.0,BUY,1,AAPL,100.0,c-%d' % i for i in range(5)], session)
+        reports = wait_for_reports(srv, session, 5)
+        # c-3 and c-4 overflow the backlog; c-1 holds its tokens, c-2 expires waiting behind it
+        assert [(r.client_order_id, r.exec_type) for r in reports] == [
+            ("c-0", ExecType.ACK), ("c-3", ExecType.REJECT), ("c-4", ExecType.REJECT),
+            ("c-1", ExecType.ACK), ("c-2", ExecType.REJECT)]
+        assert "queue full" in reports[1].reason and "queued too long" in reports[-1].reason
+        assert srv.rate_limiter.rejected["queue"] == 3
+    finally:
+        srv.shutdown()
+
+
+def test_server_without_rate_limit_config_skips_limiter(server):
+    assert server.rate_limiter is None
+
+
+def test_server_keeps_positions_per_account():
+    srv = Server({"host": "localhost", "order_manager_port": 0, "symbols": ["AAPL"],
+                  "positions": {"pnl_memory_name": "test_server_pnl", "refresh_interval": 0.01}})
+    try:
+        buyer = ClientSession(MagicMock(), ("localhost", 1))
+        seller = ClientSession(MagicMock(), ("localhost", 2))
+        srv.route_orders([b'LOGON,seller', b'1.0,SELL,10,AAPL,100.0'], seller)
+        srv.route_orders([b'LOGON,buyer', b'2.0,BUY,4,AAPL,100.0'], buyer)
+        
+        assert srv.positions.position_of("AAPL", "buyer") == 4
+        assert srv.positions.position_of("AAPL", "seller") == -4
+        assert srv.positions.account_labels == ["buyer", "seller"]  # Aggressor first
+    finally:
+        srv.shutdown()
+
+
+def test_nonblocking_session_buffers_unsent_reports():
+    import socket
+
+    server_end, client_end = socket.socketpair()
+    server_end.setblocking(False)
+    backlogged = []
+    session = ClientSession(server_end, ("localhost", 1), on_backlog=backlogged.append, max_outbound=1 << 20)
+    try:
+        report = b'x' * 1000
+        while not session.outbound:  # Fill the socket buffers without blocking
+            assert session.send(report)
+        assert backlogged == [session]
+        queued = len(session.outbound)
+        
+        client_end.setblocking(False)
+        received = 0
+        while not session.flush():
+            try:
+                received += len(client_end.recv(1 << 20))
+            except BlockingIOError:
+                pass
+        assert not session.outbound and not session.closed
+        
+        session.max_outbound = 0
+        while not session.closed:
+            session.send(report)
+        assert session.overflowed and backlogged[-1] is session
+        assert not session.send(report)
+    finally:
+        server_end.close()
+        client_end.close()
+
+
+@pytest.mark.integration
+def test_event_loop_server_drops_client_not_reading_reports():
+    """A client that never reads its reports is disconnected without stalling the others"""
+    import socket
+    import threading
+
+    srv = Server({"host": "localhost", "order_manager_port": 0, "server_mode": "event_loop",
+                  "max_outbound_bytes": 64 * 1024})
+    accept = srv._accept_client
+
+    def accept_with_small_send_buffer(server_socket, connection_count):
+        # Pin the kernel send buffer so the backlog builds up in the session
+        connection_count = accept(server_socket, connection_count)
+        for key in srv.selector.get_map().values():
+            if isinstance(key.data, ClientSession):
+                key.fileobj.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        return connection_count
+
+    srv._accept_client = accept_with_small_send_buffer
+    port = srv.server_socket.getsockname()[1]
+    thread = threading.Thread(target=srv.run, daemon=True)
+    thread.start()
+    slow = socket.socket()
+    slow.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    slow.connect(("localhost", port))
+    fast = socket.create_connection(("localhost", port))
+    try:
+        orders = b''.join(b'1.0,BUY,1,AAPL,%d.0,s-%d*' % (1 + i % 50, i) for i in range(5000))
+        threading.Thread(target=slow.sendall, args=(orders,), daemon=True).start()
+        
+        deadline = time.time() + 20
+        while len(srv.clients) == 2 and time.time() < deadline:
+            time.sleep(0.05)
+        assert len(srv.clients) == 1  # Dropped once its backlog passed the cap
+        
+        fast.settimeout(5)
+        fast.sendall(b'1.0,SELL,1,MSFT,10.0,f-1*')
+        report = ExecutionReport.from_bytes(fast.recv(4096))
+        assert report.exec_type is ExecType.ACK and report.client_order_id == "f-1"
+    finally:
+        slow.close()
+        fast.close()
+        srv.shutdown()
+        thread.join(timeout=3)
@@ -0,0 +1,196 @@
+import multiprocessing as mp
+import os
+import threading
+import time
+
+import pytest
+
+from OrderManager.models import ORDER_SIZE, Order, Side
+from OrderManager.server import Server
+from OrderManager.shm_channel import CONTROL_SIZE, OrderRing, OrderRingClient
+
+
+@pytest.fixture
+def ring_name():
+    return f"test_order_ring_{os.getpid()}"
+
+
+@pytest.fixture
+def ring(ring_name):
+    ring = OrderRing(ring_name, capacity=8, create=True)
+    yield ring
+    ring.close()
+    ring.unlink()
+
+
+def order(quantity, symbol="AAPL"):
+    return Order(symbol=symbol, quantity=quantity, price=100.0, side=Side.BUY, timestamp=1.0,
+                 origin_ns=11, sent_ns=22)
+
+
+def test_ring_roundtrip_and_wraparound(ring, ring_name):
+    producer = OrderRing(ring_name)
+    try:
+        assert producer.write([order(q) for q in range(1, 7)]) == 6
+        assert [o.quantity for o in ring.read(4)] == [1, 2, 3, 4]
+        
+        # Crosses the end of the buffer: 2 left + 6 new fill all 8 slots, the rest is refused
+        assert producer.write([order(q, "MSFT") for q in range(10, 18)]) == 6
+        assert len(ring) == 8
+        orders = ring.read()
+        assert [o.quantity for o in orders] == [5, 6, 10, 11, 12, 13, 14, 15]
+        assert (orders[-1].symbol, orders[-1].side, orders[-1].origin_ns, orders[-1].sent_ns) == ("MSFT", Side.BUY, 11, 22)
+        assert ring.read() == []
+    finally:
+        producer.close()
+
+
+def test_ring_rejects_bad_capacity():
+    with pytest.raises(ValueError):
+        OrderRing("test_order_ring_bad", capacity=100, create=True)
+
+
+def test_ring_client_requires_ring():
+    client = OrderRingClient("test_order_ring_missing")
+    assert client.connect() is False
+    assert client.place_order("AAPL", "BUY", 1, 100.0) is False
+
+
+def _produce_later(name, delay):
+    time.sleep(delay)
+    client = OrderRingClient(name)
+    client.connect()
+    client.place_order("AAPL", "SELL", 7, 101.0)
+    client.disconnect()
+
+
+def test_doorbell_wakes_consumer_in_other_process(ring, ring_name):
+    ctx = mp.get_context("fork")
+    process = ctx.Process(target=_produce_later, args=(ring_name, 0.2))
+    process.start()
+    try:
+        start = time.perf_counter()
+        assert ring.wait(timeout=5.0)
+        assert time.perf_counter() - start < 2.0
+        assert [(o.side, o.quantity) for o in ring.read()] == [(Side.SELL, 7)]
+    finally:
+        process.join(timeout=5.0)
+
+
+def test_wait_times_out_when_idle(ring):
+    start = time.perf_counter()
+    assert ring.wait(timeout=0.05) is False
+    assert time.perf_counter() - start >= 0.04
+
+
+def test_server_executes_orders_from_ring(ring_name):
+    server = Server({"host": "localhost", "order_manager_port": 0, "order_transport": "shm",
+                     "order_ring": {"name": ring_name, "capacity": 64}})
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    client = OrderRingClient(ring_name)
+    try:
+        assert client.connect()
+        futures = client.place_orders([("AAPL", "BUY", 10, 100.0), ("AAPL", "SELL", 4, 100.0),
+                                       ("MSFT", "HOLD", 1, 1.0), ("MSFT", "SELL", 5, 300.0)])
+        assert [future is not None for future in futures] == [True, True, False, True]
+        assert futures[0].result(timeout=0) is None  # Written; the ring sends no reports
+        deadline = time.time() + 3.0
+        while len(server.orders) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        assert server.matching_engine.orders["1"].remaining_quantity == 6
+        assert server.matching_engine.best_ask("MSFT") == 300.0
+    finally:
+        client.disconnect()
+        server.shutdown()
+        thread.join(timeout=3.0)
+
+
+
+def test_ring_write_publishes_nothing_on_unpackable_order(ring, ring_name):
+    client = OrderRingClient(ring_name)
+    try:
+        assert client.connect()
+        futures = client.place_orders([("AAPL", "BUY", 1, 100.0), ("AAPL", "BUY", 2 ** 32, 100.0)])
+        assert futures == [None, None]
+        assert ring.read() == []
+        assert client.place_order("AAPL", "BUY", 3, 100.0)
+        assert [o.quantity for o in ring.read()] == [3]
+    finally:
+        client.disconnect()
+
+def test_ring_read_drops_only_corrupt_records(ring, ring_name):
+    producer = OrderRing(ring_name)
+    try:
+        producer.write([order(1), order(2), order(3)])
+        producer.buf[CONTROL_SIZE + ORDER_SIZE + 36] = 7  # Record 2: side code out of range
+        assert [o.quantity for o in ring.read()] == [1, 3]
+    finally:
+        producer.close()
+
+
+def test_server_ring_thread_survives_errors(ring_name):
+    server = Server({"host": "localhost", "order_manager_port": 0, "order_transport": "shm",
+                     "order_ring": {"name": ring_name, "capacity": 64}})
+    execute_orders = server.execute_orders
+    calls = []
+    
+    def failing_once(orders, session=None, received_ns=0):
+        calls.append(orders)
+        if len(calls) == 1:
+            raise OSError("journal device gone")
+        execute_orders(orders, session, received_ns)
+    
+    server.execute_orders = failing_once
+    thread = server._ring_thread = threading.Thread(target=server.serve_order_ring, daemon=True)
+    thread.start()
+    producer = OrderRing(ring_name)
+    try:
+        producer.write([order(1)])
+        deadline = time.time() + 3.0
+        while not calls and time.time() < deadline:
+            time.sleep(0.01)
+        producer.write([order(2)])
+        while not server.orders and time.time() < deadline:
+            time.sleep(0.01)
+        assert thread.is_alive()
+        assert [o.quantity for o in server.matching_engine.orders.values()] == [2]
+    finally:
+        producer.close()
+        server.shutdown()
+        thread.join(timeout=3.0)
+
+
+def test_server_invalid_transport():
+    with pytest.raises(ValueError, match="order_transport"):
+        Server({"host": "localhost", "order_manager_port": 0, "order_transport": "udp"})
+
+
+def test_ring_client_reattaches_after_server_restart(ring_name):
+    config = {"host": "localhost", "order_manager_port": 0, "order_transport": "shm",
+              "order_ring": {"name": ring_name, "capacity": 64}}
+    server = Server(config)
+    client = OrderRingClient(ring_name)
+    try:
+        assert client.connect()
+        assert client.place_order("AAPL", "BUY", 1, 100.0)
+        server.shutdown()
+        assert client.ring.retired
+        assert not client.place_order("AAPL", "BUY", 2, 100.0)  # No ring until the restart
+        
+        server = Server(config)
+        assert client.place_order("AAPL", "BUY", 3, 100.0)
+        assert not client.ring.retired
+        assert [o.quantity for o in server.order_ring.read()] == [3]
+        
+        # A crashed server's ring is retired by its replacement
+        replacement = OrderRing(ring_name, capacity=8, create=True)
+        try:
+            assert client.send_order(order(4))
+            assert [o.quantity for o in replacement.read()] == [4]
+        finally:
+            replacement.close()
+            replacement.unlink()
+    finally:
+        client.disconnect()
+        server.shutdown()
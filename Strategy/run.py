@@ -4,6 +4,7 @@ import signal
 import sys
 import os
 import time
+from typing import Optional
 
 from trading_lib.models import MarketDataPoint
 from trading_lib.strategy.price_based_strategy import MovingAverageStrategy
@@ -13,11 +14,13 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from logger import setup_logger
+from logger import configure_logging, setup_logger
 from trading_lib.strategy_combiner.strategy_combiner import StrategyCombiner
+from trading_lib.strategy_combiner.strategy_host import StrategyHost
 from shared_memory_utils import SharedPriceBook
 
 def run_strategy(config: dict):
+    configure_logging(**config.get("logging", {}))
     logger = setup_logger("strategy")
     logger.info("Starting Strategy process")
 
@@ -25,10 +28,11 @@ def run_strategy(config: dict):
         strategy = configure_strategy(config)
         symbols = config["symbols"]
         shared_price_book = configure_shared_price_book(config, symbols)
+        traced = config.get("tracing", False)
         logger.info("Strategy process running")
 
         # Setup signal handlers
-        configure_signal_handlers(logger)
+        configure_signal_handlers(logger, strategy)
 
         last_query_time = 0.0  # Use timestamp 0.0 instead of datetime.min
 
@@ -37,6 +41,14 @@ def run_strategy(config: dict):
             time.sleep(1)
             current_query_time = time.time()
             for symbol in symbols:
+                if traced:
+                    price, timestamp, origin_ns, publish_ns = shared_price_book.read_traced(symbol)
+                    if last_query_time < timestamp <= current_query_time:
+                        received_ns = time.monotonic_ns()
+                        strategy.latency.record("shm_to_strategy", publish_ns, received_ns)
+                        strategy.got_new_price(MarketDataPoint(timestamp = timestamp, symbol = symbol, price = price,
+                                                               origin_ns = origin_ns, received_ns = received_ns))
+                    continue
                 price, timestamp = shared_price_book.read(symbol)
                 if last_query_time < timestamp <= current_query_time:
                     strategy.got_new_price(MarketDataPoint(timestamp = timestamp, symbol = symbol, price = price))
@@ -46,9 +58,12 @@ def run_strategy(config: dict):
         logger.error(f"Strategy error: {e}", exc_info=True)
         sys.exit(1)
 
-def configure_signal_handlers(logger: logging.Logger):
+def configure_signal_handlers(logger: logging.Logger, strategy: Optional[StrategyCombiner] = None):
     def signal_handler(signum, frame):
         logger.info(f"Received signal {signum}, shutting down...")
+        if strategy is not None and strategy.latency.enabled:
+            logger.info("%s", strategy.latency.format_report())
+            strategy.latency.dump("logs/latency_strategy.json")
         logger.info("Strategy shutdown complete")
         sys.exit(0)
 
@@ -68,7 +83,8 @@ def configure_shared_price_book(config: dict, symbols):
             return SharedPriceBook(
                 symbols,
                 name=config.get("shared_memory_name", "order_book"),
-                create=False
+                create=False,
+                traced=config.get("tracing", False)
             )
         except FileNotFoundError:
             if attempt < max_retries - 1:
@@ -86,6 +102,9 @@ def configure_shared_price_book(config: dict, symbols):
                 raise
 
 def configure_strategy(config: dict) -> StrategyCombiner:
+    if config.get("strategies"):
+        # Several variants in this process, sharing their moving averages
+        return StrategyHost(config["strategies"], config["symbols"], config)
     return StrategyCombiner(
         MovingAverageStrategy(config["short_window"], config["long_window"]),
         NewsBasedStrategy(config["bearish_threshold"], config["bullish_threshold"]),
@@ -0,0 +1,34 @@
+import random
+from typing import Optional
+
+
+class ExponentialBackoff:
+    """Jittered exponential backoff for reconnect loops.
+
+    Each call to ``next_delay`` doubles the base delay up to ``maximum`` and
+    returns a random value in ``[base * (1 - jitter), base]`` so that many
+    clients restarting together do not reconnect in lockstep.
+    """
+
+    def __init__(self, initial: float = 0.1, maximum: float = 5.0, multiplier: float = 2.0,
+                 jitter: float = 0.5, rng: Optional[random.Random] = None):
+        if initial <= 0 or maximum < initial:
+            raise ValueError("Backoff requires 0 < initial <= maximum")
+        if not 0.0 <= jitter <= 1.0:
+            raise ValueError("Jitter must be between 0 and 1")
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self._rng = rng or random.Random()
+        self.attempts = 0
+
+    def next_delay(self) -> float:
+        """Return the delay before the next attempt and advance the schedule"""
+        base = min(self.maximum, self.initial * (self.multiplier ** self.attempts))
+        self.attempts += 1
+        return base * (1.0 - self.jitter * self._rng.random())
+
+    def reset(self):
+        """Start over from the initial delay (call after a successful attempt)"""
+        self.attempts = 0
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for the offline backtest engine
+
+Writes a random-walk market data CSV (Gateway timestamp format) over 10
+symbols and a news CSV with one sentiment per 20 ticks to a temporary
+directory, then streams both through BacktestEngine with the default
+strategies. Reports parse+replay throughput in ticks per minute, and the
+replay alone from pre-parsed events.
+
+Usage:
+    python benchmarks/bench_backtest.py [num_ticks]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trading_lib.backtest.data import merge_feeds, read_market_data, read_news
+from trading_lib.backtest.engine import BacktestEngine
+from trading_lib.models import RecordingInterval
+
+SYMBOLS = ["AAPL", "MSFT", "SPY", "GOOG", "AMZN", "NVDA", "META", "TSLA", "JPM", "XOM"]
+NEWS_EVERY = 20
+
+
+def write_data(directory: str, n: int):
+    rng = random.Random(1)
+    prices = {symbol: 100.0 for symbol in SYMBOLS}
+    start = datetime(2025, 1, 2, 9, 30).timestamp()
+    market_path = os.path.join(directory, "market_data.csv")
+    news_path = os.path.join(directory, "news.csv")
+    with open(market_path, "w") as market, open(news_path, "w") as news:
+        market.write("timestamp,symbol,price\n")
+        news.write("timestamp,symbol,sentiment\n")
+        for i in range(n):
+            # Ten ticks per second
+            stamp = datetime.fromtimestamp(start + i // 10).strftime("%Y-%m-%d %H:%M:%S")
+            symbol = rng.choice(SYMBOLS)
+            prices[symbol] = max(1.0, prices[symbol] + rng.gauss(0, 0.1))
+            market.write(f"{stamp},{symbol},{prices[symbol]:.2f}\n")
+            if i % NEWS_EVERY == 0:
+                news.write(f"{stamp},{rng.choice(SYMBOLS)},{rng.randint(0, 100)}\n")
+    return market_path, news_path
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        market_path, news_path = write_data(directory, n)
+
+        engine = BacktestEngine.from_params(recording_interval=RecordingInterval.MINUTE)
+        start = time.perf_counter()
+        result = engine.run_files(market_path, news_path)
+        elapsed = time.perf_counter() - start
+        print(f"Backtest from CSV, {n:,} ticks / {n // NEWS_EVERY:,} news over {len(SYMBOLS)} symbols")
+        print(f"  parse + replay: {elapsed:.2f}s, {result.market_data_events / elapsed * 60 / 1e6:.2f}M ticks/min")
+        print(f"  {result.summary()}")
+
+        events = list(merge_feeds(read_market_data(market_path), read_news(news_path)))
+    for interval in (RecordingInterval.MINUTE, RecordingInterval.TICK):
+        engine = BacktestEngine.from_params(recording_interval=interval)
+        result = engine.run(events)
+        print(f"  replay only ({interval.value:>4} equity): {result.elapsed:.2f}s, "
+              f"{result.market_data_events / result.elapsed * 60 / 1e6:.2f}M ticks/min, "
+              f"{len(result.equity):,} equity points")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Update cost benchmark for trading_lib.indicators
+
+Times scalar update() per tick for each indicator at a short and a long
+window/period (the cost should not depend on the length), against a naive
+recomputation over the window for the rolling variance. Then times
+update_batch() on snapshots of 5k symbols, per tick.
+
+Usage:
+    python benchmarks/bench_indicators.py [num_ticks]
+"""
+
+import os
+import random
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trading_lib.indicators import ATR, EMA, RSI, VWAP, BollingerBands, RollingStats, ZScore
+
+NUM_SYMBOLS = 100
+BATCH_SYMBOLS = 5000
+BATCHES = 40
+
+
+def indicators(length: int):
+    return [
+        ("EMA", EMA(NUM_SYMBOLS, span=length), ("price",)),
+        ("VWAP (window)", VWAP(NUM_SYMBOLS, window=length), ("price", "volume")),
+        ("RollingStats", RollingStats(NUM_SYMBOLS, length), ("price",)),
+        ("ZScore", ZScore(NUM_SYMBOLS, length), ("price",)),
+        ("BollingerBands", BollingerBands(NUM_SYMBOLS, length), ("price",)),
+        ("RSI", RSI(NUM_SYMBOLS, length), ("price",)),
+        ("ATR", ATR(NUM_SYMBOLS, length), ("high", "low", "price")),
+    ]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(1)
+    prices = [100.0] * NUM_SYMBOLS
+    columns = {"symbol": [], "price": [], "volume": [], "high": [], "low": []}
+    for _ in range(n):
+        symbol_id = rng.randrange(NUM_SYMBOLS)
+        prices[symbol_id] += rng.gauss(0, 0.1)
+        columns["symbol"].append(symbol_id)
+        columns["price"].append(prices[symbol_id])
+        columns["volume"].append(float(rng.randint(1, 500)))
+        columns["high"].append(prices[symbol_id] + 0.05)
+        columns["low"].append(prices[symbol_id] - 0.05)
+
+    print(f"Scalar update(), {n:,} ticks over {NUM_SYMBOLS} symbols (us/update)")
+    lengths = (20, 500)
+    print(f"{'indicator':<16}" + "".join(f"{f'length {length}':>12}" for length in lengths))
+    results = {}
+    for length in lengths:
+        for name, indicator, fields in indicators(length):
+            args = list(zip(columns["symbol"], *(columns[field] for field in fields)))
+            update = indicator.update
+            start = time.perf_counter()
+            for arg in args:
+                update(*arg)
+            results.setdefault(name, []).append((time.perf_counter() - start) / n * 1e6)
+    for name, timings in results.items():
+        print(f"{name:<16}" + "".join(f"{t:>12.2f}" for t in timings))
+
+    naive_n = n // 20
+    print(f"{'naive pvariance':<16}", end="")
+    for length in lengths:
+        windows = [[] for _ in range(NUM_SYMBOLS)]
+        start = time.perf_counter()
+        for symbol_id, price in zip(columns["symbol"][:naive_n], columns["price"][:naive_n]):
+            window = windows[symbol_id]
+            window.append(price)
+            del window[:-length]
+            statistics.pvariance(window)
+        print(f"{(time.perf_counter() - start) / naive_n * 1e6:>12.2f}", end="")
+    print()
+
+    print(f"\nupdate_batch(), {BATCHES} snapshots of {BATCH_SYMBOLS:,} symbols (us/tick)")
+    random_walk = 100 + np.cumsum(np.random.default_rng(1).normal(0, 0.1, (BATCHES, BATCH_SYMBOLS)), axis=0)
+    ids = np.arange(BATCH_SYMBOLS)
+    volume = np.full(BATCH_SYMBOLS, 100.0)
+    batch_indicators = [
+        ("EMA", EMA(BATCH_SYMBOLS, span=20), lambda p: (p,)),
+        ("VWAP (window)", VWAP(BATCH_SYMBOLS, window=20), lambda p: (p, volume)),
+        ("RollingStats", RollingStats(BATCH_SYMBOLS, 20), lambda p: (p,)),
+        ("ZScore", ZScore(BATCH_SYMBOLS, 20), lambda p: (p,)),
+        ("BollingerBands", BollingerBands(BATCH_SYMBOLS, 20), lambda p: (p,)),
+        ("RSI", RSI(BATCH_SYMBOLS, 14), lambda p: (p,)),
+        ("ATR", ATR(BATCH_SYMBOLS, 14), lambda p: (p + 0.05, p - 0.05, p)),
+    ]
+    for name, indicator, make_args in batch_indicators:
+        batches = [make_args(row) for row in random_walk]
+        start = time.perf_counter()
+        for args in batches:
+            indicator.update_batch(ids, *args)
+        print(f"{name:<16}{(time.perf_counter() - start) / (BATCHES * BATCH_SYMBOLS) * 1e6:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
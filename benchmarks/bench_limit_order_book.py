@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for LimitOrderBook add/modify/cancel mixes
+
+Usage:
+    python benchmarks/bench_limit_order_book.py [num_messages]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from OrderBook.limit_order_book import LimitOrderBook
+
+
+def make_messages(n: int, add_ratio: float, modify_ratio: float, num_levels: int, seed: int = 1):
+    """Pre-generate (action, order_id, side, price, quantity) tuples so generation is not timed"""
+    rng = random.Random(seed)
+    live = []
+    messages = []
+    next_id = 0
+    mid = 100.0
+    for _ in range(n):
+        draw = rng.random()
+        if not live or draw < add_ratio:
+            side = "BUY" if rng.random() < 0.5 else "SELL"
+            offset = rng.randint(1, num_levels) * 0.01
+            price = round(mid - offset if side == "BUY" else mid + offset, 2)
+            messages.append(("add", next_id, side, price, rng.randint(1, 500)))
+            live.append(next_id)
+            next_id += 1
+        else:
+            index = rng.randrange(len(live))
+            live[index], live[-1] = live[-1], live[index]
+            if draw < add_ratio + modify_ratio:
+                messages.append(("modify", live[-1], None, None, rng.randint(1, 500)))
+            else:
+                messages.append(("cancel", live.pop(), None, None, None))
+    return messages
+
+
+def run(messages):
+    book = LimitOrderBook("BENCH")
+    add, modify, cancel = book.add, book.modify, book.cancel
+    start = time.perf_counter()
+    for action, order_id, side, price, quantity in messages:
+        if action == "add":
+            add(order_id, side, price, quantity)
+        elif action == "modify":
+            modify(order_id, quantity=quantity)
+        else:
+            cancel(order_id)
+    elapsed = time.perf_counter() - start
+    return elapsed, book
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"LimitOrderBook throughput, {n:,} messages per scenario\n")
+    for label, add_ratio, modify_ratio, num_levels in [
+        ("50% add / 50% cancel, 100 levels", 0.50, 0.0, 100),
+        ("50% add / 15% modify / 35% cancel", 0.50, 0.15, 100),
+        ("60% add / 40% cancel, 5000 levels", 0.60, 0.0, 5000),
+    ]:
+        messages = make_messages(n, add_ratio, modify_ratio, num_levels)
+        elapsed, book = run(messages)
+        print(
+            f"{label:<36} {n / elapsed:12,.0f} msg/s  {elapsed * 1e9 / n:6.0f} ns/msg  "
+            f"resting={len(book):,} levels={len(book.bids.quantity) + len(book.asks.quantity):,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Caller-side overhead of synchronous vs. queued logging
+
+Measures how long the logging thread spends per INFO call, which is what a
+hot path (e.g. Server.route_order) pays, and how long the queued listener
+takes to drain afterwards.
+
+Usage:
+    python benchmarks/bench_logging.py [num_records]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logger import dropped_records, setup_logger, shutdown_logging
+
+
+def bench(label, n, log_dir, queued, queue_size):
+    name = f"bench_{label}"
+    logger = setup_logger(name, log_dir=log_dir, queued=queued, queue_size=queue_size)
+    
+    start = time.perf_counter()
+    for i in range(n):
+        logger.info("Received order: %s", ("AAPL", "BUY", 100, 172.53, i))
+    caller = time.perf_counter() - start
+    
+    shutdown_logging()
+    for handler in logger.handlers:
+        handler.flush()
+    total = time.perf_counter() - start
+    
+    print(
+        f"{label:<24} caller {caller * 1e9 / n:7.0f} ns/record   "
+        f"until flushed {total * 1e9 / n:7.0f} ns/record   dropped={dropped_records(name):,}"
+    )
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    # Console output would dominate and scroll the results away
+    stderr, sys.stderr = sys.stderr, open(os.devnull, 'w')
+    with tempfile.TemporaryDirectory() as log_dir:
+        print(f"Logging {n:,} INFO records per mode\n")
+        bench("sync", n, log_dir, queued=False, queue_size=1)
+        bench("queued (unbounded-ish)", n, log_dir, queued=True, queue_size=n + 10)
+        bench("queued (10k bound)", n, log_dir, queued=True, queue_size=10_000)
+    sys.stderr = stderr
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: MarketDataDecoder vs. the original OrderBook parsing path
+
+Usage:
+    python benchmarks/bench_market_data_decoder.py [num_messages]
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from OrderBook.decoder import MarketDataDecoder
+
+SYMBOLS = ["AAPL", "MSFT", "SPY", "GOOG", "TSLA"]
+
+
+def legacy_parse(data: bytes):
+    """Per-tick parsing as done by OrderBook.on_market_data before the decoder"""
+    message = data.decode('utf-8').rstrip('*').strip()
+    parts = message.split(',')
+    symbol = parts[0].strip()
+    price = float(parts[1].strip())
+    dt = datetime.strptime(parts[2].strip(), '%Y-%m-%d %H:%M:%S')
+    return symbol, price, dt.timestamp()
+
+
+def make_messages(n: int):
+    messages = []
+    for i in range(n):
+        minute, second = divmod(i // len(SYMBOLS) % 3600, 60)
+        messages.append(
+            f"{SYMBOLS[i % len(SYMBOLS)]},{100 + (i % 997) / 100:.2f},"
+            f"2025-10-01 09:{minute % 60:02d}:{second:02d}*".encode()
+        )
+    return messages
+
+
+def bench(label, func, n):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1e9 / n:8.0f} ns/msg  {n / elapsed:12,.0f} msg/s")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    messages = make_messages(n)
+    stripped = [m[:-1] for m in messages]
+    buffer = b"".join(messages)
+    decoder = MarketDataDecoder(SYMBOLS)
+
+    print(f"Decoding {n:,} market data messages\n")
+    bench("legacy (strptime)", lambda: [legacy_parse(m) for m in messages], n)
+    bench("decoder.decode", lambda: [decoder.decode(m) for m in stripped], n)
+    bench("decoder.decode_batch", lambda: decoder.decode_batch(stripped), n)
+    bench("decoder.decode_buffer", lambda: decoder.decode_buffer(buffer), n)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Match throughput benchmark for the OrderManager MatchingEngine
+
+Submits random limit orders around a drifting mid price (and cancels a share
+of resting orders) and reports orders/s, fills and the final book size.
+
+Usage:
+    python benchmarks/bench_matching_engine.py [num_orders]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from OrderManager.matching_engine import MatchingEngine
+from OrderManager.models import Order, Side
+
+SYMBOLS = ["AAPL", "MSFT", "GOOG", "TSLA", "AMZN"]
+
+
+def make_orders(n: int, num_levels: int = 50, seed: int = 1):
+    """Pre-build orders so construction and validation are not timed"""
+    rng = random.Random(seed)
+    mid = {symbol: 100.0 for symbol in SYMBOLS}
+    orders = []
+    for i in range(n):
+        symbol = SYMBOLS[i % len(SYMBOLS)]
+        mid[symbol] = max(10.0, mid[symbol] + rng.choice((-0.01, 0.0, 0.01)))
+        side = Side.BUY if rng.random() < 0.5 else Side.SELL
+        # Mostly passive orders with some marketable ones crossing the mid
+        offset = rng.randint(-num_levels // 5, num_levels) * 0.01
+        price = round(mid[symbol] - offset if side == Side.BUY else mid[symbol] + offset, 2)
+        orders.append(Order(symbol=symbol, quantity=rng.randint(1, 500), price=price, side=side, timestamp=float(i)))
+    return orders
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    cancel_ratio = 0.2
+    orders = make_orders(n)
+    rng = random.Random(2)
+    cancel_draws = [rng.random() < cancel_ratio for _ in range(n)]
+
+    engine = MatchingEngine()
+    fills = [0, 0]
+
+    def on_fill(fill):
+        fills[0] += 1
+        fills[1] += fill.quantity
+
+    engine.set_fill_listener(on_fill)
+    live_ids = []
+    cancels = 0
+
+    start = time.perf_counter()
+    for order, cancel in zip(orders, cancel_draws):
+        book_order = engine.submit(order)
+        if book_order.remaining_quantity:
+            live_ids.append(book_order.order_id)
+        if cancel and live_ids:
+            # Cancel a recent order; ids already filled are skipped like a late cancel
+            order_id = live_ids.pop()
+            if order_id in engine.orders:
+                engine.cancel(order_id)
+                cancels += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"MatchingEngine benchmark: {n:,} orders, {len(SYMBOLS)} symbols")
+    print(f"elapsed      {elapsed:.3f}s")
+    print(f"throughput   {n / elapsed:,.0f} orders/s ({elapsed / n * 1e9:.0f} ns/order)")
+    print(f"fills        {fills[0]:,} ({fills[1]:,} shares)")
+    print(f"cancels      {cancels:,}")
+    print(f"resting      {len(engine):,} orders")
+
+
+if __name__ == "__main__":
+    main()
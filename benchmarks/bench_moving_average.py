@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Per-tick cost benchmark for MovingAverageStrategy
+
+Runs the same random-walk ticks through the rolling-sum MovingAverageStrategy
+and through the previous list-based version (re-sums both windows with
+sum(list[-n:]) and reslices the history on every tick), for 20/50 and
+500/2000 windows. The rolling version's cost per tick should not change
+with the window lengths.
+
+Usage:
+    python benchmarks/bench_moving_average.py [num_ticks]
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trading_lib.models import Action, MarketDataPoint
+from trading_lib.strategy.price_based_strategy import MovingAverageStrategy
+
+SYMBOLS = ["AAPL", "MSFT", "SPY"]
+WINDOWS = ((20, 50), (500, 2000))
+
+
+class ListMovingAverageStrategy:
+    """The previous implementation: O(window) sums and a new list per tick"""
+
+    def __init__(self, short_window: int, long_window: int, quantity: int = 100):
+        self.short_window = short_window
+        self.long_window = long_window
+        self.quantity = quantity
+        self._prices = {}
+        self._prev_short_gt_long = {}
+
+    def generate_signals(self, tick: MarketDataPoint):
+        sym, price = tick.symbol, tick.price
+        if sym not in self._prices:
+            self._prices[sym] = [price]
+            self._prev_short_gt_long[sym] = False
+            return []
+        prev_prices = self._prices[sym]
+        if len(prev_prices) < self.long_window:
+            prev_prices.append(price)
+            return []
+        short_ma = sum(prev_prices[-self.short_window:]) / self.short_window
+        long_ma = sum(prev_prices[-self.long_window:]) / self.long_window
+        prev_state = self._prev_short_gt_long[sym]
+        curr_state = short_ma > long_ma
+        signals = []
+        if (not prev_state) and curr_state:
+            signals.append((sym, self.quantity, price, Action.BUY))
+        if prev_state and (not curr_state):
+            signals.append((sym, self.quantity, price, Action.SELL))
+        self._prev_short_gt_long[sym] = curr_state
+        prev_prices.append(price)
+        self._prices[sym] = prev_prices[-self.long_window:]
+        return signals
+
+
+def run(strategy, ticks):
+    generate = strategy.generate_signals
+    start = time.perf_counter()
+    signals = 0
+    for tick in ticks:
+        signals += len(generate(tick))
+    return time.perf_counter() - start, signals
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    rng = random.Random(1)
+    prices = {symbol: 100.0 for symbol in SYMBOLS}
+    now = datetime.now()
+    ticks = []
+    for _ in range(n):
+        symbol = rng.choice(SYMBOLS)
+        prices[symbol] += rng.gauss(0, 0.1)
+        ticks.append(MarketDataPoint(now, symbol, prices[symbol]))
+
+    print(f"MovingAverageStrategy.generate_signals, {n:,} ticks over {len(SYMBOLS)} symbols")
+    print(f"{'windows':<10} {'list us/tick':>13} {'rolling us/tick':>16} {'speedup':>8} {'signals':>9}")
+    for short_window, long_window in WINDOWS:
+        list_time, list_signals = run(ListMovingAverageStrategy(short_window, long_window), ticks)
+        rolling_time, rolling_signals = run(MovingAverageStrategy(short_window, long_window), ticks)
+        print(f"{f'{short_window}/{long_window}':<10} {list_time / n * 1e6:>13.2f} "
+              f"{rolling_time / n * 1e6:>16.2f} {list_time / rolling_time:>7.1f}x "
+              f"{f'{rolling_signals}/{list_signals}':>9}")
+
+
+if __name__ == "__main__":
+    main()
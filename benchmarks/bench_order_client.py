@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Send-path benchmark for OrderManagerClient
+
+Pushes orders to a sink server that only drains the socket and reports the
+client-side cost per order for: one sendall per order (default client),
+buffered mode (writer thread, size/time flush), buffered low-latency mode
+(flush on every order) and place_orders() bulk calls.
+
+Usage:
+    python benchmarks/bench_order_client.py [num_orders]
+"""
+
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from OrderManager.client import OrderManagerClient
+
+BULK_SIZE = 256
+
+
+def start_sink():
+    """Server that reads and discards everything; returns (port, received-bytes counter)"""
+    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server_socket.bind(("localhost", 0))
+    server_socket.listen(8)
+    received = [0]
+
+    def drain(client_socket):
+        while chunk := client_socket.recv(1 << 20):
+            received[0] += len(chunk)
+
+    def accept():
+        while True:
+            client_socket, _ = server_socket.accept()
+            threading.Thread(target=drain, args=(client_socket,), daemon=True).start()
+
+    threading.Thread(target=accept, daemon=True).start()
+    return server_socket.getsockname()[1], received
+
+
+def run(port: int, received, num_orders: int, bulk: bool = False, **client_options) -> float:
+    client = OrderManagerClient("localhost", port, **client_options)
+    client.logger.setLevel(logging.WARNING)
+    client.connect()
+    expected = received[0]
+
+    start = time.perf_counter()
+    if bulk:
+        batch = [("AAPL", "BUY", 100, 150.5)] * BULK_SIZE
+        for _ in range(num_orders // BULK_SIZE):
+            client.place_orders(batch)
+    else:
+        for _ in range(num_orders):
+            client.place_order("AAPL", "BUY", 100, 150.5)
+    client.disconnect()  # Flushes whatever is still queued
+    elapsed = time.perf_counter() - start
+    assert received[0] > expected
+    return elapsed
+
+
+def main():
+    num_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    port, received = start_sink()
+
+    cases = [
+        ("sendall per order", {}),
+        ("buffered", {"buffered": True}),
+        ("buffered, low_latency", {"buffered": True, "low_latency": True}),
+        (f"place_orders x{BULK_SIZE}", {"bulk": True}),
+        (f"buffered place_orders x{BULK_SIZE}", {"bulk": True, "buffered": True}),
+    ]
+    print(f"OrderManagerClient send path, {num_orders:,} orders")
+    print(f"{'mode':<32} {'orders/s':>12} {'us/order':>10}")
+    for name, options in cases:
+        elapsed = run(port, received, num_orders, **options)
+        print(f"{name:<32} {num_orders / elapsed:>12,.0f} {elapsed / num_orders * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Allocation and throughput benchmark for the Order model and its wire codecs
+
+Compares the text codec (to_bytes/from_bytes) against the binary struct codec
+(to_buffer/from_buffer/iter_buffer) and reports per-instance memory.
+
+Usage:
+    python benchmarks/bench_order_codec.py [num_orders]
+"""
+
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from OrderManager.models import Order, Side, ORDER_SIZE
+
+SYMBOLS = ["AAPL", "MSFT", "GOOG", "TSLA", "AMZN"]
+
+
+def make_orders(n: int, seed: int = 1):
+    rng = random.Random(seed)
+    return [
+        Order(
+            symbol=rng.choice(SYMBOLS),
+            quantity=rng.randint(1, 1000),
+            price=round(rng.uniform(50, 500), 2),
+            side=Side.BUY if rng.random() < 0.5 else Side.SELL,
+            timestamp=1_700_000_000.0 + i,
+        )
+        for i in range(n)
+    ]
+
+
+def timed(label: str, n: int, fn):
+    gc.collect()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:7.3f}s  {n / elapsed / 1e6:6.2f}M orders/s  {elapsed / n * 1e9:7.0f} ns/order")
+    return result
+
+
+def measure_allocation(n: int):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    orders = make_orders(n)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    # The list itself is not part of the per-order cost
+    allocated -= sys.getsizeof(orders)
+    print(f"{'allocation':<28} {allocated / n:7.1f} bytes/order "
+          f"(instance {sys.getsizeof(orders[0])} bytes, __dict__: {hasattr(orders[0], '__dict__')})")
+    return orders
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Order codec benchmark: {n:,} orders, binary record {ORDER_SIZE} bytes")
+
+    measure_allocation(min(n, 100_000))
+    orders = timed("construct", n, lambda: make_orders(n))
+
+    text = timed("text encode (to_bytes)", n, lambda: [order.to_bytes() for order in orders])
+    timed("text decode (from_bytes)", n, lambda: [Order.from_bytes(data) for data in text])
+
+    buffer = bytearray(ORDER_SIZE * n)
+
+    def encode_binary():
+        offset = 0
+        for order in orders:
+            offset = order.to_buffer(buffer, offset)
+
+    timed("binary encode (to_buffer)", n, encode_binary)
+    timed("binary decode (from_buffer)", n,
+          lambda: [Order.from_buffer(buffer, i * ORDER_SIZE) for i in range(n)])
+    decoded = timed("binary decode (iter_buffer)", n, lambda: list(Order.iter_buffer(buffer)))
+    assert decoded == orders
+
+    print(f"{'wire size':<28} text {sum(map(len, text)) / n:.1f} bytes/order, binary {ORDER_SIZE} bytes/order")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Order throughput and memory benchmark for the OrderManager Server modes
+
+Runs the server in a child process (threaded, event_loop, and event_loop with
+a worker pool) and pushes pipelined orders from 1, 50 and 500 concurrent
+client connections in this process. Reports orders/s, server threads and the
+server's peak RSS.
+
+Usage:
+    python benchmarks/bench_order_manager_server.py [orders_per_run]
+"""
+
+import logging
+import multiprocessing as mp
+import os
+import resource
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from OrderManager.models import Order, Side
+from OrderManager.server import Server
+
+CLIENT_COUNTS = (1, 50, 500)
+MODES = (("threaded", 0), ("event_loop", 0), ("event_loop", 4))
+ORDERS_PER_SEND = 64
+
+
+def serve(mode: str, workers: int, total: int, port_queue, result_queue):
+    server = Server({
+        "host": "localhost",
+        "order_manager_port": 0,
+        "server_mode": mode,
+        "workers": workers,
+        "backlog": 1024,
+    })
+    server.logger.setLevel(logging.WARNING)  # Measure routing, not per-order log I/O
+
+    lock = threading.Lock()
+    done = threading.Event()
+    executed = [0]
+
+    def execute(order, session=None):
+        with lock:
+            executed[0] += 1
+            if executed[0] == total:
+                done.set()
+
+    server._execute_order = execute
+    threading.Thread(target=server.run, daemon=True).start()
+    port_queue.put(server.server_socket.getsockname()[1])
+
+    done.wait(timeout=120)
+    result_queue.put({
+        "executed": executed[0],
+        "threads": threading.active_count(),
+        "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    })
+    server.shutdown()
+
+
+def run(mode: str, workers: int, num_clients: int, total: int) -> dict:
+    ctx = mp.get_context("fork") if hasattr(os, "fork") else mp.get_context()
+    port_queue, result_queue = ctx.Queue(), ctx.Queue()
+    process = ctx.Process(target=serve, args=(mode, workers, total, port_queue, result_queue))
+    process.start()
+    port = port_queue.get(timeout=10)
+
+    chunk = Order(symbol="AAPL", quantity=100, price=150.5, side=Side.BUY, timestamp=1.0).to_bytes() * ORDERS_PER_SEND
+    sends = total // ORDERS_PER_SEND
+    clients = [socket.create_connection(("localhost", port)) for _ in range(num_clients)]
+
+    start = time.perf_counter()
+    for i in range(sends):
+        clients[i % num_clients].sendall(chunk)
+    result = result_queue.get(timeout=180)
+    result["elapsed"] = time.perf_counter() - start
+
+    for client in clients:
+        client.close()
+    process.join(timeout=10)
+    return result
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    total -= total % ORDERS_PER_SEND
+    print(f"OrderManager server benchmark: {total:,} orders per run, {ORDERS_PER_SEND} orders per send")
+    print(f"{'mode':<18}{'clients':>8}{'orders/s':>12}{'threads':>9}{'peak RSS':>11}")
+    for mode, workers in MODES:
+        label = f"{mode}+{workers}w" if workers else mode
+        for num_clients in CLIENT_COUNTS:
+            result = run(mode, workers, num_clients, total)
+            status = "" if result["executed"] == total else f"  (only {result['executed']} executed)"
+            print(f"{label:<18}{num_clients:>8}{total / result['elapsed']:>12,.0f}"
+                  f"{result['threads']:>9}{result['max_rss_kb'] / 1024:>9.1f}MB{status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Strategy -> OrderManager transport benchmark: TCP loopback vs. shared-memory ring
+
+A consumer child process stands in for the OrderManager's order intake. It
+parses text orders from a TCP connection (OrderFramer + Order.from_bytes)
+or reads binary records from an OrderRing. The measured path ends at a
+parsed Order and does not include matching. Reports:
+
+- one-way latency (p50/p99/p99.9), with orders sent one at a time at a fixed
+  pace so the consumer is idle (and asleep) between orders
+- throughput, with orders sent back to back in batches of 64
+
+The shm ring is measured sleeping on its doorbell (spin 0) and busy-polling
+for up to 1ms before sleeping, which at this pace never sleeps; spinning only
+pays off with a spare core for each side.
+
+Usage:
+    python benchmarks/bench_order_transport.py [latency_orders] [throughput_orders]
+"""
+
+import multiprocessing as mp
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from latency import LatencyHistogram, format_report
+from OrderManager.framing import OrderFramer
+from OrderManager.models import Order, Side
+from OrderManager.shm_channel import OrderRing
+
+RING_NAME = "bench_order_ring"
+PACE_S = 0.0002
+BATCH = 64
+
+
+def make_order() -> Order:
+    return Order(symbol="AAPL", quantity=100, price=150.5, side=Side.BUY, timestamp=1.0, origin_ns=1)
+
+
+def consume_tcp(total, ready, results):
+    server_socket = socket.create_server(("localhost", 0))
+    ready.put(server_socket.getsockname()[1])
+    client_socket, _ = server_socket.accept()
+    client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    framer, histogram, seen = OrderFramer(), LatencyHistogram(), 0
+    start = None
+    while seen < total:
+        frames = framer.feed(client_socket.recv(65536))
+        now = time.monotonic_ns()
+        for frame in frames:
+            order = Order.from_bytes(frame)
+            histogram.record(now - order.sent_ns)
+        if frames and start is None:
+            start = time.perf_counter()
+        seen += len(frames)
+    results.put((histogram.to_dict(), time.perf_counter() - start))
+
+
+def consume_ring(total, spin, ready, results):
+    ring = OrderRing(RING_NAME, capacity=65536, create=True)
+    ready.put(None)
+    histogram, seen, start = LatencyHistogram(), 0, None
+    while seen < total:
+        orders = ring.read(1024)
+        if not orders:
+            ring.wait(0.01, spin)
+            continue
+        now = time.monotonic_ns()
+        if start is None:
+            start = time.perf_counter()
+        for order in orders:
+            histogram.record(now - order.sent_ns)
+        seen += len(orders)
+    results.put((histogram.to_dict(), time.perf_counter() - start))
+    ring.close()
+    ring.unlink()
+
+
+def run(transport: str, total: int, paced: bool, spin: float = 0.0):
+    ctx = mp.get_context("fork")
+    ready, results = ctx.Queue(), ctx.Queue()
+    if transport == "tcp":
+        process = ctx.Process(target=consume_tcp, args=(total, ready, results))
+    else:
+        process = ctx.Process(target=consume_ring, args=(total, spin, ready, results))
+    process.start()
+    endpoint = ready.get(timeout=10)
+
+    order = make_order()
+    if transport == "tcp":
+        sock = socket.create_connection(("localhost", endpoint))
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def send(orders):
+            now = time.monotonic_ns()
+            for o in orders:
+                o.sent_ns = now
+            sock.sendall(b''.join(o.to_bytes() for o in orders))
+    else:
+        ring = OrderRing(RING_NAME)
+
+        def send(orders):
+            now = time.monotonic_ns()
+            for o in orders:
+                o.sent_ns = now
+            written = 0
+            while written < len(orders):
+                written += ring.write(orders[written:])
+
+    start = time.perf_counter()
+    if paced:
+        for i in range(total):
+            send([order])
+            deadline = start + (i + 1) * PACE_S
+            while time.perf_counter() < deadline:
+                pass
+    else:
+        batch = [make_order() for _ in range(BATCH)]
+        for _ in range(total // BATCH):
+            send(batch)
+    histogram, elapsed = results.get(timeout=300)
+    process.join()
+    if transport == "tcp":
+        sock.close()
+    else:
+        ring.close()
+    return LatencyHistogram.from_dict(histogram), elapsed
+
+
+def main():
+    latency_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    throughput_orders = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    throughput_orders -= throughput_orders % BATCH
+    cases = (("tcp", "tcp (text)", 0.0),
+             ("shm", "shm, doorbell", 0.0),
+             ("shm", "shm, spin 1ms", 1e-3))
+
+    histograms = {label: run(transport, latency_orders, paced=True, spin=spin)[0]
+                  for transport, label, spin in cases}
+    print(format_report(histograms, f"One-way latency, {latency_orders:,} orders paced every {PACE_S * 1e6:.0f}us"))
+
+    print(f"\nThroughput, {throughput_orders:,} orders in batches of {BATCH}")
+    print(f"{'transport':<18} {'orders/s':>12}")
+    for transport, label, spin in cases:
+        _, elapsed = run(transport, throughput_orders, paced=False, spin=spin)
+        print(f"{label:<18} {throughput_orders / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Fill and mark-to-market benchmark for the OrderManager PositionKeeper
+
+Applies random fills across 5k symbols and 16 accounts, then times a full
+revaluation: the vectorized PositionKeeper.mark against a per-symbol,
+per-account Python loop over the same arrays, each fed by a dict read and
+by SharedPriceBook.read_prices.
+
+Usage:
+    python benchmarks/bench_positions.py [num_fills]
+"""
+
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from OrderManager.matching_engine import Fill
+from OrderManager.models import Side
+from OrderManager.positions import PositionKeeper
+from shared_memory_utils import SharedPriceBook
+
+NUM_SYMBOLS = 5_000
+ACCOUNTS = [f"strategy-{i}" for i in range(16)]
+MARKS = 20
+
+
+def loop_mark(keeper: PositionKeeper, prices: dict) -> float:
+    total = 0.0
+    for account in range(len(keeper.account_labels)):
+        for i, symbol in enumerate(keeper.symbols):
+            position = int(keeper.position[account, i])
+            if position:
+                price = prices[symbol] or keeper.avg_price[account, i]
+                total += position * (price - keeper.avg_price[account, i])
+    return total
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(1)
+    symbols = [f"S{i:04d}" for i in range(NUM_SYMBOLS)]
+    fills = [Fill(rng.choice(symbols), round(rng.uniform(10, 500), 2), rng.randint(1, 100), "1", "2",
+                  rng.choice((Side.BUY, Side.SELL)), 1.0, 0, rng.choice(ACCOUNTS))
+             for _ in range(n)]
+    aggressors = [rng.choice(ACCOUNTS) for _ in range(n)]
+    keeper = PositionKeeper(symbols, max_accounts=len(ACCOUNTS))
+
+    start = time.perf_counter()
+    for fill, account in zip(fills, aggressors):
+        keeper.on_fill(fill, account)
+    elapsed = time.perf_counter() - start
+    print(f"PositionKeeper, {NUM_SYMBOLS:,} symbols x {len(ACCOUNTS)} accounts")
+    print(f"on_fill: {elapsed / n * 1e6:.2f} us/fill ({n:,} fills)")
+
+    with SharedPriceBook(symbols, name="bench_positions_prices") as book:
+        for i, symbol in enumerate(symbols):
+            book.update(symbol, 10.0 + i % 490, 1.0)
+
+        start = time.perf_counter()
+        for _ in range(MARKS):
+            loop_mark(keeper, book.read_all())
+        loop = (time.perf_counter() - start) / MARKS
+
+        start = time.perf_counter()
+        for _ in range(MARKS):
+            keeper.mark(book.read_prices())
+        vector = (time.perf_counter() - start) / MARKS
+
+    print(f"{'mark':<28} {'ms/revaluation':>15}")
+    print(f"{'per-symbol loop + read_all':<28} {loop * 1e3:>15.3f}")
+    print(f"{'vectorized + read_prices':<28} {vector * 1e3:>15.3f}")
+    print(f"speedup: {loop / vector:.0f}x, total unrealized {float(np.sum(keeper.unrealized)):,.2f}")
+
+
+if __name__ == "__main__":
+    main()
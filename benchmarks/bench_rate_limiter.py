@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Per-order overhead benchmark for the OrderManager RateLimiter
+
+Times acquire() with global, per-client and per-symbol buckets enabled
+over 50k symbols and 10 clients, first with every order admitted and then
+with a flood where most orders are rejected. Buckets refill lazily on use,
+so the cost per order does not depend on the number of symbols.
+
+Usage:
+    python benchmarks/bench_rate_limiter.py [num_orders]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from OrderManager.models import Order, Side
+from OrderManager.rate_limit import RateLimitExceeded, RateLimiter, RateLimits
+
+NUM_SYMBOLS = 50_000
+CLIENTS = [f"strategy-{i}" for i in range(10)]
+
+
+def run(limiter: RateLimiter, orders, clients) -> float:
+    acquire = limiter.acquire
+    start = time.perf_counter()
+    for order, client in zip(orders, clients):
+        try:
+            acquire(order, client)
+        except RateLimitExceeded:
+            pass
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    rng = random.Random(1)
+    symbols = [f"SYM{i:05d}" for i in range(NUM_SYMBOLS)]
+    orders = [Order(symbol=rng.choice(symbols), quantity=1, price=10.0, side=Side.BUY, timestamp=1.0)
+              for _ in range(n)]
+    clients = [rng.choice(CLIENTS) for _ in range(n)]
+
+    cases = (
+        ("admit all", RateLimits(global_rate=1e9, client_rate=1e9, symbol_rate=1e9)),
+        ("flood (mostly rejected)", RateLimits(global_rate=1e9, client_rate=1000, symbol_rate=1)),
+    )
+    print(f"RateLimiter.acquire, {n:,} orders over {NUM_SYMBOLS:,} symbols / {len(CLIENTS)} clients")
+    print(f"{'case':<26} {'us/order':>10} {'rejected':>10} {'symbol buckets':>15}")
+    for name, limits in cases:
+        limiter = RateLimiter(limits)
+        elapsed = run(limiter, orders, clients)
+        print(f"{name:<26} {elapsed / n * 1e6:>10.2f} {limiter.total_rejected:>10,} "
+              f"{len(limiter.symbol_buckets):>15,}")
+
+
+if __name__ == "__main__":
+    main()
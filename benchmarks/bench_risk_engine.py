@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Per-order overhead benchmark for the OrderManager RiskEngine
+
+Loads the engine with 1M open orders across 10k symbols, then times check(),
+on_rest() and on_fill() per order. Risk state is running totals per account
+and symbol, so its size and the cost per order do not depend on how many
+orders are open.
+
+Usage:
+    python benchmarks/bench_risk_engine.py [num_orders]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from OrderManager.matching_engine import BookOrder, Fill
+from OrderManager.models import Order, Side
+from OrderManager.risk import RiskEngine, RiskLimits
+from trading_lib.models import OrderStatus
+
+NUM_SYMBOLS = 10_000
+NUM_OPEN_ORDERS = 1_000_000
+ACCOUNTS = [f"strategy-{i}" for i in range(10)]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(1)
+    symbols = [f"SYM{i:05d}" for i in range(NUM_SYMBOLS)]
+    risk = RiskEngine(RiskLimits(
+        max_order_quantity=10_000,
+        max_order_notional=10_000_000.0,
+        max_position=10_000_000,
+        max_open_orders=NUM_OPEN_ORDERS,
+        max_open_notional=1e12,
+    ))
+
+    # The engine keeps no per-order state, so one BookOrder can stand in for each resting order
+    resting = BookOrder("0", symbols[0], Side.BUY, 100.0, 1, 0.0, 0, OrderStatus.ACTIVE, ACCOUNTS[0])
+    start = time.perf_counter()
+    for i in range(NUM_OPEN_ORDERS):
+        resting.symbol = symbols[i % NUM_SYMBOLS]
+        resting.side = Side.BUY if i & 1 else Side.SELL
+        resting.quantity = 10
+        resting.owner = ACCOUNTS[i % len(ACCOUNTS)]
+        risk.on_rest(resting)
+    load = time.perf_counter() - start
+    print(f"RiskEngine benchmark: {NUM_SYMBOLS:,} symbols, {NUM_OPEN_ORDERS:,} open orders, {len(ACCOUNTS)} accounts")
+    print(f"{'load (on_rest)':<16} {load / NUM_OPEN_ORDERS * 1e9:7.0f} ns/order")
+
+    orders = [
+        Order(symbol=rng.choice(symbols), quantity=rng.randint(1, 100), price=round(rng.uniform(10, 500), 2),
+              side=Side.BUY if rng.random() < 0.5 else Side.SELL, timestamp=0.0)
+        for _ in range(n)
+    ]
+    accounts = [rng.choice(ACCOUNTS) for _ in range(n)]
+    book_orders = [
+        BookOrder(str(i), o.symbol, o.side, o.price, o.quantity, 0.0, 0, OrderStatus.ACTIVE, account)
+        for i, (o, account) in enumerate(zip(orders, accounts))
+    ]
+    fills = [
+        Fill(o.symbol, o.price, o.quantity, str(i), "0", o.side, 0.0, 0, rng.choice(ACCOUNTS))
+        for i, o in enumerate(orders)
+    ]
+
+    start = time.perf_counter()
+    for o, account in zip(orders, accounts):
+        risk.check(o, account)
+    check = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for book_order in book_orders:
+        risk.on_rest(book_order)
+    rest = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for fill, account in zip(fills, accounts):
+        risk.on_fill(fill, account)
+    fill_time = time.perf_counter() - start
+
+    for label, elapsed in (("check", check), ("on_rest", rest), ("on_fill", fill_time)):
+        print(f"{label:<16} {elapsed / n * 1e9:7.0f} ns/order")
+    print(f"{'total per order':<16} {(check + rest + fill_time) / n * 1e6:7.2f} us")
+
+
+if __name__ == "__main__":
+    main()
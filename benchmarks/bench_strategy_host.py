@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Per-tick cost of running N strategy variants
+
+Compares N independent StrategyCombiners (what N Strategy processes
+compute between them, each with its own MovingAverageStrategy) against one
+StrategyHost with the same N variants, whose moving averages are shared
+SMA nodes. The variants cycle through a few window pairs, so the number
+of distinct averages stays fixed as N grows.
+
+Usage:
+    python benchmarks/bench_strategy_host.py [num_ticks]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trading_lib.models import MarketDataPoint
+from trading_lib.strategy.news_based_strategy import NewsBasedStrategy
+from trading_lib.strategy.price_based_strategy import MovingAverageStrategy
+from trading_lib.strategy_combiner.strategy_combiner import StrategyCombiner
+from trading_lib.strategy_combiner.strategy_host import StrategyHost
+
+SYMBOLS = [f"SYM{i}" for i in range(50)]
+WINDOWS = [(5, 20), (10, 50), (20, 100)]  # Five distinct averages
+
+
+def variants(n: int):
+    specs = []
+    for i in range(n):
+        short_window, long_window = WINDOWS[i % len(WINDOWS)]
+        specs.append({"name": f"v{i}", "short_window": short_window, "long_window": long_window,
+                      "bearish_threshold": 30 + i % 10, "bullish_threshold": 60 + i % 10})
+    return specs
+
+
+def time_per_tick(got_new_price, ticks) -> float:
+    start = time.perf_counter()
+    for tick in ticks:
+        got_new_price(tick)
+    return (time.perf_counter() - start) / len(ticks) * 1e6
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    rng = random.Random(1)
+    prices = {symbol: 100.0 for symbol in SYMBOLS}
+    ticks = []
+    for i in range(n):
+        symbol = rng.choice(SYMBOLS)
+        prices[symbol] += rng.gauss(0, 0.1)
+        ticks.append(MarketDataPoint(timestamp=float(i), symbol=symbol, price=prices[symbol]))
+
+    print(f"{n:,} ticks over {len(SYMBOLS)} symbols (us/tick)")
+    print(f"{'strategies':>10}  {'independent':>12}  {'host':>8}  {'indicators':>10}  {'speedup':>8}")
+    for count in (1, 10, 50, 100):
+        specs = variants(count)
+        combiners = [StrategyCombiner(MovingAverageStrategy(spec["short_window"], spec["long_window"]),
+                                      NewsBasedStrategy(spec["bearish_threshold"], spec["bullish_threshold"]))
+                     for spec in specs]
+        for combiner in combiners:
+            combiner.set_trade_signal_listener(lambda *signal: None)
+
+        def independent(tick):
+            for combiner in combiners:
+                combiner.got_new_price(tick)
+
+        host = StrategyHost(specs, SYMBOLS)
+        host.set_trade_signal_listener(lambda *signal: None)
+        for symbol in SYMBOLS:  # News on every symbol, so price signals are combined
+            for combiner in combiners:
+                combiner.got_new_news(symbol, 80)
+            host.got_new_news(symbol, 80)
+
+        separate = time_per_tick(independent, ticks)
+        shared = time_per_tick(host.got_new_price, ticks)
+        print(f"{count:>10}  {separate:>12.2f}  {shared:>8.2f}  {len(host.graph):>10}  {separate / shared:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
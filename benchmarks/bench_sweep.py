@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for the parallel parameter sweep
+
+Builds a random-walk event stream (ticks over 10 symbols, one news item per
+20 ticks), loads it once into shared memory and sweeps a fixed grid of
+moving-average windows with 1, 2, 4, ... processes up to the CPU count.
+Reports wall time, throughput and speedup over the single-process run.
+
+Usage:
+    python benchmarks/bench_sweep.py [num_ticks] [num_parameter_sets]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trading_lib.backtest.data import merge_feeds
+from trading_lib.backtest.sweep import SharedEvents, parameter_grid, run_sweep
+
+SYMBOLS = ["AAPL", "MSFT", "SPY", "GOOG", "AMZN", "NVDA", "META", "TSLA", "JPM", "XOM"]
+
+
+def make_events(n: int):
+    rng = random.Random(1)
+    prices = {symbol: 100.0 for symbol in SYMBOLS}
+    market, news = [], []
+    for i in range(n):
+        symbol = rng.choice(SYMBOLS)
+        prices[symbol] = max(1.0, prices[symbol] + rng.gauss(0, 0.1))
+        market.append((i * 0.1, symbol, round(prices[symbol], 2)))
+        if i % 20 == 0:
+            news.append((i * 0.1, rng.choice(SYMBOLS), rng.randint(0, 100)))
+    return merge_feeds(market, news)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    num_sets = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    grid = parameter_grid({"short_window": [3, 5, 10, 20, 30], "long_window": [40, 60, 90, 120]})[:num_sets]
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, cpus} | {2 ** k for k in range(1, cpus.bit_length()) if 2 ** k < cpus})
+
+    start = time.perf_counter()
+    with SharedEvents.from_events(make_events(n)) as events:
+        load = time.perf_counter() - start
+        print(f"Parameter sweep: {len(grid)} sets x {len(events):,} events, "
+              f"loaded into shared memory in {load:.2f}s ({events.shm.size / 1e6:.1f} MB), {cpus} CPU(s)")
+        print(f"{'processes':>9} {'seconds':>8} {'sets/s':>7} {'M events/s':>11} {'speedup':>8}")
+        baseline = None
+        for processes in counts:
+            start = time.perf_counter()
+            results = run_sweep(events, grid, processes=processes)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{processes:>9} {elapsed:>8.2f} {len(results) / elapsed:>7.2f} "
+                  f"{len(results) * len(events) / elapsed / 1e6:>11.2f} {baseline / elapsed:>7.2f}x")
+        best = results[0]
+        print(f"best: {best.params} return {best.total_return:+.2%}")
+
+
+if __name__ == "__main__":
+    main()
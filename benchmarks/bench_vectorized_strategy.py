@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Scalar vs. vectorized MovingAverageStrategy over thousands of symbols
+
+Feeds snapshots of every symbol's price (as read from the SharedPriceBook)
+through MovingAverageStrategy one MarketDataPoint at a time, and through
+VectorizedMovingAverageStrategy one snapshot batch at a time, then through
+random-symbol batches of the same size (repeated symbols, several rounds
+per batch). Reports the cost per tick and checks both give the same signals.
+
+Usage:
+    python benchmarks/bench_vectorized_strategy.py [num_symbols] [num_snapshots]
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trading_lib.models import MarketDataPoint
+from trading_lib.strategy.price_based_strategy import MovingAverageStrategy, VectorizedMovingAverageStrategy
+
+SHORT_WINDOW, LONG_WINDOW = 20, 50
+
+
+def run_scalar(symbols, batches):
+    strategy = MovingAverageStrategy(SHORT_WINDOW, LONG_WINDOW)
+    now = datetime.now()
+    ticks = [[MarketDataPoint(now, symbols[i], price) for i, price in zip(ids.tolist(), prices.tolist())]
+             for ids, prices in batches]
+    signals = []
+    start = time.perf_counter()
+    for batch in ticks:
+        for tick in batch:
+            signals.extend(strategy.generate_signals(tick))
+    return time.perf_counter() - start, signals
+
+
+def run_vectorized(symbols, batches):
+    strategy = VectorizedMovingAverageStrategy(symbols, SHORT_WINDOW, LONG_WINDOW)
+    masks = []
+    start = time.perf_counter()
+    for ids, prices in batches:
+        masks.append(strategy.generate_signals(ids, prices))
+    elapsed = time.perf_counter() - start
+    signals = [signal for (ids, prices), mask in zip(batches, masks) for signal in strategy.signals(ids, prices, mask)]
+    return elapsed, signals
+
+
+def main():
+    num_symbols = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    num_snapshots = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rng = np.random.default_rng(1)
+    symbols = [f"S{i:05d}" for i in range(num_symbols)]
+    paths = np.round(100 + np.cumsum(rng.normal(0, 0.2, (num_snapshots, num_symbols)), axis=0), 2)
+    all_ids = np.arange(num_symbols)
+    snapshots = [(all_ids, paths[i]) for i in range(num_snapshots)]
+    random_ids = rng.integers(0, num_symbols, (num_snapshots, num_symbols))
+    random_batches = [(random_ids[i], paths[i][random_ids[i]]) for i in range(num_snapshots)]
+
+    ticks = num_symbols * num_snapshots
+    print(f"MovingAverageStrategy {SHORT_WINDOW}/{LONG_WINDOW}, {num_symbols:,} symbols, "
+          f"{num_snapshots} batches of {num_symbols:,} ticks")
+    print(f"{'batches':<10} {'scalar us/tick':>15} {'vector us/tick':>15} {'speedup':>8} {'signals':>9} {'match':>6}")
+    for name, batches in (("snapshot", snapshots), ("random", random_batches)):
+        scalar_time, scalar_signals = run_scalar(symbols, batches)
+        vector_time, vector_signals = run_vectorized(symbols, batches)
+        print(f"{name:<10} {scalar_time / ticks * 1e6:>15.3f} {vector_time / ticks * 1e6:>15.3f} "
+              f"{scalar_time / vector_time:>7.1f}x {len(vector_signals):>9,} {str(vector_signals == scalar_signals):>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,18 +21,32 @@ class Config:
             
             # Get symbols from root level if available
             symbols = self._raw_config.get("symbols", [])
+
+            # Logging and latency tracing options are shared by every process
+            self._logging_config = self._raw_config.get("logging", {}).copy()
+            tracing = self._raw_config.get("tracing", False)
+            # Strategy -> OrderManager transport ("tcp" or "shm") and its ring, shared by both ends
+            order_transport = self._raw_config.get("order_transport", "tcp")
+            order_ring = self._raw_config.get("order_ring", {})
             
             # Process Gateway config: convert delimiter string to bytes and add symbols
             gateway_config = self._raw_config["Gateway"].copy()
             gateway_config["delimiter"] = gateway_config["delimiter"].encode('utf-8')
             gateway_config["symbols"] = symbols  # Add symbols for NewsProvider
+            gateway_config.setdefault("logging", self._logging_config)
+            gateway_config.setdefault("tracing", tracing)
             self._gateway_config = gateway_config
+            # Feed consumers must agree with the Gateway on sequence headers
+            sequenced = gateway_config.get("sequenced", False)
 
             # Process OrderBook config
             orderbook_config = self._raw_config["OrderBook"].copy()
             # Ensure symbols are included
             if "symbols" not in orderbook_config:
                 orderbook_config["symbols"] = symbols
+            orderbook_config.setdefault("sequenced", sequenced)
+            orderbook_config.setdefault("logging", self._logging_config)
+            orderbook_config.setdefault("tracing", tracing)
             self._orderbook_config = orderbook_config
 
             # Process Strategy config: add md_port from Gateway if missing
@@ -42,12 +56,24 @@ class Config:
             # Ensure symbols are included
             if "symbols" not in strategy_config:
                 strategy_config["symbols"] = symbols
+            strategy_config.setdefault("sequenced", sequenced)
+            strategy_config.setdefault("logging", self._logging_config)
+            strategy_config.setdefault("tracing", tracing)
+            strategy_config.setdefault("order_transport", order_transport)
+            strategy_config.setdefault("order_ring", order_ring)
             self._strategy_config = strategy_config
 
             # Process OrderManager config: convert "port" to "order_manager_port" if needed
             ordermanager_config = self._raw_config["OrderManager"].copy()
             if "port" in ordermanager_config and "order_manager_port" not in ordermanager_config:
                 ordermanager_config["order_manager_port"] = ordermanager_config.pop("port")
+            ordermanager_config.setdefault("logging", self._logging_config)
+            ordermanager_config.setdefault("tracing", tracing)
+            ordermanager_config.setdefault("order_transport", order_transport)
+            ordermanager_config.setdefault("order_ring", order_ring)
+            # Positions are marked to the OrderBook's price book, indexed by the same symbols
+            ordermanager_config.setdefault("symbols", orderbook_config["symbols"])
+            ordermanager_config.setdefault("shared_memory_name", orderbook_config.get("shared_memory_name"))
             self._ordermanager_config = ordermanager_config
             
             Config._initialized = True
@@ -72,6 +98,11 @@ class Config:
         """Get OrderManager configuration"""
         return self._ordermanager_config
     
+    @property
+    def logging(self) -> Dict[str, Any]:
+        """Get logging configuration (see logger.configure_logging)"""
+        return self._logging_config
+    
     def get(self, section: str) -> Dict[str, Any]:
         """Get a configuration section"""
         return self._raw_config.get(section, {})
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Tick-to-order latency tracing
+
+Each process keeps a LatencyRecorder with one log-bucketed (HDR-style)
+histogram per pipeline stage. Timestamps are ``time.monotonic_ns()``, which
+is a host-wide clock on Linux and macOS, so deltas between processes on the
+same machine are meaningful.
+
+Stages recorded by the trading system:
+- gateway_to_feed: Stream.broadcast -> FeedHandler recv (OrderBook)
+- feed_to_shm: FeedHandler recv -> SharedPriceBook publish (OrderBook)
+- shm_to_strategy: SharedPriceBook publish -> Strategy read (Strategy)
+- strategy_signal: Strategy read -> order sent (Strategy)
+- order_transit: order sent -> Server.route_order (OrderManager)
+- tick_to_order: Stream.broadcast -> Server.route_order, the whole path (OrderManager)
+
+Usage:
+    python latency.py logs/latency_*.json    # merge per-process dumps into one report
+"""
+
+import json
+import sys
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+# Values below 2**SUB_BUCKET_BITS ns are exact; above, each power of two is
+# split into 2**(SUB_BUCKET_BITS - 1) linear sub-buckets (~3% relative error)
+SUB_BUCKET_BITS = 6
+SUB_BUCKET_HALF = 1 << (SUB_BUCKET_BITS - 1)
+# Largest trackable value is ~2**40 ns (about 18 minutes); larger values are clamped
+MAX_VALUE_BITS = 40
+
+PERCENTILES = (50.0, 99.0, 99.9)
+
+
+def _bucket_index(value: int) -> int:
+    if value < (1 << SUB_BUCKET_BITS):
+        return value if value > 0 else 0
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return shift * SUB_BUCKET_HALF + (value >> shift)
+
+
+def _bucket_upper_bound(index: int) -> int:
+    if index < (1 << SUB_BUCKET_BITS):
+        return index
+    shift = index // SUB_BUCKET_HALF - 1
+    sub_bucket = index - shift * SUB_BUCKET_HALF
+    return ((sub_bucket + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Fixed-size log-bucketed histogram of nanosecond latencies"""
+
+    NUM_BUCKETS = _bucket_index((1 << MAX_VALUE_BITS) - 1) + 1
+
+    def __init__(self):
+        self.counts = [0] * self.NUM_BUCKETS
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, value_ns: int, count: int = 1):
+        """Record ``count`` occurrences of ``value_ns`` (negative values clamp to 0)"""
+        if value_ns < 0:
+            value_ns = 0
+        index = _bucket_index(value_ns)
+        if index >= self.NUM_BUCKETS:
+            index = self.NUM_BUCKETS - 1
+        self.counts[index] += count
+        self.count += count
+        self.total += value_ns * count
+        if value_ns > self.max:
+            self.max = value_ns
+        if self.min is None or value_ns < self.min:
+            self.min = value_ns
+
+    def percentile(self, percentile: float) -> int:
+        """Upper bound of the bucket holding the given percentile (0 if empty)"""
+        if self.count == 0:
+            return 0
+        target = max(1, -(-self.count * percentile // 100))  # ceil
+        running = 0
+        for index, bucket_count in enumerate(self.counts):
+            running += bucket_count
+            if running >= target:
+                return min(_bucket_upper_bound(index), self.max)
+        return self.max
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other: 'LatencyHistogram'):
+        for index, bucket_count in enumerate(other.counts):
+            if bucket_count:
+                self.counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "buckets": {str(i): c for i, c in enumerate(self.counts) if c},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'LatencyHistogram':
+        histogram = cls()
+        for index, bucket_count in data["buckets"].items():
+            histogram.counts[int(index)] = bucket_count
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
+
+
+class LatencyRecorder:
+    """Per-process set of stage histograms"""
+
+    def __init__(self, process_name: str, enabled: bool = True):
+        self.process_name = process_name
+        self.enabled = enabled
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.lock = threading.Lock()
+
+    def record(self, stage: str, start_ns: int, end_ns: Optional[int] = None, count: int = 1):
+        """Record ``end_ns - start_ns`` (end defaults to now) for ``stage``"""
+        if not self.enabled or not start_ns:
+            return
+        if end_ns is None:
+            end_ns = time.monotonic_ns()
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            with self.lock:
+                histogram = self.histograms.setdefault(stage, LatencyHistogram())
+        histogram.record(end_ns - start_ns, count)
+
+    def report(self) -> Dict[str, dict]:
+        """Per-stage count, mean, percentiles and max in nanoseconds"""
+        return {stage: summarize(histogram) for stage, histogram in self.histograms.items()}
+
+    def format_report(self) -> str:
+        return format_report(self.histograms, title=f"Latency report ({self.process_name})")
+
+    def dump(self, path: str):
+        """Write raw histograms as JSON so reports from several processes can be merged"""
+        with open(path, 'w') as f:
+            json.dump({
+                "process": self.process_name,
+                "stages": {stage: histogram.to_dict() for stage, histogram in self.histograms.items()},
+            }, f)
+
+
+def summarize(histogram: LatencyHistogram) -> dict:
+    summary = {"count": histogram.count, "mean": histogram.mean(), "max": histogram.max}
+    for percentile in PERCENTILES:
+        summary[f"p{percentile:g}"] = histogram.percentile(percentile)
+    return summary
+
+
+def format_report(histograms: Dict[str, LatencyHistogram], title: str = "Latency report") -> str:
+    header = f"{'stage':<18}{'count':>10}" + "".join(f"{'p' + format(p, 'g'):>12}" for p in PERCENTILES) + f"{'max':>12}"
+    lines = [title, header]
+    for stage, histogram in histograms.items():
+        summary = summarize(histogram)
+        lines.append(
+            f"{stage:<18}{summary['count']:>10}"
+            + "".join(f"{_format_ns(summary[f'p{p:g}']):>12}" for p in PERCENTILES)
+            + f"{_format_ns(summary['max']):>12}"
+        )
+    return "\n".join(lines)
+
+
+def _format_ns(value: int) -> str:
+    if value >= 1_000_000_000:
+        return f"{value / 1e9:.2f}s"
+    if value >= 1_000_000:
+        return f"{value / 1e6:.2f}ms"
+    if value >= 1_000:
+        return f"{value / 1e3:.1f}us"
+    return f"{value}ns"
+
+
+def merge_dumps(paths: Iterable[str]) -> Dict[str, LatencyHistogram]:
+    """Merge stage histograms from several LatencyRecorder.dump files"""
+    merged: Dict[str, LatencyHistogram] = {}
+    for path in paths:
+        with open(path) as f:
+            data = json.load(f)
+        for stage, raw in data["stages"].items():
+            merged.setdefault(stage, LatencyHistogram()).merge(LatencyHistogram.from_dict(raw))
+    return merged
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    print(format_report(merge_dumps(sys.argv[1:])))
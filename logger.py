@@ -1,10 +1,99 @@
+import atexit
+import copy
 import logging
+import numbers
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 
-def setup_logger(process_name: str, log_dir: str = "logs", level: int = logging.INFO) -> logging.Logger:
+# Process-wide defaults applied by setup_logger, see configure_logging()
+_logging_options = {
+    "queued": False,
+    "queue_size": 10000,
+}
+
+# Background listeners for queued loggers, keyed by process name
+_listeners: Dict[str, QueueListener] = {}
+_queue_handlers: Dict[str, "DroppingQueueHandler"] = {}
+_exception_formatter = logging.Formatter()
+# Log arguments queued as they are; anything else is queued as its str()
+_IMMUTABLE_ARG_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+
+def _snapshot_arg(arg):
+    if type(arg) in _IMMUTABLE_ARG_TYPES or isinstance(arg, (str, bytes, numbers.Number)):
+        return arg  # numbers.Number also keeps NumPy scalars usable with %d / %.2f
+    return str(arg)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler for a bounded in-process queue that never blocks the caller.
+
+    Records are queued with their message unformatted: the QueueListener
+    thread renders ``msg % args``, applies the handlers' formats and does all
+    I/O. Only what could change or keep frames alive while queued is
+    snapshotted on the logging thread: arguments other than strings, bytes
+    and numbers are replaced by their ``str()``, and a traceback is
+    rendered to ``exc_text``. When the queue is full the record is dropped
+    and counted in ``dropped``.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike the default, leave all formatting to the listener
+        args = record.args
+        mutable_args = bool(args) and (type(args) is not tuple
+                                       or not all(type(arg) in _IMMUTABLE_ARG_TYPES for arg in args))
+        if not mutable_args and not record.exc_info:
+            return record  # Common case: nothing to snapshot
+        record = copy.copy(record)
+        if mutable_args:
+            if type(args) is tuple:
+                record.args = tuple(map(_snapshot_arg, args))
+            else:
+                record.msg, record.args = record.getMessage(), None  # A mapping argument
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _DrainingQueueListener(QueueListener):
+    """QueueListener whose stop() waits for room in a full bounded queue"""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+def configure_logging(queued: bool = False, queue_size: int = 10000):
+    """
+    Set process-wide defaults for loggers created by setup_logger.
+    
+    Args:
+        queued: Hand records to a background thread instead of writing them inline
+        queue_size: Maximum number of pending records per logger before records are dropped
+    """
+    if queue_size <= 0:
+        raise ValueError("queue_size must be positive")
+    _logging_options["queued"] = queued
+    _logging_options["queue_size"] = queue_size
+
+
+def setup_logger(process_name: str, log_dir: str = "logs", level: int = logging.INFO,
+                 queued: Optional[bool] = None, queue_size: Optional[int] = None) -> logging.Logger:
     """
     Set up a logger for a specific process with both file and console handlers.
     
@@ -12,10 +101,17 @@ def setup_logger(process_name: str, log_dir: str = "logs", level: int = logging.
         process_name: Name of the process (e.g., 'gateway', 'strategy', 'orderbook')
         log_dir: Directory to store log files (default: 'logs')
         level: Logging level (default: INFO)
+        queued: Use a QueueHandler/QueueListener pair (default: configure_logging setting)
+        queue_size: Bound on pending records when queued (default: configure_logging setting)
     
     Returns:
         Configured logger instance
     """
+    if queued is None:
+        queued = _logging_options["queued"]
+    if queue_size is None:
+        queue_size = _logging_options["queue_size"]
+
     # Create logs directory if it doesn't exist
     log_path = Path(log_dir)
     log_path.mkdir(exist_ok=True)
@@ -25,6 +121,7 @@ def setup_logger(process_name: str, log_dir: str = "logs", level: int = logging.
     logger.setLevel(level)
     
     # Remove existing handlers to avoid duplicates
+    _stop_listener(process_name)
     logger.handlers.clear()
     
     # File handler - writes to process-specific log file
@@ -36,7 +133,6 @@ def setup_logger(process_name: str, log_dir: str = "logs", level: int = logging.
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
     
     # Console handler - writes to stdout
     console_handler = logging.StreamHandler()
@@ -46,7 +142,20 @@ def setup_logger(process_name: str, log_dir: str = "logs", level: int = logging.
         datefmt='%H:%M:%S'
     )
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+
+    if queued:
+        # Hot-path threads only enqueue; the listener thread formats and writes
+        queue_handler = DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+        queue_handler.setLevel(level)
+        listener = _DrainingQueueListener(queue_handler.queue, file_handler, console_handler, respect_handler_level=True)
+        listener.start()
+        _listeners[process_name] = listener
+        _queue_handlers[process_name] = queue_handler
+        logger.addHandler(queue_handler)
+    else:
+        _queue_handlers.pop(process_name, None)
+        logger.addHandler(file_handler)
+        logger.addHandler(console_handler)
     
     logger.info(f"Logger initialized for {process_name}. Log file: {log_file}")
     
@@ -69,3 +178,34 @@ def get_logger(process_name: str) -> logging.Logger:
         return setup_logger(process_name)
     return logger
 
+
+def dropped_records(process_name: str) -> int:
+    """Number of records dropped because the logger's queue was full (0 if not queued)"""
+    queue_handler = _queue_handlers.get(process_name)
+    return queue_handler.dropped if queue_handler else 0
+
+
+def _stop_listener(process_name: str):
+    listener = _listeners.pop(process_name, None)
+    queue_handler = _queue_handlers.get(process_name)  # Kept so dropped_records() still reports
+    if listener is None:
+        return
+    listener.stop()  # Drains pending records before returning
+    for handler in listener.handlers:
+        if queue_handler is not None and queue_handler.dropped:
+            handler.handle(logging.makeLogRecord({
+                "name": process_name,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": f"Dropped {queue_handler.dropped} log records (queue full)",
+            }))
+        handler.close()
+
+
+def shutdown_logging():
+    """Flush and stop every queued logger's background thread"""
+    for process_name in list(_listeners):
+        _stop_listener(process_name)
+
+
+atexit.register(shutdown_logging)
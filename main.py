@@ -26,7 +26,7 @@ from Gateway.run import run_gateway
 from OrderBook.run import run_orderbook
 from Strategy.run import run_strategy
 from OrderManager.run import run_order_manager
-from logger import setup_logger
+from logger import configure_logging, setup_logger
 
 
 def main():
@@ -35,6 +35,7 @@ def main():
     config = Config(config_path)
     
     # Setup logger
+    configure_logging(**config.logging)
     logger = setup_logger("main")
     logger.info("Starting Trading System")
     
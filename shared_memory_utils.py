@@ -6,21 +6,24 @@ from logger import setup_logger
 
 class SharedPriceBook:
 
-    def __init__(self, symbols, name=None, create=True):
+    def __init__(self, symbols, name=None, create=True, traced=False):
         self.logger = setup_logger("shared_price_book")
         self.symbols = symbols
         self.name = name
         self.num_symbols = len(symbols)
         self.lock = Lock()
         self._create = create  # Store for cleanup
+        # Traced books also store the Gateway origin and publish time (monotonic ns) per symbol
+        self.traced = traced
 
-        self.dtype = np.dtype(
-            [
-                ('symbol', 'U10'),
-                ('price', 'f8'),
-                ('timestamp', 'f8'),
-            ]
-        )
+        fields = [
+            ('symbol', 'U10'),
+            ('price', 'f8'),
+            ('timestamp', 'f8'),
+        ]
+        if traced:
+            fields += [('origin_ns', 'i8'), ('publish_ns', 'i8')]
+        self.dtype = np.dtype(fields)
 
         self.size = self.num_symbols * self.dtype.itemsize
 
@@ -56,7 +59,7 @@ class SharedPriceBook:
             )
 
             for i, sym in enumerate(self.symbols):
-                self.prices[i] = (sym, 0.0, 0.0)
+                self.prices[i] = (sym, 0.0, 0.0) + ((0, 0) if traced else ())
         
         else:
             self.shm = shared_memory.SharedMemory(
@@ -80,6 +83,39 @@ class SharedPriceBook:
             self.prices[idx]['price'] = price
             self.prices[idx]['timestamp'] = timestamp
 
+    def update_many(self, indices, prices, timestamps, origin_ns=None):
+        """Apply many updates under a single lock acquisition.
+
+        Args:
+            indices: Symbol indices (positions in ``symbols``)
+            prices: Prices, aligned with ``indices``
+            timestamps: Timestamps, aligned with ``indices``
+            origin_ns: Gateway origin times, aligned with ``indices`` (traced books only)
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        if indices.size == 0:
+            return
+        prices = np.asarray(prices, dtype='f8')
+        timestamps = np.asarray(timestamps, dtype='f8')
+        traced = self.traced and origin_ns is not None
+        if traced:
+            origin_ns = np.asarray(origin_ns, dtype='i8')
+
+        if indices.size > 1:
+            # Keep only the latest update per symbol, fancy assignment order is unspecified
+            _, last_from_end = np.unique(indices[::-1], return_index=True)
+            latest = indices.size - 1 - last_from_end
+            indices, prices, timestamps = indices[latest], prices[latest], timestamps[latest]
+            if traced:
+                origin_ns = origin_ns[latest]
+
+        with self.lock:
+            self.prices['price'][indices] = prices
+            self.prices['timestamp'][indices] = timestamps
+            if traced:
+                self.prices['origin_ns'][indices] = origin_ns
+                self.prices['publish_ns'][indices] = time.monotonic_ns()
+
     def read(self, symbol):
         with self.lock:
             idx = self.symbol_index.get(symbol, None)
@@ -88,6 +124,23 @@ class SharedPriceBook:
                 return None, None
             return self.prices[idx]['price'], self.prices[idx]['timestamp']
     
+    def read_traced(self, symbol):
+        """Return (price, timestamp, origin_ns, publish_ns); trace fields are 0 on untraced books"""
+        with self.lock:
+            idx = self.symbol_index.get(symbol, None)
+            if idx is None:
+                self.logger.error(f"Symbol {symbol} not found in price book")
+                return None, None, 0, 0
+            record = self.prices[idx]
+            if not self.traced:
+                return record['price'], record['timestamp'], 0, 0
+            return record['price'], record['timestamp'], int(record['origin_ns']), int(record['publish_ns'])
+
+    def read_prices(self):
+        """Copy of every symbol's latest price as one float64 vector, in ``symbols`` order"""
+        with self.lock:
+            return self.prices['price'].copy()
+
     def close(self):
         if hasattr(self, 'shm'):
             self.shm.close()
@@ -118,4 +171,146 @@ class SharedPriceBook:
         if self._create:
             self.unlink()
         return False
-    
\ No newline at end of file
+    
+
+class SharedPnLBook:
+    """Positions and PnL per account and symbol, published by the OrderManager's PositionKeeper.
+
+    One writer (``create=True``) and any number of readers attached by name.
+    Writes are bracketed by a sequence counter (odd while a write is in
+    progress), so readers take consistent snapshots without a lock or RPC:
+    they copy and retry if the counter moved.
+    """
+
+    HEADER_DTYPE = np.dtype([
+        ('seq', 'i8'),
+        ('refresh_ns', 'i8'),   # time.time_ns() of the last publish
+        ('num_accounts', 'i8'),
+        ('realized', 'f8'),
+        ('unrealized', 'f8'),
+    ])
+    ACCOUNT_DTYPE = np.dtype([('account', 'U32'), ('realized', 'f8'), ('unrealized', 'f8')])
+    POSITION_DTYPE = np.dtype([
+        ('position', 'i8'),
+        ('avg_price', 'f8'),
+        ('mark', 'f8'),
+        ('realized', 'f8'),
+        ('unrealized', 'f8'),
+    ])
+
+    def __init__(self, symbols, max_accounts=64, name=None, create=True):
+        self.logger = setup_logger("shared_pnl_book")
+        self.symbols = list(symbols)
+        self.num_symbols = len(self.symbols)
+        self.max_accounts = max_accounts
+        self.name = name or 'pnl_book'
+        self._create = create
+        self.symbol_index = {sym: i for i, sym in enumerate(self.symbols)}
+
+        header_size = self.HEADER_DTYPE.itemsize
+        accounts_size = max_accounts * self.ACCOUNT_DTYPE.itemsize
+        self.size = header_size + accounts_size + max_accounts * self.num_symbols * self.POSITION_DTYPE.itemsize
+
+        if create:
+            try:
+                self.shm = shared_memory.SharedMemory(create=True, size=self.size, name=self.name)
+            except FileExistsError:
+                self.logger.warning(f"Shared memory '{self.name}' already exists. Cleaning up...")
+                old_shm = shared_memory.SharedMemory(name=self.name, create=False)
+                old_shm.close()
+                old_shm.unlink()
+                self.shm = shared_memory.SharedMemory(create=True, size=self.size, name=self.name)
+        else:
+            self.shm = shared_memory.SharedMemory(name=self.name)
+
+        buf = self.shm.buf
+        self.header = np.ndarray(shape=(1,), dtype=self.HEADER_DTYPE, buffer=buf)
+        self.accounts = np.ndarray(shape=(max_accounts,), dtype=self.ACCOUNT_DTYPE, buffer=buf, offset=header_size)
+        self.positions = np.ndarray(shape=(max_accounts, self.num_symbols), dtype=self.POSITION_DTYPE,
+                                    buffer=buf, offset=header_size + accounts_size)
+        if create:
+            self.header[0] = (0, 0, 0, 0.0, 0.0)
+            self.accounts[:] = ('', 0.0, 0.0)
+            self.positions[:] = (0, 0.0, 0.0, 0.0, 0.0)
+
+    def publish(self, account_labels, position, avg_price, mark, realized, unrealized):
+        """Writer: publish rows for the first ``len(account_labels)`` accounts (arrays are accounts x symbols)"""
+        n = len(account_labels)
+        header = self.header
+        header['seq'] += 1
+        try:
+            rows = self.positions[:n]
+            rows['position'] = position
+            rows['avg_price'] = avg_price
+            rows['mark'] = mark
+            rows['realized'] = realized
+            rows['unrealized'] = unrealized
+            accounts = self.accounts[:n]
+            accounts['account'] = account_labels
+            accounts['realized'] = realized.sum(axis=1)
+            accounts['unrealized'] = unrealized.sum(axis=1)
+            header['num_accounts'] = n
+            header['realized'] = accounts['realized'].sum()
+            header['unrealized'] = accounts['unrealized'].sum()
+            header['refresh_ns'] = time.time_ns()
+        finally:
+            header['seq'] += 1
+
+    def snapshot(self, max_attempts=1000):
+        """Reader: consistent copies of (header, accounts, positions) for the published accounts"""
+        header = self.header
+        for _ in range(max_attempts):
+            seq = int(header['seq'][0])
+            if seq & 1:
+                continue  # Write in progress
+            n = int(header['num_accounts'][0])
+            result = header[0].copy(), self.accounts[:n].copy(), self.positions[:n].copy()
+            if int(header['seq'][0]) == seq:
+                return result
+        raise TimeoutError("PnL book is being rewritten continuously")
+
+    def read_all(self):
+        """Per-account PnL: {account: {"realized", "unrealized", "total", "symbols": {symbol: {...}}}}"""
+        _, accounts, positions = self.snapshot()
+        result = {}
+        for account, rows in zip(accounts, positions):
+            realized, unrealized = float(account['realized']), float(account['unrealized'])
+            result[str(account['account'])] = {
+                "realized": realized,
+                "unrealized": unrealized,
+                "total": realized + unrealized,
+                "symbols": {
+                    symbol: {
+                        "position": int(row['position']),
+                        "avg_price": float(row['avg_price']),
+                        "mark": float(row['mark']),
+                        "pnl": float(row['realized'] + row['unrealized']),
+                    }
+                    for symbol, row in zip(self.symbols, rows) if row['position'] or row['realized']
+                },
+            }
+        return result
+
+    def total_pnl(self) -> float:
+        header, _, _ = self.snapshot()
+        return float(header['realized'] + header['unrealized'])
+
+    def close(self):
+        if hasattr(self, 'shm'):
+            del self.header, self.accounts, self.positions
+            self.shm.close()
+            self.logger.info(f"Closed shared memory: {self.name}")
+
+    def unlink(self):
+        if hasattr(self, 'shm'):
+            self.shm.unlink()
+            self.logger.info(f"Unlinked shared memory: {self.name}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if self._create:
+            self.unlink()
+        return False
@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+from backoff import ExponentialBackoff
+
+
+def test_backoff_grows_and_caps():
+    backoff = ExponentialBackoff(initial=0.1, maximum=0.5, jitter=0.0)
+    delays = [backoff.next_delay() for _ in range(5)]
+    assert delays == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5])
+
+
+def test_backoff_jitter_stays_in_range():
+    backoff = ExponentialBackoff(initial=1.0, maximum=1.0, jitter=0.5, rng=random.Random(7))
+    for _ in range(100):
+        assert 0.5 <= backoff.next_delay() <= 1.0
+
+
+def test_backoff_reset():
+    backoff = ExponentialBackoff(initial=0.1, maximum=10.0, jitter=0.0)
+    backoff.next_delay()
+    backoff.next_delay()
+    backoff.reset()
+    assert backoff.attempts == 0
+    assert backoff.next_delay() == pytest.approx(0.1)
+
+
+def test_backoff_invalid_arguments():
+    with pytest.raises(ValueError):
+        ExponentialBackoff(initial=0.0)
+    with pytest.raises(ValueError):
+        ExponentialBackoff(initial=1.0, maximum=0.5)
+    with pytest.raises(ValueError):
+        ExponentialBackoff(jitter=1.5)
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from latency import LatencyHistogram, LatencyRecorder, format_report, merge_dumps
+
+
+def test_histogram_exact_small_values():
+    histogram = LatencyHistogram()
+    for value in range(1, 11):
+        histogram.record(value)
+    assert histogram.count == 10
+    assert histogram.min == 1
+    assert histogram.max == 10
+    assert histogram.percentile(50) == 5
+    assert histogram.percentile(100) == 10
+    assert histogram.mean() == pytest.approx(5.5)
+
+
+def test_histogram_percentiles_within_relative_error():
+    histogram = LatencyHistogram()
+    for value in range(1, 100_001):
+        histogram.record(value * 100)
+    for percentile, expected in ((50.0, 5_000_000), (99.0, 9_900_000), (99.9, 9_990_000)):
+        assert histogram.percentile(percentile) == pytest.approx(expected, rel=0.04)
+    assert histogram.percentile(100) == 10_000_000
+
+
+def test_histogram_clamps_negative_and_huge_values():
+    histogram = LatencyHistogram()
+    histogram.record(-5)
+    histogram.record(1 << 50)
+    assert histogram.min == 0
+    assert histogram.count == 2
+    assert histogram.percentile(50) == 0
+
+
+def test_histogram_merge_and_dict_roundtrip():
+    a, b = LatencyHistogram(), LatencyHistogram()
+    a.record(100, count=3)
+    b.record(5_000)
+    a.merge(LatencyHistogram.from_dict(b.to_dict()))
+    assert a.count == 4
+    assert a.min == 100
+    assert a.max == 5_000
+    assert a.percentile(50) == pytest.approx(100, rel=0.03)
+
+
+def test_recorder_disabled_and_zero_start_are_ignored():
+    recorder = LatencyRecorder("test", enabled=False)
+    recorder.record("stage", 1, 10)
+    assert recorder.histograms == {}
+
+    recorder = LatencyRecorder("test")
+    recorder.record("stage", 0, 10)
+    assert recorder.histograms == {}
+
+
+def test_recorder_report_and_merge_dumps(tmp_path):
+    first = LatencyRecorder("orderbook")
+    first.record("feed_to_shm", 1_000, 3_000, count=2)
+    second = LatencyRecorder("order_manager")
+    second.record("tick_to_order", 1_000, 101_000)
+    second.record("feed_to_shm", 1, 5_001)
+
+    assert first.report()["feed_to_shm"]["count"] == 2
+
+    paths = [tmp_path / "a.json", tmp_path / "b.json"]
+    first.dump(paths[0])
+    second.dump(paths[1])
+    assert json.loads(paths[0].read_text())["process"] == "orderbook"
+
+    merged = merge_dumps(paths)
+    assert merged["feed_to_shm"].count == 3
+    assert merged["feed_to_shm"].max == 5_000
+    assert merged["tick_to_order"].count == 1
+
+    report = format_report(merged)
+    assert "tick_to_order" in report
+    assert "100.0us" in report
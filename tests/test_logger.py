@@ -0,0 +1,95 @@
+import logging
+import queue
+
+import numpy as np
+import pytest
+
+from logger import (
+    DroppingQueueHandler,
+    configure_logging,
+    dropped_records,
+    setup_logger,
+    shutdown_logging,
+)
+
+
+def test_sync_logger_writes_file(tmp_path):
+    logger = setup_logger("test_sync_logger", log_dir=str(tmp_path), queued=False)
+    logger.info("hello %s", "sync")
+    for handler in logger.handlers:
+        handler.flush()
+    
+    assert "hello sync" in (tmp_path / "test_sync_logger.log").read_text()
+
+
+def test_queued_logger_writes_file_on_shutdown(tmp_path):
+    logger = setup_logger("test_queued_logger", log_dir=str(tmp_path), queued=True)
+    assert len(logger.handlers) == 1
+    assert isinstance(logger.handlers[0], DroppingQueueHandler)
+    
+    for i in range(100):
+        logger.info("record %d", i)
+    shutdown_logging()
+    
+    text = (tmp_path / "test_queued_logger.log").read_text()
+    assert "record 0" in text
+    assert "record 99" in text
+    assert dropped_records("test_queued_logger") == 0
+
+
+def test_dropping_queue_handler_counts_drops():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+    record = logging.makeLogRecord({"msg": "x", "levelno": logging.INFO})
+    for _ in range(3):
+        handler.handle(record)
+    
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 2
+
+
+def test_queued_records_are_formatted_by_the_listener():
+    handler = DroppingQueueHandler(queue.Queue())
+    logger = logging.getLogger("test_queued_render")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        logger.info("count %d of %s", 3, "AAPL")
+        values = [1, 2]
+        logger.info("values %s @ %.2f", values, np.float64(1.5))
+        values.append(3)  # Changed before the listener formats it
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logger.exception("failed")
+    finally:
+        logger.removeHandler(handler)
+    
+    plain, mutable, failed = (handler.queue.get_nowait() for _ in range(3))
+    assert (plain.msg, plain.args) == ("count %d of %s", (3, "AAPL"))  # Not formatted on the logging thread
+    assert mutable.args[0] == "[1, 2]" and mutable.getMessage() == "values [1, 2] @ 1.50"
+    assert failed.exc_info is None and "RuntimeError: boom" in failed.exc_text
+    assert logging.Formatter().format(failed).startswith("failed\nTraceback")
+
+
+def test_configure_logging_sets_defaults(tmp_path):
+    try:
+        configure_logging(queued=True, queue_size=5)
+        logger = setup_logger("test_configured_logger", log_dir=str(tmp_path))
+        assert isinstance(logger.handlers[0], DroppingQueueHandler)
+        assert logger.handlers[0].queue.maxsize == 5
+    finally:
+        shutdown_logging()
+        configure_logging()
+    
+    with pytest.raises(ValueError):
+        configure_logging(queue_size=0)
+
+
+def test_queued_logger_shutdown_with_full_queue(tmp_path):
+    logger = setup_logger("test_full_queue_logger", log_dir=str(tmp_path), queued=True, queue_size=2)
+    for i in range(1000):
+        logger.info("record %d", i)
+    shutdown_logging()  # Must not raise queue.Full
+    
+    assert "record" in (tmp_path / "test_full_queue_logger.log").read_text()
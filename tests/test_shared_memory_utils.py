@@ -1,6 +1,7 @@
 import unittest
 import pytest
-from shared_memory_utils import SharedPriceBook
+import numpy as np
+from shared_memory_utils import SharedPnLBook, SharedPriceBook
 
 class TestSharedMemoryUtils(unittest.TestCase):
     def test_shared_memory_size_zero(self):
@@ -20,4 +21,22 @@ class TestSharedMemoryUtils(unittest.TestCase):
     def test_shared_memory_size_five(self):
         shared_price_book = SharedPriceBook(symbols = ["APPL", "MSFT", "ABC", "DEF", "GHI"])
         assert 280 == shared_price_book.shared_memory_size()
-        shared_price_book.close()
\ No newline at end of file
+        shared_price_book.close()
+
+class TestSharedPnLBook(unittest.TestCase):
+    def test_publish_and_snapshot(self):
+        with SharedPnLBook(["AAPL", "MSFT"], max_accounts=2, name="test_pnl_book") as book:
+            position = np.array([[10, -5]])
+            zeros = np.zeros((1, 2))
+            book.publish(["acct"], position, np.array([[100.0, 50.0]]), np.array([101.0, 50.0]),
+                         np.array([[3.0, 0.0]]), np.array([[10.0, 0.0]]))
+            
+            header, accounts, positions = book.snapshot()
+            assert header['seq'] % 2 == 0 and header['num_accounts'] == 1
+            assert list(positions[0]['position']) == [10, -5]
+            assert str(accounts[0]['account']) == "acct"
+            assert book.total_pnl() == pytest.approx(13.0)
+            assert book.read_all()["acct"]["symbols"]["MSFT"]["pnl"] == 0.0
+            
+            book.publish([], zeros[:0], zeros[:0], zeros[0], zeros[:0], zeros[:0])
+            assert book.read_all() == {}
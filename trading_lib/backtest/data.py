@@ -0,0 +1,73 @@
+from typing import Dict, Iterable, Iterator, Tuple
+
+from OrderBook.decoder import MarketDataDecoder
+
+# Event kinds in a merged feed
+MARKET_DATA = 0
+NEWS = 1
+
+# (timestamp, kind, symbol, price or sentiment)
+Event = Tuple[float, int, str, float]
+
+
+class _TimestampParser:
+    """Parses ``YYYY-MM-DD HH:MM:SS`` (as the Gateway sends) or Unix epoch seconds"""
+
+    def __init__(self):
+        self._decoder = MarketDataDecoder(())
+
+    def __call__(self, value: bytes) -> float:
+        try:
+            return self._decoder.parse_timestamp(value)
+        except ValueError:
+            return float(value)
+
+
+def _read_csv(path: str, value_column: bytes, value_type) -> Iterator[Tuple[float, str, float]]:
+    parse_timestamp = _TimestampParser()
+    symbols: Dict[bytes, str] = {}  # Decode each symbol once
+    with open(path, 'rb') as file:
+        header = [name.strip() for name in file.readline().rstrip(b'\r\n').split(b',')]
+        try:
+            ts_col, symbol_col, value_col = (header.index(b'timestamp'), header.index(b'symbol'),
+                                             header.index(value_column))
+        except ValueError:
+            raise ValueError(f"{path}: expected timestamp, symbol and {value_column.decode()} columns, "
+                             f"got {b','.join(header).decode()}") from None
+        for line in file:
+            fields = line.rstrip(b'\r\n').split(b',')
+            if len(fields) < len(header):
+                continue  # Blank or truncated line
+            symbol = symbols.get(fields[symbol_col])
+            if symbol is None:
+                symbol = symbols[fields[symbol_col]] = fields[symbol_col].strip().decode('utf-8')
+            yield parse_timestamp(fields[ts_col].strip()), symbol, value_type(fields[value_col])
+
+
+def read_market_data(path: str) -> Iterator[Tuple[float, str, float]]:
+    """Stream ``(timestamp, symbol, price)`` from a ``timestamp,symbol,price`` CSV (the Gateway's input)"""
+    return _read_csv(path, b'price', float)
+
+
+def read_news(path: str) -> Iterator[Tuple[float, str, int]]:
+    """Stream ``(timestamp, symbol, sentiment)`` from a ``timestamp,symbol,sentiment`` CSV"""
+    return _read_csv(path, b'sentiment', int)
+
+
+def merge_feeds(market_data: Iterable[Tuple[float, str, float]],
+                news: Iterable[Tuple[float, str, int]] = ()) -> Iterator[Event]:
+    """Merge two timestamp-ordered streams into one stream of events.
+
+    Both inputs are consumed lazily. At equal timestamps market data comes
+    first, so news is evaluated against the price at that time.
+    """
+    news = iter(news)
+    next_news = next(news, None)
+    for timestamp, symbol, price in market_data:
+        while next_news is not None and next_news[0] < timestamp:
+            yield next_news[0], NEWS, next_news[1], next_news[2]
+            next_news = next(news, None)
+        yield timestamp, MARKET_DATA, symbol, price
+    while next_news is not None:
+        yield next_news[0], NEWS, next_news[1], next_news[2]
+        next_news = next(news, None)
@@ -0,0 +1,183 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import math
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from trading_lib.backtest.data import MARKET_DATA, Event, merge_feeds, read_market_data, read_news
+from trading_lib.models import Action, MarketDataPoint, RecordingInterval
+from trading_lib.strategy.news_based_strategy import NewsBasedStrategy
+from trading_lib.strategy.price_based_strategy import MovingAverageStrategy
+from trading_lib.strategy_combiner.strategy_combiner import StrategyCombiner
+
+_FIXED_INTERVALS = {
+    RecordingInterval.SECOND: 1.0,
+    RecordingInterval.MINUTE: 60.0,
+    RecordingInterval.HOURLY: 3600.0,
+}
+
+
+def next_boundary(timestamp: float, interval: RecordingInterval) -> float:
+    """Start of the recording period after the one containing ``timestamp``.
+
+    Days, weeks (starting Monday) and months are in local time, like the
+    Gateway's timestamps.
+    """
+    step = _FIXED_INTERVALS.get(interval)
+    if step is not None:
+        return (math.floor(timestamp / step) + 1) * step
+    day = datetime.fromtimestamp(timestamp).replace(hour=0, minute=0, second=0, microsecond=0)
+    if interval is RecordingInterval.DAILY:
+        start = day + timedelta(days=1)
+    elif interval is RecordingInterval.WEEKLY:
+        start = day + timedelta(days=7 - day.weekday())
+    elif interval is RecordingInterval.MONTHLY:
+        start = day.replace(year=day.year + day.month // 12, month=day.month % 12 + 1, day=1)
+    else:
+        raise ValueError(f"No period boundary for recording interval {interval}")
+    return start.timestamp()
+
+
+@dataclass(slots=True)
+class Trade:
+    """A simulated fill of a trade signal"""
+    timestamp: float
+    symbol: str
+    action: Action
+    quantity: int
+    price: float
+    commission: float = 0.0
+
+
+@dataclass
+class BacktestResult:
+    """Equity curve, trades and final state of a backtest run"""
+    equity_timestamps: np.ndarray
+    equity: np.ndarray
+    trades: List[Trade]
+    positions: Dict[str, int]
+    cash: float
+    initial_cash: float
+    market_data_events: int
+    news_events: int
+    elapsed: float
+    final_prices: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def final_equity(self) -> float:
+        return float(self.equity[-1]) if len(self.equity) else self.initial_cash
+
+    @property
+    def total_return(self) -> float:
+        return self.final_equity / self.initial_cash - 1.0
+
+    @property
+    def max_drawdown(self) -> float:
+        """Largest peak-to-trough fall of the recorded equity curve, as a fraction of the peak"""
+        if not len(self.equity):
+            return 0.0
+        peaks = np.maximum.accumulate(self.equity)
+        return float(np.max((peaks - self.equity) / peaks))
+
+    @property
+    def events_per_second(self) -> float:
+        return (self.market_data_events + self.news_events) / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        return (f"{self.market_data_events:,} ticks, {self.news_events:,} news in {self.elapsed:.2f}s "
+                f"({self.events_per_second:,.0f} events/s): {len(self.trades)} trades, "
+                f"final equity {self.final_equity:,.2f} ({self.total_return:+.2%}), "
+                f"max drawdown {self.max_drawdown:.2%}")
+
+
+class BacktestEngine:
+    """Replays merged market data and news through a StrategyCombiner in-process.
+
+    The combiner is built without a config, so it opens no sockets or
+    shared memory; its trade signals are filled immediately at the symbol's
+    latest market price (less ``commission`` per share). Portfolio value is
+    kept incrementally and recorded once per ``recording_interval``: every
+    event for TICK, otherwise the value at the end of each period, stamped
+    with that period's last event time. The final value is always recorded.
+    """
+
+    def __init__(self, combiner: StrategyCombiner, initial_cash: float = 1_000_000.0,
+                 recording_interval: RecordingInterval = RecordingInterval.MINUTE, commission: float = 0.0):
+        self.combiner = combiner
+        self.initial_cash = initial_cash
+        self.recording_interval = RecordingInterval(recording_interval)
+        self.commission = commission
+        combiner.set_trade_signal_listener(self._on_trade_signal)
+        self.cash = initial_cash
+        self.holdings = 0.0  # Market value of all positions at the latest prices
+        self.positions: Dict[str, int] = {}
+        self.last_prices: Dict[str, float] = {}
+        self.trades: List[Trade] = []
+        self._timestamp = 0.0
+
+    @classmethod
+    def from_params(cls, short_window: int = 20, long_window: int = 50, bearish_threshold: int = 40,
+                    bullish_threshold: int = 60, quantity: int = 100, **kwargs) -> 'BacktestEngine':
+        """Engine around a StrategyCombiner of the two trading_lib strategies"""
+        combiner = StrategyCombiner(MovingAverageStrategy(short_window, long_window, quantity),
+                                    NewsBasedStrategy(bearish_threshold, bullish_threshold))
+        return cls(combiner, **kwargs)
+
+    def _on_trade_signal(self, symbol: str, quantity: int, price: float, action: Action):
+        price = self.last_prices.get(symbol, price)
+        signed = quantity if action is Action.BUY else -quantity
+        commission = self.commission * quantity
+        self.cash -= signed * price + commission
+        self.holdings += signed * price
+        self.positions[symbol] = self.positions.get(symbol, 0) + signed
+        self.trades.append(Trade(self._timestamp, symbol, action, quantity, price, commission))
+
+    def run(self, events: Iterable[Event]) -> BacktestResult:
+        """Process ``events`` (e.g. from ``merge_feeds``) in order"""
+        combiner = self.combiner
+        got_new_price, got_new_news = combiner.got_new_price, combiner.got_new_news
+        positions, last_prices = self.positions, self.last_prices
+        every_tick = self.recording_interval is RecordingInterval.TICK
+        interval = self.recording_interval
+        boundary = -math.inf
+        times: List[float] = []
+        values: List[float] = []
+        ticks = news = 0
+        start = time.perf_counter()
+
+        for timestamp, kind, symbol, value in events:
+            if not every_tick and timestamp >= boundary:
+                if ticks or news:
+                    times.append(self._timestamp)
+                    values.append(self.cash + self.holdings)
+                boundary = next_boundary(timestamp, interval)
+            self._timestamp = timestamp
+
+            if kind == MARKET_DATA:
+                ticks += 1
+                previous = last_prices.get(symbol)
+                last_prices[symbol] = value
+                if previous is not None:
+                    position = positions.get(symbol)
+                    if position:
+                        self.holdings += position * (value - previous)
+                got_new_price(MarketDataPoint(timestamp, symbol, value))
+            else:
+                news += 1
+                got_new_news(symbol, int(value))
+
+            if every_tick:
+                times.append(timestamp)
+                values.append(self.cash + self.holdings)
+
+        if (ticks or news) and not every_tick:
+            times.append(self._timestamp)
+            values.append(self.cash + self.holdings)
+        return BacktestResult(np.array(times), np.array(values), self.trades, dict(positions), self.cash,
+                              self.initial_cash, ticks, news, time.perf_counter() - start, dict(last_prices))
+
+    def run_files(self, market_data_path: str, news_path: Optional[str] = None) -> BacktestResult:
+        """Stream a market data CSV and an optional news CSV, merged by timestamp"""
+        return self.run(merge_feeds(read_market_data(market_data_path), read_news(news_path) if news_path else ()))
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Offline backtest of the Strategy process's strategies
+
+Streams a market data CSV (timestamp,symbol,price) and an optional news CSV
+(timestamp,symbol,sentiment), merged by timestamp, through a StrategyCombiner
+in-process, with the strategy parameters from the config's Strategy section.
+An optional "backtest" section sets initial_cash, recording_interval and
+commission.
+
+Usage:
+    python -m trading_lib.backtest.run market_data.csv [news.csv] [config_file]
+"""
+
+import sys
+
+from config import Config
+from trading_lib.backtest.engine import BacktestEngine
+
+
+def run_backtest(config: dict, market_data_path: str, news_path=None):
+    engine = BacktestEngine.from_params(config["short_window"], config["long_window"], config["bearish_threshold"],
+                                        config["bullish_threshold"], **config.get("backtest", {}))
+    return engine.run_files(market_data_path, news_path)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    news_path = sys.argv[2] if len(sys.argv) > 2 else None
+    config_path = sys.argv[3] if len(sys.argv) > 3 else 'config.json'
+    result = run_backtest(Config(config_path).strategy, sys.argv[1], news_path)
+    print(result.summary())
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Parallel parameter sweep over the backtest engine
+
+Loads the market data and news once into a shared memory segment, then
+backtests every parameter set across a process pool; workers attach to the
+segment instead of receiving a copy of the data. Results are ranked by
+total return (or any SweepResult metric).
+
+The parameter space comes from an optional "sweep" key in the config's
+Strategy section, e.g. {"short_window": [5, 10, 20], "long_window": [20, 50],
+"samples": 20, "processes": 4}; unlisted parameters keep their Strategy
+values, and without "samples" the full grid is run.
+
+Usage:
+    python -m trading_lib.backtest.sweep market_data.csv [news.csv] [config_file]
+"""
+
+from dataclasses import dataclass
+import itertools
+from multiprocessing import Pool, shared_memory
+import os
+import random
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from trading_lib.backtest.data import Event, merge_feeds, read_market_data, read_news
+from trading_lib.backtest.engine import BacktestEngine
+
+SWEEP_PARAMETERS = ("short_window", "long_window", "bearish_threshold", "bullish_threshold")
+_CHUNK = 65536  # Events converted to Python objects at a time when replaying
+
+
+class SharedEvents:
+    """A merged event stream stored column-wise in one shared memory segment.
+
+    Columns (timestamps, values, symbol ids, kinds) are contiguous NumPy
+    arrays over the segment, so attaching is zero-copy; iterating converts
+    one chunk at a time back into ``(timestamp, kind, symbol, value)``
+    events for ``BacktestEngine.run``.
+    """
+
+    def __init__(self, name: str, count: int, symbols: Sequence[str], create: bool = False):
+        self.name = name
+        self.count = count
+        self.symbols = list(symbols)
+        self._create = create
+        size = max(1, count * (8 + 8 + 4 + 1))
+        if create:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name, create=False)
+        buf = self.shm.buf
+        self.timestamps = np.ndarray((count,), dtype=np.float64, buffer=buf, offset=0)
+        self.values = np.ndarray((count,), dtype=np.float64, buffer=buf, offset=8 * count)
+        self.symbol_ids = np.ndarray((count,), dtype=np.int32, buffer=buf, offset=16 * count)
+        self.kinds = np.ndarray((count,), dtype=np.int8, buffer=buf, offset=20 * count)
+
+    @classmethod
+    def from_events(cls, events: Iterable[Event], name: Optional[str] = None) -> 'SharedEvents':
+        """Copy ``events`` (e.g. from ``merge_feeds``) into a new segment"""
+        symbol_ids: Dict[str, int] = {}
+        timestamps, kinds, ids, values = [], [], [], []
+        for timestamp, kind, symbol, value in events:
+            symbol_id = symbol_ids.get(symbol)
+            if symbol_id is None:
+                symbol_id = symbol_ids[symbol] = len(symbol_ids)
+            timestamps.append(timestamp)
+            kinds.append(kind)
+            ids.append(symbol_id)
+            values.append(value)
+        shared = cls(name or f"sweep_events_{os.getpid()}", len(timestamps), list(symbol_ids), create=True)
+        shared.timestamps[:] = timestamps
+        shared.values[:] = values
+        shared.symbol_ids[:] = ids
+        shared.kinds[:] = kinds
+        return shared
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Event]:
+        symbols = self.symbols
+        for start in range(0, self.count, _CHUNK):
+            end = min(start + _CHUNK, self.count)
+            yield from zip(self.timestamps[start:end].tolist(), self.kinds[start:end].tolist(),
+                           [symbols[i] for i in self.symbol_ids[start:end].tolist()],
+                           self.values[start:end].tolist())
+
+    def close(self):
+        if hasattr(self, 'shm'):
+            del self.timestamps, self.values, self.symbol_ids, self.kinds
+            self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if self._create:
+            self.unlink()
+        return False
+
+
+def valid_parameters(params: dict) -> bool:
+    """The short window must be shorter than the long one, and bearish at most bullish"""
+    if params.get("short_window", 0) >= params.get("long_window", float("inf")):
+        return False
+    return params.get("bearish_threshold", 0) <= params.get("bullish_threshold", 100)
+
+
+def parameter_grid(space: Dict[str, Sequence]) -> List[dict]:
+    """Every valid combination of the values in ``space``"""
+    names = list(space)
+    grid = (dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names)))
+    return [params for params in grid if valid_parameters(params)]
+
+
+def sample_parameters(space: Dict[str, Sequence], samples: int, seed: Optional[int] = None) -> List[dict]:
+    """``samples`` distinct valid combinations drawn at random from ``space`` (the whole grid if smaller)"""
+    grid = parameter_grid(space)
+    if samples >= len(grid):
+        return grid
+    return random.Random(seed).sample(grid, samples)
+
+
+@dataclass
+class SweepResult:
+    """Metrics of one parameter set's backtest"""
+    params: dict
+    total_return: float
+    max_drawdown: float
+    trades: int
+    final_equity: float
+    elapsed: float
+
+
+# Worker state: the shared events, attached once per process by the pool initializer
+_events: Optional[SharedEvents] = None
+
+
+def _attach(name: str, count: int, symbols: List[str]):
+    global _events
+    _events = SharedEvents(name, count, symbols)
+
+
+def _evaluate(task) -> SweepResult:
+    params, engine_kwargs = task
+    result = BacktestEngine.from_params(**params, **engine_kwargs).run(_events)
+    return SweepResult(params, result.total_return, result.max_drawdown, len(result.trades),
+                       result.final_equity, result.elapsed)
+
+
+def run_sweep(events: SharedEvents, parameter_sets: Sequence[dict], processes: Optional[int] = None,
+              rank_by: str = "total_return", descending: bool = True, **engine_kwargs) -> List[SweepResult]:
+    """Backtest each parameter set over ``events`` and rank the results.
+
+    ``processes`` defaults to the CPU count; with 1 the sweep runs in this
+    process. ``engine_kwargs`` go to BacktestEngine (e.g. initial_cash).
+    """
+    tasks = [(dict(params), engine_kwargs) for params in parameter_sets]
+    initargs = (events.name, events.count, events.symbols)
+    if processes == 1:
+        _attach(*initargs)
+        try:
+            results = [_evaluate(task) for task in tasks]
+        finally:
+            _events.close()
+    else:
+        with Pool(processes, initializer=_attach, initargs=initargs) as pool:
+            results = pool.map(_evaluate, tasks, chunksize=1)
+    return rank(results, rank_by, descending)
+
+
+def rank(results: Iterable[SweepResult], by: str = "total_return", descending: bool = True) -> List[SweepResult]:
+    return sorted(results, key=lambda result: getattr(result, by), reverse=descending)
+
+
+def format_table(results: Sequence[SweepResult], top: Optional[int] = None) -> str:
+    """Ranked results as a fixed-width text table"""
+    names = list(dict.fromkeys(name for result in results for name in result.params))
+    lines = ["  ".join([f"{'rank':>4}"] + [f"{name:>17}" for name in names]
+                       + [f"{'return':>9}", f"{'max dd':>8}", f"{'trades':>7}", f"{'seconds':>8}"])]
+    for i, result in enumerate(results[:top], 1):
+        lines.append("  ".join([f"{i:>4}"] + [f"{result.params.get(name, ''):>17}" for name in names]
+                               + [f"{result.total_return:>+9.2%}", f"{result.max_drawdown:>8.2%}",
+                                  f"{result.trades:>7}", f"{result.elapsed:>8.2f}"]))
+    return "\n".join(lines)
+
+
+def sweep_files(market_data_path: str, news_path: Optional[str], parameter_sets: Sequence[dict],
+                **kwargs) -> List[SweepResult]:
+    """Load the files once into shared memory and run ``run_sweep`` over them"""
+    events = merge_feeds(read_market_data(market_data_path), read_news(news_path) if news_path else ())
+    with SharedEvents.from_events(events) as shared:
+        return run_sweep(shared, parameter_sets, **kwargs)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    from config import Config
+
+    news_path = sys.argv[2] if len(sys.argv) > 2 else None
+    config = Config(sys.argv[3] if len(sys.argv) > 3 else 'config.json').strategy
+    sweep = dict(config.get("sweep", {}))
+    samples, processes = sweep.pop("samples", None), sweep.pop("processes", None)
+    space = {name: sweep.get(name, [config[name]]) for name in SWEEP_PARAMETERS}
+    parameter_sets = parameter_grid(space) if samples is None else sample_parameters(space, samples)
+    start = time.perf_counter()
+    results = sweep_files(sys.argv[1], news_path, parameter_sets, processes=processes,
+                          **config.get("backtest", {}))
+    print(format_table(results, top=20))
+    print(f"{len(results)} parameter sets in {time.perf_counter() - start:.1f}s")
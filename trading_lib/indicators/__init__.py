@@ -0,0 +1,8 @@
+# Streaming O(1)-per-update indicators with per-symbol state; see base.Indicator
+from trading_lib.indicators.average import EMA, SMA, VWAP
+from trading_lib.indicators.base import Indicator
+from trading_lib.indicators.graph import IndicatorGraph
+from trading_lib.indicators.rolling import BollingerBands, RollingStats, ZScore
+from trading_lib.indicators.wilder import ATR, RSI
+
+__all__ = ['Indicator', 'SMA', 'EMA', 'VWAP', 'RollingStats', 'ZScore', 'BollingerBands', 'RSI', 'ATR', 'IndicatorGraph']
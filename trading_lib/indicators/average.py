@@ -0,0 +1,194 @@
+import math
+from typing import Optional
+
+import numpy as np
+
+from trading_lib.indicators.base import Indicator
+from trading_lib.strategy.rolling import window_sums
+
+
+class SMA(Indicator):
+    """Simple moving average of the last ``window`` values; NaN until the window is full.
+
+    A running sum over a preallocated circular buffer, updated and
+    periodically recomputed with the same float operations as
+    ``RollingSums``, so it matches MovingAverageStrategy's averages exactly.
+    """
+
+    _state = ('sum', '_since_recompute')
+
+    def __init__(self, num_symbols: int, window: int, recompute_interval: int = 1024):
+        super().__init__(num_symbols)
+        if window <= 0:
+            raise ValueError("Window length must be positive")
+        self.window = window
+        self.recompute_interval = recompute_interval
+        self.buffer = np.zeros((num_symbols, window), dtype=np.float64)
+        self.sum = np.zeros(num_symbols, dtype=np.float64)
+        self._since_recompute = np.zeros(num_symbols, dtype=np.int64)
+
+    def full(self, symbol_id: int) -> bool:
+        return self.count.item(symbol_id) >= self.window
+
+    def value(self, symbol_id: int) -> float:
+        """Current average without updating it"""
+        return self.sum.item(symbol_id) / self.window if self.full(symbol_id) else math.nan
+
+    def update(self, symbol_id: int, price: float) -> float:
+        count, window = self.count.item(symbol_id), self.window
+        slot = count % window
+        total = self.sum.item(symbol_id)
+        if count >= window:
+            total -= self.buffer.item(symbol_id, slot)
+        self.buffer[symbol_id, slot] = price
+        total += price
+        self.sum[symbol_id] = total
+        self.count[symbol_id] = count + 1
+        since = self._since_recompute.item(symbol_id) + 1
+        self._since_recompute[symbol_id] = since
+        if since >= self.recompute_interval:
+            self._recompute(symbol_id)
+        return self.value(symbol_id)
+
+    def _update_many(self, symbol_ids: np.ndarray, prices: np.ndarray) -> np.ndarray:
+        count, window = self.count[symbol_ids], self.window
+        slot = count % window
+        total = self.sum[symbol_ids]
+        total = np.where(count >= window, total - self.buffer[symbol_ids, slot], total)
+        self.buffer[symbol_ids, slot] = prices
+        self.sum[symbol_ids] = total + prices
+        self.count[symbol_ids] = count + 1
+        since = self._since_recompute[symbol_ids] + 1
+        self._since_recompute[symbol_ids] = since
+        for symbol_id in symbol_ids[since >= self.recompute_interval]:
+            self._recompute(symbol_id)
+        return np.where(count + 1 >= window, self.sum[symbol_ids] / window, np.nan)
+
+    def _recompute(self, symbol_id: int):
+        count, window = int(self.count[symbol_id]), self.window
+        self.sum[symbol_id] = window_sums(self.buffer[symbol_id], count % window, min(count, window), window)[1]
+        self._since_recompute[symbol_id] = 0
+
+    def reset(self, symbol_id: int):
+        super().reset(symbol_id)
+        self.buffer[symbol_id] = 0
+
+
+class EMA(Indicator):
+    """Exponential moving average, seeded with the first value.
+
+    Give ``span`` (``alpha = 2 / (span + 1)``) or ``alpha`` directly.
+    """
+
+    _state = ('value',)
+
+    def __init__(self, num_symbols: int, span: Optional[float] = None, alpha: Optional[float] = None):
+        super().__init__(num_symbols)
+        if (span is None) == (alpha is None):
+            raise ValueError("Give exactly one of span or alpha")
+        self.alpha = alpha if alpha is not None else 2.0 / (span + 1.0)
+        if not 0.0 < self.alpha <= 1.0:
+            raise ValueError(f"EMA alpha must be in (0, 1], got {self.alpha}")
+        self.value = np.zeros(num_symbols, dtype=np.float64)
+
+    def update(self, symbol_id: int, price: float) -> float:
+        if self.count.item(symbol_id):
+            value = self.value.item(symbol_id)
+            value += self.alpha * (price - value)
+        else:
+            value = float(price)
+        self.value[symbol_id] = value
+        self.count[symbol_id] += 1
+        return value
+
+    def _update_many(self, symbol_ids: np.ndarray, prices: np.ndarray) -> np.ndarray:
+        previous = self.value[symbol_ids]
+        values = np.where(self.count[symbol_ids] > 0, previous + self.alpha * (prices - previous), prices)
+        self.value[symbol_ids] = values
+        self.count[symbol_ids] += 1
+        return values
+
+
+class VWAP(Indicator):
+    """Volume-weighted average price: cumulative since the last ``reset``, or over the
+    last ``window`` ticks (fewer until the window fills).
+
+    The windowed sums are kept in preallocated circular buffers and
+    recomputed from them every ``recompute_interval`` updates to bound float
+    drift. NaN while there is no volume.
+    """
+
+    inputs = 2
+    _state = ('pv_sum', 'volume_sum', '_since_recompute')
+
+    def __init__(self, num_symbols: int, window: Optional[int] = None, recompute_interval: int = 1024):
+        super().__init__(num_symbols)
+        if window is not None and window <= 0:
+            raise ValueError("Window length must be positive")
+        self.window = window
+        self.recompute_interval = recompute_interval
+        self.pv_sum = np.zeros(num_symbols, dtype=np.float64)
+        self.volume_sum = np.zeros(num_symbols, dtype=np.float64)
+        self._since_recompute = np.zeros(num_symbols, dtype=np.int64)
+        if window is not None:
+            self.pv = np.zeros((num_symbols, window), dtype=np.float64)
+            self.volumes = np.zeros((num_symbols, window), dtype=np.float64)
+
+    def update(self, symbol_id: int, price: float, volume: float) -> float:
+        pv = price * volume
+        pv_sum, volume_sum = self.pv_sum.item(symbol_id), self.volume_sum.item(symbol_id)
+        count = self.count.item(symbol_id)
+        window = self.window
+        if window is not None:
+            slot = count % window
+            if count >= window:
+                pv_sum -= self.pv.item(symbol_id, slot)
+                volume_sum -= self.volumes.item(symbol_id, slot)
+            self.pv[symbol_id, slot] = pv
+            self.volumes[symbol_id, slot] = volume
+        self.pv_sum[symbol_id] = pv_sum + pv
+        self.volume_sum[symbol_id] = volume_sum + volume
+        self.count[symbol_id] = count + 1
+        if window is not None:
+            since = self._since_recompute.item(symbol_id) + 1
+            self._since_recompute[symbol_id] = since
+            if since >= self.recompute_interval:
+                self._recompute(symbol_id)
+        volume_sum = self.volume_sum.item(symbol_id)
+        return self.pv_sum.item(symbol_id) / volume_sum if volume_sum > 0 else math.nan
+
+    def _update_many(self, symbol_ids: np.ndarray, prices: np.ndarray, volumes: np.ndarray) -> np.ndarray:
+        pv = prices * volumes
+        pv_sum, volume_sum = self.pv_sum[symbol_ids], self.volume_sum[symbol_ids]
+        count = self.count[symbol_ids]
+        window = self.window
+        if window is not None:
+            slot = count % window
+            full = count >= window
+            pv_sum = np.where(full, pv_sum - self.pv[symbol_ids, slot], pv_sum)
+            volume_sum = np.where(full, volume_sum - self.volumes[symbol_ids, slot], volume_sum)
+            self.pv[symbol_ids, slot] = pv
+            self.volumes[symbol_ids, slot] = volumes
+        self.pv_sum[symbol_ids] = pv_sum + pv
+        self.volume_sum[symbol_ids] = volume_sum + volumes
+        self.count[symbol_ids] = count + 1
+        if window is not None:
+            since = self._since_recompute[symbol_ids] + 1
+            self._since_recompute[symbol_ids] = since
+            for symbol_id in symbol_ids[since >= self.recompute_interval]:
+                self._recompute(symbol_id)
+        volume_sum = self.volume_sum[symbol_ids]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(volume_sum > 0, self.pv_sum[symbol_ids] / volume_sum, np.nan)
+
+    def _recompute(self, symbol_id: int):
+        filled = min(int(self.count[symbol_id]), self.window)
+        self.pv_sum[symbol_id] = self.pv[symbol_id, :filled].sum()
+        self.volume_sum[symbol_id] = self.volumes[symbol_id, :filled].sum()
+        self._since_recompute[symbol_id] = 0
+
+    def reset(self, symbol_id: int):
+        super().reset(symbol_id)
+        if self.window is not None:
+            self.pv[symbol_id] = 0
+            self.volumes[symbol_id] = 0
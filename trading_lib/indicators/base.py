@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+import numpy as np
+
+from trading_lib.strategy.vectorized import per_symbol_rounds
+
+
+class Indicator(ABC):
+    """Base class for streaming indicators with per-symbol state.
+
+    State lives in NumPy arrays preallocated for ``num_symbols`` symbol ids
+    (e.g. positions in the SharedPriceBook), and every update is O(1).
+    ``update`` takes one symbol's new values and returns the indicator's
+    current value, NaN until enough values have been seen. ``update_batch``
+    takes aligned arrays for a batch of ticks (symbols may repeat; each
+    symbol's ticks are applied in order) and returns one result per tick,
+    identical to calling ``update`` tick by tick.
+    """
+
+    inputs = 1           # Values taken per update, e.g. 2 for (price, volume)
+    outputs = 1          # Values returned per update (columns of update_batch's result)
+    _state: Tuple[str, ...] = ()  # Per-symbol state arrays cleared by reset, besides ``count``
+
+    def __init__(self, num_symbols: int):
+        self.num_symbols = num_symbols
+        self.count = np.zeros(num_symbols, dtype=np.int64)  # Updates seen per symbol
+
+    @abstractmethod
+    def update(self, symbol_id: int, *values: float):
+        raise NotImplementedError("Subclasses must implement update method")
+
+    @abstractmethod
+    def _update_many(self, symbol_ids: np.ndarray, *values: np.ndarray) -> np.ndarray:
+        """Vector ``update`` for distinct ``symbol_ids``"""
+        raise NotImplementedError("Subclasses must implement _update_many method")
+
+    def update_batch(self, symbol_ids, *values) -> np.ndarray:
+        symbol_ids = np.asarray(symbol_ids, dtype=np.int64)
+        columns = [np.asarray(column, dtype=np.float64) for column in values]
+        shape = (len(symbol_ids),) if self.outputs == 1 else (len(symbol_ids), self.outputs)
+        results = np.full(shape, np.nan)
+        for batch_index in per_symbol_rounds(symbol_ids):
+            results[batch_index] = self._update_many(symbol_ids[batch_index],
+                                                     *(column[batch_index] for column in columns))
+        return results
+
+    def reset(self, symbol_id: int):
+        """Forget one symbol's history (e.g. at the start of a session)"""
+        self.count[symbol_id] = 0
+        for name in self._state:
+            getattr(self, name)[symbol_id] = 0
@@ -0,0 +1,65 @@
+from typing import Dict, List, Tuple, Type
+
+from trading_lib.indicators.base import Indicator
+
+NodeKey = Tuple[str, Tuple[Tuple[str, object], ...]]
+
+
+class IndicatorGraph:
+    """Reference-counted set of price indicators shared by several consumers.
+
+    ``acquire`` returns the existing indicator for an identical request
+    (same class and parameters) or creates it, and counts the reference;
+    ``release`` drops the indicator once nothing holds it. ``update`` feeds
+    a tick to every distinct indicator once, so the cost per tick depends
+    on how many different indicators are in use, not how many consumers
+    asked for them. Only single-input indicators (prices) can be added.
+    """
+
+    def __init__(self, num_symbols: int):
+        self.num_symbols = num_symbols
+        self._nodes: Dict[NodeKey, Indicator] = {}
+        self._refcounts: Dict[NodeKey, int] = {}
+        self._keys: Dict[int, NodeKey] = {}  # id(indicator) -> key, for release
+        self._updates: List = []  # Bound update methods of the nodes, in creation order
+
+    @staticmethod
+    def key(indicator_cls: Type[Indicator], **params) -> NodeKey:
+        return indicator_cls.__qualname__, tuple(sorted(params.items()))
+
+    def acquire(self, indicator_cls: Type[Indicator], **params) -> Indicator:
+        key = self.key(indicator_cls, **params)
+        node = self._nodes.get(key)
+        if node is None:
+            if indicator_cls.inputs != 1:
+                raise ValueError(f"{indicator_cls.__name__} takes {indicator_cls.inputs} inputs per update; "
+                                 f"only price indicators can be shared")
+            node = self._nodes[key] = indicator_cls(self.num_symbols, **params)
+            self._refcounts[key] = 0
+            self._keys[id(node)] = key
+            self._updates.append(node.update)
+        self._refcounts[key] += 1
+        return node
+
+    def release(self, indicator: Indicator):
+        key = self._keys.get(id(indicator))
+        if key is None or self._nodes[key] is not indicator:
+            raise KeyError(f"{indicator!r} is not in this graph")
+        self._refcounts[key] -= 1
+        if self._refcounts[key] == 0:
+            del self._nodes[key], self._refcounts[key], self._keys[id(indicator)]
+            self._updates.remove(indicator.update)
+
+    def refcount(self, indicator_cls: Type[Indicator], **params) -> int:
+        return self._refcounts.get(self.key(indicator_cls, **params), 0)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, indicator: Indicator) -> bool:
+        key = self._keys.get(id(indicator))
+        return key is not None and self._nodes[key] is indicator
+
+    def update(self, symbol_id: int, price: float):
+        for update in self._updates:
+            update(symbol_id, price)
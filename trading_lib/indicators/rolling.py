@@ -0,0 +1,143 @@
+import math
+from typing import Tuple
+
+import numpy as np
+
+from trading_lib.indicators.base import Indicator
+
+
+class RollingStats(Indicator):
+    """Mean and variance of the last ``window`` values; ``update`` returns the variance.
+
+    Values go into a preallocated ``(num_symbols, window)`` circular buffer
+    and the mean and sum of squared deviations are updated in place
+    (Welford's method, with the value leaving the window removed), which
+    avoids the cancellation of a running sum of squares at price levels.
+    Both are recomputed from the buffer every ``recompute_interval``
+    updates to bound float drift. NaN until the window is full; ``ddof=1``
+    gives the sample variance.
+    """
+
+    _state = ('mean', 'm2', '_since_recompute')
+
+    def __init__(self, num_symbols: int, window: int, ddof: int = 0, recompute_interval: int = 1024):
+        super().__init__(num_symbols)
+        if window <= ddof:
+            raise ValueError(f"Window length must be greater than ddof ({ddof})")
+        self.window = window
+        self.ddof = ddof
+        self.recompute_interval = recompute_interval
+        self.buffer = np.zeros((num_symbols, window), dtype=np.float64)
+        self.mean = np.zeros(num_symbols, dtype=np.float64)
+        self.m2 = np.zeros(num_symbols, dtype=np.float64)  # Sum of squared deviations from the mean
+        self._since_recompute = np.zeros(num_symbols, dtype=np.int64)
+
+    def _push(self, symbol_id: int, value: float) -> Tuple[float, float]:
+        """Add ``value`` to the window; returns the new (mean, variance)"""
+        count, window = self.count.item(symbol_id), self.window
+        slot = count % window
+        mean, m2 = self.mean.item(symbol_id), self.m2.item(symbol_id)
+        if count < window:
+            delta = value - mean
+            mean += delta / (count + 1)
+            m2 += delta * (value - mean)
+        else:
+            old = self.buffer.item(symbol_id, slot)
+            new_mean = mean + (value - old) / window
+            m2 += (value - old) * (value - new_mean + old - mean)
+            mean = new_mean
+        self.buffer[symbol_id, slot] = value
+        self.mean[symbol_id] = mean
+        self.m2[symbol_id] = m2
+        self.count[symbol_id] = count + 1
+        since = self._since_recompute.item(symbol_id) + 1
+        self._since_recompute[symbol_id] = since
+        if since >= self.recompute_interval:
+            self._recompute(symbol_id)
+            mean, m2 = self.mean.item(symbol_id), self.m2.item(symbol_id)
+        if count + 1 < window:
+            return mean, math.nan
+        return mean, max(m2, 0.0) / (window - self.ddof)
+
+    def _push_many(self, symbol_ids: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        count, window = self.count[symbol_ids], self.window
+        slot = count % window
+        mean, m2 = self.mean[symbol_ids], self.m2[symbol_ids]
+        growing = count < window
+        # Growing window: add the value
+        delta = values - mean
+        grown_mean = mean + delta / (count + 1)
+        grown_m2 = m2 + delta * (values - grown_mean)
+        # Full window: replace the oldest value
+        old = self.buffer[symbol_ids, slot]
+        slid_mean = mean + (values - old) / window
+        slid_m2 = m2 + (values - old) * (values - slid_mean + old - mean)
+        self.buffer[symbol_ids, slot] = values
+        self.mean[symbol_ids] = np.where(growing, grown_mean, slid_mean)
+        self.m2[symbol_ids] = np.where(growing, grown_m2, slid_m2)
+        self.count[symbol_ids] = count + 1
+        since = self._since_recompute[symbol_ids] + 1
+        self._since_recompute[symbol_ids] = since
+        for symbol_id in symbol_ids[since >= self.recompute_interval]:
+            self._recompute(symbol_id)
+        variance = np.maximum(self.m2[symbol_ids], 0.0) / (window - self.ddof)
+        return self.mean[symbol_ids], np.where(count + 1 < window, np.nan, variance)
+
+    def _recompute(self, symbol_id: int):
+        values = self.buffer[symbol_id, :min(int(self.count[symbol_id]), self.window)]
+        mean = values.sum() / len(values)
+        self.mean[symbol_id] = mean
+        self.m2[symbol_id] = ((values - mean) ** 2).sum()
+        self._since_recompute[symbol_id] = 0
+
+    def update(self, symbol_id: int, value: float) -> float:
+        return self._push(symbol_id, value)[1]
+
+    def _update_many(self, symbol_ids: np.ndarray, values: np.ndarray) -> np.ndarray:
+        return self._push_many(symbol_ids, values)[1]
+
+    def reset(self, symbol_id: int):
+        super().reset(symbol_id)
+        self.buffer[symbol_id] = 0
+
+
+class ZScore(RollingStats):
+    """``(value - mean) / std`` of the last ``window`` values, including the new one.
+
+    NaN until the window is full, or while the window is flat.
+    """
+
+    def update(self, symbol_id: int, value: float) -> float:
+        mean, variance = self._push(symbol_id, value)
+        return (value - mean) / math.sqrt(variance) if variance > 0 else math.nan
+
+    def _update_many(self, symbol_ids: np.ndarray, values: np.ndarray) -> np.ndarray:
+        mean, variance = self._push_many(symbol_ids, values)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(variance > 0, (values - mean) / np.sqrt(variance), np.nan)
+
+
+class BollingerBands(RollingStats):
+    """``(lower, middle, upper)`` bands: the rolling mean plus and minus ``num_std``
+    standard deviations (population by default). NaN until the window is full.
+    """
+
+    outputs = 3
+
+    def __init__(self, num_symbols: int, window: int = 20, num_std: float = 2.0, ddof: int = 0,
+                 recompute_interval: int = 1024):
+        super().__init__(num_symbols, window, ddof, recompute_interval)
+        self.num_std = num_std
+
+    def update(self, symbol_id: int, value: float) -> Tuple[float, float, float]:
+        mean, variance = self._push(symbol_id, value)
+        if math.isnan(variance):
+            return math.nan, math.nan, math.nan
+        width = self.num_std * math.sqrt(variance)
+        return mean - width, mean, mean + width
+
+    def _update_many(self, symbol_ids: np.ndarray, values: np.ndarray) -> np.ndarray:
+        mean, variance = self._push_many(symbol_ids, values)
+        width = self.num_std * np.sqrt(variance)
+        middle = np.where(np.isnan(variance), np.nan, mean)
+        return np.column_stack((middle - width, middle, middle + width))
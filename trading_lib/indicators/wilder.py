@@ -0,0 +1,132 @@
+import math
+
+import numpy as np
+
+from trading_lib.indicators.base import Indicator
+
+
+def _rsi(avg_gain: float, avg_loss: float) -> float:
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else 50.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+class RSI(Indicator):
+    """Relative strength index with Wilder's smoothing.
+
+    The first average gain and loss are simple means over ``period``
+    price changes; after that each change is folded in with weight
+    ``1 / period``. NaN until ``period`` changes have been seen. A window
+    without losses reads 100, and a flat one reads 50.
+    """
+
+    _state = ('previous', 'avg_gain', 'avg_loss')
+
+    def __init__(self, num_symbols: int, period: int = 14):
+        super().__init__(num_symbols)
+        if period <= 0:
+            raise ValueError("RSI period must be positive")
+        self.period = period
+        self.previous = np.zeros(num_symbols, dtype=np.float64)
+        self.avg_gain = np.zeros(num_symbols, dtype=np.float64)
+        self.avg_loss = np.zeros(num_symbols, dtype=np.float64)
+
+    def update(self, symbol_id: int, price: float) -> float:
+        count, period = self.count.item(symbol_id), self.period
+        self.count[symbol_id] = count + 1
+        change = price - self.previous.item(symbol_id)
+        self.previous[symbol_id] = price
+        if count == 0:
+            return math.nan
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        avg_gain, avg_loss = self.avg_gain.item(symbol_id), self.avg_loss.item(symbol_id)
+        if count <= period:
+            # Seeding: sum the first ``period`` changes, then average them
+            avg_gain += gain
+            avg_loss += loss
+            if count == period:
+                avg_gain /= period
+                avg_loss /= period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        self.avg_gain[symbol_id] = avg_gain
+        self.avg_loss[symbol_id] = avg_loss
+        return _rsi(avg_gain, avg_loss) if count >= period else math.nan
+
+    def _update_many(self, symbol_ids: np.ndarray, prices: np.ndarray) -> np.ndarray:
+        count, period = self.count[symbol_ids], self.period
+        self.count[symbol_ids] = count + 1
+        change = prices - self.previous[symbol_ids]
+        self.previous[symbol_ids] = prices
+        gain = np.where(change > 0, change, 0.0)
+        loss = np.where(change < 0, -change, 0.0)
+        avg_gain, avg_loss = self.avg_gain[symbol_ids], self.avg_loss[symbol_ids]
+        seeded_gain = np.where(count == period, (avg_gain + gain) / period, avg_gain + gain)
+        seeded_loss = np.where(count == period, (avg_loss + loss) / period, avg_loss + loss)
+        smoothed_gain = (avg_gain * (period - 1) + gain) / period
+        smoothed_loss = (avg_loss * (period - 1) + loss) / period
+        first, seeding = count == 0, count <= period
+        avg_gain = np.where(first, avg_gain, np.where(seeding, seeded_gain, smoothed_gain))
+        avg_loss = np.where(first, avg_loss, np.where(seeding, seeded_loss, smoothed_loss))
+        self.avg_gain[symbol_ids] = avg_gain
+        self.avg_loss[symbol_ids] = avg_loss
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        rsi = np.where(avg_loss == 0, np.where(avg_gain > 0, 100.0, 50.0), rsi)
+        return np.where(count >= period, rsi, np.nan)
+
+
+class ATR(Indicator):
+    """Average true range with Wilder's smoothing, over (high, low, close) bars.
+
+    The true range is the largest of high - low and the distances from the
+    previous close to the high and the low (high - low on the first bar).
+    The first ATR is the mean of ``period`` true ranges; NaN before that.
+    For ticks, pass the price as high, low and close.
+    """
+
+    inputs = 3
+    _state = ('previous_close', 'atr')
+
+    def __init__(self, num_symbols: int, period: int = 14):
+        super().__init__(num_symbols)
+        if period <= 0:
+            raise ValueError("ATR period must be positive")
+        self.period = period
+        self.previous_close = np.zeros(num_symbols, dtype=np.float64)
+        self.atr = np.zeros(num_symbols, dtype=np.float64)
+
+    def update(self, symbol_id: int, high: float, low: float, close: float) -> float:
+        count, period = self.count.item(symbol_id), self.period
+        self.count[symbol_id] = count + 1
+        true_range = high - low
+        if count:
+            previous_close = self.previous_close.item(symbol_id)
+            true_range = max(true_range, abs(high - previous_close), abs(low - previous_close))
+        self.previous_close[symbol_id] = close
+        atr = self.atr.item(symbol_id)
+        if count < period:
+            atr += true_range
+            if count == period - 1:
+                atr /= period
+        else:
+            atr = (atr * (period - 1) + true_range) / period
+        self.atr[symbol_id] = atr
+        return atr if count >= period - 1 else math.nan
+
+    def _update_many(self, symbol_ids: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+                     closes: np.ndarray) -> np.ndarray:
+        count, period = self.count[symbol_ids], self.period
+        self.count[symbol_ids] = count + 1
+        previous_close = self.previous_close[symbol_ids]
+        true_range = highs - lows
+        true_range = np.where(count > 0, np.maximum(np.maximum(true_range, np.abs(highs - previous_close)),
+                                                    np.abs(lows - previous_close)), true_range)
+        self.previous_close[symbol_ids] = closes
+        atr = self.atr[symbol_ids]
+        seeded = np.where(count == period - 1, (atr + true_range) / period, atr + true_range)
+        atr = np.where(count < period, seeded, (atr * (period - 1) + true_range) / period)
+        self.atr[symbol_ids] = atr
+        return np.where(count >= period - 1, atr, np.nan)
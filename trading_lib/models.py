@@ -10,6 +10,9 @@ class MarketDataPoint:
     timestamp: datetime
     symbol: str
     price: float
+    # Latency tracing (monotonic ns): Gateway origin and when the strategy read the tick, 0 if untraced
+    origin_ns: int = 0
+    received_ns: int = 0
 
 class OrderStatus(str, Enum):
     """Enum representing the status of an order.
@@ -1,4 +1,9 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
 from trading_lib.models import Action
+from trading_lib.strategy.vectorized import SignalMask, VectorizedStrategy
 
 
 class NewsBasedStrategy:
@@ -18,3 +23,17 @@ class NewsBasedStrategy:
         else:
             return ticker, Action.HOLD
 
+
+class VectorizedNewsBasedStrategy(VectorizedStrategy):
+    """NewsBasedStrategy over a batch of news sentiments; ticks in neither mask are HOLD"""
+
+    def __init__(self, symbols: Sequence[str], bearish_threshold: int = 40, bullish_threshold: int = 60,
+                 quantity: int = 100):
+        super().__init__(symbols, quantity)
+        self.bearish_threshold = bearish_threshold
+        self.bullish_threshold = bullish_threshold
+
+    def generate_signals(self, symbol_ids: np.ndarray, values: np.ndarray,
+                         timestamps: Optional[np.ndarray] = None) -> SignalMask:
+        sentiments = np.asarray(values)
+        return SignalMask(sentiments > self.bullish_threshold, sentiments < self.bearish_threshold)
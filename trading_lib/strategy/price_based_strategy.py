@@ -1,8 +1,17 @@
 import typing
 
+import numpy as np
+
+from trading_lib.indicators.average import SMA
+from trading_lib.indicators.graph import IndicatorGraph
 from trading_lib.strategy.base import Strategy
+from trading_lib.strategy.rolling import RollingSums, window_sums
+from trading_lib.strategy.vectorized import SignalMask, VectorizedStrategy, per_symbol_rounds
 from trading_lib.models import MarketDataPoint, Action
 
+# Relative difference below which the two averages count as equal
+MA_TOLERANCE = 1e-9
+
 
 class MovingAverageStrategy(Strategy):
     """
@@ -10,34 +19,39 @@ class MovingAverageStrategy(Strategy):
     Sells if 20-day MA < 50-day MA
     """
 
-    def __init__(self, short_window: int = 20, long_window: int = 50, quantity: int = 100):
+    def __init__(self, short_window: int = 20, long_window: int = 50, quantity: int = 100,
+                 recompute_interval: int = 1024):
         super().__init__(quantity)
         self.short_window = short_window
         self.long_window = long_window
-        self._prices: typing.Dict[str, typing.List[float]] = {}
+        self.recompute_interval = recompute_interval
+        # Running sums over the last long_window prices per symbol, O(1) per tick
+        self._windows: typing.Dict[str, RollingSums] = {}
         # track previous MA relationship to catch true crossovers
         self._prev_short_gt_long: typing.Dict[str, bool] = {}
 
     def generate_signals(self, tick: MarketDataPoint) -> list[tuple[str, float, int, Action]]:
         sym, price = tick.symbol, tick.price
 
-        if sym not in self._prices:
-            self._prices[sym] = [price]
+        window = self._windows.get(sym)
+        if window is None:
+            window = self._windows[sym] = RollingSums(self.short_window, self.long_window, self.recompute_interval)
+            window.push(price)
             self._prev_short_gt_long[sym] = False
             return []
 
-        prev_prices = self._prices[sym]
-
         # Wait for enough prices to calculate moving averages
-        if len(prev_prices) < self.long_window:
-            self._prices[sym].append(price)
+        if not window.full:
+            window.push(price)
             return []
 
-        short_ma = sum(prev_prices[-self.short_window:]) / self.short_window
-        long_ma = sum(prev_prices[-self.long_window:]) / self.long_window
+        # Averages of the prices before this tick
+        short_ma = window.short_sum / self.short_window
+        long_ma = window.long_sum / self.long_window
 
         prev_state = self._prev_short_gt_long[sym]
-        curr_state = short_ma > long_ma
+        # Equal averages (within the running sums' rounding) are not a crossover
+        curr_state = short_ma - long_ma > MA_TOLERANCE * abs(long_ma)
 
         signals = []
         # trigger only on transition from False -> True (crossover up)
@@ -48,7 +62,130 @@ class MovingAverageStrategy(Strategy):
 
         self._prev_short_gt_long[sym] = curr_state
 
-        prev_prices.append(price)
-        self._prices[sym] = prev_prices[-self.long_window:]  # long_window is enough
+        window.push(price)
+
+        return signals
+
+
+class SharedMovingAverageStrategy(Strategy):
+    """MovingAverageStrategy reading its averages from SMA nodes of an IndicatorGraph.
+
+    Strategies with the same window lengths share the nodes, so the
+    averages are updated once per tick however many strategies use them.
+    The owner of the graph (see StrategyHost) must call
+    ``graph.update(symbol_id, price)`` after every strategy has seen the
+    tick, so the averages are of the prices before it, as in
+    MovingAverageStrategy; the signals then match it exactly. Ticks for
+    symbols outside ``symbols`` are ignored. Call ``close`` to release the
+    nodes.
+    """
+
+    def __init__(self, graph: IndicatorGraph, symbols: typing.Sequence[str], short_window: int = 20,
+                 long_window: int = 50, quantity: int = 100, recompute_interval: int = 1024):
+        super().__init__(quantity)
+        self.graph = graph
+        self.short_window = short_window
+        self.long_window = long_window
+        self._symbol_ids = {symbol: i for i, symbol in enumerate(symbols)}
+        # Like RollingSums, the short average never covers more than long_window prices
+        self._short = graph.acquire(SMA, window=min(short_window, long_window), recompute_interval=recompute_interval)
+        self._long = graph.acquire(SMA, window=long_window, recompute_interval=recompute_interval)
+        self._prev_short_gt_long = np.zeros(len(symbols), dtype=bool)
+
+    def generate_signals(self, tick: MarketDataPoint) -> list[tuple[str, float, int, Action]]:
+        sym_id = self._symbol_ids.get(tick.symbol)
+        if sym_id is None or not self._long.full(sym_id):
+            return []
+
+        short_ma = self._short.sum.item(sym_id) / self.short_window
+        long_ma = self._long.sum.item(sym_id) / self.long_window
+        prev_state = bool(self._prev_short_gt_long[sym_id])
+        curr_state = short_ma - long_ma > MA_TOLERANCE * abs(long_ma)
+        self._prev_short_gt_long[sym_id] = curr_state
+
+        if curr_state and not prev_state:
+            return [(tick.symbol, self.quantity, tick.price, Action.BUY)]
+        if prev_state and not curr_state:
+            return [(tick.symbol, self.quantity, tick.price, Action.SELL)]
+        return []
+
+    def close(self):
+        if self._short is not None:
+            self.graph.release(self._short)
+            self.graph.release(self._long)
+            self._short = self._long = None
+
+
+class VectorizedMovingAverageStrategy(VectorizedStrategy):
+    """MovingAverageStrategy over a batch of ticks, with the same signals.
+
+    Each symbol's last ``long_window`` prices live in one row of a 2-D
+    circular buffer, with running sums, fill counts and crossover states in
+    1-D arrays indexed by symbol id. Ticks are applied in rounds of distinct
+    symbols (see ``per_symbol_rounds``) using the same float operations as
+    ``RollingSums``, so the averages and signals match the scalar strategy
+    exactly.
+    """
+
+    def __init__(self, symbols: typing.Sequence[str], short_window: int = 20, long_window: int = 50,
+                 quantity: int = 100, recompute_interval: int = 1024):
+        super().__init__(symbols, quantity)
+        self.short_window = short_window
+        self.long_window = long_window
+        self.recompute_interval = recompute_interval
+        self._window_short = min(short_window, long_window)
+        n = self.num_symbols
+        self.buffer = np.zeros((n, long_window), dtype=np.float64)
+        self.count = np.zeros(n, dtype=np.int64)
+        self.position = np.zeros(n, dtype=np.int64)
+        self.short_sum = np.zeros(n, dtype=np.float64)
+        self.long_sum = np.zeros(n, dtype=np.float64)
+        self.short_gt_long = np.zeros(n, dtype=bool)
+        self._since_recompute = np.zeros(n, dtype=np.int64)
+
+    def generate_signals(self, symbol_ids: np.ndarray, values: np.ndarray,
+                         timestamps: typing.Optional[np.ndarray] = None) -> SignalMask:
+        symbol_ids = np.asarray(symbol_ids, dtype=np.int64)
+        prices = np.asarray(values, dtype=np.float64)
+        buy = np.zeros(len(symbol_ids), dtype=bool)
+        sell = np.zeros(len(symbol_ids), dtype=bool)
+        for batch_index in per_symbol_rounds(symbol_ids):
+            self._apply_round(symbol_ids[batch_index], prices[batch_index], batch_index, buy, sell)
+        return SignalMask(buy, sell)
+
+    def _apply_round(self, ids: np.ndarray, prices: np.ndarray, batch_index: np.ndarray,
+                     buy: np.ndarray, sell: np.ndarray):
+        long_window, short_window = self.long_window, self._window_short
+        count = self.count[ids]
+        full = count == long_window
+
+        # Averages of the prices before this tick, for symbols with a full window
+        ready = ids[full]
+        short_ma = self.short_sum[ready] / self.short_window
+        long_ma = self.long_sum[ready] / long_window
+        curr_state = short_ma - long_ma > MA_TOLERANCE * np.abs(long_ma)
+        prev_state = self.short_gt_long[ready]
+        buy[batch_index[full]] = curr_state & ~prev_state
+        sell[batch_index[full]] = prev_state & ~curr_state
+        self.short_gt_long[ready] = curr_state
+
+        # Push this tick's price
+        position = self.position[ids]
+        leaving = count >= short_window
+        self.short_sum[ids[leaving]] -= self.buffer[ids[leaving], (position[leaving] - short_window) % long_window]
+        self.long_sum[ready] -= self.buffer[ready, position[full]]
+        self.count[ids] = np.minimum(count + 1, long_window)
+        self.buffer[ids, position] = prices
+        self.short_sum[ids] += prices
+        self.long_sum[ids] += prices
+        self.position[ids] = (position + 1) % long_window
+
+        since = self._since_recompute[ids] + 1
+        self._since_recompute[ids] = since
+        for symbol_id in ids[since >= self.recompute_interval]:
+            self._recompute(symbol_id)
 
-        return signals
\ No newline at end of file
+    def _recompute(self, symbol_id: int):
+        self._since_recompute[symbol_id] = 0
+        self.short_sum[symbol_id], self.long_sum[symbol_id] = window_sums(
+            self.buffer[symbol_id], int(self.position[symbol_id]), int(self.count[symbol_id]), self._window_short)
@@ -0,0 +1,65 @@
+from typing import Tuple
+
+import numpy as np
+
+
+class RollingSums:
+    """Running sums of the last ``short_window`` and ``long_window`` values.
+
+    Values go into a preallocated NumPy circular buffer of ``long_window``
+    slots. Each ``push`` adds the new value to both sums and subtracts the
+    values leaving each window, so the cost per value does not depend on
+    the window lengths. Every ``recompute_interval`` pushes both sums are
+    recomputed from the buffer to bound floating point drift.
+    """
+
+    __slots__ = ('short_window', 'long_window', 'buffer', 'count', 'position',
+                 'short_sum', 'long_sum', 'recompute_interval', '_since_recompute')
+
+    def __init__(self, short_window: int, long_window: int, recompute_interval: int = 1024):
+        if short_window <= 0 or long_window <= 0:
+            raise ValueError("Window lengths must be positive")
+        self.short_window = min(short_window, long_window)  # Only long_window values are ever kept
+        self.long_window = long_window
+        self.buffer = np.zeros(long_window, dtype=np.float64)
+        self.count = 0      # Values pushed, capped at long_window
+        self.position = 0   # Slot the next value is written to
+        self.short_sum = 0.0
+        self.long_sum = 0.0
+        self.recompute_interval = recompute_interval
+        self._since_recompute = 0
+
+    @property
+    def full(self) -> bool:
+        return self.count == self.long_window
+
+    def push(self, value: float):
+        buffer, position, long_window = self.buffer, self.position, self.long_window
+        count = self.count
+        if count >= self.short_window:
+            self.short_sum -= buffer.item((position - self.short_window) % long_window)
+        if count == long_window:
+            self.long_sum -= buffer.item(position)
+        else:
+            self.count = count + 1
+        buffer[position] = value
+        self.short_sum += value
+        self.long_sum += value
+        self.position = (position + 1) % long_window
+
+        self._since_recompute += 1
+        if self._since_recompute >= self.recompute_interval:
+            self.recompute()
+
+    def recompute(self):
+        """Recompute both sums exactly from the buffer"""
+        self._since_recompute = 0
+        self.short_sum, self.long_sum = window_sums(self.buffer, self.position, self.count, self.short_window)
+
+
+def window_sums(buffer: np.ndarray, position: int, count: int, short_window: int) -> Tuple[float, float]:
+    """Sums of the last ``short_window`` and all ``count`` values in a circular ``buffer``
+    whose next write slot is ``position``"""
+    # Most recent values first: the slots just before ``position``, wrapping around
+    recent = np.concatenate((buffer[:position][::-1], buffer[position:count][::-1]))
+    return float(recent[:short_window].sum()), float(recent.sum())
@@ -0,0 +1,77 @@
+from abc import ABC, abstractmethod
+from typing import Iterator, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from trading_lib.models import Action
+
+
+class SignalMask(NamedTuple):
+    """Boolean masks aligned with a batch of ticks: which ticks produced a BUY or a SELL"""
+    buy: np.ndarray
+    sell: np.ndarray
+
+    @property
+    def any(self) -> np.ndarray:
+        return self.buy | self.sell
+
+
+class VectorizedStrategy(ABC):
+    """Base class for strategies evaluated on a batch of ticks at once.
+
+    A batch is parallel arrays of symbol ids (positions in ``symbols``),
+    values (prices, sentiments) and timestamps, in arrival order. State is
+    kept in NumPy arrays indexed by symbol id rather than in dicts, so the
+    per-tick interpreter overhead is paid once per batch.
+    """
+
+    def __init__(self, symbols: Sequence[str], quantity: int = 100):
+        self.symbols = list(symbols)
+        self.symbol_index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.num_symbols = len(self.symbols)
+        self.quantity = quantity
+
+    def symbol_ids(self, symbols: Sequence[str]) -> np.ndarray:
+        index = self.symbol_index
+        return np.fromiter((index[symbol] for symbol in symbols), dtype=np.int64, count=len(symbols))
+
+    @abstractmethod
+    def generate_signals(self, symbol_ids: np.ndarray, values: np.ndarray,
+                         timestamps: Optional[np.ndarray] = None) -> SignalMask:
+        raise NotImplementedError("Subclasses must implement generate_signals method")
+
+    def signals(self, symbol_ids: np.ndarray, prices: np.ndarray, mask: SignalMask) -> List[tuple]:
+        """``mask`` as the scalar strategies' ``(symbol, quantity, price, action)`` tuples, in batch order"""
+        signals = []
+        for i in np.flatnonzero(mask.any):
+            action = Action.BUY if mask.buy[i] else Action.SELL
+            signals.append((self.symbols[symbol_ids[i]], self.quantity, prices[i].item(), action))
+        return signals
+
+
+def per_symbol_rounds(symbol_ids: np.ndarray) -> Iterator[np.ndarray]:
+    """Split a batch into rounds of batch indices with distinct symbols.
+
+    Round k holds each symbol's k-th tick in the batch, so applying the
+    rounds in order preserves every symbol's tick order while each round
+    can be applied to the state arrays as one vector operation. A batch
+    with one tick per symbol is a single round.
+    """
+    n = len(symbol_ids)
+    if n == 0:
+        return
+    order = np.argsort(symbol_ids, kind='stable')
+    sorted_ids = symbol_ids[order]
+    positions = np.arange(n)
+    first = np.empty(n, dtype=bool)
+    first[0] = True
+    np.not_equal(sorted_ids[1:], sorted_ids[:-1], out=first[1:])
+    group_start = np.maximum.accumulate(np.where(first, positions, 0))
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = positions - group_start
+    rounds = np.argsort(rank, kind='stable')  # Batch order within each round
+    bounds = np.cumsum(np.bincount(rank))
+    start = 0
+    for end in bounds:
+        yield rounds[start:end]
+        start = end
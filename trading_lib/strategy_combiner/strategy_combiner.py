@@ -2,9 +2,13 @@ from trading_lib.strategy.news_based_strategy import NewsBasedStrategy
 from trading_lib.strategy.price_based_strategy import  MovingAverageStrategy
 from trading_lib.models import Action, MarketDataPoint, Order
 from trading_lib.strategy.base import Strategy
+from OrderBook.decoder import NewsDecoder
+from OrderBook.events import NewsEvent
 from OrderBook.feed_handler import FeedHandler
+from latency import LatencyRecorder
 from logger import setup_logger
 from OrderManager.client import OrderManagerClient
+from OrderManager.shm_channel import OrderRingClient
 from trading_lib.models import Action
 from typing import Optional, Callable
 
@@ -15,18 +19,49 @@ class StrategyCombiner:
         self._latest_price_signal: dict[str, tuple[int, float, Action]] = {}
         self._latest_news_signal: dict[str, Action] = {}
         self._trade_signal_listener = None
+        self.news_decoder = NewsDecoder()
+        # (origin_ns, received_ns) of the tick behind each latest price signal
+        self._latest_price_trace: dict[str, tuple[int, int]] = {}
+        self.latency = LatencyRecorder("strategy", enabled=config is not None and config.get("tracing", False))
 
         self.logger = setup_logger("StrategyCombiner")
 
         if config is not None:
-            self.feed_handler = FeedHandler(config["host"], config["md_port"], config["news_port"])
+            self.feed_handler = FeedHandler(
+                config["host"],
+                config["md_port"],
+                config["news_port"],
+                sequenced=config.get("sequenced", False),
+                logger=self.logger,
+                decoders={"news": self.news_decoder}
+            )
             self.feed_handler.subscribe(self.news_listener, "news")
             self.feed_handler.run()  # Start listening to feeds
-            self.client = OrderManagerClient(config["host"], config["order_manager_port"])
-            # Retry connection to OrderManager (it may not be ready yet)
-            self._connect_to_order_manager()
+            # "order_client" holds OrderManagerClient options, e.g. {"buffered": true}
+            client_config = config.get("order_client", {})
+            if config.get("order_transport", "tcp") == "shm":
+                # Same-host shared-memory ring; attaching retries until the OrderManager creates it
+                self.client = OrderRingClient(config.get("order_ring", {}).get("name", "order_ring"))
+                client_config = {}
+            else:
+                self.client = OrderManagerClient(config["host"], config["order_manager_port"], **client_config)
+            self.client.set_execution_listener(self._on_execution_report)
+            if client_config.get("buffered", False):
+                # The client's writer thread reconnects (and queues orders) by itself
+                self.client.connect()
+            else:
+                # Retry connection to OrderManager (it may not be ready yet)
+                self._connect_to_order_manager()
             self.set_trade_signal_listener(self._publish_order_to_order_manager)
     
+    def _on_execution_report(self, report):
+        """Log order acknowledgements, fills and rejects streamed back by the OrderManager"""
+        if report.exec_type == "REJECT":
+            self.logger.warning("Order %s rejected: %s", report.client_order_id, report.reason)
+        else:
+            self.logger.info("Order %s (%s) %s: %s, filled %d, leaves %d", report.client_order_id, report.order_id,
+                             report.exec_type.value, report.status.value, report.filled_quantity, report.leaves_quantity)
+
     def _connect_to_order_manager(self, max_retries=10, retry_delay=0.5):
         """Retry connection to OrderManager with retry logic"""
         import time
@@ -49,13 +84,20 @@ class StrategyCombiner:
     def _publish_order_to_order_manager(self, symbol: str, quantity: int, price: float, action: Action):
         """ Default callback to send order to OrderManagerClient"""
         try:
-            self.client.place_order(symbol, action, quantity, price)
-            self.logger.info(f"Placed order via client: symbol = {symbol}, quantity = {quantity}, price = {price}, action = {action}")
+            origin_ns, received_ns = self._latest_price_trace.get(symbol, (0, 0))
+            if origin_ns and self.latency.enabled:
+                self.latency.record("strategy_signal", received_ns)
+                self.client.place_order(symbol, action, quantity, price, origin_ns=origin_ns)
+            else:
+                self.client.place_order(symbol, action, quantity, price)
+            self.logger.info("Placed order via client: symbol = %s, quantity = %s, price = %s, action = %s",
+                             symbol, quantity, price, action)
         except Exception as e:
             self.logger.error(f"Failed to place order for {symbol}: {e}")
 
     def shutdown(self):
         self.feed_handler.shutdown()
+        self.client.disconnect()  # Flushes orders still queued by a buffered client
 
     def set_trade_signal_listener(self, callback: Callable[[str, int, float, Action], None]):
         """Subscribe to order status updates.
@@ -66,30 +108,11 @@ class StrategyCombiner:
         self._trade_signal_listener = callback
 
     def deserialize_news_data(self, data: bytes) -> tuple[str, int]:
-        message = data.decode('utf-8').rstrip('*').strip()
-        parts = message.split(',')
-        if len(parts) != 2:
-            raise ValueError(f"Malformed market data (expected 2 fields, got {len(parts)}): '{message}'")
-
-        ticker = parts[0].strip()
-        try:
-            sentiment = int(parts[1].strip())
-        except ValueError as e:
-            raise ValueError(f"Invalid sentiment '{parts[1]}' in message: '{message}'")
+        return self.news_decoder.decode(data.rstrip(b'*').strip())
 
-        if not 0 <= sentiment <= 100:
-            raise ValueError(f"Expected sentiment between 0 and 100, actual value: '{parts[1]}' in message: '{message}'")
-
-        return ticker, sentiment
-
-    def news_listener(self, data: bytes):
-        try:
-            ticker, sentiment = self.deserialize_news_data(data)
-        except ValueError as e:
-            self.logger.error(e)
-            return
-
-        self.got_new_news(ticker, sentiment)
+    def news_listener(self, event: NewsEvent):
+        """FeedHandler subscriber; the news feed is decoded once by NewsDecoder"""
+        self.got_new_news(event.symbol, event.sentiment)
 
     def got_new_news(self, ticker: str, news_sentiment: int):
         symbol, action = self.news_strategy.generate_signal(ticker = ticker, news_sentiment = news_sentiment)
@@ -102,8 +125,14 @@ class StrategyCombiner:
         if len(signals) == 0:
             return
 
-        ticker, quantity, price, action = signals[0]
+        self.got_price_signal(signals[0], tick)
+
+    def got_price_signal(self, signal: tuple[str, int, float, Action], tick: MarketDataPoint):
+        """Combine a price signal for ``tick`` generated outside this combiner (e.g. shared by a StrategyHost)"""
+        ticker, quantity, price, action = signal
         self._latest_price_signal[ticker] = (quantity, price, action)
+        if tick.origin_ns:
+            self._latest_price_trace[ticker] = (tick.origin_ns, tick.received_ns)
 
         self.generate_trade_signal(ticker)
 
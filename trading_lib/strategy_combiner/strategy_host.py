@@ -0,0 +1,107 @@
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from trading_lib.indicators.graph import IndicatorGraph
+from trading_lib.models import Action, MarketDataPoint
+from trading_lib.strategy.news_based_strategy import NewsBasedStrategy
+from trading_lib.strategy.price_based_strategy import SharedMovingAverageStrategy
+from trading_lib.strategy_combiner.strategy_combiner import StrategyCombiner
+
+# Keys of a strategy entry that default to the Strategy section's own values
+STRATEGY_PARAMETERS = ("short_window", "long_window", "bearish_threshold", "bullish_threshold", "quantity")
+
+
+class _SignalGroup:
+    """Variants with the same window lengths: one crossover state, fanned out on signals"""
+
+    __slots__ = ('price_strategy', 'members')
+
+    def __init__(self, price_strategy: SharedMovingAverageStrategy):
+        self.price_strategy = price_strategy
+        self.members: List[Tuple[str, StrategyCombiner, int]] = []  # (name, combiner, quantity)
+
+
+class StrategyHost(StrategyCombiner):
+    """Runs several strategy variants in one process over shared indicators.
+
+    Each entry of ``strategies`` (the Strategy config's "strategies" list)
+    is a moving average + news variant with its own StrategyCombiner, e.g.
+    {"name": "fast", "short_window": 5, "long_window": 20}; parameters left
+    out take the Strategy section's values. The moving averages are SMA
+    nodes of one IndicatorGraph, so each distinct window is computed once,
+    and variants with the same window pair share one crossover check whose
+    signals are passed to each of them with its own quantity. A tick
+    therefore costs one update per distinct average and one check per
+    distinct window pair; variants are only visited when a crossover
+    fires. News goes to every variant.
+
+    With a config the host opens the news feed and the OrderManager client
+    once, like a StrategyCombiner, and all variants' trade signals go
+    through them.
+    """
+
+    def __init__(self, strategies: Iterable[dict], symbols: Sequence[str], config: Optional[dict] = None):
+        self.symbols = list(symbols)
+        self.symbol_ids = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.graph = IndicatorGraph(len(self.symbols))
+        self.strategies: Dict[str, StrategyCombiner] = {}
+        self._groups: Dict[Tuple[int, int], _SignalGroup] = {}
+        self._group_list: List[_SignalGroup] = []  # Values of self._groups, for the per-tick loop
+        self._combiners: List[StrategyCombiner] = []  # Values of self.strategies, for news
+        self._defaults = {name: config[name] for name in STRATEGY_PARAMETERS if config and name in config}
+        super().__init__(None, None, config)
+        for spec in strategies:
+            self.add_strategy(spec)
+
+    def add_strategy(self, spec: dict) -> StrategyCombiner:
+        params = {**self._defaults, **spec}
+        name = params.get("name") or f"strategy_{len(self.strategies)}"
+        if name in self.strategies:
+            raise ValueError(f"Duplicate strategy name {name!r}")
+        windows = (params.get("short_window", 20), params.get("long_window", 50))
+        group = self._groups.get(windows)
+        if group is None:
+            group = self._groups[windows] = _SignalGroup(SharedMovingAverageStrategy(self.graph, self.symbols, *windows))
+            self._group_list.append(group)
+        combiner = StrategyCombiner(group.price_strategy, NewsBasedStrategy(params.get("bearish_threshold", 40),
+                                                                            params.get("bullish_threshold", 60)))
+        combiner.set_trade_signal_listener(partial(self._on_trade_signal, name))
+        group.members.append((name, combiner, params.get("quantity", 100)))
+        self.strategies[name] = combiner
+        self._combiners.append(combiner)
+        self.logger.info("Hosting strategy %s: %s (%d distinct indicators)", name, params, len(self.graph))
+        return combiner
+
+    def remove_strategy(self, name: str):
+        combiner = self.strategies.pop(name)
+        self._combiners.remove(combiner)
+        price_strategy = combiner.price_strategy
+        group = self._groups[(price_strategy.short_window, price_strategy.long_window)]
+        group.members = [member for member in group.members if member[0] != name]
+        if not group.members:
+            del self._groups[(price_strategy.short_window, price_strategy.long_window)]
+            self._group_list.remove(group)
+            price_strategy.close()
+
+    def _on_trade_signal(self, name: str, symbol: str, quantity: int, price: float, action: Action):
+        self.logger.debug("Strategy %s signalled %s %d %s @ %s", name, action, quantity, symbol, price)
+        self._trade_signal_listener(symbol, quantity, price, action)
+
+    def got_new_news(self, ticker: str, news_sentiment: int):
+        for combiner in self._combiners:
+            combiner.got_new_news(ticker, news_sentiment)
+
+    def got_new_price(self, tick: MarketDataPoint):
+        symbol_id = self.symbol_ids.get(tick.symbol)
+        if symbol_id is None:
+            return
+        if tick.origin_ns:
+            self._latest_price_trace[tick.symbol] = (tick.origin_ns, tick.received_ns)
+        for group in self._group_list:
+            signals = group.price_strategy.generate_signals(tick)
+            if signals:
+                symbol, _, price, action = signals[0]
+                for _, combiner, quantity in group.members:
+                    combiner.got_price_signal((symbol, quantity, price, action), tick)
+        # After every crossover check has read the averages of the previous prices
+        self.graph.update(symbol_id, tick.price)
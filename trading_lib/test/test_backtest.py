@@ -0,0 +1,68 @@
+from datetime import datetime
+
+import pytest
+
+from trading_lib.backtest.data import MARKET_DATA, NEWS, merge_feeds, read_market_data, read_news
+from trading_lib.backtest.engine import BacktestEngine, next_boundary
+from trading_lib.models import Action, RecordingInterval
+
+
+def write_csv(path, header, rows):
+    path.write_text(header + "\n" + "".join(",".join(map(str, row)) + "\n" for row in rows))
+    return str(path)
+
+
+def test_readers_parse_gateway_timestamps_and_epochs(tmp_path):
+    market = write_csv(tmp_path / "md.csv", "timestamp,symbol,price",
+                       [("2025-01-02 09:30:00", "AAPL", 100.5), ("2025-01-02 09:30:01", "MSFT", 300)])
+    news = write_csv(tmp_path / "news.csv", "symbol,sentiment,timestamp", [("AAPL", 75, 1735810200.5)])
+    
+    expected = datetime(2025, 1, 2, 9, 30).timestamp()
+    assert list(read_market_data(market)) == [(expected, "AAPL", 100.5), (expected + 1, "MSFT", 300.0)]
+    assert list(read_news(news)) == [(1735810200.5, "AAPL", 75)]
+
+
+def test_reader_requires_columns(tmp_path):
+    path = write_csv(tmp_path / "md.csv", "time,symbol,price", [])
+    with pytest.raises(ValueError, match="timestamp"):
+        list(read_market_data(path))
+
+
+def test_merge_puts_market_data_first_on_ties():
+    merged = list(merge_feeds([(1.0, "A", 10.0), (3.0, "A", 11.0)], [(0.5, "A", 70), (3.0, "A", 20), (9.0, "B", 50)]))
+    assert [(ts, kind) for ts, kind, _, _ in merged] == [
+        (0.5, NEWS), (1.0, MARKET_DATA), (3.0, MARKET_DATA), (3.0, NEWS), (9.0, NEWS)]
+
+
+def test_backtest_fills_agreeing_signals_at_market_and_tracks_equity():
+    engine = BacktestEngine.from_params(short_window=1, long_window=2, quantity=10, initial_cash=10_000.0,
+                                        recording_interval=RecordingInterval.TICK, commission=0.01)
+    events = merge_feeds([(1.0, "AAPL", 100.0), (2.0, "AAPL", 100.0), (3.0, "AAPL", 101.0),
+                          (5.0, "AAPL", 104.0), (6.0, "AAPL", 106.0)],
+                         [(4.0, "AAPL", 80)])
+    result = engine.run(events)
+    
+    # Bullish news at t=4, then the averages of the prior prices cross up at t=5 (100 -> 101)
+    assert [(t.timestamp, t.action, t.quantity, t.price) for t in result.trades] == [(5.0, Action.BUY, 10, 104.0)]
+    assert result.positions == {"AAPL": 10}
+    assert result.cash == pytest.approx(10_000.0 - 1040.0 - 0.1)
+    assert list(result.equity_timestamps) == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert result.final_equity == pytest.approx(10_000.0 - 0.1 + 10 * 2.0)
+    assert (result.market_data_events, result.news_events) == (5, 1)
+
+
+def test_backtest_records_equity_once_per_interval():
+    engine = BacktestEngine.from_params(recording_interval=RecordingInterval.MINUTE)
+    result = engine.run(merge_feeds([(float(t), "AAPL", 100.0) for t in range(0, 150, 10)]))
+    # Last event of each minute, plus the final value
+    assert list(result.equity_timestamps) == [50.0, 110.0, 140.0]
+    assert list(result.equity) == [1_000_000.0] * 3
+    assert result.max_drawdown == 0.0
+
+
+def test_next_boundary_calendar_intervals():
+    wednesday = datetime(2025, 12, 17, 15, 45).timestamp()
+    assert next_boundary(wednesday, RecordingInterval.HOURLY) == datetime(2025, 12, 17, 16).timestamp()
+    assert next_boundary(wednesday, RecordingInterval.DAILY) == datetime(2025, 12, 18).timestamp()
+    assert next_boundary(wednesday, RecordingInterval.WEEKLY) == datetime(2025, 12, 22).timestamp()
+    assert next_boundary(wednesday, RecordingInterval.MONTHLY) == datetime(2026, 1, 1).timestamp()
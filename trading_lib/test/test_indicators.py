@@ -0,0 +1,218 @@
+import math
+import random
+import statistics
+
+import numpy as np
+import pytest
+
+from trading_lib.indicators import ATR, EMA, RSI, SMA, VWAP, BollingerBands, IndicatorGraph, RollingStats, ZScore
+from trading_lib.strategy.rolling import RollingSums
+
+NUM_SYMBOLS = 5
+
+
+def random_stream(n=3000, seed=11):
+    """(symbol_id, price, volume, high, low) ticks; prices far from zero to expose cancellation"""
+    rng = random.Random(seed)
+    prices = [10_000.0 + 100 * i for i in range(NUM_SYMBOLS)]
+    ticks = []
+    for i in range(n):
+        symbol_id = rng.randrange(NUM_SYMBOLS)
+        if i % 97:  # Some repeated prices give flat windows and zero changes
+            prices[symbol_id] = round(prices[symbol_id] + rng.gauss(0, 2), 2)
+        price = prices[symbol_id]
+        ticks.append((symbol_id, price, float(rng.randint(1, 500)), price + rng.random(), price - rng.random()))
+    return ticks
+
+
+def histories(ticks):
+    """Per tick: that symbol's full history of ticks up to and including it"""
+    seen = {symbol_id: [] for symbol_id in range(NUM_SYMBOLS)}
+    for tick in ticks:
+        seen[tick[0]].append(tick)
+        yield seen[tick[0]]
+
+
+def naive_ema(prices, alpha):
+    value = prices[0]
+    for price in prices[1:]:
+        value += alpha * (price - value)
+    return value
+
+
+def naive_wilder(values, period, seed_count):
+    """Mean of the first ``period`` values, then Wilder smoothing; NaN with too few values"""
+    if len(values) < seed_count:
+        return math.nan
+    average = sum(values[:period]) / period
+    for value in values[period:]:
+        average = (average * (period - 1) + value) / period
+    return average
+
+
+def naive_rsi(prices, period):
+    changes = [b - a for a, b in zip(prices, prices[1:])]
+    if len(changes) < period:
+        return math.nan
+    gain = naive_wilder([max(c, 0.0) for c in changes], period, period)
+    loss = naive_wilder([max(-c, 0.0) for c in changes], period, period)
+    return 50.0 if gain == loss == 0 else 100.0 if loss == 0 else 100 - 100 / (1 + gain / loss)
+
+
+def naive_atr(bars, period):
+    ranges = [bars[0][0] - bars[0][1]] + [max(h - l, abs(h - pc), abs(l - pc))
+                                          for (h, l, _), (_, _, pc) in zip(bars[1:], bars)]
+    return naive_wilder(ranges, period, period)
+
+
+def assert_close(actual, expected, rel=1e-9, abs=1e-6):
+    if math.isnan(expected):
+        assert math.isnan(actual)
+    else:
+        assert actual == pytest.approx(expected, rel=rel, abs=abs)
+
+
+def test_sma_matches_rolling_sums_exactly():
+    sma = SMA(NUM_SYMBOLS, 12, recompute_interval=50)
+    sums = [RollingSums(12, 30, recompute_interval=50) for _ in range(NUM_SYMBOLS)]
+    for history in histories(random_stream()):
+        symbol_id, price = history[-1][:2]
+        sums[symbol_id].push(price)
+        actual = sma.update(symbol_id, price)
+        if len(history) >= 12:
+            assert actual == sums[symbol_id].short_sum / 12
+            assert_close(actual, statistics.fmean(t[1] for t in history[-12:]))
+        else:
+            assert math.isnan(actual)
+
+
+def test_ema_matches_full_recompute():
+    ema = EMA(NUM_SYMBOLS, span=9)
+    for history in histories(random_stream()):
+        symbol_id, price = history[-1][:2]
+        assert_close(ema.update(symbol_id, price), naive_ema([t[1] for t in history], 0.2))
+
+
+def test_rolling_stats_zscore_and_bollinger_match_full_recompute():
+    window = 20
+    stats, zscore = RollingStats(NUM_SYMBOLS, window, recompute_interval=10**9), ZScore(NUM_SYMBOLS, window)
+    sample = RollingStats(NUM_SYMBOLS, window, ddof=1)
+    bands = BollingerBands(NUM_SYMBOLS, window, num_std=2.5)
+    for history in histories(random_stream()):
+        symbol_id, price = history[-1][:2]
+        recent = [t[1] for t in history[-window:]]
+        full = len(recent) == window
+        variance = statistics.pvariance(recent) if full else math.nan
+        assert_close(stats.update(symbol_id, price), variance, abs=1e-7)
+        assert_close(sample.update(symbol_id, price), statistics.variance(recent) if full else math.nan, abs=1e-7)
+        
+        mean = statistics.fmean(recent)
+        z = zscore.update(symbol_id, price)
+        if full and variance > 1e-9:
+            assert_close(z, (price - mean) / math.sqrt(variance), rel=1e-6)
+        elif not full:
+            assert math.isnan(z)
+        lower, middle, upper = bands.update(symbol_id, price)
+        expected_width = 2.5 * math.sqrt(variance) if full else math.nan
+        assert_close(middle, mean if full else math.nan)
+        assert_close(upper - middle, expected_width)
+        assert_close(middle - lower, expected_width)
+
+
+def test_flat_window_has_zero_variance_and_no_zscore():
+    zscore = ZScore(1, 3)
+    results = [zscore.update(0, 5.0) for _ in range(5)]
+    assert all(math.isnan(z) for z in results)
+    assert zscore.m2[0] == 0.0
+
+
+@pytest.mark.parametrize("window", [None, 25])
+def test_vwap_matches_full_recompute(window):
+    vwap = VWAP(NUM_SYMBOLS, window=window, recompute_interval=64)
+    for history in histories(random_stream()):
+        symbol_id, price, volume = history[-1][:3]
+        recent = history[-window:] if window else history
+        expected = sum(t[1] * t[2] for t in recent) / sum(t[2] for t in recent)
+        assert_close(vwap.update(symbol_id, price, volume), expected)
+    
+    vwap.reset(0)
+    assert vwap.update(0, 10.0, 2.0) == 10.0
+    assert math.isnan(VWAP(1).update(0, 10.0, 0.0))
+
+
+def test_rsi_and_atr_match_full_recompute():
+    rsi, atr = RSI(NUM_SYMBOLS, period=14), ATR(NUM_SYMBOLS, period=10)
+    for history in histories(random_stream(1500)):
+        symbol_id, price, _, high, low = history[-1]
+        assert_close(rsi.update(symbol_id, price), naive_rsi([t[1] for t in history], 14))
+        assert_close(atr.update(symbol_id, high, low, price), naive_atr([(t[3], t[4], t[1]) for t in history], 10))
+
+
+def test_rsi_edge_values():
+    rsi = RSI(2, period=2)
+    assert [rsi.update(0, p) for p in (1.0, 2.0, 3.0)][1:] == [pytest.approx(math.nan, nan_ok=True), 100.0]
+    assert [rsi.update(1, 5.0) for _ in range(3)][-1] == 50.0
+
+
+@pytest.mark.parametrize("make, columns", [
+    (lambda: SMA(NUM_SYMBOLS, 7, recompute_interval=5), (1,)),
+    (lambda: EMA(NUM_SYMBOLS, alpha=0.3), (1,)),
+    (lambda: VWAP(NUM_SYMBOLS), (1, 2)),
+    (lambda: VWAP(NUM_SYMBOLS, window=7, recompute_interval=5), (1, 2)),
+    (lambda: RollingStats(NUM_SYMBOLS, 8, recompute_interval=5), (1,)),
+    (lambda: ZScore(NUM_SYMBOLS, 8, ddof=1, recompute_interval=3), (1,)),
+    (lambda: BollingerBands(NUM_SYMBOLS, 8, recompute_interval=6), (1,)),
+    (lambda: RSI(NUM_SYMBOLS, 6), (1,)),
+    (lambda: ATR(NUM_SYMBOLS, 6), (3, 4, 1)),
+])
+def test_batch_updates_match_scalar_updates_exactly(make, columns):
+    ticks = random_stream(2000)
+    scalar, batch = make(), make()
+    expected = np.array([scalar.update(tick[0], *(tick[c] for c in columns)) for tick in ticks], dtype=np.float64)
+    
+    arrays = np.array(ticks)
+    symbol_ids = arrays[:, 0].astype(np.int64)
+    rng = random.Random(3)
+    results, start = [], 0
+    while start < len(ticks):  # Uneven batches with repeated symbols
+        end = start + rng.randint(1, 60)
+        results.append(batch.update_batch(symbol_ids[start:end], *(arrays[start:end, c] for c in columns)))
+        start = end
+    
+    np.testing.assert_array_equal(np.concatenate(results), expected)
+
+
+def test_reset_and_validation():
+    stats = RollingStats(2, 2)
+    stats.update(0, 1.0)
+    stats.update(0, 3.0)
+    stats.reset(0)
+    assert stats.count[0] == 0 and stats.mean[0] == 0.0
+    assert math.isnan(stats.update(0, 2.0))
+    
+    with pytest.raises(ValueError):
+        EMA(1)
+    with pytest.raises(ValueError):
+        RollingStats(1, window=1, ddof=1)
+
+
+def test_indicator_graph_shares_identical_requests():
+    graph = IndicatorGraph(2)
+    first = graph.acquire(SMA, window=5)
+    assert graph.acquire(SMA, window=5) is first
+    other = graph.acquire(EMA, span=5)
+    assert len(graph) == 2 and graph.refcount(SMA, window=5) == 2
+
+    for price in [1.0, 2.0, 3.0, 4.0, 5.0]:
+        graph.update(1, price)
+    assert first.value(1) == 3.0 and first.count[0] == 0 and other.count[1] == 5
+
+    graph.release(first)
+    assert first in graph
+    graph.release(first)
+    assert first not in graph and len(graph) == 1
+    assert graph.acquire(SMA, window=5) is not first
+    with pytest.raises(KeyError):
+        graph.release(first)
+    with pytest.raises(ValueError):
+        graph.acquire(VWAP)
@@ -1,4 +1,6 @@
+import random
 from datetime import datetime, timedelta
+from decimal import Decimal
 
 from trading_lib.strategy.price_based_strategy import MovingAverageStrategy
 from trading_lib.models import Action, MarketDataPoint
@@ -89,4 +91,34 @@ def test_moving_avg_generate_buy():
         signals.extend(strategy.generate_signals(tick))
 
     assert len(signals) == 1
-    assert signals[0] == ("AAPL", 100, 100, Action.BUY)
\ No newline at end of file
+    assert signals[0] == ("AAPL", 100, 100, Action.BUY)
+
+def reference_signals(ticks, short_window, long_window, quantity):
+    """Signals from re-summing the full windows every tick in exact decimal arithmetic"""
+    prices, above, signals = {}, {}, []
+    for tick in ticks:
+        history = prices.setdefault(tick.symbol, [])
+        if len(history) >= long_window:
+            state = sum(history[-short_window:]) / short_window > sum(history[-long_window:]) / long_window
+            if state != above.get(tick.symbol, False):
+                signals.append((tick.symbol, quantity, tick.price, Action.BUY if state else Action.SELL))
+            above[tick.symbol] = state
+        history.append(Decimal(str(tick.price)))
+    return signals
+
+
+def test_rolling_averages_match_full_recompute():
+    rng = random.Random(3)
+    base_time = datetime(2025, 1, 1, 10, 0, 0)
+    prices = {"AAPL": 100.0, "MSFT": 300.0}
+    ticks = []
+    for i in range(5000):
+        symbol = rng.choice(list(prices))
+        prices[symbol] = round(prices[symbol] + rng.gauss(0, 0.5), 2)
+        ticks.append(MarketDataPoint(timestamp=base_time + timedelta(seconds=i), symbol=symbol, price=prices[symbol]))
+    
+    for short_window, long_window in ((3, 5), (20, 50)):
+        strategy = MovingAverageStrategy(short_window, long_window, quantity=10, recompute_interval=64)
+        signals = [signal for tick in ticks for signal in strategy.generate_signals(tick)]
+        assert signals == reference_signals(ticks, short_window, long_window, 10)
+        assert len(signals) > 10
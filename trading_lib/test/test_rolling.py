@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from trading_lib.strategy.rolling import RollingSums
+
+
+def test_rolling_sums_track_last_windows_across_wraps():
+    sums = RollingSums(short_window=3, long_window=5, recompute_interval=10**9)
+    values = [float(v) for v in range(1, 13)]
+    for i, value in enumerate(values, 1):
+        sums.push(value)
+        assert sums.full == (i >= 5)
+        assert sums.short_sum == sum(values[max(0, i - 3):i])
+        assert sums.long_sum == sum(values[max(0, i - 5):i])
+
+
+def test_recompute_matches_exact_sums():
+    rng = random.Random(7)
+    sums = RollingSums(short_window=20, long_window=50, recompute_interval=10**9)
+    values = [rng.uniform(0, 1e6) for _ in range(10_000)]
+    for value in values:
+        sums.push(value)
+    sums.recompute()
+    assert sums.short_sum == pytest.approx(sum(values[-20:]), rel=1e-12)
+    assert sums.long_sum == pytest.approx(sum(values[-50:]), rel=1e-12)
+
+
+def test_short_window_longer_than_long_window_is_clamped():
+    sums = RollingSums(short_window=10, long_window=4)
+    for value in (1.0, 2.0, 3.0, 4.0, 5.0):
+        sums.push(value)
+    assert sums.short_sum == sums.long_sum == 14.0
+
+
+def test_window_lengths_must_be_positive():
+    with pytest.raises(ValueError):
+        RollingSums(0, 5)
@@ -201,3 +201,17 @@ def test_generate_trade_signal_calls_client_place_order(monkeypatch):
     fake_client_instance.place_order.assert_called_once_with(
         ticker, action, quantity, price
     )
+
+
+def test_news_listener_receives_decoded_events(generate_buy_ticks):
+    orders = []
+    strategy_combiner = StrategyCombiner(
+        price_strategy=MovingAverageStrategy(short_window=3, long_window=5, quantity=10),
+        news_strategy=NewsBasedStrategy())
+    strategy_combiner.set_trade_signal_listener(lambda *args: orders.append(args))
+
+    strategy_combiner.news_listener(strategy_combiner.news_decoder.decode_event(b"AAPL,75"))
+    for tick in generate_buy_ticks:
+        strategy_combiner.got_new_price(tick)
+
+    assert orders == [("AAPL", 10, 110, Action.BUY)]
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from trading_lib.models import MarketDataPoint
+from trading_lib.strategy.news_based_strategy import NewsBasedStrategy
+from trading_lib.strategy.price_based_strategy import MovingAverageStrategy
+from trading_lib.strategy_combiner.strategy_combiner import StrategyCombiner
+from trading_lib.strategy_combiner.strategy_host import StrategyHost
+
+SYMBOLS = ["AAPL", "MSFT", "SPY"]
+SPECS = [
+    {"name": "fast", "short_window": 3, "long_window": 8, "quantity": 10},
+    {"name": "fast_news", "short_window": 3, "long_window": 8, "bearish_threshold": 45, "bullish_threshold": 55},
+    {"name": "slow", "short_window": 8, "long_window": 30},
+    {"name": "clamped", "short_window": 12, "long_window": 8},
+]
+
+
+def random_events(n=6000, seed=5):
+    """("tick", MarketDataPoint) and ("news", symbol, sentiment) events"""
+    rng = random.Random(seed)
+    prices = {symbol: 100.0 for symbol in SYMBOLS}
+    events = []
+    for i in range(n):
+        symbol = rng.choice(SYMBOLS)
+        if rng.random() < 0.05:
+            events.append(("news", symbol, rng.randint(0, 100)))
+        else:
+            prices[symbol] = round(prices[symbol] + rng.gauss(0, 0.5), 2)
+            events.append(("tick", MarketDataPoint(timestamp=float(i), symbol=symbol, price=prices[symbol])))
+    return events
+
+
+def replay(target, events):
+    for event in events:
+        if event[0] == "tick":
+            target.got_new_price(event[1])
+        else:
+            target.got_new_news(event[1], event[2])
+
+
+def test_hosted_strategies_match_independent_combiners():
+    events = random_events()
+    host = StrategyHost(SPECS, SYMBOLS)
+    hosted = {name: [] for name in host.strategies}
+    for name, combiner in host.strategies.items():
+        combiner.set_trade_signal_listener(lambda *signal, name=name: hosted[name].append(signal))
+    replay(host, events)
+
+    for spec in SPECS:
+        expected = []
+        combiner = StrategyCombiner(
+            MovingAverageStrategy(spec["short_window"], spec["long_window"], spec.get("quantity", 100)),
+            NewsBasedStrategy(spec.get("bearish_threshold", 40), spec.get("bullish_threshold", 60)))
+        combiner.set_trade_signal_listener(lambda *signal: expected.append(signal))
+        replay(combiner, events)
+        assert expected or spec["name"] == "clamped"  # Its short average never exceeds the long one
+        assert hosted[spec["name"]] == expected, spec["name"]
+
+
+def test_identical_indicators_are_computed_once():
+    host = StrategyHost(SPECS, SYMBOLS)
+    # SMA windows 3, 8 and 30; "clamped" reuses the 8-tick average for both
+    assert len(host.graph) == 3
+
+    signals = []
+    host.set_trade_signal_listener(lambda *signal: signals.append(signal))
+    replay(host, random_events(2000))
+    assert signals  # Every variant's signals reach the host's listener
+
+    host.remove_strategy("slow")
+    assert len(host.graph) == 2
+    host.remove_strategy("fast")
+    host.remove_strategy("fast_news")
+    assert len(host.graph) == 1
+    assert list(host.strategies) == ["clamped"]
+
+
+def test_unknown_symbols_and_duplicate_names():
+    host = StrategyHost([{"short_window": 2, "long_window": 3}], SYMBOLS)
+    assert list(host.strategies) == ["strategy_0"]
+    for price in [1.0, 2.0, 3.0, 4.0]:
+        host.got_new_price(MarketDataPoint(timestamp=0.0, symbol="TSLA", price=price))
+    assert all(node.count.sum() == 0 for node in host.graph._nodes.values())
+
+    with pytest.raises(ValueError):
+        host.add_strategy({"name": "strategy_0"})
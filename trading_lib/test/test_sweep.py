@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from trading_lib.backtest.data import merge_feeds
+from trading_lib.backtest.engine import BacktestEngine
+from trading_lib.backtest.sweep import (SharedEvents, format_table, parameter_grid, run_sweep,
+                                        sample_parameters, valid_parameters)
+
+
+@pytest.fixture
+def events():
+    rng = random.Random(2)
+    prices = {"AAPL": 100.0, "MSFT": 300.0}
+    market, news = [], []
+    for i in range(3000):
+        symbol = rng.choice(list(prices))
+        prices[symbol] = round(prices[symbol] + rng.gauss(0, 0.5), 2)
+        market.append((float(i), symbol, prices[symbol]))
+        if i % 10 == 0:
+            news.append((i + 0.5, rng.choice(list(prices)), rng.randint(0, 100)))
+    return list(merge_feeds(market, news))
+
+
+def test_parameter_grid_drops_invalid_sets():
+    grid = parameter_grid({"short_window": [5, 20], "long_window": [10, 20], "bullish_threshold": [60]})
+    assert grid == [{"short_window": 5, "long_window": 10, "bullish_threshold": 60},
+                    {"short_window": 5, "long_window": 20, "bullish_threshold": 60}]
+    assert not valid_parameters({"bearish_threshold": 70, "bullish_threshold": 60})
+
+
+def test_sample_parameters_is_distinct_and_seeded():
+    space = {"short_window": range(1, 20), "long_window": range(10, 60)}
+    sample = sample_parameters(space, 25, seed=4)
+    assert len({tuple(params.items()) for params in sample}) == 25
+    assert all(valid_parameters(params) for params in sample)
+    assert sample == sample_parameters(space, 25, seed=4)
+    assert len(sample_parameters({"short_window": [1], "long_window": [2]}, 10)) == 1
+
+
+def test_shared_events_round_trip(events):
+    with SharedEvents.from_events(events, name="test_sweep_events") as shared:
+        attached = SharedEvents(shared.name, len(shared), shared.symbols)
+        try:
+            assert list(attached) == events
+        finally:
+            attached.close()
+
+
+def test_sweep_matches_direct_backtests_in_and_out_of_process(events):
+    parameter_sets = parameter_grid({"short_window": [3, 5], "long_window": [8, 13]})
+    with SharedEvents.from_events(events, name="test_sweep_run") as shared:
+        pooled = run_sweep(shared, parameter_sets, processes=2, initial_cash=50_000.0)
+        inline = run_sweep(shared, parameter_sets, processes=1, initial_cash=50_000.0)
+    
+    assert [r.params for r in pooled] == [r.params for r in inline]
+    assert [r.total_return for r in pooled] == [r.total_return for r in inline]
+    assert [r.total_return for r in pooled] == sorted((r.total_return for r in pooled), reverse=True)
+    for result in pooled:
+        direct = BacktestEngine.from_params(**result.params, initial_cash=50_000.0).run(events)
+        assert (result.final_equity, result.trades) == (direct.final_equity, len(direct.trades))
+    
+    table = format_table(pooled, top=2).splitlines()
+    assert len(table) == 3 and "short_window" in table[0]
@@ -0,0 +1,79 @@
+from datetime import datetime
+import random
+
+import numpy as np
+
+from trading_lib.models import Action, MarketDataPoint
+from trading_lib.strategy.news_based_strategy import NewsBasedStrategy, VectorizedNewsBasedStrategy
+from trading_lib.strategy.price_based_strategy import MovingAverageStrategy, VectorizedMovingAverageStrategy
+from trading_lib.strategy.vectorized import per_symbol_rounds
+
+SYMBOLS = [f"S{i}" for i in range(40)]
+
+
+def random_ticks(n, seed=5):
+    rng = random.Random(seed)
+    prices = {symbol: 100.0 for symbol in SYMBOLS}
+    symbol_ids, values = [], []
+    for _ in range(n):
+        symbol_id = rng.randrange(len(SYMBOLS))
+        symbol = SYMBOLS[symbol_id]
+        prices[symbol] = round(prices[symbol] + rng.gauss(0, 0.3), 2)
+        symbol_ids.append(symbol_id)
+        values.append(prices[symbol])
+    return np.array(symbol_ids), np.array(values)
+
+
+def test_per_symbol_rounds_keep_tick_order_with_distinct_symbols():
+    symbol_ids = np.array([3, 1, 3, 3, 0, 1])
+    rounds = [list(r) for r in per_symbol_rounds(symbol_ids)]
+    assert rounds == [[0, 1, 4], [2, 5], [3]]
+    assert list(per_symbol_rounds(np.array([], dtype=np.int64))) == []
+
+
+def test_vectorized_moving_average_matches_scalar_exactly():
+    symbol_ids, prices = random_ticks(20_000)
+    for short_window, long_window, recompute_interval in ((3, 5, 1024), (20, 50, 7), (8, 4, 3)):
+        scalar = MovingAverageStrategy(short_window, long_window, quantity=10, recompute_interval=recompute_interval)
+        vectorized = VectorizedMovingAverageStrategy(SYMBOLS, short_window, long_window, quantity=10,
+                                                     recompute_interval=recompute_interval)
+        expected = [signal for symbol_id, price in zip(symbol_ids, prices)
+                    for signal in scalar.generate_signals(MarketDataPoint(datetime.now(), SYMBOLS[symbol_id], price))]
+        
+        actual = []
+        start = 0
+        rng = random.Random(1)
+        while start < len(symbol_ids):  # Uneven batches, many with repeated symbols
+            end = start + rng.randint(1, 300)
+            mask = vectorized.generate_signals(symbol_ids[start:end], prices[start:end])
+            actual.extend(vectorized.signals(symbol_ids[start:end], prices[start:end], mask))
+            start = end
+        
+        assert actual == expected
+        assert len(expected) > 100 or short_window > long_window  # Clamped short window never crosses
+        for symbol_id, symbol in enumerate(SYMBOLS):
+            window = scalar._windows[symbol]
+            assert vectorized.short_sum[symbol_id] == window.short_sum
+            assert vectorized.long_sum[symbol_id] == window.long_sum
+
+
+def test_vectorized_moving_average_snapshot_batch():
+    strategy = VectorizedMovingAverageStrategy(["AAPL", "MSFT"], short_window=1, long_window=2)
+    ids = strategy.symbol_ids(["AAPL", "MSFT"])
+    for prices in ([10.0, 10.0], [10.0, 10.0], [11.0, 9.0], [12.0, 8.0]):
+        mask = strategy.generate_signals(ids, np.array(prices))
+    assert list(mask.buy) == [True, False] and list(mask.sell) == [False, False]
+    # MSFT fell, but its short average was never above the long one, so there is no crossover down
+    assert list(strategy.short_gt_long) == [True, False]
+
+
+def test_vectorized_news_matches_scalar():
+    scalar = NewsBasedStrategy(bearish_threshold=40, bullish_threshold=60)
+    vectorized = VectorizedNewsBasedStrategy(SYMBOLS, bearish_threshold=40, bullish_threshold=60)
+    symbol_ids = np.arange(101) % len(SYMBOLS)
+    sentiments = np.arange(101)
+    mask = vectorized.generate_signals(symbol_ids, sentiments)
+    
+    for symbol_id, sentiment, buy, sell in zip(symbol_ids, sentiments, mask.buy, mask.sell):
+        _, action = scalar.generate_signal(SYMBOLS[symbol_id], int(sentiment))
+        assert action == (Action.BUY if buy else Action.SELL if sell else Action.HOLD)